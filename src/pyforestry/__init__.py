@@ -1,5 +1,17 @@
 """Top-level package for pyforestry."""
 
-from . import base, sweden
+import importlib
 
 __all__ = ["base", "sweden"]
+
+
+def __getattr__(name: str):
+    """Import the ``base`` and ``sweden`` subpackages on first access."""
+    if name in __all__:
+        return importlib.import_module(f"{__name__}.{name}")
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    """Return available public names for ``dir()``."""
+    return sorted(__all__)
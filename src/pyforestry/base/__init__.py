@@ -0,0 +1,17 @@
+"""Country-independent building blocks of pyforestry."""
+
+import importlib
+
+_submodules = ("helpers", "pricelist", "taper", "timber", "timber_bucking")
+
+
+def __getattr__(name: str):
+    """Import a subpackage on first access."""
+    if name in _submodules:
+        return importlib.import_module(f"{__name__}.{name}")
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    """Return the subpackages for ``dir()``."""
+    return sorted(_submodules)
@@ -1,39 +1,13 @@
-"""Convenience imports for common helper types."""
+"""Convenience imports for common helper types.
 
-# Suggested pyforestry/Helpers/__init__.py
-# ruff: noqa: F401, F403, F405
-# isort: off
+Names are loaded on first access, so importing one helper (for example
+:mod:`pyforestry.base.helpers.tree_species`) does not import geopandas,
+pyproj or matplotlib through the stand, position and bucking modules.
+"""
 
-# From TreeSpecies.py
-from .tree_species import (
-    BETULA_PENDULA,  # noqa: F401
-    BETULA_PUBESCENS,  # noqa: F401
-    GLOBAL_TREE_SPECIES,  # noqa: F401
-    # Constants for common species are also defined here, e.g.:
-    PICEA_ABIES,  # noqa: F401
-    PINUS_SYLVESTRIS,  # noqa: F401
-    TreeGenus,  # noqa: F401
-    TreeName,  # noqa: F401
-    TreeSpecies,  # The regional container class
-    parse_tree_species,
-)
-
-# From Primitives.py
-from .primitives import *  # noqa: F401,F403
-from .tree import Tree
-from .bitterlich_angle_count import AngleCount, AngleCountAggregator
-from .plot import CircularPlot
-from .stand import Stand, StandMetricAccessor
-from .utils import enum_code
-from .bucking import (
-    BuckingConfig,
-    BuckingResult,
-    CrossCutSection,
-    QualityType,
-    _TreeCache,
-)
-
-# isort: on
+import importlib
+import typing
+from typing import TYPE_CHECKING
 
 __all__ = [
     # TreeSpecies components
@@ -74,4 +48,128 @@ __all__ = [
     "BuckingConfig",
     "_TreeCache",
     "QualityType",
+    # Height imputation
+    "impute_heights",
+    "fit_naslund_curves",
+    "naslund_height",
+    "NaslundHeightCurves",
 ]
+
+if TYPE_CHECKING:  # pragma: no cover - imported only for type checking
+    from . import tree_species  # pragma: no cover
+    from .bitterlich_angle_count import AngleCount, AngleCountAggregator  # pragma: no cover
+    from .bucking import (  # pragma: no cover
+        BuckingConfig,  # pragma: no cover
+        BuckingResult,  # pragma: no cover
+        CrossCutSection,  # pragma: no cover
+        QualityType,  # pragma: no cover
+        _TreeCache,  # pragma: no cover
+    )
+    from .height_imputation import (  # pragma: no cover
+        NaslundHeightCurves,  # pragma: no cover
+        fit_naslund_curves,  # pragma: no cover
+        impute_heights,  # pragma: no cover
+        naslund_height,  # pragma: no cover
+    )
+    from .plot import CircularPlot  # pragma: no cover
+    from .primitives import (  # pragma: no cover
+        Age,  # pragma: no cover
+        AgeMeasurement,  # pragma: no cover
+        AtomicVolume,  # pragma: no cover
+        CompositeVolume,  # pragma: no cover
+        Diameter_cm,  # pragma: no cover
+        Position,  # pragma: no cover
+        QuadraticMeanDiameter,  # pragma: no cover
+        SiteBase,  # pragma: no cover
+        SiteIndexValue,  # pragma: no cover
+        StandBasalArea,  # pragma: no cover
+        StandVolume,  # pragma: no cover
+        Stems,  # pragma: no cover
+        TopHeightDefinition,  # pragma: no cover
+        TopHeightMeasurement,  # pragma: no cover
+    )
+    from .stand import Stand, StandMetricAccessor  # pragma: no cover
+    from .tree import Tree  # pragma: no cover
+    from .tree_species import (  # pragma: no cover
+        BETULA_PENDULA,  # pragma: no cover
+        BETULA_PUBESCENS,  # pragma: no cover
+        GLOBAL_TREE_SPECIES,  # pragma: no cover
+        PICEA_ABIES,  # pragma: no cover
+        PINUS_SYLVESTRIS,  # pragma: no cover
+        TreeGenus,  # pragma: no cover
+        TreeName,  # pragma: no cover
+        parse_tree_species,  # pragma: no cover
+    )
+    from .utils import enum_code  # pragma: no cover
+
+# Map of public name → submodule
+_name_to_module: typing.Dict[str, str] = {
+    "BETULA_PENDULA": "tree_species",
+    "BETULA_PUBESCENS": "tree_species",
+    "GLOBAL_TREE_SPECIES": "tree_species",
+    "PICEA_ABIES": "tree_species",
+    "PINUS_SYLVESTRIS": "tree_species",
+    "TreeGenus": "tree_species",
+    "TreeName": "tree_species",
+    "TreeSpecies": "tree_species",
+    "parse_tree_species": "tree_species",
+    "Age": "primitives",
+    "AgeMeasurement": "primitives",
+    "AtomicVolume": "primitives",
+    "BasalAreaWeightedDiameter": "primitives",
+    "CompositeVolume": "primitives",
+    "Diameter_cm": "primitives",
+    "Position": "primitives",
+    "QuadraticMeanDiameter": "primitives",
+    "SiteBase": "primitives",
+    "SiteIndexValue": "primitives",
+    "StandBasalArea": "primitives",
+    "StandVolume": "primitives",
+    "Stems": "primitives",
+    "TopHeightDefinition": "primitives",
+    "TopHeightMeasurement": "primitives",
+    "Tree": "tree",
+    "AngleCount": "bitterlich_angle_count",
+    "AngleCountAggregator": "bitterlich_angle_count",
+    "CircularPlot": "plot",
+    "Stand": "stand",
+    "StandMetricAccessor": "stand",
+    "enum_code": "utils",
+    "BuckingConfig": "bucking",
+    "BuckingResult": "bucking",
+    "CrossCutSection": "bucking",
+    "QualityType": "bucking",
+    "_TreeCache": "bucking",
+    "impute_heights": "height_imputation",
+    "fit_naslund_curves": "height_imputation",
+    "naslund_height": "height_imputation",
+    "NaslundHeightCurves": "height_imputation",
+}
+
+# Submodules reachable as attributes of the package.
+_submodules = {
+    "bitterlich_angle_count",
+    "bucking",
+    "height_imputation",
+    "plot",
+    "primitives",
+    "stand",
+    "tree",
+    "tree_species",
+    "utils",
+}
+
+
+def __getattr__(name: str):
+    """Load a helper on demand."""
+    if name in _name_to_module:
+        module = importlib.import_module(f"{__name__}.{_name_to_module[name]}")
+        return getattr(module, name)
+    if name in _submodules:
+        return importlib.import_module(f"{__name__}.{name}")
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    """Return available public names for ``dir()``."""
+    return sorted(__all__)
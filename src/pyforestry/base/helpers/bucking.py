@@ -75,9 +75,24 @@ class _TreeCache:
 
     def height(self, taper: Taper, target: float) -> int:
         """Return the height (dm) at ``target`` diameter using a cache."""
-        if target not in self._heights:
-            self._heights[target] = int(taper.get_height_at_diameter(target) * 10)
-        return self._heights[target]
+        return self.heights(taper, [target])[0]
+
+    def heights(self, taper: Taper, targets: List[float]) -> List[int]:
+        """
+        Return the heights (dm) at each of the ``targets`` diameters.
+
+        Diameters not yet cached are inverted in one ``get_height_array``
+        call; tapers without it fall back to ``get_height_at_diameter``.
+        """
+        missing = [t for t in dict.fromkeys(targets) if t not in self._heights]
+        if missing:
+            if hasattr(taper, "get_height_array"):
+                values = np.asarray(taper.get_height_array(missing), dtype=float).tolist()
+            else:
+                values = [taper.get_height_at_diameter(t) for t in missing]
+            for target, value in zip(missing, values, strict=True):
+                self._heights[target] = int(value * 10)
+        return [self._heights[t] for t in targets]
 
 
 @dataclass
@@ -0,0 +1,174 @@
+"""
+Heights for trees measured for diameter only.
+
+Field plots measure height on sample trees, so most trees of a stand have
+no ``Tree.height_m``. `impute_heights` fits Näslund height curves,
+
+    h = 1.3 + d² / (a + b·d)²,
+
+to the sample trees of each plot and species, and fills in the heights of
+the other trees from them. The curves of all groups are fitted at once, by
+least squares on the linear form d / √(h − 1.3) = a + b·d.
+"""
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Dict, Hashable, Iterable, List, Union
+
+import numpy as np
+
+if TYPE_CHECKING:  # pragma: no cover - imported only for type checking
+    from pyforestry.base.helpers.stand import Stand  # pragma: no cover
+
+
+def naslund_height(diameter_cm, a, b) -> np.ndarray:
+    """Height (m) of the Näslund curve ``1.3 + d² / (a + b·d)²``."""
+    diameter_cm = np.asarray(diameter_cm, dtype=float)
+    return 1.3 + diameter_cm**2 / (a + b * diameter_cm) ** 2
+
+
+@dataclass(frozen=True)
+class NaslundHeightCurves:
+    """
+    Näslund height curves of a set of groups.
+
+    Attributes
+    ----------
+    a, b : np.ndarray
+        Curve parameters of each group.
+    n_trees : np.ndarray
+        Number of sample trees each curve was fitted to.
+    valid : np.ndarray
+        ``True`` for curves fitted to at least ``min_trees`` trees of
+        different diameters with positive ``a`` and ``b``, so that height
+        grows with diameter towards ``1.3 + 1 / b²``.
+    """
+
+    a: np.ndarray
+    b: np.ndarray
+    n_trees: np.ndarray
+    valid: np.ndarray
+
+    def height(self, group, diameter_cm) -> np.ndarray:
+        """Height (m) from the curve of each tree's ``group``; NaN where it is not valid."""
+        group = np.asarray(group)
+        height = naslund_height(diameter_cm, self.a[group], self.b[group])
+        return np.where(self.valid[group], height, np.nan)
+
+
+def fit_naslund_curves(
+    groups, diameter_cm, height_m, min_trees: int = 3, n_groups: Union[int, None] = None
+) -> NaslundHeightCurves:
+    """
+    Fit a Näslund height curve per group.
+
+    ``groups`` holds the non-negative integer group of each tree. Trees
+    with a NaN height, a height of at most 1.3 m or a diameter of at most
+    zero are not used. The curves are indexed by group, from zero to
+    ``n_groups`` (by default one more than the largest group).
+    """
+    if min_trees < 2:
+        raise ValueError("min_trees must be at least 2.")
+    groups = np.asarray(groups)
+    if groups.dtype.kind not in "iu":
+        raise TypeError(f"Groups must be integers, not {groups.dtype}.")
+    groups, diameter_cm, height_m = (
+        column.ravel()
+        for column in np.broadcast_arrays(
+            groups, np.asarray(diameter_cm, dtype=float), np.asarray(height_m, dtype=float)
+        )
+    )
+    if np.any(groups < 0):
+        raise ValueError("Groups must be non-negative.")
+    if n_groups is None:
+        n_groups = int(groups.max()) + 1 if groups.size else 0
+
+    sample = (diameter_cm > 0) & (height_m > 1.3)
+    group, x = groups[sample], diameter_cm[sample]
+    y = x / np.sqrt(height_m[sample] - 1.3)
+    n_trees = np.bincount(group, minlength=n_groups)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        x_mean = np.bincount(group, x, n_groups) / n_trees
+        y_mean = np.bincount(group, y, n_groups) / n_trees
+        dx = x - x_mean[group]
+        sxx = np.bincount(group, dx * dx, n_groups)
+        b = np.bincount(group, dx * (y - y_mean[group]), n_groups) / sxx
+        a = y_mean - b * x_mean
+    # Diameters that differ only by rounding error do not determine a slope.
+    spread = sxx > 1e-12 * np.bincount(group, x * x, n_groups)
+    valid = (n_trees >= min_trees) & spread & (a > 0) & (b > 0)
+    return NaslundHeightCurves(a=a, b=b, n_trees=n_trees, valid=valid)
+
+
+def impute_heights(stands: Union["Stand", Iterable["Stand"]], min_trees: int = 3) -> int:
+    """
+    Fill in ``height_m`` of the trees of one or more stands that lack it.
+
+    Näslund curves are fitted to the trees with a measured height, for all
+    stands at once. Each tree without a height takes the first valid curve
+    of, in turn:
+
+    1. its plot and species,
+    2. its stand and species,
+    3. its stand, all species together.
+
+    Trees without a positive diameter, and trees of stands with too few
+    sample trees for any curve, keep ``height_m=None``. Measured heights are
+    never changed. Returns the number of heights filled in.
+    """
+    from pyforestry.base.helpers.stand import Stand
+
+    stand_list: List[Stand] = [stands] if isinstance(stands, Stand) else list(stands)
+    species_keys: Dict[Hashable, int] = {}
+    trees = []
+    stand_index: List[int] = []
+    plot_index: List[int] = []
+    species_index: List[int] = []
+    n_plots = 0
+    for i, stand in enumerate(stand_list):
+        for plot in stand.plots:
+            for tree in plot.trees:
+                trees.append(tree)
+                stand_index.append(i)
+                plot_index.append(n_plots)
+                sp = getattr(tree, "species", None)
+                species_index.append(
+                    -1 if sp is None else species_keys.setdefault(sp, len(species_keys))
+                )
+            n_plots += 1
+
+    diameter_cm = np.array(
+        [np.nan if t.diameter_cm is None else float(t.diameter_cm) for t in trees], dtype=float
+    )
+    height_m = np.array(
+        [np.nan if t.height_m is None else float(t.height_m) for t in trees], dtype=float
+    )
+    stand_key = np.array(stand_index, dtype=np.intp)
+    plot_key = np.array(plot_index, dtype=np.intp)
+    sp = np.array(species_index, dtype=np.intp)
+    n_species = len(species_keys)
+
+    # Curves of stands, of species in stands and of species in plots, coarse
+    # first; the finer ones replace them where they are valid. Trees without
+    # a species only enter the curves of whole stands.
+    everyone = np.ones(len(trees), dtype=bool)
+    has_species = sp >= 0
+    levels = [(stand_key, len(stand_list), everyone)]
+    if n_species:
+        levels.append((stand_key * n_species + sp, len(stand_list) * n_species, has_species))
+        levels.append((plot_key * n_species + sp, n_plots * n_species, has_species))
+    imputed = np.full(len(trees), np.nan)
+    for key, n_groups, members in levels:
+        key = np.where(members, key, 0)
+        heights = np.where(members, height_m, np.nan)
+        curves = fit_naslund_curves(key, diameter_cm, heights, min_trees, n_groups)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            height = curves.height(key, diameter_cm)
+        imputed = np.where(members & ~np.isnan(height), height, imputed)
+
+    fill = np.isnan(height_m) & (diameter_cm > 0) & ~np.isnan(imputed)
+    for i in np.flatnonzero(fill).tolist():
+        trees[i].height_m = float(imputed[i])
+    # Volumes depend on heights; they are recomputed on next access.
+    for i in np.unique(stand_key[fill]).tolist():
+        stand_list[i]._metric_estimates.pop("Volume", None)
+    return int(fill.sum())
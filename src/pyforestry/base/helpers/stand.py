@@ -8,7 +8,7 @@ used to access aggregated stand metrics such as basal area or stem count.
 import statistics
 from dataclasses import dataclass, field
 from math import isclose, pi, sqrt
-from typing import Any, Callable, Dict, List, Optional, Union, cast
+from typing import Any, Callable, Dict, List, Mapping, Optional, Tuple, Union, cast
 
 import geopandas as gpd
 import numpy as np
@@ -29,12 +29,69 @@ from pyforestry.base.helpers.primitives import (
     QuadraticMeanDiameter,
     SiteBase,
     StandBasalArea,
+    StandVolume,
     Stems,
     TopHeightDefinition,
     TopHeightMeasurement,
 )
 
 
+@dataclass(frozen=True)
+class _TreeColumns:
+    """Trees of a stand's plots as columns, one row per tree with a species."""
+
+    species: List[TreeName]
+    plot_index: np.ndarray
+    species_index: np.ndarray
+    weight_n: np.ndarray
+    diameter_cm: np.ndarray
+    height_m: np.ndarray
+    effective_area_ha: np.ndarray
+
+
+def _between_plot_moments(
+    plot_index: np.ndarray,
+    species_index: np.ndarray,
+    columns: np.ndarray,
+    effective_area_ha: np.ndarray,
+    n_species: int,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Mean and population variance over plots of per-hectare column sums.
+
+    ``columns`` holds one row per metric and one column per tree. Each row is
+    summed per plot and species, divided by the plot's effective area, and
+    averaged over the plots in which the species occurs. Both results have
+    the shape ``(n_metrics, n_species)``.
+    """
+    n_plots = len(effective_area_ha)
+    key = species_index * n_plots + plot_index
+    present = np.bincount(key, minlength=n_species * n_plots).reshape(n_species, n_plots) > 0
+    per_ha = (
+        np.array(
+            [np.bincount(key, weights=column, minlength=n_species * n_plots) for column in columns]
+        ).reshape(len(columns), n_species, n_plots)
+        / effective_area_ha
+    )
+    n_present = np.maximum(present.sum(axis=1), 1)
+    means = per_ha.sum(axis=2) / n_present
+    variances = (((per_ha - means[..., None]) * present) ** 2).sum(axis=2) / n_present
+    return means, variances
+
+
+def _bawad(ba_mean: float, ba_var: float, d3_mean: float, d3_var: float):
+    """Basal-area weighted diameter from BA and ΣD³ per hectare, with its precision."""
+    if ba_mean <= 0:
+        return BasalAreaWeightedDiameter(0.0, precision=0.0)
+    d2_mean = ba_mean * (40000.0 / pi)
+    d2_var = ba_var * (40000.0 / pi) ** 2
+    bawad_value = d3_mean / d2_mean
+    dR_dN = 1.0 / d2_mean
+    dR_dD = -d3_mean / (d2_mean**2)
+    bawad_precision = sqrt((dR_dN**2 * d3_var) + (dR_dD**2 * d2_var))
+    return BasalAreaWeightedDiameter(bawad_value, precision=bawad_precision)
+
+
 # -------------------------------------------------------------------------
 # Accessor for .BasalArea, .Stems, etc.
 # -------------------------------------------------------------------------
@@ -67,10 +124,11 @@ class StandMetricAccessor:
     def _ensure_estimates(self):
         """Compute or refresh HT estimates if not done."""
         if self._metric_name not in self._stand._metric_estimates:
-            if not self._stand.use_angle_count:
-                self._stand._compute_ht_estimates()
-            else:
+            if self._stand.use_angle_count:
                 raise KeyError(f"{self._metric_name} metric unavailable for angle-count data")
+            if self._metric_name == "Volume" and self._stand._volume_model is None:
+                raise KeyError("Volume metric needs a volume model, see Stand.estimate_volume")
+            self._stand._compute_ht_estimates()
 
     def __getattr__(self, item):
         """
@@ -154,6 +212,9 @@ class Stand:
         init=False,
     )
     use_angle_count: bool = field(default=False, init=False)
+    _volume_model: Optional[Tuple[Callable[[Mapping[str, Any]], Any], bool, Dict[str, Any]]] = (
+        field(default=None, init=False, repr=False)
+    )
 
     def __post_init__(self) -> None:
         """Initialize derived attributes and pre-compute metric estimates.
@@ -251,6 +312,57 @@ class Stand:
         """Access the stand's basal-area weighted mean diameter."""
         return StandMetricAccessor(self, "BAWAD")
 
+    @property
+    def Volume(self) -> StandMetricAccessor:
+        """
+        Access the stand's volume aggregator, once `estimate_volume` has
+        set a volume model.
+        Example:
+            stand.Volume.TOTAL          -> StandVolume for total
+            stand.Volume(TreeName(...)) -> species-level StandVolume
+            float(stand.Volume)         -> numeric total (m³/ha)
+        """
+        return StandMetricAccessor(self, "Volume")
+
+    def estimate_volume(
+        self,
+        volume_function: Callable[[Mapping[str, Any]], Any],
+        over_bark: bool = True,
+        **columns: Any,
+    ) -> Dict[Union[TreeName, str], StandVolume]:
+        """
+        Estimate the standing volume (m³/ha) per species and in total.
+
+        ``volume_function`` takes a table of trees, a mapping of column names
+        to arrays, and returns the stem volume (m³) of every tree, for example
+        :func:`pyforestry.sweden.volume.swe_timber_volumes`. The table has the
+        columns ``species`` (lower-case names), ``diameter_cm``, ``height_m``
+        and ``over_bark``, plus any extra ``columns`` given here, such as
+        ``latitude`` or ``region``.
+
+        Tree volumes are expanded by ``weight_n`` and the effective plot area
+        in the same pass as the stem and basal-area estimates, and their
+        precision is the standard deviation between plots. The volume model
+        is kept, so `append_plot` and `thin_trees` update the volumes along
+        with the other metrics, and :attr:`Volume` gives access to them.
+
+        Raises
+        ------
+        ValueError
+            If the stand uses AngleCount data, a tree has no height, or the
+            volume function gives no volume (NaN) for a tree.
+        """
+        if self.use_angle_count:
+            raise ValueError("Volume estimates not supported when using AngleCount data.")
+        previous = self._volume_model
+        self._volume_model = (volume_function, over_bark, columns)
+        try:
+            self._compute_ht_estimates()
+        except Exception:
+            self._volume_model = previous
+            raise
+        return dict(self._metric_estimates["Volume"])
+
     def _ensure_qmd_estimates(self):
         """
         Ensure that QMD estimates are computed.
@@ -296,12 +408,78 @@ class Stand:
 
         self._metric_estimates["QMD"] = qmd_dict
 
+    def _tree_columns(self) -> _TreeColumns:
+        """Collect the trees of all plots into columns, one row per tree."""
+        species: Dict[TreeName, int] = {}
+        parsed: Dict[str, TreeName] = {}
+        plot_index: List[int] = []
+        species_index: List[int] = []
+        weight_n: List[float] = []
+        diameter_cm: List[float] = []
+        height_m: List[float] = []
+        effective_area_ha = np.empty(len(self.plots))
+        for i, plot in enumerate(self.plots):
+            area_ha = plot.area_ha or 1.0
+            # effective area is the visible portion of the plot
+            effective_area_ha[i] = (
+                area_ha * (1 - plot.occlusion) if (1 - plot.occlusion) > 0 else area_ha
+            )
+            for tr in plot.trees:
+                sp = getattr(tr, "species", None)
+                if sp is None:
+                    continue
+                if isinstance(sp, str):
+                    if sp not in parsed:
+                        parsed[sp] = parse_tree_species(sp)
+                    sp = parsed[sp]
+                plot_index.append(i)
+                species_index.append(species.setdefault(sp, len(species)))
+                weight_n.append(tr.weight_n)
+                diameter_cm.append(float(tr.diameter_cm) if tr.diameter_cm is not None else 0.0)
+                height_m.append(float(tr.height_m) if tr.height_m is not None else np.nan)
+        return _TreeColumns(
+            species=list(species),
+            plot_index=np.array(plot_index, dtype=np.intp),
+            species_index=np.array(species_index, dtype=np.intp),
+            weight_n=np.array(weight_n, dtype=float),
+            diameter_cm=np.array(diameter_cm, dtype=float),
+            height_m=np.array(height_m, dtype=float),
+            effective_area_ha=effective_area_ha,
+        )
+
+    def _tree_volumes(self, trees: _TreeColumns) -> np.ndarray:
+        """Single-tree volumes (m³) from the volume model of `estimate_volume`."""
+        assert self._volume_model is not None
+        volume_function, over_bark, columns = self._volume_model
+        if np.isnan(trees.height_m).any():
+            raise ValueError(
+                f"{int(np.isnan(trees.height_m).sum())} trees have no height; "
+                "volume estimates need a height for every tree."
+            )
+        names = np.array([sp.full_name.lower() for sp in trees.species], dtype=str)
+        table = {
+            **columns,
+            "species": names[trees.species_index],
+            "diameter_cm": trees.diameter_cm,
+            "height_m": trees.height_m,
+            "over_bark": over_bark,
+        }
+        volume = np.asarray(volume_function(table), dtype=float)
+        if volume.shape != trees.height_m.shape:
+            raise ValueError("The volume function must return one volume per tree.")
+        if np.isnan(volume).any():
+            raise ValueError(
+                f"The volume function gave no volume for {int(np.isnan(volume).sum())} trees."
+            )
+        return volume
+
     def _compute_ht_estimates(self):
         """
         Compute Horvitz-Thompson style estimates across all plots.
         We'll sum or average the per-plot values for each species:
           - stems/ha
           - basal_area/ha
+          - volume/ha, if a volume model was set with `estimate_volume`
         Store them in self._metric_estimates:
             {
                 "Stems": {TreeName(...): Stems(...), ..., "TOTAL": Stems(...)},
@@ -311,135 +489,76 @@ class Stand:
                     "TOTAL": StandBasalArea(...),
                 }
             }
+
+        All metrics are per-tree columns reduced in one pass by
+        `_between_plot_moments`, so each metric costs one more column.
         """
-        species_data: Dict[TreeName, Dict[str, List[float]]] = {}
-        # 1. Gather data from each plot
-        for plot in self.plots:
-            area_ha = plot.area_ha or 1.0
-            # effective area is the visible portion of the plot
-            effective_area_ha = (
-                area_ha * (1 - plot.occlusion) if (1 - plot.occlusion) > 0 else area_ha
-            )
+        trees = self._tree_columns()
+        # 1. Per-tree contributions, summed per plot and species below
+        columns = [
+            trees.weight_n,
+            pi * (trees.diameter_cm / 200.0) ** 2 * trees.weight_n,
+            trees.diameter_cm**3 * trees.weight_n,
+        ]
+        if self._volume_model is not None:
+            columns.append(self._tree_volumes(trees) * trees.weight_n)
+
+        # 2. Compute means and variances across plots
+        means, variances = _between_plot_moments(
+            trees.plot_index,
+            trees.species_index,
+            np.array(columns).reshape(len(columns), -1),
+            trees.effective_area_ha,
+            len(trees.species),
+        )
 
-            # Group trees by species
-            trees_by_sp: Dict[TreeName, List[Tree]] = {}
-            for tr in plot.trees:
-                sp = getattr(tr, "species", None)
-                if sp is None:
-                    continue
-                if isinstance(sp, str):
-                    sp = parse_tree_species(sp)
-                trees_by_sp.setdefault(sp, []).append(tr)
-
-            # For each species in this plot, compute the adjusted stems/ha and BA/ha
-            for sp, trlist in trees_by_sp.items():
-                stems_count = sum(t.weight_n for t in trlist)
-                # Adjusted stems/ha: divide by the effective area
-                stems_ha = stems_count / effective_area_ha
-
-                # Compute basal area (m²) for trees in the plot.
-                ba_sum = 0.0
-                for t in trlist:
-                    d_cm = float(t.diameter_cm) if t.diameter_cm is not None else 0.0
-                    r_m = (d_cm / 100.0) / 2.0
-                    ba_sum += pi * (r_m**2) * t.weight_n
-                # Adjusted BA/ha: divide by effective area.
-                ba_ha = ba_sum / effective_area_ha
-
-                # Compute sums of diameter powers
-                d2_sum = 0.0
-                d3_sum = 0.0
-                for t in trlist:
-                    d_cm = float(t.diameter_cm) if t.diameter_cm is not None else 0.0
-                    d2_sum += (d_cm**2) * t.weight_n
-                    d3_sum += (d_cm**3) * t.weight_n
-                d3_ha = d3_sum / effective_area_ha
-
-                if sp not in species_data:
-                    species_data[sp] = {
-                        "stems_per_ha": [],
-                        "basal_area_per_ha": [],
-                        "d3_per_ha": [],
-                    }
-                species_data[sp]["stems_per_ha"].append(stems_ha)
-                species_data[sp]["basal_area_per_ha"].append(ba_ha)
-                species_data[sp]["d3_per_ha"].append(d3_ha)
-
-        # 2. Compute means and variances across plots (as before)
         stems_dict: Dict[Union[TreeName, str], Stems] = {}
         ba_dict: Dict[Union[TreeName, str], StandBasalArea] = {}
         bawad_dict: Dict[Union[TreeName, str], BasalAreaWeightedDiameter] = {}
 
-        total_stems_val = 0.0
-        total_stems_var = 0.0
-        total_ba_val = 0.0
-        total_ba_var = 0.0
-        total_d3_val = 0.0
-        total_d3_var = 0.0
-
-        for sp, metricvals in species_data.items():
-            s_vals = metricvals["stems_per_ha"]
-            b_vals = metricvals["basal_area_per_ha"]
-            d3_vals = metricvals["d3_per_ha"]
-
-            stems_mean = statistics.mean(s_vals) if s_vals else 0.0
-            stems_var = statistics.pvariance(s_vals) if len(s_vals) > 1 else 0.0
-
-            ba_mean = statistics.mean(b_vals) if b_vals else 0.0
-            ba_var = statistics.pvariance(b_vals) if len(b_vals) > 1 else 0.0
-
-            d3_mean = statistics.mean(d3_vals) if d3_vals else 0.0
-            d3_var = statistics.pvariance(d3_vals) if len(d3_vals) > 1 else 0.0
+        for i, sp in enumerate(trees.species):
+            stems_mean, ba_mean, d3_mean = means[:3, i].tolist()
+            stems_var, ba_var, d3_var = variances[:3, i].tolist()
 
             stems_dict[sp] = Stems(value=stems_mean, species=sp, precision=sqrt(stems_var))
             ba_dict[sp] = StandBasalArea(value=ba_mean, species=sp, precision=sqrt(ba_var))
+            bawad_dict[sp] = _bawad(ba_mean, ba_var, d3_mean, d3_var)
 
-            total_stems_val += stems_mean
-            total_stems_var += stems_var
-            total_ba_val += ba_mean
-            total_ba_var += ba_var
-            total_d3_val += d3_mean
-            total_d3_var += d3_var
-
-            if ba_mean > 0:
-                d2_mean = ba_mean * (40000.0 / pi)
-                d2_var = ba_var * (40000.0 / pi) ** 2
-                bawad_value = d3_mean / d2_mean if d2_mean > 0 else 0.0
-                dR_dN = 1.0 / d2_mean if d2_mean > 0 else 0.0
-                dR_dD = -d3_mean / (d2_mean**2) if d2_mean > 0 else 0.0
-                bawad_precision = sqrt((dR_dN**2 * d3_var) + (dR_dD**2 * d2_var))
-            else:
-                bawad_value = 0.0
-                bawad_precision = 0.0
-            bawad_dict[sp] = BasalAreaWeightedDiameter(bawad_value, precision=bawad_precision)
-
-            # "TOTAL" aggregator
+        # "TOTAL" aggregator
+        total_stems_val, total_ba_val, total_d3_val = means[:3].sum(axis=1).tolist()
+        total_stems_var, total_ba_var, total_d3_var = variances[:3].sum(axis=1).tolist()
         stems_dict["TOTAL"] = Stems(
             value=total_stems_val, species=None, precision=sqrt(total_stems_var)
         )
         ba_dict["TOTAL"] = StandBasalArea(
             value=total_ba_val, species=None, precision=sqrt(total_ba_var)
         )
-
-        if total_ba_val > 0:
-            d2_total_mean = total_ba_val * (40000.0 / pi)
-            d2_total_var = total_ba_var * (40000.0 / pi) ** 2
-            bawad_total_value = total_d3_val / d2_total_mean if d2_total_mean > 0 else 0.0
-            dR_dN_t = 1.0 / d2_total_mean if d2_total_mean > 0 else 0.0
-            dR_dD_t = -total_d3_val / (d2_total_mean**2) if d2_total_mean > 0 else 0.0
-            bawad_total_precision = sqrt((dR_dN_t**2 * total_d3_var) + (dR_dD_t**2 * d2_total_var))
-        else:
-            bawad_total_value = 0.0
-            bawad_total_precision = 0.0
-
-        bawad_dict["TOTAL"] = BasalAreaWeightedDiameter(
-            bawad_total_value, precision=bawad_total_precision
-        )
+        bawad_dict["TOTAL"] = _bawad(total_ba_val, total_ba_var, total_d3_val, total_d3_var)
 
         self._metric_estimates["Stems"] = {k: v for k, v in stems_dict.items()}
         self._metric_estimates["BasalArea"] = {k: v for k, v in ba_dict.items()}
         self._metric_estimates["BAWAD"] = {k: v for k, v in bawad_dict.items()}
 
+        if self._volume_model is not None:
+            volume_function, over_bark, _ = self._volume_model
+            volume_dict: Dict[Union[TreeName, str], StandVolume] = {}
+            for i, sp in enumerate(trees.species):
+                volume_dict[sp] = StandVolume(
+                    value=float(means[3, i]),
+                    species=sp,
+                    precision=sqrt(variances[3, i]),
+                    over_bark=over_bark,
+                    fn=volume_function,
+                )
+            volume_dict["TOTAL"] = StandVolume(
+                value=float(means[3].sum()),
+                species=None,
+                precision=sqrt(variances[3].sum()),
+                over_bark=over_bark,
+                fn=volume_function,
+            )
+            self._metric_estimates["Volume"] = volume_dict
+
     def __repr__(self):
         """Return a short textual description of the stand."""
         return f"Stand(area_ha={self.area_ha}, n_plots={len(self.plots)})"
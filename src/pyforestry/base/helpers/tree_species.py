@@ -8,7 +8,9 @@ given region.  For example ``TreeSpecies.Sweden.pinus_sylvestris`` returns the
 """
 
 from dataclasses import dataclass
-from typing import Any, ClassVar, Dict, Iterator, List, Union
+from typing import Any, ClassVar, Dict, Iterable, Iterator, List, Union
+
+import numpy as np
 
 # --------------------------------------------------------------------
 # Global Taxonomy: Genera and Species (renamed to TreeName)
@@ -300,6 +302,42 @@ def parse_tree_species(species_str: Union[str, TreeName]) -> TreeName:
     raise ValueError(f"Could not find species matching '{species_str}'")
 
 
+def tree_species_codes(
+    species: Union[str, TreeName, Iterable[Union[str, TreeName]]],
+) -> Union[int, np.ndarray]:
+    """Integer species codes: positions in ``GLOBAL_TREE_SPECIES``.
+
+    Codes index per-species arrays such as
+    ``PulpPricelist.species_price_array``. ``species`` is one species (giving
+    an ``int``) or an array-like of species names or :class:`TreeName`
+    objects (giving an array of the same shape); each distinct value is
+    parsed once.
+    """
+    if isinstance(species, (str, TreeName)):
+        return int(tree_species_codes([species])[0])
+    values = np.asarray(
+        [sp.full_name if isinstance(sp, TreeName) else sp for sp in np.ravel(species)],
+        dtype=str,
+    ).reshape(np.shape(species))
+    unique, inverse = np.unique(values, return_inverse=True)
+    code_of = {sp.full_name: code for code, sp in enumerate(GLOBAL_TREE_SPECIES)}
+    codes = np.array(
+        [code_of[parse_tree_species(name).full_name] for name in unique], dtype=np.intp
+    )
+    return codes[inverse].reshape(values.shape)
+
+
+def tree_species_names(codes: Union[int, Iterable[int]]) -> np.ndarray:
+    """Lower-case full names of `tree_species_codes`, as a string array."""
+    codes = np.asarray(codes)
+    if codes.dtype.kind not in "iu":
+        raise TypeError(f"Species codes must be integers, not {codes.dtype}.")
+    if np.any((codes < 0) | (codes >= len(GLOBAL_TREE_SPECIES))):
+        raise ValueError(f"Species codes must be in [0, {len(GLOBAL_TREE_SPECIES)}).")
+    names = np.array([sp.full_name.lower() for sp in GLOBAL_TREE_SPECIES])
+    return names[codes]
+
+
 # --------------------------------------------------------------------
 # Automatically load regional extensions if available
 try:  # pragma: no cover - optional dependency
@@ -1,9 +1,12 @@
 """Public API for pricelist utilities."""
 
 from .pricelist import (
+    CompiledLengthCorrections,
+    CompiledTimberPrices,
     DiameterRange,
     LengthCorrections,
     LengthRange,
+    LogPrices,
     Pricelist,
     PulpPricelist,
     TimberPriceForDiameter,
@@ -12,14 +15,39 @@ from .pricelist import (
 )
 from .solutioncube import SolutionCube
 
+# isort: split
+from .cube_cache import SolutionCubeCache
+from .cube_diff import changed_cells, compare_cubes, price_data_changes, regenerate_cube
+from .frozen import FrozenPricelist
+from .series import PricelistSeries, compound_trend
+from .stand_valuation import DBHHistogram, WeibullDBH, value_stands
+from .tables import load_price_data, load_pricelist, save_price_table
+
 __all__ = [
+    "CompiledLengthCorrections",
+    "CompiledTimberPrices",
     "DiameterRange",
+    "FrozenPricelist",
     "LengthCorrections",
     "LengthRange",
+    "LogPrices",
     "TimberPriceForDiameter",
     "TimberPricelist",
     "PulpPricelist",
     "Pricelist",
+    "PricelistSeries",
+    "compound_trend",
     "create_pricelist_from_data",
     "SolutionCube",
+    "SolutionCubeCache",
+    "changed_cells",
+    "compare_cubes",
+    "price_data_changes",
+    "regenerate_cube",
+    "DBHHistogram",
+    "WeibullDBH",
+    "value_stands",
+    "load_price_data",
+    "load_pricelist",
+    "save_price_table",
 ]
@@ -0,0 +1,254 @@
+"""On-disk cache of generated :class:`SolutionCube` instances."""
+
+import errno
+import hashlib
+import json
+import os
+import shutil
+import uuid
+from importlib.metadata import PackageNotFoundError, version
+from pathlib import Path
+from typing import List, Optional, Tuple, Type, Union
+
+from pyforestry.base.pricelist.solutioncube import (
+    _MMAP_META,
+    PricelistSource,
+    SolutionCube,
+    _hash_pricelist,
+)
+from pyforestry.base.taper.registry import get_taper_model, taper_model_name
+from pyforestry.base.taper.taper import Taper
+
+_TMP_PREFIX = ".tmp-"
+_TRASH_PREFIX = ".trash-"
+# Attempts of `SolutionCubeCache.put` to store an entry that other
+# processes keep evicting before it can be loaded.
+_PUT_ATTEMPTS = 3
+
+
+def _package_version() -> str:
+    """Return the installed pyforestry version (``"unknown"`` if not installed)."""
+    try:
+        return version("pyforestry")
+    except PackageNotFoundError:  # pragma: no cover - running from a source tree
+        return "unknown"
+
+
+def _directory_size(path: Path) -> int:
+    """Return the total size in bytes of the files below ``path``; vanished files count 0."""
+    total = 0
+    for root, _, files in os.walk(path):
+        for name in files:
+            try:
+                total += os.stat(os.path.join(root, name)).st_size
+            except OSError:  # removed by another process
+                pass
+    return total
+
+
+def _last_used(entry: Path) -> Optional[float]:
+    """Return when ``entry`` was last used, or ``None`` if it is not a complete entry."""
+    try:
+        return (entry / _MMAP_META).stat().st_mtime
+    except OSError:
+        return None
+
+
+class SolutionCubeCache:
+    """
+    Directory of memory-mapped solution cubes keyed on how they were generated.
+
+    Each entry is identified by the pricelist hash, the taper model name, the
+    generation grid and the pyforestry version. `get_or_generate` reuses an
+    entry on a hit and generates (and stores) the cube on a miss, so repeated
+    batch runs against the same price list pay for generation only once.
+
+    Entries are written to a temporary directory and renamed into place, which
+    is atomic on POSIX file systems: concurrent processes either see a complete
+    entry or none at all. When ``max_bytes`` is set, the least recently used
+    entries are evicted after each write until the cache fits. Another
+    process may evict an entry at any time; reads then report a miss, and
+    entries that vanish while the cache is scanned are skipped.
+    """
+
+    def __init__(self, directory: Union[str, Path], max_bytes: Optional[int] = None):
+        """
+        :param directory: Cache directory; created if missing.
+        :param max_bytes: Optional size limit for all entries together.
+        """
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+
+    # ------------------------------------------------------------------ keys
+    @staticmethod
+    def key(
+        pricelist_data: PricelistSource,
+        taper_model: Union[str, Type[Taper]],
+        species_list: List[str],
+        dbh_range: Tuple[float, float],
+        height_range: Tuple[float, float],
+        dbh_step: int = 2,
+        height_step: float = 0.2,
+    ) -> str:
+        """
+        Return the cache key for a `SolutionCube.generate` call.
+
+        A registered taper model gives the same key by name or by class, and
+        the species are sorted and deduplicated like `SolutionCube.generate`
+        does, so their order does not matter.
+        """
+        spec = {
+            "pricelist_hash": _hash_pricelist(pricelist_data),
+            "taper_model": taper_model_name(get_taper_model(taper_model)),
+            "grid": {
+                "species": sorted(set(species_list)),
+                "dbh_range": [float(v) for v in dbh_range],
+                "height_range": [float(v) for v in height_range],
+                "dbh_step": float(dbh_step),
+                "height_step": float(height_step),
+            },
+            "pyforestry_version": _package_version(),
+        }
+        encoded = json.dumps(spec, sort_keys=True).encode()
+        return hashlib.sha256(encoded).hexdigest()
+
+    def path_for(self, key: str) -> Path:
+        """Return the directory used for the entry ``key``."""
+        return self.directory / key
+
+    # ---------------------------------------------------------------- access
+    def get(self, key: str) -> Optional[SolutionCube]:
+        """Return the cached cube for ``key`` or ``None`` on a miss."""
+        entry = self.path_for(key)
+        try:
+            os.utime(entry / _MMAP_META)  # mark as recently used
+            # Opened as a directory directly: `SolutionCube.load` would try
+            # an evicted entry as a netCDF file.
+            return SolutionCube._open_mmap(entry)
+        except OSError:  # missing, or evicted by another process meanwhile
+            return None
+
+    def put(self, key: str, cube: SolutionCube) -> SolutionCube:
+        """
+        Store ``cube`` under ``key`` and return the memory-mapped entry.
+
+        If another process stored the same key first, its entry is kept. If
+        other processes evict the entry before it is loaded, it is stored
+        again; after `_PUT_ATTEMPTS` tries ``cube`` itself is returned.
+        """
+        for _ in range(_PUT_ATTEMPTS):
+            self._store(key, cube)
+            self.evict(keep=key)
+            stored = self.get(key)
+            if stored is not None:
+                return stored
+        return cube
+
+    def _store(self, key: str, cube: SolutionCube) -> None:
+        """Write ``cube`` to a temporary directory and rename it to the entry ``key``."""
+        tmp = self.directory / f"{_TMP_PREFIX}{key}-{os.getpid()}-{uuid.uuid4().hex}"
+        try:
+            cube.save_mmap(tmp)
+            try:
+                os.rename(tmp, self.path_for(key))
+            except OSError as error:
+                # Another process stored the key first (it may be evicted by now).
+                if error.errno not in (errno.EEXIST, errno.ENOTEMPTY):
+                    raise
+        finally:
+            shutil.rmtree(tmp, ignore_errors=True)
+
+    def get_or_generate(
+        self,
+        pricelist_data: PricelistSource,
+        taper_model: Union[str, Type[Taper]],
+        species_list: List[str],
+        dbh_range: Tuple[float, float],
+        height_range: Tuple[float, float],
+        dbh_step: int = 2,
+        height_step: float = 0.2,
+        workers: int = -1,
+    ) -> SolutionCube:
+        """Return a cached cube, generating and storing it on a miss."""
+        key = self.key(
+            pricelist_data,
+            taper_model,
+            species_list,
+            dbh_range,
+            height_range,
+            dbh_step,
+            height_step,
+        )
+        cube = self.get(key)
+        if cube is not None:
+            if cube.pricelist_hash != _hash_pricelist(pricelist_data):
+                raise ValueError(f"Cache entry {key} does not match its pricelist hash.")
+            print(f"Solution cube cache hit: {key}")
+            return cube
+
+        print(f"Solution cube cache miss: {key}")
+        cube = SolutionCube.generate(
+            pricelist_data=pricelist_data,
+            taper_model=taper_model,
+            species_list=species_list,
+            dbh_range=dbh_range,
+            height_range=height_range,
+            dbh_step=dbh_step,
+            height_step=height_step,
+            workers=workers,
+        )
+        return self.put(key, cube)
+
+    # ------------------------------------------------------------- eviction
+    def entries(self) -> List[Path]:
+        """Return complete entries ordered from least to most recently used."""
+        # Temporary and trashed directories of other processes are not entries.
+        used = {
+            p: _last_used(p)
+            for p in self.directory.iterdir()
+            if not p.name.startswith((_TMP_PREFIX, _TRASH_PREFIX))
+        }
+        return sorted((p for p, t in used.items() if t is not None), key=used.__getitem__)
+
+    @property
+    def size_bytes(self) -> int:
+        """Total size of all complete entries."""
+        return sum(_directory_size(p) for p in self.entries())
+
+    def _remove(self, entry: Path) -> None:
+        """Remove ``entry`` by renaming it away first so it vanishes atomically."""
+        trash = self.directory / f"{_TRASH_PREFIX}{entry.name}-{uuid.uuid4().hex}"
+        try:
+            os.rename(entry, trash)
+        except OSError:  # already removed by another process
+            return
+        shutil.rmtree(trash, ignore_errors=True)
+
+    def evict(self, keep: Optional[str] = None) -> List[str]:
+        """
+        Remove least recently used entries until the cache fits ``max_bytes``.
+
+        The entry ``keep`` is never removed. Returns the evicted keys.
+        """
+        if self.max_bytes is None:
+            return []
+        entries = self.entries()
+        sizes = {p: _directory_size(p) for p in entries}
+        total = sum(sizes.values())
+        evicted = []
+        for entry in entries:
+            if total <= self.max_bytes:
+                break
+            if entry.name == keep:
+                continue
+            self._remove(entry)
+            total -= sizes[entry]
+            evicted.append(entry.name)
+        return evicted
+
+    def clear(self) -> None:
+        """Remove every entry, including leftovers of interrupted writes."""
+        for path in self.directory.iterdir():
+            if path.is_dir():
+                self._remove(path)
@@ -0,0 +1,279 @@
+"""Compare solution cubes and regenerate them incrementally after price changes."""
+
+import json
+from datetime import datetime, timezone
+from multiprocessing import cpu_count
+from typing import Any, Dict, Iterable, List, Optional, Set, Type, Union
+
+import numpy as np
+import xarray as xr
+
+from pyforestry.base.pricelist.pricelist import PulpPricelist
+from pyforestry.base.pricelist.solutioncube import (
+    _CUBE_DIMS,
+    SolutionCube,
+    _hash_pricelist,
+    _solve_cells,
+)
+from pyforestry.base.taper.registry import get_taper_model, taper_model_name
+from pyforestry.base.taper.taper import Taper
+from pyforestry.sweden.timber.swe_timber import SweTimber
+
+# Species keys that only change the price of individual log diameter classes.
+_PER_DIAMETER_KEYS = ("DiameterPrices", "LengthCorrectionsPercent")
+
+
+def _cutting_pattern(sections_json: str) -> List[tuple]:
+    """Return the cut positions and qualities of a stored solution."""
+    return [
+        (s["start_point"], s["end_point"], s["quality"]) for s in json.loads(str(sections_json))
+    ]
+
+
+def _changed_diameter_classes(
+    old: Optional[Dict[str, Any]], new: Optional[Dict[str, Any]]
+) -> Optional[Set[int]]:
+    """
+    Return the log diameter classes whose prices differ between two species blocks.
+
+    ``None`` means the change is not limited to individual diameter classes
+    (e.g. new quality outcomes or a different diameter range).
+    """
+    if old is None or new is None:
+        return set() if old is new else None
+    for key in (set(old) | set(new)) - set(_PER_DIAMETER_KEYS):
+        if old.get(key) != new.get(key):
+            return None
+
+    old_prices, new_prices = old["DiameterPrices"], new["DiameterPrices"]
+    if (min(old_prices), max(old_prices)) != (min(new_prices), max(new_prices)):
+        return None
+    changed = {
+        int(d)
+        for d in set(old_prices) | set(new_prices)
+        if list(old_prices.get(d, ())) != list(new_prices.get(d, ()))
+    }
+    old_corr = old.get("LengthCorrectionsPercent", {})
+    new_corr = new.get("LengthCorrectionsPercent", {})
+    changed.update(
+        int(d) for d in set(old_corr) | set(new_corr) if old_corr.get(d) != new_corr.get(d)
+    )
+    return changed
+
+
+def price_data_changes(
+    old_price_data: Dict[str, Any],
+    new_price_data: Dict[str, Any],
+    species_list: Iterable[str],
+) -> Dict[str, Optional[Set[int]]]:
+    """
+    Summarise how a new price list affects each species.
+
+    Returns a mapping from species to the set of log diameter classes (cm)
+    whose butt/middle/top prices or length corrections changed. ``None``
+    means every stem of that species may be affected: the ``Common`` block,
+    the species' pulpwood price or one of its non-diameter settings changed.
+    An empty set means the species is unaffected.
+    """
+    old_common = dict(old_price_data["Common"])
+    new_common = dict(new_price_data["Common"])
+    old_pulp = PulpPricelist()
+    old_pulp._prices = old_common.pop("PulpwoodPrices")
+    new_pulp = PulpPricelist()
+    new_pulp._prices = new_common.pop("PulpwoodPrices")
+    common_changed = old_common != new_common
+
+    changes: Dict[str, Optional[Set[int]]] = {}
+    for sp in species_list:
+        if common_changed or old_pulp.getPulpwoodPrice(sp) != new_pulp.getPulpwoodPrice(sp):
+            changes[sp] = None
+        else:
+            changes[sp] = _changed_diameter_classes(old_price_data.get(sp), new_price_data.get(sp))
+    return changes
+
+
+def _stump_diameters(
+    taper_model: Type[Taper], species: str, heights: np.ndarray, dbhs: np.ndarray
+) -> np.ndarray:
+    """
+    Return the diameter at stump height, the largest log diameter, of every grid stem.
+
+    The result has shape ``(len(heights), len(dbhs))`` and holds float32
+    diameters at the stump height, as the bucking grid evaluates them with
+    ``get_diameter_vectorised``. Edgren–Nylinder stems are evaluated together
+    with `EdgrenNylinder1949Batch`; other models, and grids the batch
+    rejects, stem by stem. Stems the taper model rejects with a
+    ``ValueError`` get ``inf``, so they are always regenerated.
+    """
+    from pyforestry.sweden.taper import EdgrenNylinder1949, EdgrenNylinder1949Batch
+
+    height, dbh = (
+        grid.ravel()
+        for grid in np.meshgrid(
+            np.asarray(heights, dtype=float), np.asarray(dbhs, dtype=float), indexing="ij"
+        )
+    )
+    shape = (len(heights), len(dbhs))
+    if taper_model is EdgrenNylinder1949:
+        try:
+            batch = EdgrenNylinder1949Batch(species, dbh, height)
+        except ValueError:
+            pass  # some stems are invalid; they are found stem by stem below
+        else:
+            # Stump height as set by `SweTimber`; float32 like the bucking grid.
+            stumps = batch.diameter((0.01 * height)[:, None])[:, 0]
+            return stumps.astype(np.float32).reshape(shape)
+
+    stumps = np.full(height.shape, np.inf, dtype=np.float32)
+    for i, (h, d) in enumerate(zip(height.tolist(), dbh.tolist(), strict=True)):
+        try:
+            timber = SweTimber(species=species, diameter_cm=d, height_m=h)
+            taper = taper_model(timber)
+        except ValueError:  # stem not supported by the model
+            continue
+        stumps[i] = taper.get_diameter_vectorised(np.array([timber.stump_height_m]))[0]
+    return stumps.reshape(shape)
+
+
+def changed_cells(
+    cube: SolutionCube,
+    old_price_data: Dict[str, Any],
+    new_price_data: Dict[str, Any],
+    taper_model: Union[str, Type[Taper]],
+) -> xr.DataArray:
+    """
+    Return a boolean mask of the cube cells that a price change can affect.
+
+    A log is priced by its integer top diameter, which never exceeds the stem
+    diameter at stump height. A change limited to diameter classes ``D``
+    therefore only affects stems whose stump diameter is at least ``min(D)``.
+    The mask is conservative: unmarked cells keep their optimal solution.
+    """
+    taper_model = get_taper_model(taper_model)
+    coords = cube.dataset.coords
+    species = [str(sp) for sp in coords["species"].values]
+    heights = coords["height"].values
+    dbhs = coords["dbh"].values
+    mask = np.zeros((len(species), len(heights), len(dbhs)), dtype=bool)
+
+    changes = price_data_changes(old_price_data, new_price_data, species)
+    for s, sp in enumerate(species):
+        classes = changes[sp]
+        if classes is None:
+            mask[s] = True
+            continue
+        if not classes:
+            continue
+        mask[s] = ~(_stump_diameters(taper_model, sp, heights, dbhs) < min(classes))
+
+    return xr.DataArray(mask, dims=_CUBE_DIMS, coords={d: coords[d] for d in _CUBE_DIMS})
+
+
+def compare_cubes(old: SolutionCube, new: SolutionCube) -> xr.Dataset:
+    """
+    Compare two cubes generated on the same grid, cell by cell.
+
+    The result holds the old and new ``total_value``, their difference
+    ``value_delta`` (new minus old), the ``relative_delta`` (NaN where the old
+    value is zero) and ``pattern_changed``, which is true where the optimal
+    cut positions or log qualities differ.
+    """
+    for dim in _CUBE_DIMS:
+        if not np.array_equal(old.dataset.coords[dim].values, new.dataset.coords[dim].values):
+            raise ValueError(f"Cannot compare solution cubes with different '{dim}' coordinates.")
+
+    old_value = old.dataset["total_value"].transpose(*_CUBE_DIMS).astype(float)
+    new_value = new.dataset["total_value"].transpose(*_CUBE_DIMS).astype(float)
+    old_sections = old._section_strings()
+    new_sections = new._section_strings()
+    changed = np.fromiter(
+        (
+            a != b and _cutting_pattern(a) != _cutting_pattern(b)
+            for a, b in zip(old_sections, new_sections, strict=True)
+        ),
+        dtype=bool,
+        count=len(old_sections),
+    ).reshape(old_value.shape)
+
+    delta = new_value - old_value
+    return xr.Dataset(
+        {
+            "old_value": old_value,
+            "new_value": new_value,
+            "value_delta": delta,
+            "relative_delta": delta / old_value.where(old_value != 0),
+            "pattern_changed": (_CUBE_DIMS, changed),
+        },
+        attrs={
+            "old_pricelist_hash": old.pricelist_hash,
+            "new_pricelist_hash": new.pricelist_hash,
+        },
+    )
+
+
+def regenerate_cube(
+    cube: SolutionCube,
+    old_price_data: Dict[str, Any],
+    new_price_data: Dict[str, Any],
+    taper_model: Optional[Union[str, Type[Taper]]] = None,
+    workers: int = -1,
+    block_size: Optional[int] = None,
+) -> SolutionCube:
+    """
+    Return ``cube`` re-solved for ``new_price_data``, recomputing only changed cells.
+
+    Cells outside `changed_cells` are copied from ``cube``; the rest are
+    bucked again with the same grid. ``cube`` must have been generated from
+    ``old_price_data`` with ``taper_model``, which defaults to the registered
+    model named in the cube's attributes.
+    """
+    if cube.pricelist_hash != _hash_pricelist(old_price_data):
+        raise ValueError("The cube was not generated with the old pricelist.")
+    if taper_model is None:
+        taper_model = cube.taper_model_class()
+    taper_model = get_taper_model(taper_model)
+    name = taper_model_name(taper_model)
+    if cube.taper_model != name:
+        raise ValueError(f"The cube was generated with {cube.taper_model}, not {name}.")
+    if workers == -1:
+        workers = cpu_count()
+
+    mask = changed_cells(cube, old_price_data, new_price_data, taper_model)
+    cells = np.flatnonzero(mask.values)
+    print(f"Regenerating {len(cells)} of {mask.size} cells.")
+
+    coords = cube.dataset.coords
+    grid = (
+        [str(sp) for sp in coords["species"].values],
+        np.round(coords["height"].values * 10).astype(int),
+        coords["dbh"].values.astype(int),
+    )
+    total_value = np.array(
+        cube.dataset["total_value"].transpose(*_CUBE_DIMS).values, dtype=float
+    ).ravel()
+    solution_sections = np.array(cube._section_strings(), dtype=object)
+    if len(cells):
+        _solve_cells(
+            new_price_data,
+            taper_model,
+            grid,
+            cells,
+            total_value,
+            solution_sections,
+            workers,
+            block_size,
+        )
+
+    shape = mask.shape
+    ds = xr.Dataset(
+        {
+            "total_value": (_CUBE_DIMS, total_value.reshape(shape)),
+            "solution_sections": (_CUBE_DIMS, solution_sections.reshape(shape)),
+        },
+        coords={d: coords[d].values for d in _CUBE_DIMS},
+        attrs=dict(cube.dataset.attrs),
+    )
+    ds.attrs["pricelist_hash"] = _hash_pricelist(new_price_data)
+    ds.attrs["creation_date_utc"] = datetime.now(timezone.utc).isoformat()
+    ds.attrs["regenerated_cells"] = int(len(cells))
+    return SolutionCube(ds)
@@ -0,0 +1,249 @@
+"""
+Immutable, compiled snapshots of price lists.
+
+A `FrozenPricelist` copies a `Pricelist`, compiles every dense lookup table
+up front and refuses later changes. Its ``fingerprint`` is a SHA-256 hash of
+the canonical price content, so it is stable across processes and Python
+sessions and can key caches of solution cubes or value tables. Snapshots
+pickle as plain data, which makes them cheap to ship to worker pools.
+"""
+
+import hashlib
+import json
+from enum import Enum
+from typing import Any, Dict, Mapping
+
+import numpy as np
+
+from pyforestry.base.helpers.tree_species import TreeName
+from pyforestry.base.pricelist.pricelist import (
+    LengthCorrections,
+    Pricelist,
+    PulpPricelist,
+    TimberPriceForDiameter,
+    TimberPricelist,
+)
+
+
+def canonical_price_data(obj: Any) -> Any:
+    """
+    JSON-ready canonical form of price data.
+
+    Mapping keys become their JSON text, so ``13`` and ``"13"`` stay
+    distinct, and are sorted. `TreeName` objects become their full name,
+    NumPy values and enums their Python values, tuples lists, and integral
+    floats integers, so equal prices hash equally whatever their type.
+    """
+    if isinstance(obj, Mapping):
+        return {
+            json.dumps(canonical_price_data(key), sort_keys=True): canonical_price_data(value)
+            for key, value in obj.items()
+        }
+    if isinstance(obj, TreeName):
+        return obj.full_name
+    if isinstance(obj, Enum):
+        return canonical_price_data(obj.value)
+    if isinstance(obj, np.ndarray):
+        return canonical_price_data(obj.tolist())
+    if isinstance(obj, np.generic):
+        return canonical_price_data(obj.item())
+    if isinstance(obj, (list, tuple)):
+        return [canonical_price_data(value) for value in obj]
+    if isinstance(obj, float) and obj.is_integer():
+        return int(obj)
+    if obj is None or isinstance(obj, (str, int, float)):
+        return obj
+    raise TypeError(f"Cannot fingerprint price data of type {type(obj).__name__}.")
+
+
+def price_data_fingerprint(obj: Any) -> str:
+    """SHA-256 hex digest of `canonical_price_data` of ``obj``."""
+    encoded = json.dumps(canonical_price_data(obj), sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(encoded.encode()).hexdigest()
+
+
+class _FrozenDict(dict):
+    """A ``dict`` that refuses changes but still pickles as a plain mapping."""
+
+    def _immutable(self, *args, **kwargs):
+        """Raise for any method that would change the mapping."""
+        raise TypeError(f"{type(self).__name__} is immutable.")
+
+    __setitem__ = __delitem__ = __ior__ = _immutable
+    clear = pop = popitem = setdefault = update = _immutable
+
+    def __reduce__(self):
+        """Pickle as this type rebuilt from a plain ``dict``."""
+        return type(self), (dict(self),)
+
+
+class _Frozen:
+    """Mixin refusing attribute changes once ``_freeze`` has been called."""
+
+    _frozen = False
+
+    def _freeze(self) -> None:
+        """Refuse attribute changes from now on."""
+        object.__setattr__(self, "_frozen", True)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        """Set an attribute unless the object is frozen."""
+        if self._frozen:
+            raise AttributeError(f"{type(self).__name__} is immutable.")
+        super().__setattr__(name, value)
+
+    def __delattr__(self, name: str) -> None:
+        """Delete an attribute unless the object is frozen."""
+        if self._frozen:
+            raise AttributeError(f"{type(self).__name__} is immutable.")
+        super().__delattr__(name)
+
+
+class _FrozenTimberPrice(_Frozen, TimberPriceForDiameter):
+    """Immutable butt, middle and top prices for one diameter class."""
+
+    def __init__(self, butt_price: float, middle_price: float, top_price: float):
+        """Store the three prices and freeze."""
+        super().__init__(butt_price, middle_price, top_price)
+        self._freeze()
+
+
+class _FrozenLengthCorrections(_Frozen, LengthCorrections):
+    """Immutable length correction table, compiled when it is created."""
+
+    def __init__(self, corrections: Mapping[int, Mapping[int, int]]):
+        """Copy ``corrections``, compile the lookup table and freeze."""
+        super().__init__(
+            _FrozenDict({diameter: _FrozenDict(row) for diameter, row in corrections.items()})
+        )
+        self.compiled  # noqa: B018 - build the lookup table before freezing
+        self._freeze()
+
+
+class _FrozenTimberPricelist(_Frozen, TimberPricelist):
+    """Immutable, compiled copy of a `TimberPricelist`."""
+
+    def __init__(self, source: TimberPricelist):
+        """Copy the prices and tables of ``source``, compile them and freeze."""
+        super().__init__(source.min_diameter, source.max_diameter, source.volume_type)
+        self._price_by_diameter = _FrozenDict(
+            {
+                diameter: _FrozenTimberPrice(entry.butt_price, entry.middle_price, entry.top_price)
+                for diameter, entry in source._price_by_diameter.items()
+            }
+        )
+        self.length_corrections = _FrozenLengthCorrections(source.length_corrections.corrections)
+        self.quality_outcome = _FrozenDict(
+            {key: tuple(value) for key, value in source.quality_outcome.items()}
+        )
+        self.downgrade_proportions = _FrozenDict(source.downgrade_proportions)
+        self.max_height_quality1 = source.max_height_quality1
+        self.max_height_quality2 = source.max_height_quality2
+        self.max_height_quality3 = source.max_height_quality3
+        self.compiled  # noqa: B018 - build the lookup table before freezing
+        self._freeze()
+
+    def _content(self) -> Dict[str, Any]:
+        """Timber price content hashed into the fingerprint."""
+        return {
+            "MinDiameter": self.min_diameter,
+            "MaxDiameter": self.max_diameter,
+            "VolumeType": self.volume_type,
+            "DiameterPrices": {
+                diameter: [entry.butt_price, entry.middle_price, entry.top_price]
+                for diameter, entry in self._price_by_diameter.items()
+            },
+            "LengthCorrectionsPercent": self.length_corrections.corrections,
+            "QualityOutcome": self.quality_outcome,
+            "DowngradeProportions": self.downgrade_proportions,
+            "MaxHeight": {
+                "Butt": self.max_height_quality1,
+                "Middle": self.max_height_quality2,
+                "Top": self.max_height_quality3,
+            },
+        }
+
+
+class _FrozenPulpPricelist(_Frozen, PulpPricelist):
+    """Immutable pulpwood prices with every species resolved up front."""
+
+    def __init__(self, prices: Mapping):
+        """Copy ``prices``, resolve the price of every species and freeze."""
+        super().__init__()
+        self._prices = _FrozenDict(prices)
+        self.species_price_array  # noqa: B018 - resolve every species before freezing
+        self._resolved = _FrozenDict(self.species_prices)
+        self._freeze()
+
+
+class FrozenPricelist(_Frozen, Pricelist):
+    """
+    Immutable snapshot of a `Pricelist` with a stable content ``fingerprint``.
+
+    Every timber price list and length correction table is compiled when the
+    snapshot is taken, and any later attempt to change prices, ranges or
+    tables raises. The snapshot works wherever a `Pricelist` is expected
+    (bucking, `Pricelist.price_logs`, `SolutionCube.generate`), and equal
+    price content gives an equal ``fingerprint`` in any process.
+
+    Note that the fingerprint hashes the loaded price content, not the raw
+    price dictionary, so it differs from the hash of a cube generated from
+    the dictionary itself.
+    """
+
+    def __init__(self, source: Pricelist):
+        """:param source: Price list to copy; later changes to it do not affect the snapshot."""
+        super().__init__()
+        self.Timber = _FrozenDict(
+            {name: _FrozenTimberPricelist(timber) for name, timber in source.Timber.items()}
+        )
+        self.PulpLogDiameter = source.PulpLogDiameter
+        self.Pulp = _FrozenPulpPricelist(source.Pulp._prices)
+        self.TopDiameter = source.TopDiameter
+        self.LogCullPrice = source.LogCullPrice
+        self.FuelWoodPrice = source.FuelWoodPrice
+        self.HighStumpHeight = source.HighStumpHeight
+        self.PulpLogLength = source.PulpLogLength
+        self.TimberLogLength = source.TimberLogLength
+        self.fingerprint = price_data_fingerprint(self._content())
+        self._freeze()
+
+    def _content(self) -> Dict[str, Any]:
+        """Price content hashed into the fingerprint."""
+        return {
+            "Common": {
+                "PulpLogDiameterRange": (self.PulpLogDiameter.Min, self.PulpLogDiameter.Max),
+                "TopDiameter": self.TopDiameter,
+                "HarvestResiduePrice": self.LogCullPrice,
+                "FuelwoodLogPrice": self.FuelWoodPrice,
+                "HighStumpHeight": self.HighStumpHeight,
+                "PulpwoodLengthRange": (self.PulpLogLength.Min, self.PulpLogLength.Max),
+                "SawlogLengthRange": (self.TimberLogLength.Min, self.TimberLogLength.Max),
+                "PulpwoodPrices": self.Pulp._prices,
+            },
+            "Timber": {name: timber._content() for name, timber in self.Timber.items()},
+        }
+
+    def __eq__(self, other: object) -> bool:
+        """Snapshots are equal when their fingerprints are."""
+        if not isinstance(other, FrozenPricelist):
+            return NotImplemented
+        return self.fingerprint == other.fingerprint
+
+    def __hash__(self) -> int:
+        """Hash of the fingerprint."""
+        return hash(self.fingerprint)
+
+    def __repr__(self) -> str:
+        """Return the species and the start of the fingerprint."""
+        return (
+            f"FrozenPricelist(species={list(self.Timber)}, fingerprint={self.fingerprint[:12]!r})"
+        )
+
+    def load_from_dict(self, price_data: dict):
+        """Raise ``TypeError``; a snapshot cannot be reloaded."""
+        raise TypeError("FrozenPricelist is immutable; load a new Pricelist and freeze it.")
+
+    def freeze(self) -> "FrozenPricelist":
+        """Return this snapshot; it is already frozen."""
+        return self
@@ -1,17 +1,24 @@
 from dataclasses import dataclass
 from enum import IntEnum
-from typing import Dict, Iterable, List, Optional, Sequence, Union
+from typing import TYPE_CHECKING, Dict, Iterable, List, Mapping, Optional, Sequence, Union
 
-from pyforestry.base.helpers.tree_species import TreeName, parse_tree_species
+import numpy as np
+import numpy.typing as npt
 
+from pyforestry.base.helpers.bucking import QualityType
+from pyforestry.base.helpers.tree_species import GLOBAL_TREE_SPECIES, TreeName
 
-@dataclass
+if TYPE_CHECKING:
+    from pyforestry.base.pricelist.frozen import FrozenPricelist
+
+
+@dataclass(frozen=True)
 class DiameterRange:
     Min: float
     Max: float
 
 
-@dataclass
+@dataclass(frozen=True)
 class LengthRange:
     Min: float
     Max: float
@@ -40,6 +47,164 @@ class TimberPriceForDiameter:
             return 0.0
 
 
+def _integer_keys(keys: Iterable, what: str) -> np.ndarray:
+    """Sorted keys as an integer array; keys must be non-negative integers."""
+    keys = np.array(sorted(keys), dtype=float)
+    if np.any(keys < 0) or np.any(keys != np.floor(keys)):
+        raise ValueError(f"{what} must be non-negative integers, got {keys.tolist()}.")
+    return keys.astype(np.intp)
+
+
+def _floor_table(keys: np.ndarray) -> np.ndarray:
+    """
+    Dense lookup table for sorted non-negative integer ``keys``.
+
+    Entry ``i`` is the position of the largest key ``<= i`` (-1 below the
+    first key), for every integer up to the largest key.
+    """
+    size = keys[-1] + 1 if len(keys) else 0
+    return np.searchsorted(keys, np.arange(size), side="right") - 1
+
+
+def _floor_lookup(table: np.ndarray, values: npt.ArrayLike) -> np.ndarray:
+    """Position of the largest key ``<= value`` from a `_floor_table` (-1 for none or NaN)."""
+    values = np.asarray(values, dtype=float)
+    if len(table) == 0:
+        return np.full(values.shape, -1, dtype=np.intp)
+    with np.errstate(invalid="ignore"):
+        position = np.clip(np.floor(values), -1, len(table) - 1)
+    position = np.nan_to_num(position, nan=-1).astype(np.intp)
+    return np.where(position >= 0, table[np.maximum(position, 0)], -1)
+
+
+def _read_only(*arrays: np.ndarray) -> None:
+    for array in arrays:
+        array.setflags(write=False)
+
+
+@dataclass(frozen=True)
+class CompiledTimberPrices:
+    """
+    Dense array form of the diameter-class prices of a `TimberPricelist`.
+
+    ``prices[i, part]`` is the price of log part ``part`` (butt, middle, top)
+    in the ``i``-th diameter class of ``diameter_classes``; its last row is
+    zero and stands for "no class". ``class_index`` maps every integer
+    diameter up to the largest class to the index of the largest class not
+    above it (-1 below the first class), so a diameter lookup is one integer
+    index.
+    """
+
+    diameter_classes: np.ndarray
+    class_index: np.ndarray
+    prices: np.ndarray
+
+    @classmethod
+    def build(
+        cls, price_by_diameter: Mapping[int, TimberPriceForDiameter]
+    ) -> "CompiledTimberPrices":
+        """Compile a ``{diameter class: TimberPriceForDiameter}`` mapping."""
+        classes = _integer_keys(price_by_diameter, "Diameter classes")
+        rows = [
+            [price_by_diameter[key].price_for_log_part(part) for part in range(3)]
+            for key in sorted(price_by_diameter)
+        ]
+        dtype = np.result_type(*(value for row in rows for value in row)) if rows else np.int64
+        prices = np.zeros((len(classes) + 1, 3), dtype=dtype)
+        if rows:
+            prices[:-1] = rows
+        class_index = _floor_table(classes)
+        _read_only(classes, class_index, prices)
+        return cls(classes, class_index, prices)
+
+    def diameter_class_index(self, diameter_cm: npt.ArrayLike) -> np.ndarray:
+        """Index of the largest class ``<= diameter_cm`` (-1 when there is none)."""
+        return _floor_lookup(self.class_index, diameter_cm)
+
+    def nearest_diameter_class(self, diameter_cm: npt.ArrayLike) -> np.ndarray:
+        """Largest class ``<= diameter_cm``, or 0 when there is none."""
+        index = self.diameter_class_index(diameter_cm)
+        classes = np.append(self.diameter_classes, 0)
+        return classes[index]
+
+    def _part_prices(self, index: np.ndarray, log_part: npt.ArrayLike) -> np.ndarray:
+        """Prices at class ``index`` (-1 for none); log parts other than 0-2 give 0."""
+        index, log_part = np.broadcast_arrays(index, np.asarray(log_part, dtype=np.intp))
+        valid_part = (log_part >= 0) & (log_part <= 2)
+        return self.prices[np.where(valid_part, index, -1), np.where(valid_part, log_part, 0)]
+
+    def prices_for(self, log_part: npt.ArrayLike, diameter_cm: npt.ArrayLike) -> np.ndarray:
+        """Vectorised `TimberPricelist.price_for_log_part` (nearest lower class)."""
+        # Diameters below every class are priced as class 0, as in the object API.
+        diameter_cm = np.fmax(np.asarray(diameter_cm, dtype=float), 0.0)
+        return self._part_prices(self.diameter_class_index(diameter_cm), log_part)
+
+    def exact_prices(self, log_part: npt.ArrayLike, diameter: npt.ArrayLike) -> np.ndarray:
+        """Vectorised ``pricelist[diameter].price_for_log_part(log_part)`` (exact classes only)."""
+        diameter = np.asarray(diameter, dtype=float)
+        index = self.diameter_class_index(diameter)
+        exact = np.append(self.diameter_classes, -1)[index] == diameter
+        return self._part_prices(np.where(exact, index, -1), log_part)
+
+
+# Returned by `TimberPricelist.__getitem__` for diameters without prices.
+_NO_PRICE = TimberPriceForDiameter(0, 0, 0)
+
+
+@dataclass(frozen=True)
+class CompiledLengthCorrections:
+    """
+    Dense array form of `LengthCorrections`.
+
+    ``corrections[d, i]`` is the correction for diameter ``d`` (cm) and the
+    ``i``-th entry of ``lengths``, already carried forward from the next
+    shorter length of that diameter; rows of diameters without corrections
+    are 0. ``length_index`` maps every integer length up to the longest one to
+    the column of the largest length not above it (-1 below the first).
+    """
+
+    lengths: np.ndarray
+    length_index: np.ndarray
+    corrections: np.ndarray
+
+    @classmethod
+    def build(cls, corrections: Mapping[int, Mapping[int, float]]) -> "CompiledLengthCorrections":
+        """Compile a ``{diameter: {length: correction}}`` mapping."""
+        diameters = _integer_keys(corrections, "Length correction diameters")
+        lengths = _integer_keys(
+            {length for row in corrections.values() for length in row}, "Correction lengths"
+        )
+        values = [value for row in corrections.values() for value in row.values()]
+        dtype = np.result_type(*values) if values else np.int64
+        table = np.zeros((diameters[-1] + 2 if len(diameters) else 1, len(lengths) + 1), dtype)
+        for diameter, row in corrections.items():
+            row_lengths = _integer_keys(row, "Correction lengths")
+            row_values = np.array([row[length] for length in sorted(row)] + [0], dtype=dtype)
+            # Lengths without their own entry use the next shorter one of this row.
+            table[int(diameter), :-1] = row_values[
+                _floor_lookup(_floor_table(row_lengths), lengths)
+            ]
+        length_index = _floor_table(lengths)
+        _read_only(lengths, length_index, table)
+        return cls(lengths, length_index, table)
+
+    def lookup(self, diameter: npt.ArrayLike, length: npt.ArrayLike) -> np.ndarray:
+        """
+        Corrections for arrays of diameters and lengths.
+
+        Diameters must match a key exactly; lengths are floored to the
+        nearest shorter key. Anything without a correction gives 0.
+        """
+        diameter, length = np.broadcast_arrays(
+            np.asarray(diameter, dtype=float), np.asarray(length, dtype=float)
+        )
+        # The last row and column of the table are zero.
+        exact = (diameter >= 0) & (diameter < len(self.corrections) - 1)
+        exact &= diameter == np.floor(diameter)
+        row = np.where(exact, diameter, -1).astype(np.intp)
+        return self.corrections[row, _floor_lookup(self.length_index, length)]
+
+
 class LengthCorrections:
     """
     Holds logic for how the length modifies price (absolute or percent).
@@ -47,28 +212,37 @@ class LengthCorrections:
     Now accepts a dictionary of corrections in the form::
 
         {diameter: {length: correction_percentage, ...}, ...}
+
+    Lookups read from a `CompiledLengthCorrections` built on first use and
+    rebuilt when ``corrections`` is reassigned (not when it is edited in place).
     """
 
     def __init__(self, corrections: Optional[Dict[int, Dict[int, int]]] = None):
         self.corrections = corrections or {}
 
+    @property
+    def corrections(self) -> Dict[int, Dict[int, int]]:
+        return self._corrections
+
+    @corrections.setter
+    def corrections(self, corrections: Dict[int, Dict[int, int]]) -> None:
+        self._corrections = corrections
+        self._compiled: Optional[CompiledLengthCorrections] = None
+
+    @property
+    def compiled(self) -> CompiledLengthCorrections:
+        """The dense array form of the corrections."""
+        if self._compiled is None:
+            self._compiled = CompiledLengthCorrections.build(self._corrections)
+        return self._compiled
+
     def get_length_correction(self, diameter: int, log_part: Optional[int], length: int) -> int:
         """
         Returns the correction percentage for a given diameter and log length.
         Looks up the corrections dictionary for the closest available length (floored).
         Returns 0 if no correction applies.
         """
-        if diameter not in self.corrections:
-            return 0
-        length_dict = self.corrections[diameter]
-        # Get all lengths that are <= provided length
-        available_lengths = sorted(
-            length_val for length_val in length_dict.keys() if length_val <= length
-        )
-        if available_lengths:
-            nearest_length = max(available_lengths)
-            return length_dict[nearest_length]
-        return 0  # no suitable correction
+        return self.compiled.lookup(diameter, length).item()
 
 
 class TimberPricelist:
@@ -85,6 +259,7 @@ class TimberPricelist:
         self.max_diameter = max_diameter
         self.volume_type = volume_type  # e.g. "m3to" or "m3fub"
         self._price_by_diameter: Dict[int, TimberPriceForDiameter] = {}
+        self._compiled: Optional[CompiledTimberPrices] = None
         # Default length corrections (can be replaced when data is loaded)
         self.length_corrections = LengthCorrections()
         # Placeholders for additional data:
@@ -97,12 +272,25 @@ class TimberPricelist:
         self.max_height_quality3 = 99.9
 
     def __getitem__(self, diameter: int) -> TimberPriceForDiameter:
-        """Return the price structure for a given diameter."""
-        return self._price_by_diameter.get(diameter, TimberPriceForDiameter(0, 0, 0))
+        """Return the price structure for a given diameter (a shared zero entry on misses)."""
+        return self._price_by_diameter.get(diameter, _NO_PRICE)
 
     def set_price_for_diameter(self, diameter: int, price_struct: TimberPriceForDiameter):
         """Store a price entry for a certain diameter class."""
         self._price_by_diameter[diameter] = price_struct
+        self._compiled = None
+
+    @property
+    def compiled(self) -> "CompiledTimberPrices":
+        """
+        Dense array form of the diameter-class prices, built on first use.
+
+        It is rebuilt after `set_price_for_diameter`; editing a stored
+        `TimberPriceForDiameter` in place is not tracked.
+        """
+        if self._compiled is None:
+            self._compiled = CompiledTimberPrices.build(self._price_by_diameter)
+        return self._compiled
 
     @property
     def minDiameter(self):
@@ -134,9 +322,7 @@ class TimberPricelist:
         Get the price for a given log part (Butt, Middle, Top) at a given diameter (cm).
         Rounds or floors the diameter to the nearest available diameter class.
         """
-        diameter_class = self.get_nearest_diameter_class(diameter_cm)
-        price_struct = self[diameter_class]
-        return price_struct.price_for_log_part(log_part)
+        return self.compiled.prices_for(log_part, diameter_cm).item()
 
     def get_nearest_diameter_class(self, diameter_cm: float) -> int:
         """
@@ -144,54 +330,100 @@ class TimberPricelist:
         If the requested diameter is smaller than ``min``, returns ``min``.
         If larger than ``max``, returns ``max``.
         """
-        available_classes = sorted(self._price_by_diameter.keys())
-        suitable_classes = [d for d in available_classes if d <= diameter_cm]
-
-        if suitable_classes:
-            return max(suitable_classes)
-        else:
-            return 0  # smallest available class
+        return self.compiled.nearest_diameter_class(diameter_cm).item()
 
 
 class PulpPricelist:
-    """Placeholder for pulp prices per species."""
+    """
+    Pulpwood prices per species, keyed by species full name or genus name.
+
+    Every species of ``GLOBAL_TREE_SPECIES`` is resolved once (full name,
+    then genus, then the default price) when prices are first looked up,
+    and lookups read from the result. It is rebuilt when ``_prices`` is
+    reassigned (not when it is edited in place).
+    """
+
+    #: Price of species with neither a species nor a genus price.
+    default_price = 200
 
     def __init__(self):
         self._prices = {}
 
+    @property
+    def _prices(self) -> dict:
+        return self._pulp_prices
+
+    @_prices.setter
+    def _prices(self, prices: dict) -> None:
+        self._pulp_prices = prices
+        self._resolved: Optional[Dict[str, float]] = None
+        self._species_price_array: Optional[np.ndarray] = None
+
+    def _resolve(self, species: TreeName) -> float:
+        """Price of ``species`` by full name, then genus, then the default."""
+        full_name_key = species.full_name.lower()
+        if full_name_key in self._prices:
+            return self._prices[full_name_key]
+        # Fallback: look up by genus
+        genus_key = species.genus.name.lower()
+        if genus_key in self._prices:
+            return self._prices[genus_key]
+        return self.default_price
+
+    @property
+    def species_prices(self) -> Dict[str, float]:
+        """Resolved price of every global species, by full name."""
+        if self._resolved is None:
+            self._resolved = {sp.full_name: self._resolve(sp) for sp in GLOBAL_TREE_SPECIES}
+        return self._resolved
+
+    @property
+    def species_price_array(self) -> np.ndarray:
+        """Resolved prices indexed by `tree_species_codes` (read-only)."""
+        if self._species_price_array is None:
+            prices = np.array(list(self.species_prices.values()))
+            _read_only(prices)
+            self._species_price_array = prices
+        return self._species_price_array
+
     def getPulpwoodPrice(self, species: Union[str, TreeName]) -> int:
         """
         Try to find the price for a species by first looking for a full name match.
         If none is found, look for a match on just the genus.
         Returns a default price if no match is found.
         """
-        # Ensure we have a TreeName object
         if isinstance(species, str):
-            try:
-                species_obj = parse_tree_species(species)
-            except ValueError:
-                # Could not parse full species; treat the string as a genus.
-                species_obj = None
-        else:
-            species_obj = species
-
-        if species_obj:
-            full_name_key = species_obj.full_name.lower()
-            if full_name_key in self._prices:
-                return self._prices[full_name_key]
-            else:
-                # Fallback: look up by genus
-                genus_key = species_obj.genus.name.lower()
-                if genus_key in self._prices:
-                    return self._prices[genus_key]
-        else:
-            # When species_obj is None, try matching the input as a genus.
-            NotImplementedError("TODO: Implement species via genus")
-            # if normalized in self._prices:
-            #    return self._prices[normalized]
+            # Strings that are not a known species get the default price.
+            return self.species_prices.get(species.strip().lower(), self.default_price)
+        price = self.species_prices.get(species.full_name)
+        return self._resolve(species) if price is None else price
+
+    def pulpwood_prices(self, species_codes: npt.ArrayLike) -> np.ndarray:
+        """Vectorised `getPulpwoodPrice` for arrays of `tree_species_codes`."""
+        codes = np.asarray(species_codes, dtype=np.intp)
+        prices = self.species_price_array
+        if codes.size and (codes.min() < 0 or codes.max() >= len(prices)):
+            raise ValueError(f"Species codes must be in [0, {len(prices)}).")
+        return prices[codes]
+
+
+@dataclass(frozen=True)
+class LogPrices:
+    """
+    Prices of a batch of logs from `Pricelist.price_logs`.
+
+    All arrays have one entry per log. ``assortment`` holds the
+    `QualityType` each log was priced as, ``price_per_m3`` the price (SEK)
+    per m³ in the unit of that assortment's price list, and ``value`` the
+    value of the log (SEK).
+    """
+
+    assortment: np.ndarray
+    price_per_m3: np.ndarray
+    value: np.ndarray
+
 
-        # Default price if no match is found.
-        return 200
+_TIMBER_PARTS = (QualityType.ButtLog, QualityType.MiddleLog, QualityType.TopLog)
 
 
 class Pricelist:
@@ -231,6 +463,12 @@ class Pricelist:
         except Exception as e:
             raise ValueError(f"Error loading price data: {e}") from e
 
+    def freeze(self) -> "FrozenPricelist":
+        """Immutable, compiled snapshot of this price list; see `FrozenPricelist`."""
+        from pyforestry.base.pricelist.frozen import FrozenPricelist
+
+        return FrozenPricelist(self)
+
     def _load_species_specific_data(self, price_data: dict, species_key: str):
         """Helper to load data for a single species."""
         timber_data = price_data[species_key]
@@ -261,6 +499,109 @@ class Pricelist:
 
         self.Timber[species_key] = timber_pricelist
 
+    def price_logs(
+        self,
+        species: npt.ArrayLike,
+        log_part: npt.ArrayLike,
+        top_diameter_cm: npt.ArrayLike,
+        length_m: npt.ArrayLike,
+        volume_m3: npt.ArrayLike,
+        species_names: Optional[Sequence[str]] = None,
+    ) -> LogPrices:
+        """
+        Price arrays of logs in one call.
+
+        Diameters are floored to whole cm and lengths rounded to dm. Timber
+        logs (butt, middle and top `QualityType`) inside the species' timber
+        diameter range and the saw log length range, whose diameter is itself
+        a diameter class, get the price of that class plus the length
+        correction of that exact diameter. This is the rule of the bucking
+        optimiser's value table, which prices diameters between classes at 0
+        and so never makes them timber. ``m3to`` prices are per m³ of the
+        top-diameter cylinder, ``m3fub`` prices per m³ of ``volume_m3``. Logs
+        that do not qualify, and logs marked as pulp or undefined, fall back
+        to pulpwood when they are within the pulp diameter and length ranges,
+        otherwise to log cull; fuelwood logs get the fuelwood price. Pulp,
+        cull and fuelwood are valued per m³ of ``volume_m3``.
+
+        :param species: Species names, or integer codes into ``species_names``
+            (by default the timber species in load order).
+        :param log_part: `QualityType` code of every log.
+        :param top_diameter_cm: Top diameter (cm).
+        :param length_m: Log length (m).
+        :param volume_m3: Solid volume (m³fub) of every log.
+        :return: `LogPrices` with the assortment, price and value of each log.
+        """
+        species = np.asarray(species)
+        if species.dtype.kind in "iu":
+            names = list(self.Timber) if species_names is None else list(species_names)
+            codes = species
+            if codes.size and (codes.min() < 0 or codes.max() >= len(names)):
+                raise ValueError(f"Species codes must index {names}.")
+        else:
+            unique, codes = np.unique(species, return_inverse=True)
+            names, codes = unique.tolist(), codes.reshape(species.shape)
+        codes, part, diameter, length, volume = np.broadcast_arrays(
+            codes,
+            np.asarray(log_part, dtype=np.intp),
+            np.floor(np.asarray(top_diameter_cm, dtype=float)),
+            np.asarray(length_m, dtype=float),
+            np.asarray(volume_m3, dtype=float),
+        )
+        length_dm = np.rint(length * 10)
+
+        assortment = np.full(part.shape, QualityType.LogCull.value, dtype=np.uint8)
+        price = np.full(part.shape, float(self.LogCullPrice))
+        value = np.zeros(part.shape)
+        timber_part = np.isin(part, _TIMBER_PARTS)
+        pulp_size = (
+            (diameter >= self.PulpLogDiameter.Min)
+            & (diameter <= self.PulpLogDiameter.Max)
+            & (length_dm >= int(round(self.PulpLogLength.Min * 10)))
+            & (length_dm <= int(round(self.PulpLogLength.Max * 10)))
+        )
+        pulp_part = timber_part | (part == QualityType.Pulp) | (part == QualityType.Undefined)
+
+        for code, name in enumerate(names):
+            in_species = codes == code
+            if not in_species.any():
+                continue
+            timber = self.Timber.get(name)
+            priced = np.zeros(part.shape, dtype=bool)
+            if timber is not None:
+                priced = (
+                    in_species
+                    & timber_part
+                    & (diameter >= timber.min_diameter)
+                    & (diameter <= timber.max_diameter)
+                    & (length_dm >= int(round(self.TimberLogLength.Min * 10)))
+                    & (length_dm <= int(round(self.TimberLogLength.Max * 10)))
+                    & np.isin(diameter, timber.compiled.diameter_classes)
+                )
+                d, dm = diameter[priced], length_dm[priced]
+                log_price = timber.compiled.exact_prices(
+                    part[priced] - QualityType.ButtLog, d
+                ) + timber.length_corrections.compiled.lookup(d, dm)
+                if timber.volume_type == "m3to":
+                    r = (d / 100) * 0.5
+                    log_volume = np.pi * r * r * (dm / 10)
+                else:
+                    log_volume = volume[priced]
+                assortment[priced] = part[priced]
+                price[priced] = log_price
+                value[priced] = log_price * log_volume
+
+            pulp = in_species & ~priced & pulp_part & pulp_size
+            assortment[pulp] = QualityType.Pulp.value
+            price[pulp] = self.Pulp.getPulpwoodPrice(name)
+
+        fuel = part == QualityType.Fuelwood
+        assortment[fuel] = QualityType.Fuelwood.value
+        price[fuel] = self.FuelWoodPrice
+        by_volume = ~np.isin(assortment, _TIMBER_PARTS)
+        value[by_volume] = price[by_volume] * volume[by_volume]
+        return LogPrices(assortment, price, value)
+
 
 def create_pricelist_from_data(
     price_data: dict, species_to_load: Optional[Union[str, Sequence[str]]] = None
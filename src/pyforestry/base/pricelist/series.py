@@ -0,0 +1,266 @@
+"""
+Price lists over several periods.
+
+A `PricelistSeries` holds one compiled `FrozenPricelist` per period, each
+with the date from which it applies. Periods may come from separate price
+lists or from one price list and trend functions. All periods share the
+bucking structure of the first (log length and diameter ranges, timber
+diameter limits, volume types and species), so a tree can be bucked
+against every period in one pass of the optimiser, see
+`Nasberg_1985_BranchBound.calculate_period_values`.
+"""
+
+import hashlib
+from bisect import bisect_right
+from datetime import date
+from typing import Any, Callable, Iterable, Iterator, Optional, Sequence, Tuple
+
+import numpy as np
+import numpy.typing as npt
+
+from pyforestry.base.pricelist.frozen import FrozenPricelist
+from pyforestry.base.pricelist.pricelist import (
+    LengthCorrections,
+    LogPrices,
+    Pricelist,
+    TimberPriceForDiameter,
+    TimberPricelist,
+    create_pricelist_from_data,
+)
+
+#: Price factor as a function of the years since the first period.
+PriceTrend = Callable[[float], float]
+
+_DAYS_PER_YEAR = 365.25
+
+
+def compound_trend(annual_rate: float) -> PriceTrend:
+    """Trend growing prices by ``annual_rate`` (e.g. 0.02 for 2 %) per year."""
+    return lambda years: (1.0 + annual_rate) ** years
+
+
+def _bucking_structure(pricelist: Pricelist) -> Tuple[Any, ...]:
+    """Everything except prices that the bucking optimiser depends on."""
+    timber = {
+        name: (
+            tp.min_diameter,
+            tp.max_diameter,
+            tp.volume_type,
+            tp.max_height_quality1,
+            tp.max_height_quality2,
+            tp.max_height_quality3,
+        )
+        for name, tp in pricelist.Timber.items()
+    }
+    return (
+        pricelist.PulpLogDiameter,
+        pricelist.PulpLogLength,
+        pricelist.TimberLogLength,
+        pricelist.TopDiameter,
+        pricelist.HighStumpHeight,
+        timber,
+    )
+
+
+def _scaled_pricelist(pricelist: Pricelist, timber_factor: float, pulp_factor: float) -> Pricelist:
+    """
+    Copy of ``pricelist`` with scaled prices.
+
+    Timber prices and length corrections are scaled by ``timber_factor``;
+    pulpwood, fuelwood and harvest residue prices by ``pulp_factor``.
+    """
+    scaled = Pricelist()
+    scaled.PulpLogDiameter = pricelist.PulpLogDiameter
+    scaled.PulpLogLength = pricelist.PulpLogLength
+    scaled.TimberLogLength = pricelist.TimberLogLength
+    scaled.TopDiameter = pricelist.TopDiameter
+    scaled.HighStumpHeight = pricelist.HighStumpHeight
+    scaled.LogCullPrice = pricelist.LogCullPrice * pulp_factor
+    scaled.FuelWoodPrice = pricelist.FuelWoodPrice * pulp_factor
+    scaled.Pulp._prices = {
+        key: price * pulp_factor for key, price in pricelist.Pulp._prices.items()
+    }
+    for name, tp in pricelist.Timber.items():
+        timber = TimberPricelist(tp.min_diameter, tp.max_diameter, tp.volume_type)
+        for diameter, entry in tp._price_by_diameter.items():
+            timber.set_price_for_diameter(
+                diameter,
+                TimberPriceForDiameter(
+                    entry.butt_price * timber_factor,
+                    entry.middle_price * timber_factor,
+                    entry.top_price * timber_factor,
+                ),
+            )
+        timber.length_corrections = LengthCorrections(
+            {
+                diameter: {length: value * timber_factor for length, value in row.items()}
+                for diameter, row in tp.length_corrections.corrections.items()
+            }
+        )
+        timber.quality_outcome = dict(tp.quality_outcome)
+        timber.downgrade_proportions = dict(tp.downgrade_proportions)
+        timber.max_height_quality1 = tp.max_height_quality1
+        timber.max_height_quality2 = tp.max_height_quality2
+        timber.max_height_quality3 = tp.max_height_quality3
+        scaled.Timber[name] = timber
+    return scaled
+
+
+class PricelistSeries:
+    """
+    Sequence of price lists, each effective from a date until the next.
+
+    Every period is stored as a compiled `FrozenPricelist`. Only prices may
+    differ between periods; ranges, diameter limits, volume types and
+    species must match the first period so that bucking can share its taper
+    and volume work across periods.
+    """
+
+    def __init__(self, periods: Iterable[Tuple[date, Pricelist]]):
+        """:param periods: ``(effective date, price list)`` pairs, in any order."""
+        periods = sorted(periods, key=lambda period: period[0])
+        if not periods:
+            raise ValueError("A price list series needs at least one period.")
+        dates = [effective for effective, _ in periods]
+        if len(set(dates)) != len(dates):
+            raise ValueError("Price list periods must have distinct effective dates.")
+        pricelists = [pricelist.freeze() for _, pricelist in periods]
+        structure = _bucking_structure(pricelists[0])
+        for effective, pricelist in zip(dates[1:], pricelists[1:], strict=True):
+            if _bucking_structure(pricelist) != structure:
+                raise ValueError(
+                    f"The price list effective {effective} differs from the first period in "
+                    "more than its prices; ranges, diameter limits, volume types and species "
+                    "must be the same in every period."
+                )
+        self._dates: Tuple[date, ...] = tuple(dates)
+        self._pricelists: Tuple[FrozenPricelist, ...] = tuple(pricelists)
+
+    @classmethod
+    def from_trends(
+        cls,
+        pricelist: Pricelist,
+        dates: Sequence[date],
+        timber_trend: Optional[PriceTrend] = None,
+        pulp_trend: Optional[PriceTrend] = None,
+    ) -> "PricelistSeries":
+        """
+        Series of ``pricelist`` with prices following trend functions.
+
+        Each trend maps the years since the first date to a price factor;
+        ``timber_trend`` scales timber prices and length corrections,
+        ``pulp_trend`` pulpwood, fuelwood and harvest residue prices.
+        Without trends every period has the prices of ``pricelist``.
+        """
+        if not dates:
+            raise ValueError("A price list series needs at least one period.")
+        start = min(dates)
+        periods = []
+        for effective in dates:
+            years = (effective - start).days / _DAYS_PER_YEAR
+            timber_factor = timber_trend(years) if timber_trend else 1.0
+            pulp_factor = pulp_trend(years) if pulp_trend else 1.0
+            periods.append((effective, _scaled_pricelist(pricelist, timber_factor, pulp_factor)))
+        return cls(periods)
+
+    @classmethod
+    def from_data(
+        cls,
+        price_data: dict,
+        dates: Sequence[date],
+        timber_trend: Optional[PriceTrend] = None,
+        pulp_trend: Optional[PriceTrend] = None,
+        apply_trends: Optional[bool] = None,
+    ) -> "PricelistSeries":
+        """
+        Series of a price dictionary, as in `from_trends`.
+
+        ``apply_trends`` defaults to the ``ApplyPriceTrends`` flag of the
+        ``Common`` block; when it is false the trends are not applied and
+        every period has the prices of ``price_data``.
+        """
+        if apply_trends is None:
+            apply_trends = bool(price_data.get("Common", {}).get("ApplyPriceTrends", False))
+        if not apply_trends:
+            timber_trend = pulp_trend = None
+        return cls.from_trends(
+            create_pricelist_from_data(price_data), dates, timber_trend, pulp_trend
+        )
+
+    @property
+    def dates(self) -> Tuple[date, ...]:
+        """Effective date of each period, in order."""
+        return self._dates
+
+    @property
+    def pricelists(self) -> Tuple[FrozenPricelist, ...]:
+        """Price list of each period, in order."""
+        return self._pricelists
+
+    @property
+    def years(self) -> np.ndarray:
+        """Years from the first effective date to each period, e.g. for discounting."""
+        start = self._dates[0]
+        return np.array([(d - start).days / _DAYS_PER_YEAR for d in self._dates])
+
+    @property
+    def fingerprint(self) -> str:
+        """SHA-256 of the dates and price list fingerprints of all periods."""
+        digest = hashlib.sha256()
+        for effective, pricelist in zip(self._dates, self._pricelists, strict=True):
+            digest.update(f"{effective.isoformat()}:{pricelist.fingerprint};".encode())
+        return digest.hexdigest()
+
+    def __len__(self) -> int:
+        """Number of price periods."""
+        return len(self._pricelists)
+
+    def __getitem__(self, period: int) -> FrozenPricelist:
+        """Price list of period number ``period``."""
+        return self._pricelists[period]
+
+    def __iter__(self) -> Iterator[Tuple[date, FrozenPricelist]]:
+        """Iterate over ``(effective date, price list)`` pairs."""
+        return iter(zip(self._dates, self._pricelists, strict=True))
+
+    def __repr__(self) -> str:
+        """Return the number of periods and the first and last dates."""
+        return f"PricelistSeries(periods={len(self)}, dates={self._dates[0]}..{self._dates[-1]})"
+
+    def period_index(self, at: date) -> int:
+        """Index of the period in effect on ``at``."""
+        index = bisect_right(self._dates, at) - 1
+        if index < 0:
+            raise ValueError(f"No price list is in effect on {at}; the first is {self._dates[0]}.")
+        return index
+
+    def pricelist_at(self, at: date) -> FrozenPricelist:
+        """The price list in effect on ``at``."""
+        return self._pricelists[self.period_index(at)]
+
+    def price_logs(
+        self,
+        species: npt.ArrayLike,
+        log_part: npt.ArrayLike,
+        top_diameter_cm: npt.ArrayLike,
+        length_m: npt.ArrayLike,
+        volume_m3: npt.ArrayLike,
+        species_names: Optional[Sequence[str]] = None,
+    ) -> LogPrices:
+        """
+        `Pricelist.price_logs` in every period.
+
+        The arrays of the result get a leading period axis. Assortments are
+        the same in every period, since periods share their ranges.
+        """
+        results = [
+            pricelist.price_logs(
+                species, log_part, top_diameter_cm, length_m, volume_m3, species_names
+            )
+            for pricelist in self._pricelists
+        ]
+        return LogPrices(
+            assortment=np.stack([result.assortment for result in results]),
+            price_per_m3=np.stack([result.price_per_m3 for result in results]),
+            value=np.stack([result.value for result in results]),
+        )
@@ -4,110 +4,369 @@ import hashlib
 import json
 import time
 from datetime import datetime, timezone
-from functools import partial
 from multiprocessing import Pool, cpu_count
-from typing import Any, Dict, Optional, Tuple, Type
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple, Type, Union
 
 import numpy as np
-import pandas as pd
 import xarray as xr
 from tqdm import tqdm
 
+from pyforestry.base.pricelist.frozen import FrozenPricelist, price_data_fingerprint
 from pyforestry.base.pricelist.pricelist import create_pricelist_from_data
+from pyforestry.base.taper.registry import get_taper_model, taper_model_name
 from pyforestry.base.taper.taper import Taper
-from pyforestry.base.timber_bucking.nasberg_1985 import BuckingConfig, Nasberg_1985_BranchBound
+from pyforestry.base.timber_bucking.nasberg_1985 import (
+    BuckingConfig,
+    Nasberg_1985_BranchBound,
+    QualityType,
+)
 
 # Import your project's classes
 from pyforestry.sweden.timber.swe_timber import SweTimber
 
+#: Price data accepted by cubes: a price dictionary or a frozen price list.
+PricelistSource = Union[Dict[str, Any], FrozenPricelist]
 
-def _hash_pricelist(price_data: Dict[str, Any]) -> str:
-    """Creates a SHA256 hash of a pricelist dictionary for validation."""
+
+def _hash_pricelist(price_data: PricelistSource) -> str:
+    """
+    Creates a SHA256 hash of a pricelist dictionary for validation.
+
+    A `FrozenPricelist` is hashed by its fingerprint. Dictionaries that plain
+    JSON cannot encode, e.g. with `TreeName` or mixed-type keys, are hashed
+    by `price_data_fingerprint`.
+    """
+    if isinstance(price_data, FrozenPricelist):
+        return price_data.fingerprint
     # Using json.dumps with sort_keys ensures a consistent string representation
     dhash = hashlib.sha256()
-    encoded = json.dumps(price_data, sort_keys=True).encode()
+    try:
+        encoded = json.dumps(price_data, sort_keys=True).encode()
+    except TypeError:
+        return price_data_fingerprint(price_data)
     dhash.update(encoded)
     return dhash.hexdigest()
 
 
-def _worker_buck_one_tree(
-    tree_params: Tuple[str, int, int], pricelist_data: Dict, taper_model_class: Type[Taper]
-):
+# --- Parallel generation -----------------------------------------------------
+# Each worker process builds the pricelist and a template optimiser once per
+# species (see ``_init_worker``) and then bucks contiguous blocks of grid cells.
+# Blocks come back as NumPy arrays; the section JSON is assembled once in the
+# parent, which keeps the per-cell pickling overhead small.
+_SECTION_DTYPE = np.dtype(
+    [
+        ("start_point", np.int64),
+        ("end_point", np.int64),
+        ("volume", np.float64),
+        ("top_diameter", np.float64),
+        ("value", np.float64),
+        ("timber_proportion", np.float64),
+        ("pulp_proportion", np.float64),
+        ("cull_proportion", np.float64),
+        ("fuelwood_proportion", np.float64),
+        ("quality", np.int8),
+    ]
+)
+# Key order of ``CrossCutSection.__dict__`` in the stored JSON.
+_SECTION_FIELDS = (
+    "start_point",
+    "end_point",
+    "volume",
+    "top_diameter",
+    "value",
+    "species_group",
+    "timber_proportion",
+    "pulp_proportion",
+    "cull_proportion",
+    "fuelwood_proportion",
+    "quality",
+)
+
+
+_MAX_BLOCK_SIZE = 512
+
+_WORKER_STATE: Dict[str, Any] = {}
+
+
+def _init_worker(
+    pricelist_data: PricelistSource,
+    taper_model_class: Type[Taper],
+    grid: Tuple[list, np.ndarray, np.ndarray],
+) -> None:
+    """
+    Pool initializer: build one pricelist per species for this process.
+
+    A `FrozenPricelist` is already compiled and is shared by all species.
+    """
+    species, heights_dm, dbhs = grid
+    pricelists: Dict[str, Any] = {}
+    errors: Dict[str, Exception] = {}
+    for sp in species:
+        if isinstance(pricelist_data, FrozenPricelist):
+            pricelists[sp] = pricelist_data
+            continue
+        try:
+            pricelists[sp] = create_pricelist_from_data(pricelist_data, sp)
+        except Exception as e:
+            errors[sp] = e
+    _WORKER_STATE.clear()
+    _WORKER_STATE.update(
+        taper_model_class=taper_model_class,
+        species=list(species),
+        heights_dm=np.asarray(heights_dm),
+        dbhs=np.asarray(dbhs),
+        pricelists=pricelists,
+        errors=errors,
+        optimizers={},
+    )
+
+
+def _worker_optimizer(species: str, timber: SweTimber) -> Nasberg_1985_BranchBound:
+    """Return an optimiser for ``timber`` reusing the per-species value table."""
+    if species in _WORKER_STATE["errors"]:
+        raise _WORKER_STATE["errors"][species]
+    template = _WORKER_STATE["optimizers"].get(species)
+    if template is None:
+        template = Nasberg_1985_BranchBound(
+            timber, _WORKER_STATE["pricelists"][species], _WORKER_STATE["taper_model_class"]
+        )
+        _WORKER_STATE["optimizers"][species] = template
+        return template
+    return template.for_timber(timber)
+
+
+def _section_record(section) -> tuple:
+    """Return ``section`` as a row of ``_SECTION_DTYPE``."""
+    return tuple(getattr(section, name) for name in _SECTION_DTYPE.names)
+
+
+def _worker_buck_block(
+    indices: np.ndarray,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Buck the grid cells at the flat ``indices`` (species-major grid order).
+
+    Returns the indices, the total value per cell (NaN on failure), the number
+    of sections per cell and all sections as one ``_SECTION_DTYPE`` array.
     """
-    A top-level function for a single tree optimization.
-    This is what each parallel process will execute.
+    species = _WORKER_STATE["species"]
+    heights_dm = _WORKER_STATE["heights_dm"]
+    dbhs = _WORKER_STATE["dbhs"]
+    shape = (len(species), len(heights_dm), len(dbhs))
+    config = BuckingConfig(save_sections=True)
+
+    values = np.full(len(indices), np.nan)
+    counts = np.zeros(len(indices), dtype=np.int32)
+    records = []
+    for i, (s, h, d) in enumerate(zip(*np.unravel_index(indices, shape), strict=True)):
+        sp = species[s]
+        dbh_cm = int(dbhs[d])
+        height_m = int(heights_dm[h]) / 10.0
+        try:
+            timber = SweTimber(species=sp, diameter_cm=dbh_cm, height_m=height_m)
+            result = _worker_optimizer(sp, timber).calculate_tree_value(
+                min_diam_dead_wood=99, config=config
+            )
+            rows = [_section_record(sec) for sec in result.sections or []]
+        except Exception as e:
+            # Log or handle errors for specific tree combinations
+            print(f"Error processing {sp} DBH={dbh_cm} H={height_m}: {e}")
+            continue
+        values[i] = result.total_value
+        counts[i] = len(rows)
+        records.extend(rows)
+    return indices, values, counts, np.array(records, dtype=_SECTION_DTYPE)
+
+
+def _sections_json(records: np.ndarray, species_group: str) -> str:
+    """Encode section ``records`` the way ``CrossCutSection.__dict__`` serialises."""
+    sections = []
+    for rec in records.tolist():
+        section = dict(zip(_SECTION_DTYPE.names, rec, strict=True))
+        section["species_group"] = species_group
+        sections.append({name: section[name] for name in _SECTION_FIELDS})
+    return json.dumps(sections)
+
+
+def _auto_block_size(n_cells: int, workers: int) -> int:
+    """Return a block size giving each worker about four blocks to balance load."""
+    return max(1, min(_MAX_BLOCK_SIZE, -(-n_cells // (workers * 4))))
+
+
+def _solve_cells(
+    pricelist_data: PricelistSource,
+    taper_model: Type[Taper],
+    grid: Tuple[list, np.ndarray, np.ndarray],
+    cells: np.ndarray,
+    total_value: np.ndarray,
+    solution_sections: np.ndarray,
+    workers: int,
+    block_size: Optional[int] = None,
+) -> None:
     """
-    species, dbh_cm, height_dm = tree_params
-    height_m = height_dm / 10.0
+    Buck the flat grid ``cells`` and write the results into the flat arrays.
 
+    ``cells`` is split into contiguous blocks that are solved by a process
+    pool initialised with `_init_worker`, or in-process when ``workers == 1``.
+    """
+    species, heights_dm, dbhs = grid
+    cells_per_species = len(heights_dm) * len(dbhs)
+    species_groups = [sp.lower() for sp in species]
+    if block_size is None:
+        block_size = _auto_block_size(len(cells), workers)
+    blocks = [cells[start : start + block_size] for start in range(0, len(cells), block_size)]
+
+    # Run the optimizations in parallel
+    start_time = time.time()
+    initargs = (pricelist_data, taper_model, grid)
+    if workers == 1:
+        _init_worker(*initargs)
+        results = map(_worker_buck_block, blocks)
+        pool = None
+    else:
+        pool = Pool(processes=workers, initializer=_init_worker, initargs=initargs)
+        results = pool.imap_unordered(_worker_buck_block, blocks, chunksize=1)
     try:
-        timber = SweTimber(species=species, diameter_cm=dbh_cm, height_m=height_m)
-        pricelist = create_pricelist_from_data(
-            pricelist_data,
-            species,
-        )
-        optimizer = Nasberg_1985_BranchBound(timber, pricelist, taper_model_class)
+        with tqdm(total=len(cells), desc="Generating Solution Cube") as progress:
+            for indices, values, counts, records in results:
+                total_value[indices] = values
+                offsets = np.concatenate(([0], np.cumsum(counts)))
+                for i, flat in enumerate(indices):
+                    sections = "[]"
+                    if counts[i]:
+                        sp = species_groups[flat // cells_per_species]
+                        sections = _sections_json(records[offsets[i] : offsets[i + 1]], sp)
+                    solution_sections[flat] = sections
+                progress.update(len(indices))
+    finally:
+        if pool is not None:
+            pool.close()
+            pool.join()
+    end_time = time.time()
+    print(f"\nFinished parallel computation in {end_time - start_time:.2f} seconds.")
+
+
+# --- Flat binary ("memory-mapped") cube layout -------------------------------
+# A cube saved with ``SolutionCube.save_mmap`` is a directory holding one
+# ``.npy`` array per numeric variable, the cutting sections as a single UTF-8
+# blob plus an offsets array, and a small JSON header. ``species`` is the
+# leading axis, so every species slice is one contiguous block on disk.
+_MMAP_FORMAT = "pyforestry-solutioncube"
+_MMAP_VERSION = 1
+_MMAP_META = "meta.json"
+_MMAP_VALUES = "total_value.npy"
+_MMAP_OFFSETS = "sections_offsets.npy"
+_MMAP_SECTIONS = "sections.bin"
+_CUBE_DIMS = ("species", "height", "dbh")
+
+# Assortments reported by ``SolutionCube.assortment_volumes`` and the section
+# qualities (``QualityType`` values) that make them up.
+ASSORTMENTS = ("sawlog", "pulpwood", "cull", "fuelwood")
+_QUALITY_ASSORTMENT = {
+    QualityType.ButtLog: 0,
+    QualityType.MiddleLog: 0,
+    QualityType.TopLog: 0,
+    QualityType.Pulp: 1,
+    QualityType.LogCull: 2,
+    QualityType.Fuelwood: 3,
+}
+
+
+class _SectionStore:
+    """Read-only view of JSON-encoded cutting sections stored as one blob.
+
+    Both the offsets and the blob are memory-mapped, so decoding a cell only
+    touches the pages holding that cell's bytes.
+    """
 
-        # We need the full result to get the sections
-        result = optimizer.calculate_tree_value(
-            min_diam_dead_wood=99, config=BuckingConfig(save_sections=True)
-        )
+    def __init__(self, offsets: np.ndarray, blob: np.ndarray):
+        """Wrap an ``offsets`` array (length ``n + 1``) and a ``uint8`` blob."""
+        self._offsets = offsets
+        self._blob = blob
 
-        if result.sections is None:
-            sections_data = []
-        else:
-            sections_data = [s.__dict__ for s in result.sections]
+    def __len__(self) -> int:
+        """Return the number of stored cells."""
+        return len(self._offsets) - 1
 
-        sections_json = json.dumps(
-            sections_data, default=lambda o: o.item() if isinstance(o, np.generic) else str(o)
-        )
+    def __getitem__(self, flat_index: int) -> str:
+        """Return the JSON string stored for cell ``flat_index``."""
+        start = int(self._offsets[flat_index])
+        stop = int(self._offsets[flat_index + 1])
+        return self._blob[start:stop].tobytes().decode("utf-8")
 
-        return {
-            "species": species,
-            "dbh": dbh_cm,
-            "height": height_m,
-            "total_value": result.total_value,
-            "solution_sections": sections_json,
-        }
-    except Exception as e:
-        # Log or handle errors for specific tree combinations
-        print(f"Error processing {species} DBH={dbh_cm} H={height_m}: {e}")
-        return {
-            "species": species,
-            "dbh": dbh_cm,
-            "height": height_m,
-            "total_value": np.nan,
-            "solution_sections": "[]",
-        }
+    @classmethod
+    def open(cls, directory: Path) -> "_SectionStore":
+        """Memory-map the section arrays found in ``directory``."""
+        offsets = np.load(directory / _MMAP_OFFSETS, mmap_mode="r")
+        blob_path = directory / _MMAP_SECTIONS
+        if blob_path.stat().st_size > 0:
+            blob = np.memmap(blob_path, dtype=np.uint8, mode="r")
+        else:  # np.memmap cannot map empty files
+            blob = np.empty(0, dtype=np.uint8)
+        return cls(offsets, blob)
+
+    @staticmethod
+    def write(directory: Path, sections) -> None:
+        """Write an iterable of JSON strings to ``directory``."""
+        encoded = [str(s).encode("utf-8") for s in sections]
+        offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+        np.cumsum([len(e) for e in encoded], out=offsets[1:])
+        np.save(directory / _MMAP_OFFSETS, offsets)
+        with open(directory / _MMAP_SECTIONS, "wb") as fh:
+            for e in encoded:
+                fh.write(e)
 
 
 class SolutionCube:
     """Container for precomputed bucking solutions."""
 
-    def __init__(self, dataset: xr.Dataset):
+    def __init__(self, dataset: xr.Dataset, sections: Optional[_SectionStore] = None):
         """
         Initializes the SolutionCube with a loaded xarray Dataset.
         It's recommended to use the `load` classmethod to create instances.
+
+        ``sections`` is only given for memory-mapped cubes, whose cutting
+        sections live outside the dataset and are decoded on demand.
         """
         self.dataset = dataset
         self.pricelist_hash = dataset.attrs.get("pricelist_hash")
         self.taper_model = dataset.attrs.get("taper_model")
+        self._sections = sections
+        self._assortments: Optional[xr.DataArray] = None
+
+    def taper_model_class(self) -> type:
+        """Return the registered taper model the cube was generated with."""
+        if self.taper_model is None:
+            raise ValueError("The solution cube does not record its taper model.")
+        return get_taper_model(self.taper_model)
 
     @classmethod
     def generate(
         cls,
-        pricelist_data: Dict[str, Any],
-        taper_model: Type[Taper],
+        pricelist_data: PricelistSource,
+        taper_model: Union[str, Type[Taper]],
         species_list: list[str],
         dbh_range: Tuple[float, float],
         height_range: Tuple[float, float],
         dbh_step: int = 2,
         height_step: float = 0.2,
         workers: int = -1,
+        block_size: Optional[int] = None,
     ):
         """
         Generates the solution cube by running the optimizer in parallel.
+
+        Every worker process builds the pricelist and value tables once per
+        species and then bucks contiguous blocks of ``block_size`` grid cells.
+        By default the block size is chosen from the grid size and number of
+        workers. ``taper_model`` is a taper model class or the name of a
+        registered model; the registered name is stored in the cube's
+        ``taper_model`` attribute. ``pricelist_data`` may also be a
+        `FrozenPricelist`, which is pickled to the workers as is and whose
+        fingerprint becomes the cube's ``pricelist_hash``.
         """
+        taper_model = get_taper_model(taper_model)
         if workers == -1:
             workers = cpu_count()
         print(f"Generating Solution Cube using {workers} parallel processes...")
@@ -118,44 +377,39 @@ class SolutionCube:
         # Create the grid of all tree parameters to compute
         dbh_coords = np.arange(dbh_range[0], dbh_range[1] + dbh_step, dbh_step)
         height_coords = np.arange(height_range[0], height_range[1] + height_step, height_step)
-
-        tasks = [
-            (sp, int(dbh), int(h * 10))
-            for sp in species_list
-            for dbh in dbh_coords
-            for h in height_coords
-        ]
-
-        print(f"Total trees to process: {len(tasks)}")
-
-        # Use a partial function to pass the static pricelist and taper model to the worker
-        worker_func = partial(
-            _worker_buck_one_tree, pricelist_data=pricelist_data, taper_model_class=taper_model
+        species = sorted(set(species_list))
+        dbhs = np.unique(dbh_coords.astype(int))
+        heights_dm = np.unique(np.round(height_coords * 10).astype(int))
+        grid = (species, heights_dm, dbhs)
+        shape = (len(species), len(heights_dm), len(dbhs))
+        n_cells = int(np.prod(shape))
+        print(f"Total trees to process: {n_cells}")
+
+        total_value = np.full(n_cells, np.nan)
+        solution_sections = np.full(n_cells, "[]", dtype=object)
+        _solve_cells(
+            pricelist_data,
+            taper_model,
+            grid,
+            np.arange(n_cells),
+            total_value,
+            solution_sections,
+            workers,
+            block_size,
         )
 
-        # Run the optimizations in parallel
-        start_time = time.time()
-        with Pool(processes=workers) as pool:
-            # imap_unordered is great for getting results as they complete
-            results = tqdm(
-                list(pool.imap_unordered(worker_func, tasks, chunksize=10)),
-                total=len(tasks),
-                desc="Generating Solution Cube",
-            )
-        end_time = time.time()
-        print(f"\nFinished parallel computation in {end_time - start_time:.2f} seconds.")
-
         # --- Structure the results into an xarray Dataset ---
-        # Convert flat list of dicts to a DataFrame for easier manipulation
-        df = pd.DataFrame(results)
-        df = df.set_index(["species", "height", "dbh"])
-
-        # Convert to an xarray Dataset
-        ds = xr.Dataset.from_dataframe(df)
+        ds = xr.Dataset(
+            {
+                "total_value": (_CUBE_DIMS, total_value.reshape(shape)),
+                "solution_sections": (_CUBE_DIMS, solution_sections.reshape(shape)),
+            },
+            coords={"species": species, "height": heights_dm / 10.0, "dbh": dbhs},
+        )
 
         # Add metadata as attributes
         ds.attrs["pricelist_hash"] = pricelist_hash
-        ds.attrs["taper_model"] = taper_model.__name__
+        ds.attrs["taper_model"] = taper_model_name(taper_model)
         ds.attrs["creation_date_utc"] = datetime.now(timezone.utc).isoformat()
         ds.attrs["dbh_range"] = f"{dbh_range[0]}-{dbh_range[1]} cm"
         ds.attrs["height_range"] = f"{height_range[0]}-{height_range[1]} m"
@@ -169,15 +423,83 @@ class SolutionCube:
         self.dataset.to_netcdf(path)
         print("Save complete.")
 
+    def save_mmap(self, path: Union[str, Path]):
+        """
+        Saves the cube as a directory of flat binary arrays.
+
+        A cube stored this way is opened by `load` with ``numpy`` memory maps:
+        opening costs the same regardless of cube size, processes that open
+        the same directory share its pages through the OS cache, and only the
+        species slices that are actually queried are read from disk.
+        """
+        directory = Path(path)
+        print(f"Saving memory-mapped solution cube to {directory}...")
+        directory.mkdir(parents=True, exist_ok=True)
+
+        ds = self.dataset
+        total_value = ds["total_value"].broadcast_like(ds).transpose(*_CUBE_DIMS)
+        np.save(directory / _MMAP_VALUES, np.ascontiguousarray(total_value.values, dtype=float))
+
+        _SectionStore.write(directory, self._section_strings())
+
+        # The header is written last, so a directory without it is incomplete.
+        meta = {
+            "format": _MMAP_FORMAT,
+            "version": _MMAP_VERSION,
+            "dims": list(_CUBE_DIMS),
+            "coords": {dim: ds.coords[dim].values.tolist() for dim in _CUBE_DIMS},
+            "attrs": dict(ds.attrs),
+        }
+        with open(directory / _MMAP_META, "w", encoding="utf-8") as fh:
+            json.dump(meta, fh, default=str)
+        print("Save complete.")
+
+    def _section_strings(self) -> np.ndarray:
+        """Return the section JSON of every cell, flat in ``_CUBE_DIMS`` order."""
+        ds = self.dataset
+        if "solution_sections" in ds:
+            sections = ds["solution_sections"].broadcast_like(ds).transpose(*_CUBE_DIMS)
+            return sections.values.ravel()
+        n_cells = int(np.prod([ds.sizes[d] for d in _CUBE_DIMS]))
+        if self._sections is not None:
+            return np.array([self._sections[i] for i in range(n_cells)], dtype=object)
+        return np.full(n_cells, "[]", dtype=object)
+
     @classmethod
-    def load(cls, path: str, pricelist_to_verify: Optional[Dict] = None):
-        """Loads a solution cube from a netCDF file."""
+    def _open_mmap(cls, directory: Path) -> "SolutionCube":
+        """Open a directory written by `save_mmap` without reading its arrays."""
+        with open(directory / _MMAP_META, encoding="utf-8") as fh:
+            meta = json.load(fh)
+        if meta.get("format") != _MMAP_FORMAT:
+            raise ValueError(f"{directory} is not a memory-mapped solution cube.")
+        if meta.get("version") != _MMAP_VERSION:
+            raise ValueError(f"Unsupported solution cube version: {meta.get('version')}")
+
+        dims = tuple(meta["dims"])
+        total_value = np.load(directory / _MMAP_VALUES, mmap_mode="r")
+        ds = xr.Dataset(
+            {"total_value": (dims, total_value)},
+            coords={dim: np.asarray(meta["coords"][dim]) for dim in dims},
+            attrs=meta["attrs"],
+        )
+        return cls(ds, sections=_SectionStore.open(directory))
+
+    @classmethod
+    def load(cls, path: Union[str, Path], pricelist_to_verify: Optional[PricelistSource] = None):
+        """
+        Loads a solution cube from a netCDF file or a `save_mmap` directory.
+
+        Directories are opened memory-mapped; see `save_mmap`.
+        """
         print(f"Loading solution cube from {path}...")
-        ds = xr.open_dataset(path)
+        if Path(path).is_dir():
+            cube = cls._open_mmap(Path(path))
+        else:
+            cube = cls(xr.open_dataset(path))
 
         if pricelist_to_verify:
             new_hash = _hash_pricelist(pricelist_to_verify)
-            if ds.attrs.get("pricelist_hash") != new_hash:
+            if cube.pricelist_hash != new_hash:
                 raise ValueError(
                     "Pricelist hash mismatch! "
                     "The loaded cube was not generated with the provided pricelist."
@@ -185,7 +507,16 @@ class SolutionCube:
             print("Pricelist hash verified.")
 
         print("Cube loaded successfully.")
-        return cls(ds)
+        return cube
+
+    def _cell_position(self, species: str, dbh: float, height: float) -> Dict[str, int]:
+        """Return integer positions of ``species`` and the nearest dbh/height."""
+        indexes = self.dataset.indexes
+        return {
+            "species": int(indexes["species"].get_loc(species)),
+            "height": int(indexes["height"].get_indexer([height], method="nearest")[0]),
+            "dbh": int(indexes["dbh"].get_indexer([dbh], method="nearest")[0]),
+        }
 
     def lookup(self, species: str, dbh: float, height: float) -> Tuple[float, list]:
         """
@@ -193,11 +524,22 @@ class SolutionCube:
         Uses nearest-neighbor interpolation.
         """
         try:
-            # .sel is xarray's powerful selection method. 'nearest' finds the closest point.
-            solution = self.dataset.sel(species=species, dbh=dbh, height=height, method="nearest")
-
-            total_value = float(solution["total_value"].values)
-            sections_json = str(solution["solution_sections"].values)
+            pos = self._cell_position(species, dbh, height)
+
+            def cell(name: str):
+                var = self.dataset[name]
+                return var.isel({d: pos[d] for d in var.dims}).values
+
+            total_value = float(cell("total_value"))
+
+            if "solution_sections" in self.dataset:
+                sections_json = str(cell("solution_sections"))
+            elif self._sections is not None:
+                shape = tuple(self.dataset.sizes[d] for d in _CUBE_DIMS)
+                flat = np.ravel_multi_index(tuple(pos[d] for d in _CUBE_DIMS), shape)
+                sections_json = self._sections[int(flat)]
+            else:
+                sections_json = "[]"
             sections = json.loads(sections_json)
 
             return total_value, sections
@@ -209,6 +551,31 @@ class SolutionCube:
             print(f"An error occurred during lookup: {e}")
             return 0.0, []
 
+    def assortment_volumes(self) -> xr.DataArray:
+        """
+        Return the volume per assortment of every cell's optimal solution.
+
+        The result has the cube dimensions plus an ``assortment`` dimension
+        (see ``ASSORTMENTS``). Volumes are summed from the stored cutting
+        sections by log quality; they are decoded once and then cached.
+        """
+        if self._assortments is None:
+            ds = self.dataset
+            shape = tuple(ds.sizes[d] for d in _CUBE_DIMS)
+            volumes = np.zeros((int(np.prod(shape)), len(ASSORTMENTS)))
+            for flat, sections_json in enumerate(self._section_strings()):
+                for section in json.loads(str(sections_json)):
+                    column = _QUALITY_ASSORTMENT.get(int(section["quality"]))
+                    if column is not None:
+                        volumes[flat, column] += section["volume"]
+            self._assortments = xr.DataArray(
+                volumes.reshape(shape + (len(ASSORTMENTS),)),
+                dims=_CUBE_DIMS + ("assortment",),
+                coords={**{d: ds.coords[d] for d in _CUBE_DIMS}, "assortment": list(ASSORTMENTS)},
+                name="assortment_volume",
+            )
+        return self._assortments
+
     def lookup_timber_pricelist(self, species: str) -> Tuple[float, list]:
         """Return an arbitrary timber value for ``species`` or warn if missing."""
 
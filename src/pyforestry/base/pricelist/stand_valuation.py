@@ -0,0 +1,190 @@
+"""Value stand diameter distributions against a :class:`SolutionCube`."""
+
+from dataclasses import dataclass
+from typing import Callable, Dict, Mapping, Tuple, Union
+
+import numpy as np
+import xarray as xr
+
+from pyforestry.base.pricelist.solutioncube import _CUBE_DIMS, ASSORTMENTS, SolutionCube
+
+HeightCurve = Callable[[np.ndarray], np.ndarray]
+
+
+@dataclass
+class WeibullDBH:
+    """
+    Weibull diameter distribution of one species, for one or many stands.
+
+    ``F(d) = 1 - exp(-((d - location) / scale) ** shape)``. Every field may
+    be a scalar or an array with one entry per stand.
+    """
+
+    shape: Union[float, np.ndarray]
+    scale: Union[float, np.ndarray]
+    stems_per_ha: Union[float, np.ndarray]
+    location: Union[float, np.ndarray] = 0.0
+
+    def cdf(self, dbh: np.ndarray) -> np.ndarray:
+        """Return ``F(dbh)`` with a leading stand axis."""
+        shape, scale, location = (
+            np.atleast_1d(np.asarray(v, dtype=float))[:, None]
+            for v in (self.shape, self.scale, self.location)
+        )
+        z = np.clip((np.asarray(dbh, dtype=float) - location) / scale, 0.0, None)
+        return 1.0 - np.exp(-(z**shape))
+
+
+@dataclass
+class DBHHistogram:
+    """
+    Stem numbers per diameter class of one species.
+
+    ``dbh`` holds the class midpoints (cm) and ``stems_per_ha`` the stems in
+    each class, both with shape ``(n_classes,)`` or ``(n_stands, n_classes)``.
+    """
+
+    dbh: np.ndarray
+    stems_per_ha: np.ndarray
+
+
+DBHDistribution = Union[WeibullDBH, DBHHistogram]
+
+
+def _grid_edges(nodes: np.ndarray) -> np.ndarray:
+    """Return bin edges halfway between ``nodes``, extended by half a step outside."""
+    nodes = np.asarray(nodes, dtype=float)
+    if len(nodes) == 1:
+        return np.array([nodes[0] - 0.5, nodes[0] + 0.5])
+    mid = 0.5 * (nodes[1:] + nodes[:-1])
+    return np.concatenate(([2 * nodes[0] - mid[0]], mid, [2 * nodes[-1] - mid[-1]]))
+
+
+def _distribution_points(
+    distribution: DBHDistribution, dbh_nodes: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Return quadrature points and stem weights, both ``(n_stands, n_points)``."""
+    if isinstance(distribution, WeibullDBH):
+        # Integrate the density over the bin of every grid node (midpoint rule
+        # on the cube grid). Stems outside the outermost bins stay unassigned.
+        cdf = distribution.cdf(_grid_edges(dbh_nodes))
+        stems = np.atleast_1d(np.asarray(distribution.stems_per_ha, dtype=float))[:, None]
+        weights = stems * np.diff(cdf, axis=1)
+        points = np.broadcast_to(np.asarray(dbh_nodes, dtype=float), weights.shape)
+        return points, weights
+    if isinstance(distribution, DBHHistogram):
+        points = np.atleast_2d(np.asarray(distribution.dbh, dtype=float))
+        weights = np.atleast_2d(np.asarray(distribution.stems_per_ha, dtype=float))
+        return np.broadcast_arrays(points, weights)
+    raise TypeError(f"Unsupported diameter distribution: {type(distribution).__name__}")
+
+
+def _interpolation(nodes: np.ndarray, x: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Return the lower node index and linear weight of the upper node for ``x``."""
+    nodes = np.asarray(nodes, dtype=float)
+    if len(nodes) == 1:
+        return np.zeros(x.shape, dtype=int), np.zeros(x.shape)
+    x = np.clip(x, nodes[0], nodes[-1])
+    lower = np.clip(np.searchsorted(nodes, x, side="right") - 1, 0, len(nodes) - 2)
+    frac = (x - nodes[lower]) / (nodes[lower + 1] - nodes[lower])
+    return lower, frac
+
+
+def _bilinear(surface: np.ndarray, ih, fh, id_, fd) -> np.ndarray:
+    """Interpolate ``surface[height, dbh, ...]`` at the given positions."""
+    nh, nd = surface.shape[:2]
+    ih1 = np.minimum(ih + 1, nh - 1)
+    id1 = np.minimum(id_ + 1, nd - 1)
+    trailing = (1,) * (surface.ndim - 2)
+    fh = fh.reshape(fh.shape + trailing)
+    fd = fd.reshape(fd.shape + trailing)
+    return (
+        surface[ih, id_] * (1 - fh) * (1 - fd)
+        + surface[ih, id1] * (1 - fh) * fd
+        + surface[ih1, id_] * fh * (1 - fd)
+        + surface[ih1, id1] * fh * fd
+    )
+
+
+def value_stands(
+    cube: SolutionCube,
+    distributions: Mapping[str, DBHDistribution],
+    height_curves: Union[HeightCurve, Mapping[str, HeightCurve]],
+) -> xr.Dataset:
+    """
+    Value stand diameter distributions per hectare without individual trees.
+
+    For each species the distribution is reduced to quadrature points on the
+    cube's DBH grid (Weibull distributions) or to its class midpoints
+    (histograms). Heights come from the species' height curve, which is called
+    with a ``(n_stands, n_points)`` DBH array and must broadcast over it. The
+    cube's value and assortment surfaces are then interpolated bilinearly in
+    height and DBH and summed with the stem numbers as weights, for all stands
+    at once.
+
+    Diameters and heights are clipped to the cube grid, except that Weibull
+    stems more than half a DBH step outside the grid are reported in
+    ``stems_outside`` rather than valued; histogram classes outside the grid
+    are counted there too. Cells the cube failed to solve (NaN) count as zero.
+
+    :param cube: Solution cube holding the species to value.
+    :param distributions: Diameter distribution per species.
+    :param height_curves: A height curve shared by all species, or one per species.
+    :return: Dataset with ``value_per_ha`` (stand, species), ``volume_per_ha``
+        (stand, species, assortment) and ``stems_outside`` (stand, species).
+    """
+    if not distributions:
+        raise ValueError("At least one diameter distribution is required.")
+    ds = cube.dataset
+    missing = set(distributions) - set(ds.coords["species"].values.tolist())
+    if missing:
+        raise ValueError(f"Species not in the solution cube: {sorted(missing)}")
+    heights = ds.coords["height"].values.astype(float)
+    dbh_nodes = ds.coords["dbh"].values.astype(float)
+    edges = _grid_edges(dbh_nodes)
+    values = ds["total_value"].transpose(*_CUBE_DIMS)
+    volumes = cube.assortment_volumes()
+
+    results: Dict[str, Tuple[np.ndarray, np.ndarray, np.ndarray]] = {}
+    for species, distribution in distributions.items():
+        curve = height_curves[species] if isinstance(height_curves, Mapping) else height_curves
+        points, stems = _distribution_points(distribution, dbh_nodes)
+        inside = (points >= edges[0]) & (points <= edges[-1])
+        if isinstance(distribution, WeibullDBH):
+            outside = np.atleast_1d(np.asarray(distribution.stems_per_ha, dtype=float))
+            outside = outside - stems.sum(axis=1)
+        else:
+            outside = np.where(inside, 0.0, stems).sum(axis=1)
+        stems = np.where(inside, stems, 0.0)
+
+        tree_heights = np.broadcast_to(np.asarray(curve(points), dtype=float), points.shape)
+        ih, fh = _interpolation(heights, tree_heights)
+        id_, fd = _interpolation(dbh_nodes, points)
+
+        value_surface = np.nan_to_num(values.sel(species=species).values)
+        volume_surface = np.nan_to_num(volumes.sel(species=species).values)
+        tree_value = _bilinear(value_surface, ih, fh, id_, fd)
+        tree_volume = _bilinear(volume_surface, ih, fh, id_, fd)
+        results[species] = (
+            (stems * tree_value).sum(axis=1),
+            np.einsum("sp,spa->sa", stems, tree_volume),
+            outside,
+        )
+
+    species_names = list(results)
+    n_stands = max(len(r[0]) for r in results.values())
+    value = np.stack([np.broadcast_to(results[sp][0], (n_stands,)) for sp in species_names], 1)
+    volume = np.stack(
+        [np.broadcast_to(results[sp][1], (n_stands, len(ASSORTMENTS))) for sp in species_names],
+        axis=1,
+    )
+    outside = np.stack([np.broadcast_to(results[sp][2], (n_stands,)) for sp in species_names], 1)
+    return xr.Dataset(
+        {
+            "value_per_ha": (("stand", "species"), value),
+            "volume_per_ha": (("stand", "species", "assortment"), volume),
+            "stems_outside": (("stand", "species"), outside),
+        },
+        coords={"species": species_names, "assortment": list(ASSORTMENTS)},
+        attrs={"pricelist_hash": cube.pricelist_hash, "taper_model": cube.taper_model},
+    )
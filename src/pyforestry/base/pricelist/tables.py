@@ -0,0 +1,345 @@
+"""
+Price lists from CSV, Parquet and JSON tables.
+
+A price table has one row per price with the columns ``species``, ``part``,
+``diameter``, ``length`` and ``value``. ``part`` is ``butt``, ``middle`` or
+``top`` for the price (SEK/m³) of a diameter class (cm), or
+``length_correction`` for the correction at a diameter and log length
+(dm); ``length`` is empty on price rows. Within a species the diameter
+classes of each part, and the lengths of each correction diameter, must be
+strictly increasing, and every diameter class needs all three parts.
+
+CSV and Parquet tables hold only the prices; the ``Common`` block of the
+price dictionaries and per-species settings (``VolumeType``, ``MaxHeight``,
+``QualityOutcome``, ``DowngradeProportions``) are passed to the loaders. A
+JSON file holds ``{"Common": {...}, "Species": {...}, "Prices": [...]}``
+with the rows as records. Reading Parquet needs ``pyarrow``.
+
+Validated tables are cached as ``<file>.npz`` next to the source and reused
+while the file and the settings are unchanged, so regenerating valuations
+from many price lists skips parsing and validation.
+"""
+
+import csv
+import hashlib
+import json
+import os
+import uuid
+import zipfile
+from pathlib import Path
+from typing import Any, Dict, Mapping, NamedTuple, Optional, Tuple, Union
+
+import numpy as np
+
+from pyforestry.base.pricelist.frozen import FrozenPricelist, price_data_fingerprint
+from pyforestry.base.pricelist.pricelist import create_pricelist_from_data
+
+#: Values of the ``part`` column, in code order.
+PRICE_TABLE_PARTS = ("butt", "middle", "top", "length_correction")
+#: Columns of a price table.
+PRICE_TABLE_COLUMNS = ("species", "part", "diameter", "length", "value")
+
+_CORRECTION = PRICE_TABLE_PARTS.index("length_correction")
+_CACHE_VERSION = 1
+_DEFAULT_MAX_HEIGHT = {"Butt": 99.9, "Middle": 99.9, "Top": 99.9}
+_TABLE_KEYS = ("DiameterPrices", "LengthCorrectionsPercent")
+
+PathLike = Union[str, os.PathLike]
+
+
+class _PriceTable(NamedTuple):
+    """Validated price table; ``length`` is -1 on price rows."""
+
+    species: np.ndarray
+    species_index: np.ndarray
+    part: np.ndarray
+    diameter: np.ndarray
+    length: np.ndarray
+    value: np.ndarray
+
+
+def _numbers(values, column: str) -> np.ndarray:
+    """Column as floats; empty cells become NaN."""
+    try:
+        return np.array([np.nan if v is None or v == "" else v for v in values], dtype=float)
+    except ValueError as exc:
+        raise ValueError(f"Price table column {column!r} must be numeric: {exc}") from exc
+
+
+def _check(bad: np.ndarray, message: str) -> None:
+    """Raise with the (1-based) data rows where ``bad`` holds."""
+    if bad.any():
+        rows = (np.flatnonzero(bad) + 1).tolist()
+        more = f" and {len(rows) - 10} more" if len(rows) > 10 else ""
+        raise ValueError(f"{message} (rows {rows[:10]}{more}).")
+
+
+def _validate(columns: Mapping[str, Any]) -> _PriceTable:
+    """Check a price table column by column and convert it to arrays."""
+    missing = [name for name in PRICE_TABLE_COLUMNS if name != "length" and name not in columns]
+    if missing:
+        raise ValueError(f"Price table is missing the columns {missing}.")
+    n = len(columns["species"])
+    if any(len(columns[name]) != n for name in PRICE_TABLE_COLUMNS if name in columns):
+        raise ValueError("Price table columns must have the same length.")
+
+    species = np.char.lower(np.char.strip(np.asarray(columns["species"], dtype=str)))
+    part_names = np.char.lower(np.char.strip(np.asarray(columns["part"], dtype=str)))
+    diameter = _numbers(columns["diameter"], "diameter")
+    length = _numbers(columns.get("length", [None] * n), "length")
+    value = _numbers(columns["value"], "value")
+
+    names, species_index = np.unique(species, return_inverse=True)
+    part = np.full(n, -1, dtype=np.int8)
+    for code, name in enumerate(PRICE_TABLE_PARTS):
+        part[part_names == name] = code
+    _check(part < 0, f"Unknown log parts; expected one of {list(PRICE_TABLE_PARTS)}")
+    _check(species == "", "Species must not be empty")
+    with np.errstate(invalid="ignore"):
+        _check(
+            ~np.isfinite(diameter) | (diameter < 0) | (diameter != np.floor(diameter)),
+            "Diameter classes must be non-negative integers",
+        )
+        _check(~np.isfinite(value), "Values must be finite numbers")
+        correction = part == _CORRECTION
+        _check(~correction & (value < 0), "Prices must not be negative")
+        _check(
+            correction & (~np.isfinite(length) | (length < 0) | (length != np.floor(length))),
+            "Length corrections need non-negative integer lengths (dm)",
+        )
+    _check(~correction & ~np.isnan(length), "Price rows must not have a length")
+
+    diameter = diameter.astype(np.int64)
+    length = np.where(correction, np.nan_to_num(length, nan=-1), -1).astype(np.int64)
+
+    # Strictly increasing diameters (or lengths) within each group, in file order.
+    groups = np.unique(
+        np.stack([species_index, part, np.where(correction, diameter, -1)], axis=1),
+        axis=0,
+        return_inverse=True,
+    )[1].ravel()
+    order = np.argsort(groups, kind="stable")
+    key = np.where(correction, length, diameter)[order]
+    decreasing = np.zeros(n, dtype=bool)
+    decreasing[order[1:]] = (groups[order][1:] == groups[order][:-1]) & (np.diff(key) <= 0)
+    _check(
+        decreasing,
+        "Diameter classes of each part, and lengths of each correction diameter, "
+        "must be strictly increasing",
+    )
+
+    # Every diameter class of a species has a butt, middle and top price.
+    price_rows = np.flatnonzero(~correction)
+    _, class_of, counts = np.unique(
+        np.stack([species_index[price_rows], diameter[price_rows]], axis=1),
+        axis=0,
+        return_inverse=True,
+        return_counts=True,
+    )
+    incomplete = np.zeros(n, dtype=bool)
+    incomplete[price_rows] = counts[class_of.ravel()] != 3
+    _check(incomplete, "Every diameter class needs a butt, middle and top price")
+    priced = np.isin(species_index, species_index[price_rows])
+    _check(~priced, "Species have length corrections but no prices")
+
+    return _PriceTable(names, species_index, part, diameter, length, value)
+
+
+def _read_columns(path: Path) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    """Raw columns and the settings stored in the file (JSON only)."""
+    suffix = path.suffix.lower()
+    if suffix == ".csv":
+        with path.open(newline="", encoding="utf-8") as handle:
+            reader = csv.DictReader(handle)
+            rows = list(reader)
+            fields = reader.fieldnames or []
+        return {name: [row[name] for row in rows] for name in fields}, {}
+    if suffix in (".parquet", ".pq"):
+        try:
+            import pyarrow.parquet as pq
+        except ImportError as exc:
+            raise ImportError("Reading Parquet price tables needs pyarrow.") from exc
+        return pq.read_table(path).to_pydict(), {}
+    if suffix == ".json":
+        with path.open(encoding="utf-8") as handle:
+            content = json.load(handle)
+        prices = content.get("Prices", [])
+        if isinstance(prices, list):
+            names = {name for row in prices for name in row}
+            prices = {name: [row.get(name) for row in prices] for name in names}
+        settings = {key: content[key] for key in ("Common", "Species") if key in content}
+        return prices, settings
+    raise ValueError(f"Unsupported price table format {path.suffix!r}; use CSV, Parquet or JSON.")
+
+
+def _cache_key(source: bytes, common: Any, species_info: Any) -> str:
+    """Cache key of a table file from its bytes, the cache version and the settings."""
+    digest = hashlib.sha256(source)
+    digest.update(f"v{_CACHE_VERSION}".encode())
+    settings = {"Common": common, "Species": species_info}
+    digest.update(price_data_fingerprint(settings).encode())
+    return digest.hexdigest()
+
+
+def _read_cache(cache: Path, key: str) -> Optional[Tuple[_PriceTable, Dict[str, Any]]]:
+    """The cached table and file settings, or ``None`` if missing or stale."""
+    try:
+        with np.load(cache, allow_pickle=False) as stored:
+            if str(stored["key"]) != key:
+                return None
+            table = _PriceTable(*(stored[name] for name in _PriceTable._fields))
+            settings = json.loads(str(stored["settings"]))
+    except (OSError, KeyError, ValueError, zipfile.BadZipFile):
+        return None
+    return table, settings
+
+
+def _write_cache(cache: Path, key: str, table: _PriceTable, settings: Dict[str, Any]) -> None:
+    """Write the cache atomically; unwritable directories are skipped."""
+    tmp = cache.with_name(f".{cache.name}.{uuid.uuid4().hex}.tmp.npz")
+    try:
+        np.savez(tmp, key=key, settings=json.dumps(settings), **table._asdict())
+        os.replace(tmp, cache)
+    except OSError:
+        tmp.unlink(missing_ok=True)
+
+
+def _price_data(
+    table: _PriceTable, common: Mapping[str, Any], species_info: Mapping[str, Any]
+) -> Dict[str, Any]:
+    """Price dictionary, in the layout of `create_pricelist_from_data`, from a table."""
+    info = {str(name).strip().lower(): settings for name, settings in species_info.items()}
+    prices = table.part != _CORRECTION
+    price_order = np.lexsort((table.part, table.diameter, table.species_index))
+    price_order = price_order[prices[price_order]]
+    triples = table.value[price_order].reshape(-1, 3)
+    classes = table.diameter[price_order][::3]
+    owners = table.species_index[price_order][::3]
+    corrections = np.flatnonzero(~prices)
+
+    data: Dict[str, Any] = {"Common": dict(common)}
+    for index, name in enumerate(table.species.tolist()):
+        timber = {key: value for key, value in info.get(name, {}).items()}
+        timber.setdefault("VolumeType", "m3to")
+        timber.setdefault("MaxHeight", dict(_DEFAULT_MAX_HEIGHT))
+        own = owners == index
+        timber["DiameterPrices"] = {
+            int(d): row
+            for d, row in zip(classes[own].tolist(), triples[own].tolist(), strict=True)
+        }
+        rows: Dict[int, Dict[int, float]] = {}
+        for row in corrections[table.species_index[corrections] == index]:
+            rows.setdefault(int(table.diameter[row]), {})[int(table.length[row])] = float(
+                table.value[row]
+            )
+        if rows:
+            timber["LengthCorrectionsPercent"] = rows
+        data[name] = timber
+    return data
+
+
+def load_price_data(
+    path: PathLike,
+    common: Optional[Mapping[str, Any]] = None,
+    species_info: Optional[Mapping[str, Mapping[str, Any]]] = None,
+    cache: bool = True,
+) -> Dict[str, Any]:
+    """
+    Read a price table into a price dictionary.
+
+    :param path: CSV, Parquet or JSON price table.
+    :param common: The ``Common`` block; required unless a JSON file has one.
+    :param species_info: Per-species settings, e.g.
+        ``{"picea abies": {"VolumeType": "m3to", "MaxHeight": {...}}}``;
+        they override those of a JSON file. ``VolumeType`` defaults to
+        ``"m3to"`` and ``MaxHeight`` to no limit.
+    :param cache: Read and write the ``<file>.npz`` cache next to ``path``.
+    :return: A dictionary in the layout of ``Mellanskog_2013_price_data``.
+    """
+    path = Path(path)
+    source = path.read_bytes()
+    key = _cache_key(source, common, species_info)
+    cache_path = path.with_name(path.name + ".npz")
+    cached = _read_cache(cache_path, key) if cache else None
+    if cached is None:
+        columns, settings = _read_columns(path)
+        table = _validate(columns)
+        if cache:
+            _write_cache(cache_path, key, table, settings)
+    else:
+        table, settings = cached
+
+    common = common if common is not None else settings.get("Common")
+    if common is None:
+        raise ValueError(f"No Common block for the price table {path.name}; pass `common`.")
+    species = {**settings.get("Species", {}), **(species_info or {})}
+    return _price_data(table, common, species)
+
+
+def load_pricelist(
+    path: PathLike,
+    common: Optional[Mapping[str, Any]] = None,
+    species_info: Optional[Mapping[str, Mapping[str, Any]]] = None,
+    cache: bool = True,
+) -> FrozenPricelist:
+    """Read a price table into a compiled `FrozenPricelist`; see `load_price_data`."""
+    return create_pricelist_from_data(load_price_data(path, common, species_info, cache)).freeze()
+
+
+def save_price_table(price_data: Mapping[str, Any], path: PathLike) -> None:
+    """
+    Write the prices of a price dictionary as a CSV, Parquet or JSON table.
+
+    JSON files also store the ``Common`` block and the species settings, so
+    `load_price_data` can read them back without further arguments.
+    """
+    path = Path(path)
+    columns: Dict[str, list] = {name: [] for name in PRICE_TABLE_COLUMNS}
+    species_info = {}
+
+    def add(species, part, diameter, length, value):
+        """Append one row to the table columns."""
+        for name, item in zip(
+            PRICE_TABLE_COLUMNS, (species, part, diameter, length, value), strict=True
+        ):
+            columns[name].append(item)
+
+    for species, timber in price_data.items():
+        if species == "Common":
+            continue
+        species_info[str(species)] = {k: v for k, v in timber.items() if k not in _TABLE_KEYS}
+        for diameter in sorted(timber["DiameterPrices"]):
+            prices = timber["DiameterPrices"][diameter]
+            for part, value in zip(PRICE_TABLE_PARTS[:_CORRECTION], prices, strict=True):
+                add(str(species), part, diameter, None, value)
+        for diameter, row in sorted(timber.get("LengthCorrectionsPercent", {}).items()):
+            for length in sorted(row):
+                add(str(species), PRICE_TABLE_PARTS[_CORRECTION], diameter, length, row[length])
+
+    suffix = path.suffix.lower()
+    if suffix == ".csv":
+        with path.open("w", newline="", encoding="utf-8") as handle:
+            writer = csv.writer(handle)
+            writer.writerow(PRICE_TABLE_COLUMNS)
+            writer.writerows(
+                ["" if item is None else item for item in row]
+                for row in zip(*columns.values(), strict=True)
+            )
+    elif suffix in (".parquet", ".pq"):
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError as exc:
+            raise ImportError("Writing Parquet price tables needs pyarrow.") from exc
+        pq.write_table(pa.table(columns), path)
+    elif suffix == ".json":
+        rows = [
+            dict(zip(columns, row, strict=True)) for row in zip(*columns.values(), strict=True)
+        ]
+        content = {"Common": price_data.get("Common", {}), "Species": species_info, "Prices": rows}
+        with path.open("w", encoding="utf-8") as handle:
+            json.dump(content, handle, indent=1)
+    else:
+        raise ValueError(
+            f"Unsupported price table format {path.suffix!r}; use CSV, Parquet or JSON."
+        )
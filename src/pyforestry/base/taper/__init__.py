@@ -2,4 +2,27 @@
 
 from .taper import Taper
 
-__all__ = ["Taper"]
+# isort: split
+from .cache import TaperCache, TaperCacheStats
+from .conformance import TaperConformance, check_registered_models, check_taper_model
+from .registry import (
+    TaperModel,
+    available_taper_models,
+    get_taper_model,
+    register_taper_model,
+    taper_model_name,
+)
+
+__all__ = [
+    "Taper",
+    "TaperCache",
+    "TaperCacheStats",
+    "TaperConformance",
+    "TaperModel",
+    "available_taper_models",
+    "check_registered_models",
+    "check_taper_model",
+    "get_taper_model",
+    "register_taper_model",
+    "taper_model_name",
+]
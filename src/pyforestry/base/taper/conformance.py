@@ -0,0 +1,150 @@
+"""Conformance and throughput checks for registered taper models."""
+
+import time
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+
+from pyforestry.base.taper.registry import (
+    TaperModelSpec,
+    available_taper_models,
+    get_taper_model,
+    taper_model_name,
+)
+from pyforestry.base.timber import Timber
+
+
+@dataclass
+class TaperConformance:
+    """
+    Result of `check_taper_model` for one model over a set of stems.
+
+    ``max_diameter_increase`` is the largest rise (cm) of the diameter from
+    one height to the next, ``max_volume_error`` the largest difference
+    between a section volume and its numerical integral, relative to the
+    stem volume. Throughputs are evaluations per second. ``stems`` counts the
+    stems that were checked; ``skipped`` describes the stems the model does
+    not support (its constructor raised ``ValueError``), such as species
+    without a bark model.
+    """
+
+    model: str
+    stems: int
+    max_diameter_increase: float
+    max_volume_error: float
+    diameters_per_second: float
+    volumes_per_second: float
+    monotonic_tolerance: float
+    volume_tolerance: float
+    skipped: List[str] = field(default_factory=list)
+
+    @property
+    def monotonic(self) -> bool:
+        """Whether diameters never grow with height beyond the tolerance."""
+        return self.max_diameter_increase <= self.monotonic_tolerance
+
+    @property
+    def volume_consistent(self) -> bool:
+        """Whether section volumes agree with the reference integral."""
+        return self.max_volume_error <= self.volume_tolerance
+
+    @property
+    def passed(self) -> bool:
+        """Whether at least one stem was checked and the model passed both checks."""
+        return self.stems > 0 and self.monotonic and self.volume_consistent
+
+
+def _reference_volumes(taper, h1: np.ndarray, h2: np.ndarray, nodes: int) -> np.ndarray:
+    """Trapezoidal integral of the cross-section area over each section."""
+    t = np.linspace(0.0, 1.0, nodes)
+    heights = h1[:, None] + (h2 - h1)[:, None] * t
+    area = np.pi / 4 * (np.asarray(taper.get_diameter_array(heights), dtype=float) / 100) ** 2
+    return np.sum(0.5 * (area[:, 1:] + area[:, :-1]) * np.diff(heights, axis=1), axis=1)
+
+
+def check_taper_model(
+    model: TaperModelSpec,
+    timbers: Sequence[Timber],
+    points: int = 200,
+    section_length_m: float = 1.0,
+    integration_nodes: int = 401,
+    monotonic_tolerance: float = 1e-9,
+    volume_tolerance: float = 1e-3,
+) -> TaperConformance:
+    """
+    Check a taper model against the `TaperModel` protocol's expectations.
+
+    Heights from 0 to the stem height are sampled, which covers the whole
+    stem whether the model measures from the ground or the stump. For every
+    stem the diameter must not increase with height (at ``points`` heights),
+    and the volume of each
+    ``section_length_m`` section must agree with a trapezoidal integral of the
+    model's own diameters. Throughput is measured on the same calls. Stems
+    the model cannot be constructed for (``ValueError``) are skipped and
+    listed in `TaperConformance.skipped`.
+
+    :param model: Registered model name or model class.
+    :param timbers: Stems to construct the model for.
+    :return: The measured `TaperConformance`.
+    """
+    if not timbers:
+        raise ValueError("At least one timber is required.")
+    model_class = get_taper_model(model)
+    tapers = []
+    skipped = []
+    for index, timber in enumerate(timbers):
+        try:
+            tapers.append(model_class(timber))
+        except ValueError as error:
+            skipped.append(f"stem {index} ({getattr(timber, 'species', '?')}): {error}")
+
+    max_increase = 0.0
+    max_volume_error = 0.0
+    diameter_time = volume_time = 0.0
+    n_diameters = n_volumes = 0
+    for taper in tapers:
+        length = float(taper.timber.height_m)
+        heights = np.linspace(0.0, length, points)
+        start = time.perf_counter()
+        diameters = np.asarray(taper.get_diameter_array(heights), dtype=float)
+        diameter_time += time.perf_counter() - start
+        n_diameters += points
+        max_increase = max(max_increase, float(np.max(np.diff(diameters), initial=0.0)))
+
+        bounds = np.append(np.arange(0.0, length, section_length_m), length)
+        h1, h2 = bounds[:-1], bounds[1:]
+        start = time.perf_counter()
+        volumes = np.asarray(taper.volume_sections(h1, h2), dtype=float)
+        volume_time += time.perf_counter() - start
+        n_volumes += len(h1)
+        reference = _reference_volumes(taper, h1, h2, integration_nodes)
+        stem_volume = max(float(reference.sum()), np.finfo(float).tiny)
+        max_volume_error = max(
+            max_volume_error, float(np.max(np.abs(volumes - reference))) / stem_volume
+        )
+
+    return TaperConformance(
+        model=taper_model_name(model_class),
+        stems=len(tapers),
+        max_diameter_increase=max_increase,
+        max_volume_error=max_volume_error,
+        diameters_per_second=n_diameters / diameter_time if diameter_time else np.inf,
+        volumes_per_second=n_volumes / volume_time if volume_time else np.inf,
+        monotonic_tolerance=monotonic_tolerance,
+        volume_tolerance=volume_tolerance,
+        skipped=skipped,
+    )
+
+
+def check_registered_models(
+    timbers: Sequence[Timber], models: Optional[Sequence[str]] = None, **kwargs
+) -> Dict[str, TaperConformance]:
+    """
+    Run `check_taper_model` for every registered model (or the given names).
+
+    Keyword arguments are passed on to `check_taper_model`. Stems a model
+    does not support are skipped and reported, not raised.
+    """
+    names = available_taper_models() if models is None else list(models)
+    return {name: check_taper_model(name, timbers, **kwargs) for name in names}
@@ -0,0 +1,124 @@
+"""Common array protocol for taper models and a registry to select them by name."""
+
+import importlib
+from typing import Dict, List, Protocol, Type, Union, runtime_checkable
+
+import numpy as np
+import numpy.typing as npt
+
+from pyforestry.base.timber import Timber
+
+
+@runtime_checkable
+class TaperModel(Protocol):
+    """
+    Array interface shared by all taper models.
+
+    Diameters are in cm and heights in m. The three methods measure heights
+    from the same reference: the stump for the generic `Taper` wrapper, the
+    ground for models that act as their own taper (such as
+    ``EdgrenNylinder1949``). The base `Taper` class implements every method
+    on top of a model's scalar methods, so subclasses only need to provide
+    native versions where they are faster. Models are constructed from a
+    single `Timber`.
+    """
+
+    timber: Timber
+
+    def get_diameter_array(self, heights: npt.ArrayLike) -> np.ndarray:
+        """Diameter (cm) at each height (m); 0 outside the stem."""
+        ...
+
+    def volume_sections(self, h1_m: npt.ArrayLike, h2_m: npt.ArrayLike) -> np.ndarray:
+        """Volume (m^3) of each stem section between two heights (m)."""
+        ...
+
+    def get_height_array(self, diameters: npt.ArrayLike) -> np.ndarray:
+        """Height (m) at which the stem tapers to each diameter (cm)."""
+        ...
+
+
+TaperModelSpec = Union[str, Type[TaperModel]]
+
+# Registered models by name. Entries are classes or lazy "module:attribute"
+# references, so registering a model does not import it.
+_TAPER_MODELS: Dict[str, Union[str, type]] = {
+    "EdgrenNylinder1949": "pyforestry.sweden.taper.edgren_nylinder_1949:EdgrenNylinder1949",
+    "EdgrenNylinder1949UnderBark": "pyforestry.sweden.taper.under_bark:UnderBarkTaper",
+}
+
+
+def _resolve(entry: Union[str, type]) -> type:
+    """Import a lazy registry entry."""
+    if not isinstance(entry, str):
+        return entry
+    module_name, _, attribute = entry.partition(":")
+    return getattr(importlib.import_module(module_name), attribute)
+
+
+def _reference(model: type) -> str:
+    """The ``module:attribute`` reference of a class."""
+    return f"{model.__module__}:{model.__qualname__}"
+
+
+def register_taper_model(name: str, model: Union[str, type], overwrite: bool = False) -> None:
+    """
+    Register a taper model under ``name``.
+
+    :param name: Name used in solution cube attributes and cache keys.
+    :param model: The model class, or a ``"module:attribute"`` reference that
+        is imported on first use.
+    :param overwrite: Replace an existing registration of ``name``.
+    """
+    if not isinstance(name, str) or not name:
+        raise ValueError("Taper model name must be a non-empty string.")
+    if isinstance(model, str) and ":" not in model:
+        raise ValueError(f"Taper model reference must be 'module:attribute', got {model!r}.")
+    if not isinstance(model, (str, type)):
+        raise TypeError("Taper model must be a class or a 'module:attribute' reference.")
+    existing = _TAPER_MODELS.get(name)
+    if existing is not None and not overwrite and existing != model:
+        raise ValueError(f"Taper model {name!r} is already registered.")
+    _TAPER_MODELS[name] = model
+
+
+def available_taper_models() -> List[str]:
+    """Names of all registered taper models."""
+    return sorted(_TAPER_MODELS)
+
+
+def get_taper_model(model: TaperModelSpec) -> type:
+    """
+    Return the taper model class for a registered name or a class.
+
+    Classes (and other taper factories) are returned unchanged, so callers
+    can accept either form.
+    """
+    if not isinstance(model, str):
+        if callable(model):
+            return model
+        raise TypeError(f"Expected a taper model name or class, got {type(model).__name__}.")
+    try:
+        entry = _TAPER_MODELS[model]
+    except KeyError:
+        raise ValueError(
+            f"Unknown taper model {model!r}. Registered models: {available_taper_models()}"
+        ) from None
+    resolved = _resolve(entry)
+    _TAPER_MODELS[model] = resolved
+    return resolved
+
+
+def taper_model_name(model: TaperModelSpec) -> str:
+    """
+    Name under which ``model`` is recorded, e.g. in solution cube attributes.
+
+    Registered classes use their registered name, other classes their class
+    name; names are returned as given.
+    """
+    if isinstance(model, str):
+        return model
+    for name, entry in _TAPER_MODELS.items():
+        if entry is model or entry == _reference(model):
+            return name
+    return model.__name__
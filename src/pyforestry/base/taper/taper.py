@@ -40,9 +40,38 @@ class Taper:
         return diam_cm
 
     def get_diameter_vectorised(self, h_array: Union[npt.ArrayLike, np.ndarray]) -> np.ndarray:
-        # --- CORRECTED: Vectorize the wrapper method to ensure height checks are applied ---
-        f = np.vectorize(self.get_diameter_at_height, otypes=[np.float32])
-        return f(h_array)
+        """Vectorised `get_diameter_at_height` returning ``float32`` diameters."""
+        return np.asarray(self.get_diameter_array(h_array), dtype=np.float32)
+
+    def get_diameter_array(self, heights: Union[npt.ArrayLike, np.ndarray]) -> np.ndarray:
+        """
+        Array version of `get_diameter_at_height`.
+
+        Taper models declare a native implementation by defining
+        ``get_diameter_array`` (heights above ground); this wrapper applies the
+        stump offset and height limits as arrays and dispatches to it. Models
+        without one, and subclasses that only override the scalar method, are
+        evaluated point by point.
+        """
+        heights = np.asarray(heights, dtype=float)
+        if type(self).get_diameter_at_height is not Taper.get_diameter_at_height:
+            # Subclass with only a scalar implementation
+            return np.vectorize(self.get_diameter_at_height, otypes=[float])(heights)
+
+        stump_height_m = 0.0 if self.timber.stump_height_m is None else self.timber.stump_height_m
+        h = heights + stump_height_m
+        valid = (h >= 0) & (h <= self.timber.height_m)
+        diam_cm = np.zeros(h.shape)
+        if not valid.any():
+            return diam_cm
+
+        model = self.taper
+        if model is not self and hasattr(model, "get_diameter_array"):
+            diam_cm[valid] = model.get_diameter_array(h[valid])
+        else:
+            values = (model.get_diameter_at_height(x) for x in h[valid].tolist())
+            diam_cm[valid] = [0.0 if d is None else d for d in values]
+        return diam_cm
 
     def get_height_at_diameter(self, diameter: float) -> float:
         """
@@ -59,6 +88,30 @@ class Taper:
         # Return height above stump
         return height_above_ground - stump_height
 
+    def get_height_array(self, diameters: Union[npt.ArrayLike, np.ndarray]) -> np.ndarray:
+        """
+        Array version of `get_height_at_diameter` (heights above stump, m).
+
+        Dispatches to the taper model's ``get_height_array`` (heights above
+        ground) when it declares one; otherwise the scalar method is evaluated
+        point by point.
+        """
+        diameters = np.asarray(diameters, dtype=float)
+        if type(self).get_height_at_diameter is not Taper.get_height_at_diameter:
+            # Subclass with only a scalar implementation
+            return np.vectorize(self.get_height_at_diameter, otypes=[float])(diameters)
+
+        stump_height = 0.0 if self.timber.stump_height_m is None else self.timber.stump_height_m
+        model = self.taper
+        if model is not self and hasattr(model, "get_height_array"):
+            height_above_ground = np.asarray(model.get_height_array(diameters), dtype=float)
+        else:
+            values = (model.get_height_at_diameter(d) for d in diameters.ravel().tolist())
+            height_above_ground = np.array(
+                [np.nan if h is None else h for h in values], dtype=float
+            ).reshape(diameters.shape)
+        return np.where(np.isnan(height_above_ground), 0.0, height_above_ground - stump_height)
+
     def volume_section(self, h1_m: float, h2_m: float) -> float:
         """
         Integrate volume (m^3) from h1_m to h2_m above stump.
@@ -72,3 +125,21 @@ class Taper:
 
         # The integrator now works with the stateful taper instance.
         return TimberVolumeIntegrator.integrate_volume(h1_m, h2_m, self)
+
+    def volume_sections(
+        self, h1_m: Union[npt.ArrayLike, np.ndarray], h2_m: Union[npt.ArrayLike, np.ndarray]
+    ) -> np.ndarray:
+        """
+        Batch version of `volume_section` for arrays of ``(h1_m, h2_m)`` intervals.
+
+        Uses fixed-order Gauss–Legendre integration with one vectorised
+        diameter evaluation for all intervals. Subclasses that only override
+        `volume_section` are evaluated interval by interval.
+        """
+        from pyforestry.base.timber import (
+            TimberVolumeIntegrator,
+        )  # Local import to break circular dependency
+
+        if type(self).volume_section is not Taper.volume_section:
+            return np.vectorize(self.volume_section, otypes=[float])(h1_m, h2_m)
+        return TimberVolumeIntegrator.integrate_volumes(h1_m, h2_m, self)
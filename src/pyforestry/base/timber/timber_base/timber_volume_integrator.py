@@ -1,5 +1,24 @@
+from functools import lru_cache
+from typing import Tuple
+
 import numpy as np
-from scipy.integrate import quad
+import numpy.typing as npt
+
+#: Default number of Gauss–Legendre nodes per integration piece.
+GAUSS_LEGENDRE_ORDER = 8
+
+#: Relative heights at which intervals are also split, grading the pieces
+#: towards the butt. Taper curves such as Edgren–Nylinder's are log-shaped
+#: with a near-singularity just below the ground, so one 8-node piece from
+#: the ground up is off by tenths of a percent; with these splits the
+#: relative error of Edgren–Nylinder sections stays below 1e-6.
+BUTT_SPLITS = (0.001, 0.01, 0.1)
+
+
+@lru_cache(maxsize=None)
+def _gauss_legendre(order: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Return Gauss–Legendre nodes and weights on ``[-1, 1]``."""
+    return np.polynomial.legendre.leggauss(order)
 
 
 class TimberVolumeIntegrator:
@@ -23,6 +42,10 @@ class TimberVolumeIntegrator:
         if height2 <= height1:
             return 0.0
 
+        # scipy is imported here, not at module level, to keep it out of
+        # the import of every timber class.
+        from scipy.integrate import quad
+
         # The 'args' tuple now only contains the taper_instance
         volume, _ = quad(
             TimberVolumeIntegrator.cylinder_volume_integrand,
@@ -37,3 +60,61 @@ class TimberVolumeIntegrator:
             limit=50,
         )
         return volume
+
+    @staticmethod
+    def integrate_volume_gauss(
+        height1: float, height2: float, taper_instance, order: int = GAUSS_LEGENDRE_ORDER
+    ) -> float:
+        """
+        Integrate the volume between two heights with a fixed-order Gauss–Legendre rule.
+
+        See `integrate_volumes`; this is the single-interval form.
+        """
+        if height2 <= height1:
+            return 0.0
+        volumes = TimberVolumeIntegrator.integrate_volumes(
+            [height1], [height2], taper_instance, order
+        )
+        return float(volumes[0])
+
+    @staticmethod
+    def integrate_volumes(
+        heights1: npt.ArrayLike,
+        heights2: npt.ArrayLike,
+        taper_instance,
+        order: int = GAUSS_LEGENDRE_ORDER,
+    ) -> np.ndarray:
+        """
+        Integrate the volume of many ``(height1, height2)`` intervals at once.
+
+        Each interval is split at the taper's ``segment_heights`` (if the
+        taper defines them), so every piece is smooth, and at `BUTT_SPLITS`
+        of the stem height (if the taper has a ``timber``), so the pieces
+        near the butt are short. Each piece is integrated with ``order``
+        Gauss–Legendre nodes. The diameters at all
+        nodes of all intervals are evaluated in a single
+        ``get_diameter_array`` call. Intervals with ``height2 <= height1`` give 0.
+        """
+        h1, h2 = np.broadcast_arrays(
+            np.asarray(heights1, dtype=float), np.asarray(heights2, dtype=float)
+        )
+        shape = h1.shape
+        h1 = h1.ravel()
+        h2 = np.maximum(h2.ravel(), h1)
+
+        breaks = list(getattr(taper_instance, "segment_heights", ()))
+        stem_height = getattr(getattr(taper_instance, "timber", None), "height_m", None)
+        if stem_height:
+            breaks.extend(split * stem_height for split in BUTT_SPLITS)
+        breaks = np.asarray(breaks, dtype=float)
+        inner = np.clip(breaks[None, :], h1[:, None], h2[:, None])
+        bounds = np.sort(np.column_stack([h1, inner, h2]), axis=1)
+        lower, upper = bounds[:, :-1], bounds[:, 1:]
+        half = 0.5 * (upper - lower)
+
+        nodes, weights = _gauss_legendre(order)
+        heights = (0.5 * (upper + lower))[..., None] + half[..., None] * nodes
+        diameters = np.asarray(taper_instance.get_diameter_array(heights), dtype=float)
+        areas = np.pi * (diameters / 200) ** 2
+        volumes = (half * (areas @ weights)).sum(axis=1)
+        return volumes.reshape(shape)
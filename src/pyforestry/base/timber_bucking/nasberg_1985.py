@@ -1,12 +1,14 @@
 """Branch-and-bound timber bucking algorithm from Näslund (1985)."""
 
+import copy
 from math import pi
-from typing import Optional, Type
+from typing import List, Optional, Tuple, Type, Union
 
 import numpy as np
 
 from pyforestry.base.pricelist import Pricelist, TimberPricelist
-from pyforestry.base.taper import Taper
+from pyforestry.base.pricelist.series import PricelistSeries
+from pyforestry.base.taper import Taper, TaperCache, get_taper_model
 from pyforestry.base.timber import Timber
 
 from ..helpers.bucking import (
@@ -26,14 +28,36 @@ class Nasberg_1985_BranchBound:
 
     # -------------------- ctor helpers (unchanged except float32 tv) -------
     def __init__(
-        self, timber: Timber, pricelist: Pricelist, taper_class: Optional[Type[Taper]] = None
+        self,
+        timber: Timber,
+        pricelist: Union[Pricelist, PricelistSeries],
+        taper_class: Optional[Union[str, Type[Taper]]] = None,
+        taper_cache: Optional[TaperCache] = None,
     ):
-        """Initialise the optimizer with timber data and pricing information."""
+        """
+        Initialise the optimizer with timber data and pricing information.
+
+        ``taper_class`` is a taper model class or the name of a registered
+        taper model; by default the base `Taper` is used. With a
+        ``taper_cache`` the taper is taken from the cache and the tree is
+        bucked as the quantised stem the cached taper describes. With a
+        `PricelistSeries` the value tables of all periods are built once and
+        `calculate_period_values` bucks the tree for every period.
+        """
         self._timber = timber
         self._species = timber.species
-        self._taper_class = taper_class or Taper
+        if taper_cache is not None:
+            if taper_class is not None and get_taper_model(taper_class) is not taper_cache.model:
+                raise ValueError("The taper cache holds a different taper model than taper_class.")
+            taper_class = taper_cache.model
+        self._taper_class = Taper if taper_class is None else get_taper_model(taper_class)
+        self._taper_cache = taper_cache
         if pricelist is None:
             raise ValueError("Pricelist must be set")
+        series = pricelist if isinstance(pricelist, PricelistSeries) else None
+        if series is not None:
+            # Periods share the first period's ranges, so it sets the structure.
+            pricelist = series[0]
         self._pricelist = pricelist
 
         self._timber_prices = pricelist.Timber.get(timber.species)
@@ -63,6 +87,9 @@ class Nasberg_1985_BranchBound:
         self._mod_ix = {dm: i for i, dm in enumerate(self._moduler)}
 
         self._timberValue = self._build_value_table().astype(np.float32)
+        self._series_prices = None
+        if series is not None:
+            self._series_prices = self._stack_period_prices(series)
 
         # static map butt/middle/top
         self.quality_log_part = {
@@ -75,43 +102,123 @@ class Nasberg_1985_BranchBound:
             QualityType.Undefined: -1,
         }
 
-    def _build_value_table(self) -> np.ndarray:
+    def for_timber(self, timber: Timber) -> "Nasberg_1985_BranchBound":
+        """Return an optimiser for ``timber`` that shares this instance's price tables.
+
+        The value table depends only on the pricelist and species, so trees of
+        the same species can reuse it instead of rebuilding it per tree.
+        """
+        if timber.species != self._species:
+            raise ValueError(
+                f"Cannot reuse an optimiser for {self._species} with a {timber.species} tree"
+            )
+        clone = copy.copy(self)
+        clone._timber = timber
+        return clone
+
+    def _build_value_table(self, timber_prices: Optional[TimberPricelist] = None) -> np.ndarray:
         """Pre-compute log values for quick lookups during optimisation."""
         max_diam = self._maxDiameterTimberLog
         tv = np.zeros((max_diam + 1, len(self._moduler), 4))
-        tp = self._timber_prices
-        if tp is None:
+        tp = self._timber_prices if timber_prices is None else timber_prices
+        if tp is None or max_diam < self._minDiameterTimberLog:
             return tv
-        for d in range(self._minDiameterTimberLog, max_diam + 1):
-            for idx, dm in enumerate(self._moduler[:-1]):  # skip sentinel
-                if dm < self._minLengthTimberLog_dm or dm > self._maxLengthTimberLog_dm:
-                    continue
-                vf = 1.0
-                if tp.volume_type == "m3to":
-                    r = (d / 100) * 0.5
-                    vf = pi * r * r * (dm / 10)
-                for p in (0, 1, 2):
-                    base = tp[d].price_for_log_part(p)
-                    corr = tp.length_corrections.get_length_correction(d, p, dm)
-                    tv[d, idx, p + 1] = (base + corr) * 100.0 * vf
+        # Diameters down the rows, log lengths (dm) across, sentinel skipped.
+        d = np.arange(self._minDiameterTimberLog, max_diam + 1)[:, None]
+        dm = np.array(self._moduler[:-1])[None, :]
+        vf = np.ones(dm.shape)
+        if tp.volume_type == "m3to":
+            r = (d / 100) * 0.5
+            vf = pi * r * r * (dm / 10)
+        base = tp.compiled.exact_prices(np.arange(3), d)  # (diameters, parts)
+        corr = tp.length_corrections.compiled.lookup(d, dm)  # (diameters, lengths)
+        values = (base[:, None, :] + corr[:, :, None]) * 100.0 * vf[..., None]
+        timber_length = (dm >= self._minLengthTimberLog_dm) & (dm <= self._maxLengthTimberLog_dm)
+        tv[d[:, 0], : dm.shape[1], 1:] = np.where(timber_length[..., None], values, 0.0)
         return tv
 
+    def _stack_period_prices(self, series: PricelistSeries) -> Tuple[np.ndarray, ...]:
+        """Value tables and assortment prices of every period of ``series``."""
+        tables = np.stack(
+            [
+                self._build_value_table(pricelist.Timber[self._species])
+                for pricelist in series.pricelists
+            ]
+        ).astype(np.float32)
+        pulp = np.array(
+            [
+                pricelist.Pulp.getPulpwoodPrice(self._species) * 100.0
+                for pricelist in series.pricelists
+            ]
+        )
+        cull = np.array([pricelist.LogCullPrice * 100.0 for pricelist in series.pricelists])
+        fuel = np.array([pricelist.FuelWoodPrice * 100.0 for pricelist in series.pricelists])
+        return tables, pulp, cull, fuel
+
+    def _period_prices(self) -> Tuple[np.ndarray, ...]:
+        """
+        Per-period value tables and pulp, cull and fuelwood prices (öre/m³).
+
+        A single pricelist is one period; its cull and fuelwood prices are
+        read when the tree is bucked.
+        """
+        if self._series_prices is not None:
+            return self._series_prices
+        return (
+            self._timberValue[None],
+            np.array([self._mvarde]),
+            np.array([self._pricelist.LogCullPrice * 100.0]),
+            np.array([self._pricelist.FuelWoodPrice * 100.0]),
+        )
+
     # ---------------------------------------------------------------------
     def calculate_tree_value(
         self, *, min_diam_dead_wood: float, config: BuckingConfig | None = None
     ) -> BuckingResult:
-        """Run the branch-and-bound optimisation and return the result."""
+        """
+        Run the branch-and-bound optimisation and return the result.
+
+        With a `PricelistSeries` the tree is bucked for the first period;
+        see `calculate_period_values` for all periods.
+        """
+        prices = tuple(array[:1] for array in self._period_prices())
+        return self._solve(min_diam_dead_wood, config, prices)[0]
+
+    def calculate_period_values(
+        self, *, min_diam_dead_wood: float, config: BuckingConfig | None = None
+    ) -> List[BuckingResult]:
+        """
+        Buck the tree once for every price period, in period order.
+
+        The taper, the section volumes and the candidate logs are computed
+        once and shared by all periods; only the values and the chosen cuts
+        differ. A single pricelist gives a list with one result.
+        """
+        return self._solve(min_diam_dead_wood, config, self._period_prices())
+
+    def _solve(
+        self,
+        min_diam_dead_wood: float,
+        config: BuckingConfig | None,
+        prices: Tuple[np.ndarray, ...],
+    ) -> List[BuckingResult]:
+        """Dynamic programme over the stem for each period of ``prices``."""
         config = config or BuckingConfig()
-        height_m = self._timber.height_m
-        taper = self._taper_class(self._timber)
+        timber_values, pulp_prices, cull_prices, fuel_prices = prices
+        n_periods = len(timber_values)
+        if self._taper_cache is None:
+            timber = self._timber
+            taper = self._taper_class(timber)
+        else:
+            taper = self._taper_cache.get(self._timber)
+            timber = taper.timber
+        height_m = timber.height_m
         cache = _TreeCache()
 
         # ------------ heights with cached inversion ----------------------
-        HSTUB = self._timber.stump_height_m
+        HSTUB = timber.stump_height_m
         top_diam = max(self._pricelist.TopDiameter, self._pricelist.PulpLogDiameter.Min)
-        HTOP = cache.height(taper, top_diam)
-
-        q_height = cache.height(taper, self._minDiameterTimberLog)
+        HTOP, q_height = cache.heights(taper, [top_diam, self._minDiameterTimberLog])
         tp = self._timber_prices
         h_butt = min(tp.max_height_quality1, q_height)
         h_mid = min(tp.max_height_quality2, q_height)
@@ -127,7 +234,9 @@ class Nasberg_1985_BranchBound:
         NMAX = 400
         total_dm = min(int((HTOP - HSTUB) * 10), NMAX)
         if total_dm <= 0:
-            return BuckingResult(0, 1, 1, 1, 1, 0, [0] * 7, [0] * 7, 0, 0)
+            return [
+                BuckingResult(0, 1, 1, 1, 1, 0, [0] * 7, [0] * 7, 0, 0) for _ in range(n_periods)
+            ]
 
         dm = np.arange(total_dm + 1, dtype=np.int32)
         h = HSTUB + dm * 0.1
@@ -157,12 +266,12 @@ class Nasberg_1985_BranchBound:
         vol_hs = taper.volume_section(h[0], h[hs_ep]) if hs_ep else 0.0
         p_vol_hs = vol_hs / vol_sk if vol_sk else 0.0
 
-        # ---------------- DP arrays (float32) ----------------------------
-        v = np.full(total_dm + 1, -np.inf, dtype=np.float32)
+        # ---------------- DP arrays (float32, one row per period) --------
+        v = np.full((n_periods, total_dm + 1), -np.inf, dtype=np.float32)
         vtimber = np.full_like(v, -np.inf)
-        back = np.zeros(total_dm + 1, dtype=np.int16)
-        kval = np.zeros(total_dm + 1, dtype=np.uint8)
-        v[0] = vtimber[0] = 1e-5
+        back = np.zeros(v.shape, dtype=np.int16)
+        kval = np.zeros(v.shape, dtype=np.uint8)
+        v[:, 0] = vtimber[:, 0] = 1e-5
 
         # quality dm limits
         i_butt = int((h_butt - HSTUB) * 10 - 1e-7)
@@ -179,8 +288,12 @@ class Nasberg_1985_BranchBound:
                 return QualityType.TopLog
             return QualityType.Pulp
 
-        cull_price = self._pricelist.LogCullPrice * 100.0
-        fuel_price = self._pricelist.FuelWoodPrice * 100.0
+        # Prices as float32 columns, rounded as the float32 DP arrays round
+        # Python scalars.
+        mvarde = pulp_prices.astype(np.float32)[:, None]
+        pulp_value = (config.pulp_price_factor * pulp_prices).astype(np.float32)[:, None]
+        cull_price = cull_prices.astype(np.float32)[:, None]
+        fuel_price = fuel_prices.astype(np.float32)[:, None]
 
         # ---- DP main loop (vector over modules) -------------------------
         mod_arr = np.array(self._moduler[:-1], dtype=np.int32)  # skip 999 sentinel
@@ -188,7 +301,8 @@ class Nasberg_1985_BranchBound:
         zero_f = np.zeros(mod_len, dtype=np.float32)
 
         for left in range(total_dm + 1):
-            if left > tp_idx and v[left] <= 0:
+            active = (left <= tp_idx) | (v[:, left] > 0)
+            if not active.any():
                 continue
             # vector of right indices for all modules
             right = left + mod_arr
@@ -199,7 +313,7 @@ class Nasberg_1985_BranchBound:
             mods = mod_arr[mask]
             h1 = h[left]
             h2 = h[right]
-            vol_vec = np.array([taper.volume_section(h1, hh) for hh in h2], dtype=np.float32)
+            vol_vec = np.asarray(taper.volume_sections(h1, h2), dtype=np.float32)
             diam_vec = dh[right].astype(np.int16)
 
             q_vec = np.vectorize(qual, otypes=[np.uint8])(right)
@@ -224,16 +338,17 @@ class Nasberg_1985_BranchBound:
             cull_ok = (~timber_ok) & (~pulp_ok) & (mods >= 0.5 * self._minLengthPulpwoodLog_dm)
 
             # ---------- compute values in vector form -------------------
-            new_v = np.full_like(vol_vec, -np.inf)
-            new_vt = np.full_like(vol_vec, -np.inf)
+            v_left = v[:, left, None]
+            new_v = np.full((n_periods, vol_vec.size), -np.inf, dtype=np.float32)
+            new_vt = np.full_like(new_v, -np.inf)
             # timber branch
             if timber_ok.any():
                 idxs = np.where(timber_ok)[0]
                 parts = np.vectorize(lambda q: self.quality_log_part[QualityType(q)])
                 part_vec = parts(q_vec[idxs])
                 pulp_p = fuel_p = cull_p = zero_f[: idxs.size]
-                price = self._timberValue[
-                    diam_vec[idxs], [self._mod_ix[m] for m in mods[idxs]], q_vec[idxs]
+                price = timber_values[
+                    :, diam_vec[idxs], [self._mod_ix[m] for m in mods[idxs]], q_vec[idxs]
                 ]
                 price *= config.timber_price_factor
                 if self._timber_prices.volume_type == "m3fub":
@@ -256,19 +371,19 @@ class Nasberg_1985_BranchBound:
                         cull_p[k] = cp
                     timber_val = price * (1 - pulp_p - fuel_p - cull_p)
 
-                new_v[idxs] = (
-                    v[left]
+                new_v[:, idxs] = (
+                    v_left
                     + timber_val
-                    + pulp_p * config.pulp_price_factor * self._mvarde * vol_vec[idxs]
+                    + pulp_p * config.pulp_price_factor * mvarde * vol_vec[idxs]
                     + cull_p * cull_price * vol_vec[idxs]
                     + fuel_p * fuel_price * vol_vec[idxs]
                 )
-                new_vt[idxs] = vtimber[left] + price
+                new_vt[:, idxs] = vtimber[:, left, None] + price
 
             # pulp branch
             if pulp_ok.any():
                 idxs = np.where(pulp_ok)[0]
-                pulp_val = config.pulp_price_factor * self._mvarde * vol_vec[idxs]
+                pulp_val = pulp_value * vol_vec[idxs]
                 if config.use_downgrading:
                     waste = self._pricelist.getPulpWoodWasteProportion(self._species)
                     fuel = self._pricelist.getPulpwoodFuelwoodProportion(self._species)
@@ -278,24 +393,74 @@ class Nasberg_1985_BranchBound:
                     pulp_val += (
                         fuel * fuel_price * vol_vec[idxs] + waste * cull_price * vol_vec[idxs]
                     )
-                new_v[idxs] = v[left] + pulp_val
-                new_vt[idxs] = vtimber[left]
+                new_v[:, idxs] = v_left + pulp_val
+                new_vt[:, idxs] = vtimber[:, left, None]
 
             # cull branch
             if cull_ok.any():
                 idxs = np.where(cull_ok)[0]
-                new_v[idxs] = v[left] + cull_price * vol_vec[idxs]
-                new_vt[idxs] = vtimber[left]
+                new_v[:, idxs] = v_left + cull_price * vol_vec[idxs]
+                new_vt[:, idxs] = vtimber[:, left, None]
                 q_vec[idxs] = QualityType.LogCull.value
 
             # -------- scatter update into global DP arrays ---------------
-            better = new_v > v[right]
+            better = (new_v > v[:, right]) & active[:, None]
             if better.any():
-                v[right[better]] = new_v[better]
-                vtimber[right[better]] = new_vt[better]
-                back[right[better]] = left
-                kval[right[better]] = q_vec[better]
-
+                rows, cols = np.nonzero(better)
+                cells = right[cols]
+                v[rows, cells] = new_v[rows, cols]
+                vtimber[rows, cells] = new_vt[rows, cols]
+                back[rows, cells] = left
+                kval[rows, cells] = q_vec[cols]
+
+        return [
+            self._period_result(
+                config,
+                taper,
+                timber,
+                h,
+                dh,
+                v[p],
+                vtimber[p],
+                back[p],
+                kval[p],
+                hs_ep=hs_ep,
+                p_dead=p_dead,
+                p_vol_hs=p_vol_hs,
+                vol_fub5=vol_fub5,
+                vol_sk=vol_sk,
+                DBH_cm=DBH_cm,
+                diameter_stump_cm=diameter_stump_cm,
+                taperDiams_cm=taperDiams_cm,
+                taperHeights_m=taperHeights_m,
+            )
+            for p in range(n_periods)
+        ]
+
+    def _period_result(
+        self,
+        config: BuckingConfig,
+        taper: Taper,
+        timber: Timber,
+        h: np.ndarray,
+        dh: np.ndarray,
+        v: np.ndarray,
+        vtimber: np.ndarray,
+        back: np.ndarray,
+        kval: np.ndarray,
+        *,
+        hs_ep: int,
+        p_dead: float,
+        p_vol_hs: float,
+        vol_fub5: float,
+        vol_sk: float,
+        DBH_cm: float,
+        diameter_stump_cm: float,
+        taperDiams_cm: list,
+        taperHeights_m: list,
+    ) -> BuckingResult:
+        """Pick the best endpoint of one period's DP arrays and reconstruct the cuts."""
+        height_m = timber.height_m
         # ---------------- pick best endpoint ----------------------------
         end = int(np.argmax(v))
         best = v[end]
@@ -378,7 +543,7 @@ class Nasberg_1985_BranchBound:
             vol_sk_ub=vol_sk,
             DBH_cm=DBH_cm,
             height_m=height_m,
-            stump_height_m=self._timber.stump_height_m,
+            stump_height_m=timber.stump_height_m,
             diameter_stump_cm=diameter_stump_cm,
             taperDiams_cm=taperDiams_cm,
             taperHeights_m=taperHeights_m,
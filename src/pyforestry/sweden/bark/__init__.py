@@ -2,10 +2,26 @@
 
 from .hannrup_2004 import (
     Hannrup_2004_bark_picea_abies_sweden,
+    Hannrup_2004_bark_picea_abies_sweden_array,
     Hannrup_2004_bark_pinus_sylvestris_sweden,
+    Hannrup_2004_bark_pinus_sylvestris_sweden_array,
+)
+
+# isort: split
+from .bark_profile import (
+    BARK_PROFILE_SPECIES,
+    double_bark_profile,
+    over_bark_profile,
+    under_bark_profile,
 )
 
 __all__ = [
+    "BARK_PROFILE_SPECIES",
     "Hannrup_2004_bark_picea_abies_sweden",
+    "Hannrup_2004_bark_picea_abies_sweden_array",
     "Hannrup_2004_bark_pinus_sylvestris_sweden",
+    "Hannrup_2004_bark_pinus_sylvestris_sweden_array",
+    "double_bark_profile",
+    "over_bark_profile",
+    "under_bark_profile",
 ]
@@ -0,0 +1,142 @@
+"""
+Over- and under-bark conversion of whole stem profiles.
+
+The Hannrup (2004) double bark thickness models are evaluated for every
+point of one or many stem profiles at once. Arguments broadcast against each
+other, so a batch of profiles is passed as ``(n_stems, n_points)`` heights
+and diameters with ``(n_stems, 1)`` columns of species, DBH and latitude.
+Diameters are in cm, heights in m above ground, bark in mm; the DBH is
+always over bark, as both bark models expect. Points outside the stem
+(diameter 0) stay 0.
+"""
+
+import numpy as np
+import numpy.typing as npt
+
+from pyforestry.sweden.bark.hannrup_2004 import (
+    Hannrup_2004_bark_picea_abies_sweden_array,
+    Hannrup_2004_bark_pinus_sylvestris_sweden_array,
+)
+
+#: Species with a Hannrup (2004) bark model.
+BARK_PROFILE_SPECIES = ("pinus sylvestris", "picea abies")
+
+# Spruce double bark (mm) is linear in the over-bark diameter d (mm):
+# intercept + dbh_coef * dbh + diameter_coef * d, at least 2 mm.
+_SPRUCE_INTERCEPT = 0.46146
+_SPRUCE_DBH_COEF = 0.01386
+_SPRUCE_DIAMETER_COEF = 0.03571
+
+
+def _pine_mask(species: npt.ArrayLike) -> np.ndarray:
+    """``True`` for pine, ``False`` for spruce; other species raise."""
+    species = np.char.lower(np.asarray(species, dtype=str))
+    unknown = ~np.isin(species, BARK_PROFILE_SPECIES)
+    if unknown.any():
+        raise ValueError(
+            f"No Hannrup (2004) bark model for species {sorted(set(species[unknown].tolist()))}; "
+            f"expected one of {list(BARK_PROFILE_SPECIES)}."
+        )
+    return species == BARK_PROFILE_SPECIES[0]
+
+
+def _profile_arrays(species, dbh_cm, heights_m, diameters_cm, latitude):
+    """Broadcast the profile arguments to one shape."""
+    pine, dbh, heights, diameters, latitude = np.broadcast_arrays(
+        _pine_mask(species),
+        np.asarray(dbh_cm, dtype=float),
+        np.asarray(heights_m, dtype=float),
+        np.asarray(diameters_cm, dtype=float),
+        np.asarray(latitude, dtype=float),
+    )
+    return pine, dbh, heights, diameters, latitude
+
+
+def double_bark_profile(
+    species: npt.ArrayLike,
+    dbh_cm: npt.ArrayLike,
+    heights_m: npt.ArrayLike,
+    diameters_ob_cm: npt.ArrayLike,
+    latitude: npt.ArrayLike = 58.0,
+) -> np.ndarray:
+    """
+    Double bark thickness (mm) along stem profiles.
+
+    Pine bark depends on the height and latitude, spruce bark on the
+    over-bark diameter at each point.
+
+    :param species: ``"pinus sylvestris"`` or ``"picea abies"`` (scalar or array).
+    :param dbh_cm: Diameter at breast height over bark (cm).
+    :param heights_m: Heights above ground (m).
+    :param diameters_ob_cm: Diameters over bark (cm) at ``heights_m``.
+    :param latitude: Latitude (degrees), used for pine.
+    """
+    pine, dbh, heights, diameters, latitude = _profile_arrays(
+        species, dbh_cm, heights_m, diameters_ob_cm, latitude
+    )
+    bark = np.empty(diameters.shape)
+    if pine.any():
+        bark[pine] = Hannrup_2004_bark_pinus_sylvestris_sweden_array(
+            10 * dbh[pine], latitude[pine], 100 * heights[pine]
+        )
+    spruce = ~pine
+    if spruce.any():
+        bark[spruce] = Hannrup_2004_bark_picea_abies_sweden_array(
+            10 * diameters[spruce], 10 * dbh[spruce]
+        )
+    return bark
+
+
+def under_bark_profile(
+    species: npt.ArrayLike,
+    dbh_cm: npt.ArrayLike,
+    heights_m: npt.ArrayLike,
+    diameters_ob_cm: npt.ArrayLike,
+    latitude: npt.ArrayLike = 58.0,
+) -> np.ndarray:
+    """
+    Convert over-bark diameters (cm) along stem profiles to under bark.
+
+    Diameters thinner than their bark give 0. Arguments as in
+    `double_bark_profile`.
+    """
+    diameters = np.asarray(diameters_ob_cm, dtype=float)
+    bark = double_bark_profile(species, dbh_cm, heights_m, diameters, latitude)
+    return np.where(diameters > 0, np.maximum(diameters - bark / 10, 0.0), 0.0)
+
+
+def over_bark_profile(
+    species: npt.ArrayLike,
+    dbh_cm: npt.ArrayLike,
+    heights_m: npt.ArrayLike,
+    diameters_ub_cm: npt.ArrayLike,
+    latitude: npt.ArrayLike = 58.0,
+) -> np.ndarray:
+    """
+    Convert under-bark diameters (cm) along stem profiles to over bark.
+
+    The inverse of `under_bark_profile` for diameters above 0. Pine bark does
+    not depend on the diameter and is added directly; spruce bark is linear
+    in the over-bark diameter, so the over-bark diameter is solved in closed
+    form. ``dbh_cm`` is still the DBH over bark.
+    """
+    pine, dbh, heights, diameters, latitude = _profile_arrays(
+        species, dbh_cm, heights_m, diameters_ub_cm, latitude
+    )
+    if np.any(diameters < 0):
+        raise ValueError("Under-bark diameters must be non-negative.")
+    bark = np.empty(diameters.shape)
+    if pine.any():
+        bark[pine] = Hannrup_2004_bark_pinus_sylvestris_sweden_array(
+            10 * dbh[pine], latitude[pine], 100 * heights[pine]
+        )
+    spruce = ~pine
+    if spruce.any():
+        if np.any(dbh[spruce] <= 0):
+            raise ValueError("DBH must be positive for the spruce bark model.")
+        d_ub_mm = 10 * diameters[spruce]
+        d_ob_mm = (d_ub_mm + _SPRUCE_INTERCEPT + _SPRUCE_DBH_COEF * 10 * dbh[spruce]) / (
+            1 - _SPRUCE_DIAMETER_COEF
+        )
+        bark[spruce] = np.maximum(d_ob_mm - d_ub_mm, 2.0)
+    return np.where(diameters > 0, diameters + bark / 10, 0.0)
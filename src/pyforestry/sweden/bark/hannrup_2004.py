@@ -9,8 +9,9 @@ for the two major conifer species in Sweden:
 * ``Hannrup_2004_bark_picea_abies_sweden`` - Norway spruce model that relates
   the diameter at a given point to the breast height diameter.
 
-Both functions return the estimated double bark thickness in millimetres and
-are derived from:
+Both functions return the estimated double bark thickness in millimetres.
+The ``*_array`` variants evaluate the same models for whole arrays of points.
+The models are derived from:
 
     Hannrup, Björn. (2004). *Funktioner för skattning av barkens tjocklek hos
     tall och gran vid avverkning med skördare*. Arbetsrapport 575, Skogforsk.
@@ -20,6 +21,8 @@ import math
 import warnings
 from typing import Union
 
+import numpy as np
+
 from pyforestry.base.helpers.primitives import Diameter_cm
 
 # --- Scots Pine Function ---
@@ -250,3 +253,75 @@ def Hannrup_2004_bark_picea_abies_sweden(
     db_mm_final = max(db_mm, 2.0)
 
     return db_mm_final
+
+
+# --- Array versions ---
+
+
+def Hannrup_2004_bark_pinus_sylvestris_sweden_array(
+    diameter_breast_height_mm, latitude, stem_height_cm
+) -> np.ndarray:
+    """
+    Array version of `Hannrup_2004_bark_pinus_sylvestris_sweden`.
+
+    All arguments broadcast against each other, so a whole stem profile (or
+    a batch of profiles with one DBH and latitude per stem) is evaluated in
+    one call. Inputs are validated once for the whole array; points where the
+    breakpoint height cannot be computed get the minimum bark of 2 mm
+    without a warning.
+
+    Returns:
+        np.ndarray: Double bark thickness (mm) at every stem height.
+    """
+    dbh_mm, latitude, h = np.broadcast_arrays(
+        np.asarray(diameter_breast_height_mm, dtype=float),
+        np.asarray(latitude, dtype=float),
+        np.asarray(stem_height_cm, dtype=float),
+    )
+    if np.any(dbh_mm < 0):
+        raise ValueError("Input 'diameter_breast_height_mm' must be non-negative.")
+    if np.any(h < 0):
+        raise ValueError("Input 'stem_height_cm' must be non-negative.")
+    if np.any((latitude < 55.0) | (latitude > 70.0)):
+        warnings.warn(
+            "Latitudes outside the typical range for Sweden (55-70). Results may be extrapolated.",
+            stacklevel=2,
+        )
+
+    dbh_b = np.minimum(dbh_mm, 590.0)
+    term_lat = 72.1814 + 0.0789 * dbh_b - 0.9868 * latitude
+    term_exp_coeff = 0.0078557 - 0.0000132 * dbh_b
+    valid = term_lat > 0
+    with np.errstate(divide="ignore", invalid="ignore"):
+        htg = -np.log(0.12 / term_lat) / term_exp_coeff
+    below = 3.5808 + 0.0109 * dbh_b + term_lat * np.exp(np.maximum(-term_exp_coeff * h, -700))
+    above = 3.5808 + 0.0109 * dbh_b + 0.12 - 0.005 * (h - htg)
+    db_mm = np.where(h <= htg, below, above)
+    return np.where(valid, np.maximum(db_mm, 2.0), 2.0)
+
+
+def Hannrup_2004_bark_picea_abies_sweden_array(
+    diameter_at_height_mm, diameter_breast_height_mm
+) -> np.ndarray:
+    """
+    Array version of `Hannrup_2004_bark_picea_abies_sweden`.
+
+    Arguments broadcast against each other; inputs are validated once for
+    the whole array.
+
+    Returns:
+        np.ndarray: Double bark thickness (mm) at every diameter.
+    """
+    dia_mm, dbh_mm = np.broadcast_arrays(
+        np.asarray(diameter_at_height_mm, dtype=float),
+        np.asarray(diameter_breast_height_mm, dtype=float),
+    )
+    if np.any(dia_mm < 0):
+        raise ValueError("Input 'diameter_at_height_mm' must be non-negative.")
+    if np.any(dbh_mm <= 0):
+        raise ValueError(
+            "Input 'diameter_breast_height_mm' must be positive for relative diameter calculation."
+        )
+    reldia = dia_mm / dbh_mm
+    db_mm = 0.46146 + 0.01386 * dbh_mm + 0.03571 * dbh_mm * reldia
+    return np.maximum(db_mm, 2.0)
@@ -1,5 +1,12 @@
 """Public API for the taper models subpackage."""
 
-from .edgren_nylinder_1949 import EdgrenNylinder1949
+from .edgren_nylinder_1949 import EdgrenNylinder1949, EdgrenNylinder1949Batch
+from .edgren_nylinder_tables import TabulatedEdgrenNylinder1949Batch
+from .under_bark import UnderBarkTaper
 
-__all__ = ["EdgrenNylinder1949"]
+__all__ = [
+    "EdgrenNylinder1949",
+    "EdgrenNylinder1949Batch",
+    "TabulatedEdgrenNylinder1949Batch",
+    "UnderBarkTaper",
+]
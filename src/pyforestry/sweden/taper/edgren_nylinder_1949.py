@@ -1,4 +1,5 @@
 from functools import lru_cache  # to cache results
+from typing import Sequence, Tuple
 
 import numpy as np
 from scipy.optimize import minimize_scalar
@@ -110,6 +111,17 @@ class EdgrenNylinder1949Consts:
                 return 0.06873 / (1 - form_quotient) ** 0.8
 
 
+# Every constants table, indexed by ``2 * north + spruce``.
+_CONSTANT_TABLES = np.stack(
+    [
+        EdgrenNylinder1949Consts._CONST_PINE_SOUTH,
+        EdgrenNylinder1949Consts._CONST_SPRUCE_SOUTH,
+        EdgrenNylinder1949Consts._CONST_PINE_NORTH,
+        EdgrenNylinder1949Consts._CONST_SPRUCE_NORTH,
+    ]
+)
+
+
 class Pettersson1949_consts:
     @staticmethod
     def form_quotient(
@@ -127,6 +139,189 @@ class Pettersson1949_consts:
                 return 0.372 + 0.008742 * height - 0.003263 * dbh_ub + 0.4929 * form_factor_ub
 
 
+def _segment_curves(constants: np.ndarray, inflexion_point):
+    """
+    Return the three taper segments and their inverses for broadcast parameters.
+
+    ``constants`` holds rows ``(F, beta, Gamma, q, Q, R)`` along its last axis.
+    Each segment maps a relative height to a relative diameter (percent of the
+    base diameter); each inverse maps a relative diameter back to a relative
+    height. Rows with ``Q = NaN`` use the straight line between the inflexion
+    point and 60 % of the height for the middle segment.
+    """
+    constants = np.asarray(constants, dtype=float)
+    const_beta, const_Gamma, const_q, const_Q, const_R = (constants[..., i] for i in range(1, 6))
+    inflexion_point = np.asarray(inflexion_point, dtype=float)
+    nan_q = np.isnan(const_Q)
+    Diameter_inflexion_point = 100 - const_q * np.log10(1 + 10000 * inflexion_point)
+    Diameter_60p_height = const_R * np.log10(1 + (1 - 0.6) * const_Gamma)
+    slope = (Diameter_60p_height - Diameter_inflexion_point) / (0.6 - inflexion_point)
+
+    def lower(r):
+        return 100 - const_q * np.log10(1 + 10000 * r)
+
+    def middle(r):
+        line = Diameter_inflexion_point + slope * (r - inflexion_point)
+        return np.where(nan_q, line, const_Q * np.log10(1 + (1 - r) * const_beta))
+
+    def upper(r):
+        return const_R * np.log10(1 + (1 - r) * const_Gamma)
+
+    def lower_inverse(d):
+        return (10 ** ((100 - d) / const_q) - 1) / 10000
+
+    def middle_inverse(d):
+        line = inflexion_point + (d - Diameter_inflexion_point) / slope
+        return np.where(nan_q, line, 1 - (10 ** (d / const_Q) - 1) / const_beta)
+
+    def upper_inverse(d):
+        return 1 - (10 ** (d / const_R) - 1) / const_Gamma
+
+    return (lower, middle, upper), (lower_inverse, middle_inverse, upper_inverse)
+
+
+def _relative_diameter_array(rel_height, constants, inflexion_point) -> np.ndarray:
+    """Vectorised Edgren–Nylinder relative diameter; 0 at relative heights of 1 or more."""
+    rel_height = np.asarray(rel_height, dtype=float)
+    inflexion_point = np.asarray(inflexion_point, dtype=float)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        (lower, middle, upper), _ = _segment_curves(constants, inflexion_point)
+        return np.where(
+            rel_height <= inflexion_point,
+            lower(rel_height),
+            np.where(
+                rel_height <= 0.6,
+                middle(rel_height),
+                np.where(rel_height < 1, upper(rel_height), 0.0),
+            ),
+        )
+
+
+def _bisect_decreasing(f, target, lo, hi, iterations: int = 60) -> np.ndarray:
+    """Largest ``x`` in ``[lo, hi]`` with ``f(x) >= target`` for decreasing ``f`` (vectorised)."""
+    target, lo, hi = np.broadcast_arrays(
+        np.asarray(target, dtype=float), np.asarray(lo, dtype=float), np.asarray(hi, dtype=float)
+    )
+    lo, hi = lo.copy(), hi.copy()
+    for _ in range(iterations):
+        mid = 0.5 * (lo + hi)
+        above = f(mid) >= target
+        lo = np.where(above, mid, lo)
+        hi = np.where(above, hi, mid)
+    return lo
+
+
+def _inverse_relative_diameter(target, constants, inflexion_point) -> np.ndarray:
+    """
+    Relative height at which the relative diameter falls to ``target``.
+
+    Returns the largest relative height whose relative diameter is still at
+    least ``target``; where the curve jumps past ``target`` at a segment
+    boundary, that boundary is returned. Each segment is inverted
+    analytically; elements whose analytic root is not finite are solved by
+    bisection. Targets above 100 give NaN. The segment bounds are clipped
+    to the top of the stem, so an inflexion point above 1 never gives a
+    relative height beyond 1.
+    """
+    target = np.asarray(target, dtype=float)
+    inflexion_point = np.asarray(inflexion_point, dtype=float)
+    lower_break = np.minimum(inflexion_point, 1.0)
+    upper_break = np.clip(inflexion_point, 0.6, 1.0)
+    limits = ((0.0, lower_break), (lower_break, upper_break), (upper_break, 1.0))
+
+    rel_height = np.full(np.broadcast(target, inflexion_point).shape, -np.inf)
+    with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+        curves, inverses = _segment_curves(constants, inflexion_point)
+        for curve, inverse, (lo, hi) in zip(curves, inverses, limits, strict=True):
+            root = inverse(target)
+            if not np.all(np.isfinite(root)):
+                root = np.where(
+                    np.isfinite(root),
+                    root,
+                    _bisect_decreasing(curve, target, lo, hi),
+                )
+            contribution = np.where(
+                target > curve(lo),
+                -np.inf,
+                np.where(target <= curve(hi), hi, np.clip(root, lo, hi)),
+            )
+            rel_height = np.maximum(rel_height, contribution)
+    return np.where(np.isfinite(rel_height), rel_height, np.nan)
+
+
+def _relative_area_antiderivative(segment: int, rel_height, constants, inflexion_point):
+    """
+    Antiderivative of the squared relative diameter on one taper segment.
+
+    Segments 0, 1 and 2 lie below the inflexion point, between it and 60 %
+    of the height, and above. Each log10 segment has the form
+    ``A + B ln(u)`` with ``u`` linear in the relative height, and
+    ``∫ (A + B ln u)^2 du = u (f^2 - 2 B f + 2 B^2)`` with ``f = A + B ln u``.
+    The straight NaN-Q segment integrates to a cubic. Parameters broadcast
+    like in `_segment_curves`.
+    """
+    constants = np.asarray(constants, dtype=float)
+    const_beta, const_Gamma, const_q, const_Q, const_R = (constants[..., i] for i in range(1, 6))
+
+    def log_segment(A, B, u, du_dr):
+        f = A + B * np.log(u)
+        return u * (f * f - 2 * B * f + 2 * B * B) / du_dr
+
+    if segment == 0:
+        return log_segment(100.0, -const_q / np.log(10), 1 + 10000 * rel_height, 10000.0)
+    if segment == 2:
+        u = 1 + (1 - rel_height) * const_Gamma
+        return log_segment(0.0, const_R / np.log(10), u, -const_Gamma)
+
+    nan_q = np.isnan(const_Q)
+    log_part = log_segment(
+        0.0, const_Q / np.log(10), 1 + (1 - rel_height) * const_beta, -const_beta
+    )
+    if not np.any(nan_q):
+        return log_part
+    Diameter_inflexion_point = 100 - const_q * np.log10(1 + 10000 * inflexion_point)
+    Diameter_60p_height = const_R * np.log10(1 + (1 - 0.6) * const_Gamma)
+    slope = (Diameter_60p_height - Diameter_inflexion_point) / (0.6 - inflexion_point)
+    line = Diameter_inflexion_point + slope * (rel_height - inflexion_point)
+    line_part = np.where(
+        slope == 0, Diameter_inflexion_point**2 * rel_height, line**3 / (3 * slope)
+    )
+    return np.where(nan_q, line_part, log_part)
+
+
+def _relative_section_area(r1, r2, inflexion_point, antiderivative) -> np.ndarray:
+    """
+    Integral of the squared relative diameter between relative heights ``r1 <= r2``.
+
+    Splits every interval at the segment boundaries and applies
+    ``antiderivative(segment, rel_height)`` on each piece, so the stem volume
+    is this integral times ``height * pi / 4 * (base_diameter / 1e4) ** 2``.
+    """
+    inflexion_point = np.asarray(inflexion_point, dtype=float)
+    upper_break = np.maximum(inflexion_point, 0.6)
+    limits = ((0.0, inflexion_point), (inflexion_point, upper_break), (upper_break, 1.0))
+    integral = np.zeros(np.broadcast(r1, r2, inflexion_point).shape)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        for segment, (lo, hi) in enumerate(limits):
+            a = np.clip(r1, lo, hi)
+            b = np.clip(r2, lo, hi)
+            inside = b > a
+            if inside.any():
+                F_b = antiderivative(segment, b)
+                F_a = antiderivative(segment, a)
+                integral += np.where(inside, F_b - F_a, 0.0)
+    return integral
+
+
+def _analytic_antiderivative(constants, inflexion_point):
+    """Bind `_relative_area_antiderivative` to one set of taper parameters."""
+
+    def antiderivative(segment, rel_height):
+        return _relative_area_antiderivative(segment, rel_height, constants, inflexion_point)
+
+    return antiderivative
+
+
 class EdgrenNylinder1949(Taper):
     def __init__(self, timber: SweTimber):
         """
@@ -245,6 +440,15 @@ class EdgrenNylinder1949(Taper):
             print(f"Warning: Unexpected value for relative height: {rel_height}")
             return 0
 
+    def get_relative_diameter_array(self, rel_height: np.ndarray) -> np.ndarray:
+        """
+        Array version of `get_relative_diameter`.
+
+        The three height regions are evaluated with masks; relative heights
+        of 1 or more give 0 (without the scalar method's warning).
+        """
+        return _relative_diameter_array(rel_height, self.constants[0], self.inflexion_point)
+
     def get_diameter_at_height(self, height_m: float) -> float:
         """
         Instance method using pre-calculated base diameter.
@@ -260,6 +464,81 @@ class EdgrenNylinder1949(Taper):
 
         return (self.base_diameter * relative_diameter) / 100
 
+    def get_diameter_array(self, heights: np.ndarray) -> np.ndarray:
+        """Array version of `get_diameter_at_height` (heights above ground)."""
+        heights = np.asarray(heights, dtype=float)
+        valid = (heights >= 0) & (heights < self.timber.height_m)
+        relative_diameter = self.get_relative_diameter_array(
+            np.where(valid, heights, 0.0) / self.timber.height_m
+        )
+        valid &= relative_diameter > 0
+        return np.where(valid, (self.base_diameter * relative_diameter) / 100, 0.0)
+
+    @property
+    def segment_heights(self) -> Tuple[float, float]:
+        """Heights above ground (m) where the taper curve changes segment."""
+        height = self.timber.height_m
+        return (self.inflexion_point * height, max(self.inflexion_point, 0.6) * height)
+
+    def volume_sections(self, h1_m, h2_m) -> np.ndarray:
+        """
+        Closed-form volume (m^3) of stem sections between heights above ground.
+
+        Integrates the squared taper curve segment by segment with the
+        analytic antiderivatives, so no quadrature is involved. Accepts arrays
+        of ``(h1_m, h2_m)`` intervals; heights are clipped to the stem.
+        """
+        height = self.timber.height_m
+        h1, h2 = np.broadcast_arrays(np.asarray(h1_m, dtype=float), np.asarray(h2_m, dtype=float))
+        r1 = np.clip(h1, 0.0, height) / height
+        r2 = np.clip(np.maximum(h1, h2), 0.0, height) / height
+        integral = _relative_section_area(
+            r1,
+            r2,
+            self.inflexion_point,
+            _analytic_antiderivative(self.constants[0], self.inflexion_point),
+        )
+        return height * np.pi / 4 * (self.base_diameter / 1e4) ** 2 * integral
+
+    def volume_section(self, h1_m: float, h2_m: float) -> float:
+        """Closed-form volume (m^3) between two heights above ground."""
+        if h2_m <= h1_m:
+            return 0.0
+        return float(self.volume_sections(h1_m, h2_m))
+
+    def get_height_array(self, diameters) -> np.ndarray:
+        """
+        Array version of `get_height_at_diameter` (heights above ground, m).
+
+        Inverts each taper segment analytically instead of minimising, so it
+        is fast and silent: diameters outside ``(0, base_diameter]`` give 0.
+        """
+        diameters = np.asarray(diameters, dtype=float)
+        valid = (diameters > 0) & (diameters <= self.base_diameter)
+        rel_height = _inverse_relative_diameter(
+            100 * diameters / self.base_diameter, self.constants[0], self.inflexion_point
+        )
+        return np.where(valid, np.nan_to_num(rel_height) * self.timber.height_m, 0.0)
+
+    @staticmethod
+    def get_heights_for_trees(tapers, diameters) -> np.ndarray:
+        """
+        Heights above ground (m) at ``diameters`` for many trees at once.
+
+        :param tapers: Sequence of ``EdgrenNylinder1949`` instances.
+        :param diameters: Target diameters (cm), shape ``(n_diameters,)`` or
+            ``(n_trees, n_diameters)``.
+        :return: Array of shape ``(n_trees, n_diameters)``.
+        """
+        constants = np.array([t.constants[0] for t in tapers])[:, None, :]
+        inflexion_point = np.array([t.inflexion_point for t in tapers])[:, None]
+        base = np.array([t.base_diameter for t in tapers])[:, None]
+        height = np.array([t.timber.height_m for t in tapers])[:, None]
+        diameters = np.asarray(diameters, dtype=float)
+        valid = (diameters > 0) & (diameters <= base)
+        rel_height = _inverse_relative_diameter(100 * diameters / base, constants, inflexion_point)
+        return np.where(valid, np.nan_to_num(rel_height) * height, 0.0)
+
     def get_height_at_diameter(self, diameter: float) -> float:
         """Instance method."""
         if diameter <= 0 or diameter > self.base_diameter:
@@ -279,3 +558,238 @@ class EdgrenNylinder1949(Taper):
         else:
             print(f"Optimization failed for minDiameter: {diameter}")
             return 0.0
+
+
+class EdgrenNylinder1949Batch:
+    """
+    Edgren–Nylinder (1949) taper for a whole population of stems.
+
+    Computes the Näslund form factor, Pettersson form quotient, inflexion
+    point, constants row and base diameter of every stem with array
+    arithmetic, giving the same parameters (up to floating point rounding)
+    as one `EdgrenNylinder1949` per stem. Per-stem parameters are stored as
+    columns of shape ``(n_stems, 1)`` so that query arrays broadcast with a
+    leading stem axis: a 1-D query of length ``k`` is evaluated for every
+    stem, a ``(n_stems, k)`` query row by row. All heights are above
+    ground, as for `EdgrenNylinder1949`.
+    """
+
+    def __init__(
+        self,
+        species,
+        diameter_cm,
+        height_m,
+        region="southern",
+        double_bark_mm=None,
+        crown_base_height_m=None,
+        over_bark=True,
+    ):
+        """
+        :param species: Species name per stem (or one for all stems).
+        :param diameter_cm: Diameter at breast height (cm).
+        :param height_m: Total stem height (m).
+        :param region: ``"northern"`` or ``"southern"``, per stem or shared.
+        :param double_bark_mm: Double bark thickness (mm); ``None``/NaN if unknown.
+        :param crown_base_height_m: Crown base height (m); ``None``/NaN if unknown.
+        :param over_bark: Whether ``diameter_cm`` is measured over bark.
+        """
+        species = np.char.lower(np.asarray(species, dtype=str))
+        region = np.char.lower(np.asarray(region, dtype=str))
+        diameter_cm = np.asarray(diameter_cm, dtype=float)
+        height_m = np.asarray(height_m, dtype=float)
+        bark = np.asarray(np.nan if double_bark_mm is None else double_bark_mm, dtype=float)
+        crown = np.asarray(
+            np.nan if crown_base_height_m is None else crown_base_height_m, dtype=float
+        )
+        arrays = np.broadcast_arrays(
+            species, region, diameter_cm, height_m, bark, crown, np.asarray(over_bark, dtype=bool)
+        )
+        species, region, diameter_cm, height_m, bark, crown, over_bark = (
+            np.atleast_1d(a).ravel() for a in arrays
+        )
+        self._validate(region, diameter_cm, height_m, bark, crown)
+
+        self.species = species
+        self.region = region
+        self.diameter_cm = diameter_cm
+        self.height_m = height_m
+        north = region == "northern"
+        spruce = species == "picea abies"
+
+        form_factor = NaslundFormFactor.calculate_array(
+            species=species,
+            height_m=height_m,
+            diameter_cm=diameter_cm,
+            double_bark_mm=bark,
+            crown_base_height_m=crown,
+            over_bark=over_bark,
+            region=region,
+        )
+
+        def by_group(function, **kwargs):
+            # Evaluate a species/region-specific scalar formula for each group.
+            return np.select(
+                [north & spruce, north & ~spruce, ~north & spruce],
+                [
+                    function(species="picea abies", north=True, **kwargs),
+                    function(species="pinus sylvestris", north=True, **kwargs),
+                    function(species="picea abies", north=False, **kwargs),
+                ],
+                function(species="pinus sylvestris", north=False, **kwargs),
+            )
+
+        form_quotient = by_group(
+            Pettersson1949_consts.form_quotient,
+            height=height_m,
+            dbh_ub=diameter_cm,
+            form_factor_ub=form_factor,
+        )
+        with np.errstate(invalid="ignore", divide="ignore"):
+            self.inflexion_point = by_group(
+                EdgrenNylinder1949Consts.get_inflexion_point, form_quotient=form_quotient
+            )
+        invalid = ~np.isfinite(self.inflexion_point)
+        if invalid.any():
+            raise ValueError(
+                f"Invalid inflexion point for stems {np.flatnonzero(invalid).tolist()}: "
+                "the form quotient must be below 1."
+            )
+        self.constants_index = self._constants_index(north, spruce, form_quotient)
+        self.constants = _CONSTANT_TABLES.reshape(-1, _CONSTANT_TABLES.shape[-1])[
+            self.constants_index
+        ]
+
+        dbh_relative = _relative_diameter_array(
+            1.3 / height_m, self.constants, self.inflexion_point
+        )
+        invalid = ~(dbh_relative > 0)
+        if invalid.any():
+            raise ValueError(
+                "Invalid relative diameter at breast height for stems "
+                f"{np.flatnonzero(invalid).tolist()}."
+            )
+        self.base_diameter = 100 * (diameter_cm / dbh_relative)
+
+    @staticmethod
+    def _validate(region, diameter_cm, height_m, bark, crown) -> None:
+        """Vectorised counterpart of `EdgrenNylinder1949.validate`."""
+        checks = (
+            (
+                ~np.isin(region, ["northern", "southern"]),
+                "region must be 'northern' or 'southern'",
+            ),
+            (~(height_m > 0), "height_m must be a positive number"),
+            (~(diameter_cm > 0), "diameter_cm must be a positive number"),
+            (crown < 0, "crown_base_height_m cannot be negative"),
+            (crown >= height_m, "crown_base_height_m must be less than height_m"),
+            (bark < 0, "double_bark_mm cannot be negative"),
+        )
+        for failed, message in checks:
+            if failed.any():
+                raise ValueError(f"Timber {message} (stems {np.flatnonzero(failed).tolist()}).")
+
+    @staticmethod
+    def _constants_index(north, spruce, form_quotient) -> np.ndarray:
+        """
+        Index of every stem's constants row in the flattened `_CONSTANT_TABLES`.
+
+        Rows are selected as in `EdgrenNylinder1949Consts.get_constants`.
+        """
+        rounded = np.clip(np.round(form_quotient * 2) / 2, 0.5, 0.8)
+        if np.any(np.isnan(rounded)):
+            raise ValueError("No matching row for form factor: nan")
+        form_factors = _CONSTANT_TABLES[0, :, 0]
+        row = np.argmin(np.abs(form_factors[None, :] - rounded[:, None]), axis=1)
+        return (2 * north + spruce) * len(form_factors) + row
+
+    @classmethod
+    def from_timbers(cls, timbers: Sequence[SweTimber]) -> "EdgrenNylinder1949Batch":
+        """Create a batch from `SweTimber` objects."""
+        for timber in timbers:
+            EdgrenNylinder1949.validate(timber)
+
+        def column(attribute):
+            values = [getattr(t, attribute) for t in timbers]
+            return np.array([np.nan if v is None else v for v in values])
+
+        return cls(
+            species=[t.species for t in timbers],
+            diameter_cm=column("diameter_cm"),
+            height_m=column("height_m"),
+            region=[t.region for t in timbers],
+            double_bark_mm=column("double_bark_mm"),
+            crown_base_height_m=column("crown_base_height_m"),
+            over_bark=[t.over_bark for t in timbers],
+        )
+
+    def __len__(self) -> int:
+        return len(self.height_m)
+
+    @staticmethod
+    def _column(values: np.ndarray) -> np.ndarray:
+        """Per-stem parameter as a ``(n_stems, 1)`` column."""
+        return values[:, None]
+
+    @staticmethod
+    def _query(values) -> np.ndarray:
+        """Query array with at least a stem and a query axis."""
+        return np.atleast_2d(np.asarray(values, dtype=float))
+
+    def _relative_diameter(self, rel_height: np.ndarray) -> np.ndarray:
+        """Relative diameter of every stem at ``(n_stems, k)`` relative heights."""
+        return _relative_diameter_array(
+            rel_height, self.constants[:, None, :], self._column(self.inflexion_point)
+        )
+
+    def _relative_area(self, r1: np.ndarray, r2: np.ndarray) -> np.ndarray:
+        """Integral of every stem's squared relative diameter between ``r1 <= r2``."""
+        inflexion_point = self._column(self.inflexion_point)
+        antiderivative = _analytic_antiderivative(self.constants[:, None, :], inflexion_point)
+        return _relative_section_area(r1, r2, inflexion_point, antiderivative)
+
+    def diameter(self, heights) -> np.ndarray:
+        """
+        Diameter (cm) at heights above ground, shape ``(n_stems, k)``.
+
+        Heights outside ``[0, height_m)`` give 0, like
+        `EdgrenNylinder1949.get_diameter_array`.
+        """
+        heights = self._query(heights)
+        total = self._column(self.height_m)
+        valid = (heights >= 0) & (heights < total)
+        relative_diameter = self._relative_diameter(np.where(valid, heights, 0.0) / total)
+        valid &= relative_diameter > 0
+        base = self._column(self.base_diameter)
+        return np.where(valid, (base * relative_diameter) / 100, 0.0)
+
+    def volume(self, h1_m, h2_m) -> np.ndarray:
+        """
+        Closed-form volume (m^3) of the sections between heights above ground.
+
+        ``h1_m`` and ``h2_m`` broadcast to ``(n_stems, k)``; heights are
+        clipped to each stem and empty intervals give 0.
+        """
+        h1, h2 = np.broadcast_arrays(self._query(h1_m), self._query(h2_m))
+        total = self._column(self.height_m)
+        r1 = np.clip(h1, 0.0, total) / total
+        r2 = np.clip(np.maximum(h1, h2), 0.0, total) / total
+        integral = self._relative_area(r1, r2)
+        base = self._column(self.base_diameter)
+        return total * np.pi / 4 * (base / 1e4) ** 2 * integral
+
+    def height_at_diameter(self, diameters) -> np.ndarray:
+        """
+        Height above ground (m) where each stem tapers to ``diameters`` (cm).
+
+        Uses the analytic inverse of `EdgrenNylinder1949.get_height_array`;
+        diameters outside ``(0, base_diameter]`` give 0.
+        """
+        diameters = self._query(diameters)
+        base = self._column(self.base_diameter)
+        valid = (diameters > 0) & (diameters <= base)
+        rel_height = _inverse_relative_diameter(
+            100 * diameters / base,
+            self.constants[:, None, :],
+            self._column(self.inflexion_point),
+        )
+        return np.where(valid, np.nan_to_num(rel_height) * self._column(self.height_m), 0.0)
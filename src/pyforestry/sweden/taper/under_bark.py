@@ -0,0 +1,112 @@
+"""Under-bark taper of an over-bark taper model, with Hannrup (2004) bark."""
+
+from typing import Tuple
+
+import numpy as np
+import numpy.typing as npt
+
+from pyforestry.base.taper import Taper, get_taper_model
+from pyforestry.base.taper.registry import TaperModelSpec
+from pyforestry.base.timber import TimberVolumeIntegrator
+from pyforestry.sweden.bark.bark_profile import BARK_PROFILE_SPECIES, under_bark_profile
+from pyforestry.sweden.taper.edgren_nylinder_1949 import EdgrenNylinder1949, _bisect_decreasing
+from pyforestry.sweden.timber.swe_timber import SweTimber
+
+# Heights at which the profile is sampled to bracket each diameter before
+# bisection in `UnderBarkTaper.get_height_array`.
+_HEIGHT_GRID = 257
+
+
+class UnderBarkTaper(Taper):
+    """
+    Under-bark stem profile of an over-bark taper model.
+
+    The wrapped model describes the stem over bark; every diameter it returns
+    is converted with `under_bark_profile` in one array call, so volumes and
+    bucking use the wood without bark. Like ``EdgrenNylinder1949`` the taper
+    acts as its own model and measures heights above ground, and it can be
+    passed as ``taper_class`` to the bucking optimiser or selected by the
+    registered name ``"EdgrenNylinder1949UnderBark"``.
+    """
+
+    def __init__(self, timber: SweTimber, model: TaperModelSpec = EdgrenNylinder1949):
+        """
+        :param timber: Over-bark pine or spruce stem.
+        :param model: Over-bark taper model (class or registered name).
+        """
+        super().__init__(timber, self)
+        if not timber.over_bark:
+            raise ValueError("UnderBarkTaper needs an over-bark timber.")
+        if timber.species not in BARK_PROFILE_SPECIES:
+            raise ValueError(
+                f"No Hannrup (2004) bark model for {timber.species!r}; "
+                f"expected one of {list(BARK_PROFILE_SPECIES)}."
+            )
+        self.over_bark_taper = get_taper_model(model)(timber)
+        # Models wrapped by the generic `Taper` measure heights above stump.
+        inner = self.over_bark_taper
+        self._stump_offset = (
+            0.0 if getattr(inner, "taper", inner) is inner else timber.stump_height_m or 0.0
+        )
+        self.latitude = getattr(timber, "latitude", 58.0)
+
+    @property
+    def segment_heights(self) -> Tuple[float, ...]:
+        """Segment heights above ground of the over-bark model, if it has any."""
+        heights = getattr(self.over_bark_taper, "segment_heights", ())
+        return tuple(h + self._stump_offset for h in heights)
+
+    def get_diameter_array(self, heights: npt.ArrayLike) -> np.ndarray:
+        """Under-bark diameter (cm) at heights above ground (m); 0 outside the stem."""
+        heights = np.asarray(heights, dtype=float)
+        over_bark = np.asarray(
+            self.over_bark_taper.get_diameter_array(heights - self._stump_offset), dtype=float
+        )
+        return under_bark_profile(
+            self.timber.species,
+            self.timber.diameter_cm,
+            np.maximum(heights, 0.0),
+            np.maximum(over_bark, 0.0),
+            self.latitude,
+        )
+
+    def get_diameter_at_height(self, height_m: float) -> float:
+        """Under-bark diameter (cm) at a height above ground (m)."""
+        return float(self.get_diameter_array(height_m))
+
+    def volume_sections(self, h1_m, h2_m) -> np.ndarray:
+        """Under-bark volume (m^3) of sections between heights above ground."""
+        return TimberVolumeIntegrator.integrate_volumes(h1_m, h2_m, self)
+
+    def volume_section(self, h1_m: float, h2_m: float) -> float:
+        """Under-bark volume (m^3) between two heights above ground."""
+        if h2_m <= h1_m:
+            return 0.0
+        return float(self.volume_sections(h1_m, h2_m))
+
+    def get_height_array(self, diameters: npt.ArrayLike) -> np.ndarray:
+        """
+        Highest height above ground (m) with at least each under-bark diameter (cm).
+
+        Bark can thin faster than the wood near the butt, so the profile need
+        not decrease everywhere. Each diameter is first bracketed on a grid of
+        heights and then bisected within its grid cell. Diameters the stem
+        never reaches give 0.
+        """
+        diameters = np.asarray(diameters, dtype=float)
+        grid = np.linspace(0.0, self.timber.height_m, _HEIGHT_GRID)
+        reaches = self.get_diameter_array(grid) >= diameters[..., None]
+        last = _HEIGHT_GRID - 1 - np.argmax(reaches[..., ::-1], axis=-1)
+        found = reaches.any(axis=-1) & (diameters > 0)
+        heights = _bisect_decreasing(
+            self.get_diameter_array,
+            diameters,
+            grid[last],
+            grid[np.minimum(last + 1, _HEIGHT_GRID - 1)],
+            iterations=40,
+        )
+        return np.where(found, heights, 0.0)
+
+    def get_height_at_diameter(self, diameter: float) -> float:
+        """Scalar version of `get_height_array`."""
+        return float(self.get_height_array(diameter))
@@ -1,11 +1,8 @@
 """Timber class with Swedish volume model integrations."""
 
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
 from pyforestry.base.timber import Timber
-
-# Import SwedishSite and its region-specific namespace.
-from pyforestry.sweden.site import SwedishSite
 from pyforestry.sweden.volume import (
     BrandelVolume,
     Eriksson_1973_volume_aspen_Sweden,
@@ -19,6 +16,10 @@ from pyforestry.sweden.volume import (
     matern_1975_volume_sweden_oak,
 )
 
+if TYPE_CHECKING:  # pragma: no cover - imported only for type checking
+    # SwedishSite pulls in geopandas and the site index models.
+    from pyforestry.sweden.site import SwedishSite  # pragma: no cover
+
 
 class SweTimber(Timber):
     """Timber record with access to Swedish volume models."""
@@ -34,7 +35,7 @@ class SweTimber(Timber):
         region: str = "southern",  # Default to "southern"; can be "northern"
         latitude: Optional[float] = None,
         # Optionally, supply a SwedishSite with additional region‐specific parameters.
-        swedish_site: Optional[SwedishSite] = None,
+        swedish_site: Optional["SwedishSite"] = None,
     ):
         """Instantiate a timber record and infer missing fields."""
         self.species = species.lower()
@@ -12,6 +12,7 @@ __all__ = [
     "andersson_1954_volume_small_trees_spruce",
     "andersson_1954_volume_small_trees_birch_under_diameter_5_cm",
     "BrandelVolume",
+    "BrandelVolumes",
     "carbonnier_1954_volume_larch",
     "johnsson_1953_volume_hybrid_aspen",
     "matern_1975_volume_sweden_beech",
@@ -20,6 +21,9 @@ __all__ = [
     "NaslundFormFactor",
     "Eriksson_1973_volume_aspen_Sweden",
     "Eriksson_1973_volume_lodgepole_pine_Sweden",
+    "swe_timber_volumes",
+    "volume_models",
+    "VOLUME_MODELS",
 ]
 
 if TYPE_CHECKING:  # pragma: no cover - imported only for type checking
@@ -30,7 +34,7 @@ if TYPE_CHECKING:  # pragma: no cover - imported only for type checking
         andersson_1954_volume_small_trees_pine,  # pragma: no cover
         andersson_1954_volume_small_trees_spruce,  # pragma: no cover
     )
-    from .brandel_1990 import BrandelVolume  # pragma: no cover
+    from .brandel_1990 import BrandelVolume, BrandelVolumes  # pragma: no cover
     from .carbonnier_1954 import carbonnier_1954_volume_larch  # pragma: no cover
     from .eriksson_1973 import (  # pragma: no cover
         Eriksson_1973_volume_aspen_Sweden,  # pragma: no cover
@@ -42,6 +46,11 @@ if TYPE_CHECKING:  # pragma: no cover - imported only for type checking
         matern_1975_volume_sweden_oak,  # pragma: no cover
     )
     from .naslund_1947 import NaslundFormFactor, NaslundVolume  # pragma: no cover
+    from .swe_timber_volume import (  # pragma: no cover
+        VOLUME_MODELS,  # pragma: no cover
+        swe_timber_volumes,  # pragma: no cover
+        volume_models,  # pragma: no cover
+    )
 
 # Map of public name → submodule
 _name_to_module: typing.Dict[str, str] = {
@@ -50,6 +59,7 @@ _name_to_module: typing.Dict[str, str] = {
     "andersson_1954_volume_small_trees_spruce": "andersson_1954",
     "andersson_1954_volume_small_trees_birch_under_diameter_5_cm": "andersson_1954",
     "BrandelVolume": "brandel_1990",
+    "BrandelVolumes": "brandel_1990",
     "carbonnier_1954_volume_larch": "carbonnier_1954",
     "johnsson_1953_volume_hybrid_aspen": "johnsson_1953",
     "matern_1975_volume_sweden_beech": "matern_1975",
@@ -58,6 +68,9 @@ _name_to_module: typing.Dict[str, str] = {
     "NaslundFormFactor": "naslund_1947",
     "Eriksson_1973_volume_aspen_Sweden": "eriksson_1973",
     "Eriksson_1973_volume_lodgepole_pine_Sweden": "eriksson_1973",
+    "swe_timber_volumes": "swe_timber_volume",
+    "volume_models": "swe_timber_volume",
+    "VOLUME_MODELS": "swe_timber_volume",
 }
 
 
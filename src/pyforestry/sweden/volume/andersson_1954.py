@@ -1,5 +1,7 @@
 import math
 
+import numpy as np
+
 
 def andersson_1954_volume_small_trees_birch_height_above_4_m(diameter_cm, height_m):
     """
@@ -18,14 +20,16 @@ def andersson_1954_volume_small_trees_birch_height_above_4_m(diameter_cm, height
         height_m (float): Height in m.
 
     Returns:
-        float: Volume in m³.
+        float: Volume in m³ (an array for array arguments).
     """
+    # Scalars keep math's float results and domain errors; arrays use NumPy.
+    lib = math if np.ndim(diameter_cm) == np.ndim(height_m) == 0 else np
     return (
-        math.exp(
+        lib.exp(
             -4.49213
-            + 2.10253 * math.log(diameter_cm)
-            + 3.98519 * math.log(height_m)
-            - 2.65900 * math.log(height_m - 1.3)
+            + 2.10253 * lib.log(diameter_cm)
+            + 3.98519 * lib.log(height_m)
+            - 2.65900 * lib.log(height_m - 1.3)
             - 0.0140970 * diameter_cm
         )
         / 1000
@@ -1,6 +1,33 @@
 import math
 from copy import deepcopy
-from typing import Dict, List, Optional, Union
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple, Union
+
+import numpy as np
+import numpy.typing as npt
+
+from pyforestry.base.helpers.tree_species import GLOBAL_TREE_SPECIES
+
+
+@dataclass(frozen=True)
+class BrandelVolumes:
+    """
+    Volumes of a batch of trees from `BrandelVolume.get_volume_array`.
+
+    ``volume`` holds the volume (m³) of each tree and is NaN where the tree
+    is outside the valid range of the functions: ``valid_diameter`` marks
+    trees with a diameter of at least 5 cm and ``valid_height`` trees taller
+    than 1.3 m.
+    """
+
+    volume: np.ndarray
+    valid_diameter: np.ndarray
+    valid_height: np.ndarray
+
+    @property
+    def valid(self) -> np.ndarray:
+        """Trees with a volume, i.e. with a valid diameter and height."""
+        return self.valid_diameter & self.valid_height
 
 
 class BrandelVolume:
@@ -195,22 +222,34 @@ class BrandelVolume:
         """
         if diameter_cm < 5:
             raise ValueError("Diameter must be at least 5 cm.")
+        key = BrandelVolume._species_key(species)
+        if key is None:
+            raise ValueError(f"Species '{species}' not supported.")
+        return (
+            BrandelVolume.get_volume_log(coeff_dict[key], diameter_cm, height_m) / 1000
+        )  # dm3 to m3
+
+    @staticmethod
+    def _species_key(species: str) -> Optional[str]:
+        """Coefficient group ("Pine", "Spruce" or "Birch") of a species name."""
         sp: str = species.lower()
         # Here we check for keywords in species to select the appropriate coefficient group.
         if "pinus sylvestris" in sp or "pine" in sp:
-            return (
-                BrandelVolume.get_volume_log(coeff_dict["Pine"], diameter_cm, height_m) / 1000
-            )  # dm3 to m3
+            return "Pine"
         elif "picea abies" in sp or "spruce" in sp:
-            return (
-                BrandelVolume.get_volume_log(coeff_dict["Spruce"], diameter_cm, height_m) / 1000
-            )  # dm3 to m3
+            return "Spruce"
         elif sp.startswith("betula") or "birch" in sp:
-            return (
-                BrandelVolume.get_volume_log(coeff_dict["Birch"], diameter_cm, height_m) / 1000
-            )  # dm3 to m3
-        else:
-            raise ValueError(f"Species '{species}' not supported.")
+            return "Birch"
+        return None
+
+    @staticmethod
+    def _part_of_sweden(latitude: float) -> str:
+        """'south' below 57°N, 'middle' below 59°N, else 'north'."""
+        if latitude < 57:
+            return "south"
+        elif latitude < 59:
+            return "middle"
+        return "north"
 
     @staticmethod
     def get_volume(
@@ -236,14 +275,163 @@ class BrandelVolume:
         The part_of_sweden is determined from latitude:
           'south' if lat < 57, 'middle' if lat < 59, else 'north'.
         """
-        if latitude < 57:
-            part_of_sweden: str = "south"
-        elif latitude < 59:
-            part_of_sweden = "middle"
-        else:
-            part_of_sweden = "north"
-
+        part_of_sweden = BrandelVolume._part_of_sweden(latitude)
         coeffs: Dict[str, List[float]] = BrandelVolume.get_coefficients(
             part_of_sweden, latitude, altitude, field_layer, over_bark
         )
         return BrandelVolume._internal_get_tree_volume(height_m, diameter_cm, species, coeffs)
+
+    # --- Array API ---
+    # Trees are grouped on everything `get_coefficients` depends on: whether
+    # the site is described in detail (altitude and field layer known), a
+    # latitude band, an altitude band, the spruce field layer index and
+    # over_bark. The bands of detailed sites follow the latitude and altitude
+    # limits of `get_coefficients`; without details only latitude > 60
+    # matters. Each group is resolved once, through `get_coefficients`, from
+    # a representative site.
+    _LATITUDE_LIMITS = (57, 59, 63, 65, 67)
+    _ALTITUDE_LIMITS = (200, 500)
+    _BAND_LATITUDES = (56, 58, 60, 64, 66, 68)
+    _BAND_ALTITUDES = (0, 200, 500)
+    _SPECIES_KEYS = ("Pine", "Spruce", "Birch")
+
+    @staticmethod
+    def _species_columns(species: npt.ArrayLike) -> np.ndarray:
+        """Index of each species in ``_SPECIES_KEYS``; -1 if not supported."""
+        species = np.asarray(species)
+
+        def index(name: str) -> int:
+            key = BrandelVolume._species_key(str(name))
+            return -1 if key is None else BrandelVolume._SPECIES_KEYS.index(key)
+
+        if species.dtype.kind in "iu":
+            table = np.array([index(sp.full_name) for sp in GLOBAL_TREE_SPECIES])
+            if np.any((species < 0) | (species >= len(table))):
+                raise ValueError(f"Species codes must be in [0, {len(table)}).")
+            return table[species]
+        columns = np.full(species.shape, -1, dtype=np.intp)
+        # Compare against the usual names first; only other names are parsed.
+        for name in ("pinus sylvestris", "picea abies", "betula pendula", "betula pubescens"):
+            columns[species == name] = index(name)
+        other = columns < 0
+        if other.any():
+            names, inverse = np.unique(species[other].astype(str), return_inverse=True)
+            columns[other] = np.array([index(name) for name in names], dtype=np.intp)[inverse]
+        return columns
+
+    @staticmethod
+    def _site_groups(
+        latitude: np.ndarray, altitude: np.ndarray, field_layer: np.ndarray, over_bark: np.ndarray
+    ) -> np.ndarray:
+        """Integer coefficient group of each tree, see `_resolve_group`."""
+        detailed = ~np.isnan(altitude) & ~np.isnan(field_layer)
+        latitude_band = np.where(
+            detailed,
+            np.searchsorted(BrandelVolume._LATITUDE_LIMITS, latitude, side="right"),
+            latitude > 60,
+        )
+        south = detailed & (latitude_band < 2)
+        north = detailed & (latitude_band >= 2)
+        altitude_band = np.where(
+            north,
+            np.searchsorted(BrandelVolume._ALTITUDE_LIMITS, np.nan_to_num(altitude), side="right"),
+            0,
+        )
+        mapping = np.array(BrandelVolume.fieldlayerTypeToIndex)
+        code = np.where(south, np.nan_to_num(field_layer), 0).astype(np.intp)
+        in_range = (code >= 1) & (code <= len(mapping))
+        vegetation = np.where(south & in_range, mapping[np.clip(code - 1, 0, len(mapping) - 1)], 0)
+        group = ((detailed * 6 + latitude_band) * 3 + altitude_band) * 6 + vegetation
+        return group * 2 + over_bark
+
+    @staticmethod
+    def _resolve_group(group: int) -> Tuple[List[float], List[float], List[float]]:
+        """Pine, spruce and birch coefficients of a group from `_site_groups`."""
+        group, over_bark = divmod(group, 2)
+        group, vegetation = divmod(group, 6)
+        group, altitude_band = divmod(group, 3)
+        detailed, latitude_band = divmod(group, 6)
+        if detailed:
+            latitude = BrandelVolume._BAND_LATITUDES[latitude_band]
+            altitude = BrandelVolume._BAND_ALTITUDES[altitude_band]
+            field_layer = BrandelVolume.fieldlayerTypeToIndex.index(vegetation) + 1
+        else:
+            latitude, altitude, field_layer = (61 if latitude_band else 60), None, None
+        coeffs = BrandelVolume.get_coefficients(
+            BrandelVolume._part_of_sweden(latitude),
+            latitude,
+            altitude,
+            field_layer,
+            bool(over_bark),
+        )
+        return tuple(coeffs[key] for key in BrandelVolume._SPECIES_KEYS)
+
+    @staticmethod
+    def get_volume_array(
+        species: npt.ArrayLike,
+        diameter_cm: npt.ArrayLike,
+        height_m: npt.ArrayLike,
+        latitude: npt.ArrayLike,
+        altitude: Optional[npt.ArrayLike] = None,
+        field_layer: Optional[npt.ArrayLike] = None,
+        over_bark: npt.ArrayLike = True,
+    ) -> BrandelVolumes:
+        """
+        Array version of :meth:`get_volume` for many trees at once.
+
+        All arguments broadcast against each other. ``species`` holds names,
+        matched as in :meth:`get_volume`, or integer codes from
+        :func:`~pyforestry.base.helpers.tree_species.tree_species_codes`;
+        ``field_layer`` holds integer field layer codes. A missing altitude or
+        field layer (``None`` or NaN) selects the coefficients by latitude
+        only, as in the scalar method.
+
+        The coefficients are resolved once per group of trees sharing a
+        latitude band, altitude band, field layer index and ``over_bark``,
+        and the volume function is then evaluated for all trees with NumPy.
+        Trees with a diameter below 5 cm or a height of at most 1.3 m get a
+        NaN volume and are flagged in the masks of the result, rather than
+        raising as the scalar method does. Unsupported species raise
+        ``ValueError``.
+        """
+        species = BrandelVolume._species_columns(species)
+        species, diameter_cm, height_m, latitude, altitude, field_layer, over_bark = (
+            np.broadcast_arrays(
+                species,
+                np.asarray(diameter_cm, dtype=float),
+                np.asarray(height_m, dtype=float),
+                np.asarray(latitude, dtype=float),
+                np.asarray(np.nan if altitude is None else altitude, dtype=float),
+                np.asarray(np.nan if field_layer is None else field_layer, dtype=float),
+                np.asarray(over_bark, dtype=bool),
+            )
+        )
+        if np.any(species < 0):
+            raise ValueError("Species must be pine, spruce or birch.")
+
+        valid_diameter = diameter_cm >= 5
+        valid_height = height_m > 1.3
+        valid = valid_diameter & valid_height
+        volume = np.full(species.shape, np.nan)
+        if not valid.any():
+            return BrandelVolumes(volume, valid_diameter, valid_height)
+
+        # Coefficient matrix of shape (groups present, species, 5).
+        groups = BrandelVolume._site_groups(
+            latitude[valid], altitude[valid], field_layer[valid], over_bark[valid]
+        )
+        present = np.flatnonzero(np.bincount(groups))
+        matrix = np.array([BrandelVolume._resolve_group(int(group)) for group in present])
+        row_of_group = np.zeros(present[-1] + 1, dtype=np.intp)
+        row_of_group[present] = np.arange(len(present))
+        c = matrix[row_of_group[groups], species[valid]]
+        d, h = diameter_cm[valid], height_m[valid]
+        exponent = (
+            c[:, 0]
+            + c[:, 1] * np.log10(d)
+            + c[:, 2] * np.log10(d + 20)
+            + c[:, 3] * np.log10(h)
+            + c[:, 4] * np.log10(h - 1.3)
+        )
+        volume[valid] = 10**exponent / 1000  # dm3 to m3
+        return BrandelVolumes(volume, valid_diameter, valid_height)
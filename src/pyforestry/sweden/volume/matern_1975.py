@@ -1,3 +1,6 @@
+import numpy as np
+
+
 def matern_1975_volume_sweden_oak(diameter_cm, height_m):
     """
     Calculate the volume of Oak trees based on Matérn (1975).
@@ -18,27 +21,21 @@ def matern_1975_volume_sweden_oak(diameter_cm, height_m):
         PM for Heureka 2004-01-20 Björn Elfving. Available:
         https://www.heurekaslu.org/w/images/9/93/Heureka_prognossystem_(Elfving_rapportutkast).pdf
     """
-    if height_m >= 10:
-        # For trees with height >= 10 m
-        volume = (
-            0.03522 * (diameter_cm**2) * height_m
-            + 0.08772 * diameter_cm * height_m
-            - 0.04905 * (diameter_cm**2)
-        )
-    else:
-        # For trees with height < 10 m
-        volume = (
-            0.03522 * (diameter_cm**2) * height_m
-            + 0.08772 * diameter_cm * height_m
-            - 0.04905 * (diameter_cm**2)
-            + ((1 - (height_m / 10)) ** 2)
-            * (
-                0.01682 * (diameter_cm**2) * height_m
-                + 0.01108 * diameter_cm * height_m
-                - 0.02167 * diameter_cm * (height_m**2)
-                + 0.04905 * (diameter_cm**2)
-            )
+    # Trees shorter than 10 m get a correction term weighted by (1 - h/10)**2;
+    # the weight is clipped to zero from 10 m so arrays need no branching.
+    weight = np.maximum(1 - (height_m / 10), 0) ** 2
+    volume = (
+        0.03522 * (diameter_cm**2) * height_m
+        + 0.08772 * diameter_cm * height_m
+        - 0.04905 * (diameter_cm**2)
+        + weight
+        * (
+            0.01682 * (diameter_cm**2) * height_m
+            + 0.01108 * diameter_cm * height_m
+            - 0.02167 * diameter_cm * (height_m**2)
+            + 0.04905 * (diameter_cm**2)
         )
+    )
     return volume / 1000
 
 
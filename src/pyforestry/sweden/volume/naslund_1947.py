@@ -1,9 +1,142 @@
 """Volume and form factor equations from Näslund (1947)."""
 
-from typing import Optional
+from typing import Optional, Sequence
 
+import numpy as np
+
+from pyforestry.base.helpers.tree_species import GLOBAL_TREE_SPECIES, tree_species_names
 from pyforestry.sweden.timber import SweTimber
 
+_SPECIES_GROUPS = {
+    "pinus sylvestris": "pine",
+    "picea abies": "spruce",
+    "betula": "birch",
+    "betula pendula": "birch",
+    "betula pubescens": "birch",
+}
+_GROUPS = ("pine", "spruce", "birch")
+_REGIONS = ("southern", "northern")
+
+# Inputs an equation needs for its detailed (crown and/or bark) variant.
+_DETAIL_INPUTS = {
+    ("southern", "pine", True): ("crown", "bark"),
+    ("southern", "pine", False): ("crown", "bark"),
+    ("southern", "spruce", True): ("crown",),
+    ("southern", "spruce", False): ("crown",),
+    ("southern", "birch", True): ("bark",),
+    ("southern", "birch", False): ("bark",),
+    ("northern", "pine", True): ("crown", "bark"),
+    ("northern", "pine", False): ("crown", "bark"),
+    ("northern", "spruce", True): ("crown",),
+    ("northern", "spruce", False): ("crown",),
+    ("northern", "birch", True): ("crown", "bark"),
+    ("northern", "birch", False): ("crown",),
+}
+
+# Every (region, species group, over_bark) combination and every equation,
+# (region, species group, over_bark, detailed), in the order of the integer
+# keys computed by `_equation_runs`.
+_COMBINATIONS = [(reg, grp, ob) for reg in _REGIONS for grp in _GROUPS for ob in (False, True)]
+_EQUATIONS = [
+    (*combination, detailed) for combination in _COMBINATIONS for detailed in (False, True)
+]
+_NEEDS_CROWN = np.array(["crown" in _DETAIL_INPUTS[c] for c in _COMBINATIONS])
+_NEEDS_BARK = np.array(["bark" in _DETAIL_INPUTS[c] for c in _COMBINATIONS])
+
+
+def _match(values: np.ndarray, choices: Sequence[str]) -> np.ndarray:
+    """Index of each value in ``choices``, ignoring case; -1 where none matches."""
+    index = np.full(values.shape, -1, dtype=np.intp)
+    for i, choice in enumerate(choices):
+        index[values == choice] = i
+    unmatched = index < 0
+    if unmatched.any():
+        # Only values not already in lower case pay for the conversion.
+        lowered = np.char.lower(values[unmatched].astype(str))
+        found = np.full(lowered.shape, -1, dtype=np.intp)
+        for i, choice in enumerate(choices):
+            found[lowered == choice] = i
+        index[unmatched] = found
+    return index
+
+
+def _tree_columns(
+    species, region, diameter_cm, height_m, double_bark_mm, crown_base_height_m, over_bark
+):
+    """
+    Flattened, broadcast tree columns for the array equations.
+
+    Species become indices into ``_GROUPS`` and regions indices into
+    ``_REGIONS``; missing bark and crown values become NaN. The broadcast
+    shape is returned first.
+    """
+    species = np.asarray(species)
+    group_of = np.array([_GROUPS.index(group) for group in _SPECIES_GROUPS.values()] + [-1])
+    if species.dtype.kind in "iu":
+        # Map every species code through a table rather than every tree's name.
+        names = tree_species_names(np.arange(len(GLOBAL_TREE_SPECIES)))
+        if np.any((species < 0) | (species >= len(names))):
+            raise ValueError(f"Species codes must be in [0, {len(names)}).")
+        group = group_of[_match(names, list(_SPECIES_GROUPS))][species]
+    else:
+        group = group_of[_match(species, list(_SPECIES_GROUPS))]
+    if np.any(group < 0):
+        raise ValueError(
+            "Species must be one of: pinus sylvestris, picea abies, "
+            "betula, betula pendula, betula pubescens."
+        )
+    region = _match(np.asarray(region), _REGIONS)
+    if np.any(region < 0):
+        raise ValueError("Region must be 'northern' or 'southern'.")
+    columns = np.broadcast_arrays(
+        group,
+        region,
+        np.asarray(diameter_cm, dtype=float),
+        np.asarray(height_m, dtype=float),
+        np.asarray(np.nan if double_bark_mm is None else double_bark_mm, dtype=float),
+        np.asarray(np.nan if crown_base_height_m is None else crown_base_height_m, dtype=float),
+        np.asarray(over_bark, dtype=bool),
+    )
+    return (columns[0].shape, *(column.ravel() for column in columns))
+
+
+def _equation_runs(group, region, over_bark, crown, bark):
+    """
+    Sort trees by the equation that applies to them.
+
+    Returns the sorting order and an ``(equation, slice)`` pair for each
+    equation in `_EQUATIONS` that applies to any tree, the slice selecting
+    its trees in sorted order. As in the scalar equations, a crown base
+    height or bark thickness of zero counts as missing.
+    """
+    combination = (region * len(_GROUPS) + group) * 2 + over_bark
+    has_crown = ~np.isnan(crown) & (crown != 0)
+    has_bark = ~np.isnan(bark) & (bark != 0)
+    detailed = (has_crown | ~_NEEDS_CROWN[combination]) & (has_bark | ~_NEEDS_BARK[combination])
+    key = (combination * 2 + detailed).astype(np.int8)
+    order = np.argsort(key, kind="stable")
+    bounds = np.concatenate([[0], np.cumsum(np.bincount(key, minlength=len(_EQUATIONS)))])
+    runs = [
+        (equation, slice(start, stop))
+        for equation, start, stop in zip(_EQUATIONS, bounds[:-1], bounds[1:], strict=True)
+        if stop > start
+    ]
+    return order, runs
+
+
+def _square(x: np.ndarray) -> np.ndarray:
+    """
+    ``x**2`` as computed by Python floats in the scalar equations.
+
+    Python's ``**`` calls the C library ``pow``, which is not always
+    correctly rounded and so differs from ``x * x`` (and from NumPy's
+    ``power``) in the last bit for some values. Squaring the distinct values
+    in Python keeps the array equations bit-identical to the scalar ones;
+    measured diameters and heights have few distinct values.
+    """
+    values, inverse = np.unique(x, return_inverse=True)
+    return np.array([value**2 for value in values.tolist()])[inverse].reshape(x.shape)
+
 
 class NaslundVolume:
     """Stem volume equations for southern and northern Sweden."""
@@ -31,6 +164,175 @@ class NaslundVolume:
             "is not implemented.",
         )  # pragma: no cover - defensive
 
+    # Terms of the volume equations, keyed on (region, species group,
+    # over_bark, detailed): the products summed, in order, and their
+    # coefficients. Products follow the operand order of the scalar equations
+    # (``hd2`` is ``a * h * d**2``, ``d2h`` is ``a * d**2 * h``, ...) so that
+    # the array path rounds exactly like the scalar one. Subtracted terms have
+    # negative coefficients, which is exact in floating point.
+    _ARRAY_TERMS = {
+        ("southern", "pine", True, True): (
+            ("d2", "hd2", "cd2", "dh2", "dhB"),
+            (0.1193, 0.02574, 0.007262, 0.004054, -0.003112),
+        ),
+        ("southern", "pine", True, False): (
+            ("d2", "hd2", "dh2"),
+            (0.1072, 0.02427, 0.007315),
+        ),
+        ("southern", "pine", False, True): (
+            ("d2", "hd2", "cd2", "dh2", "dhB"),
+            (0.07141, 0.02580, 0.009430, 0.003511, 0.001052),
+        ),
+        ("southern", "pine", False, False): (
+            ("d2", "hd2", "dh2"),
+            (0.06271, 0.03208, 0.005725),
+        ),
+        ("southern", "spruce", True, True): (
+            ("d2", "hd2", "cd2", "dh2", "h2"),
+            (0.1059, 0.01968, 0.006168, 0.01468, -0.04585),
+        ),
+        ("southern", "spruce", True, False): (
+            ("d2", "hd2", "dh2", "h2"),
+            (0.1104, 0.01928, 0.01815, -0.04936),
+        ),
+        ("southern", "spruce", False, True): (
+            ("d2", "hd2", "cd2", "dh2", "h2"),
+            (0.1039, 0.01959, 0.005942, 0.01417, -0.04332),
+        ),
+        ("southern", "spruce", False, False): (
+            ("d2", "hd2", "dh2", "h2"),
+            (0.1076, 0.01929, 0.01723, -0.04615),
+        ),
+        ("southern", "birch", True, True): (
+            ("d2", "hd2", "dh2", "h2", "dhB"),
+            (0.09595, 0.02375, 0.01221, -0.03636, -0.004605),
+        ),
+        ("southern", "birch", True, False): (
+            ("d2", "hd2", "dh2", "h2"),
+            (0.1432, 0.008561, 0.02180, -0.06630),
+        ),
+        ("southern", "birch", False, True): (
+            ("d2", "hd2", "dh2", "h2", "dhB"),
+            (0.08953, 0.02101, 0.01171, -0.03189, -0.0007244),
+        ),
+        ("southern", "birch", False, False): (
+            ("d2", "hd2", "dh2", "h2"),
+            (0.09944, 0.01862, 0.01278, -0.03544),
+        ),
+        ("northern", "pine", True, True): (
+            ("d2", "d2h", "d2c", "dhB"),
+            (0.1018, 0.03112, 0.007312, -0.002906),
+        ),
+        ("northern", "pine", True, False): (
+            ("d2", "d2h", "dh2"),
+            (0.09314, 0.03069, 0.002818),
+        ),
+        ("northern", "pine", False, True): (
+            ("d2", "d2h", "d2c", "dhB"),
+            (0.06059, 0.03153, 0.007919, 0.001773),
+        ),
+        ("northern", "pine", False, False): (
+            ("d2", "d2h", "dh2"),
+            (0.05491, 0.03641, 0.002699),
+        ),
+        ("northern", "spruce", True, True): (
+            ("d2", "d2h", "d2c", "dh2", "h2"),
+            (0.1102, 0.01648, 0.005901, 0.01929, -0.05565),
+        ),
+        ("northern", "spruce", True, False): (
+            ("d2", "d2h", "dh2", "h2"),
+            (0.1202, 0.01504, 0.02341, -0.06590),
+        ),
+        ("northern", "spruce", False, True): (
+            ("d2", "d2h", "d2c", "dh2", "h2"),
+            (0.1057, 0.01658, 0.006267, 0.01782, -0.04681),
+        ),
+        ("northern", "spruce", False, False): (
+            ("d2", "d2h", "dh2", "h2"),
+            (0.1153, 0.01522, 0.02170, -0.05501),
+        ),
+        ("northern", "birch", True, True): (
+            ("d2", "d2h", "d2c", "dh2", "dhB"),
+            (0.04192, 0.02927, 0.003263, 0.003719, -0.001692),
+        ),
+        ("northern", "birch", True, False): (
+            ("d2", "d2h", "dh2"),
+            (0.03715, 0.02892, 0.004983),
+        ),
+        ("northern", "birch", False, True): (
+            ("d2", "d2h", "d2c", "dh2"),
+            (0.03328, 0.02876, 0.002991, 0.003695),
+        ),
+        ("northern", "birch", False, False): (
+            ("d2", "d2h", "dh2"),
+            (0.02703, 0.03023, 0.004346),
+        ),
+    }
+
+    # Products as functions of the coefficient ``a``, diameter ``d``, height
+    # ``h``, crown base height ``c``, double bark ``B`` and the squares ``d2``
+    # and ``h2``.
+    _ARRAY_PRODUCTS = {
+        "d2": lambda a, d, h, c, B, d2, h2: a * d2,
+        "hd2": lambda a, d, h, c, B, d2, h2: a * h * d2,
+        "cd2": lambda a, d, h, c, B, d2, h2: a * c * d2,
+        "d2h": lambda a, d, h, c, B, d2, h2: a * d2 * h,
+        "d2c": lambda a, d, h, c, B, d2, h2: a * d2 * c,
+        "dh2": lambda a, d, h, c, B, d2, h2: a * d * h2,
+        "dhB": lambda a, d, h, c, B, d2, h2: a * d * h * B,
+        "h2": lambda a, d, h, c, B, d2, h2: a * h2,
+    }
+
+    @staticmethod
+    def calculate_array(
+        species,
+        diameter_cm,
+        height_m,
+        double_bark_mm=None,
+        crown_base_height_m=None,
+        over_bark=True,
+        region="southern",
+    ) -> np.ndarray:
+        """
+        Array version of :meth:`calculate`, in cubic metres.
+
+        The arguments are the fields of :class:`SweTimber` as columns that
+        broadcast against each other. ``species`` holds names or integer
+        codes from :func:`~pyforestry.base.helpers.tree_species.tree_species_codes`.
+        Missing crown base heights or bark thicknesses are ``None`` or NaN; as
+        in the scalar path, zero also selects the equation without that input.
+        Each equation is evaluated once on the rows it applies to, with the
+        arithmetic of the scalar path, so the results are bit-identical.
+        """
+        shape, group, region, diameter_cm, height_m, bark, crown, over_bark = _tree_columns(
+            species, region, diameter_cm, height_m, double_bark_mm, crown_base_height_m, over_bark
+        )
+        if np.any(height_m <= 0):
+            raise ValueError("Height must be larger than 0 m.")
+        if np.any(diameter_cm < 0):
+            raise ValueError("Diameter must be larger or equal to 0 cm.")
+        if np.any(crown >= height_m):
+            raise ValueError("Crown base height cannot be higher than tree height.")
+
+        order, runs = _equation_runs(group, region, over_bark, crown, bark)
+        d, h, c, B = diameter_cm[order], height_m[order], crown[order], bark[order]
+        columns = (d, h, c, B, _square(d), _square(h))
+        sorted_volume = np.empty(len(order))
+        for equation, rows in runs:
+            args = [column[rows] for column in columns]
+            products, coefficients = NaslundVolume._ARRAY_TERMS[equation]
+            terms = [
+                NaslundVolume._ARRAY_PRODUCTS[product](coefficient, *args)
+                for product, coefficient in zip(products, coefficients, strict=True)
+            ]
+            value = terms[0]
+            for term in terms[1:]:
+                value = value + term
+            sorted_volume[rows] = value / 1000
+        volume = np.empty(len(order))
+        volume[order] = sorted_volume
+        return volume.reshape(shape)
+
     @staticmethod
     def _southern_pine_volume(timber: SweTimber) -> float:
         """Southern Sweden pine volume in dm³."""
@@ -305,6 +607,81 @@ class NaslundFormFactor:
             f"Form factor calculation for {species} in {region} region is not implemented."
         )  # pragma: no cover - defensive
 
+    # Coefficients of every form factor equation, keyed on (region, species
+    # group, over_bark, detailed). The columns multiply ``1``, ``1/h``,
+    # ``h/d``, ``c*h/d**2`` (coefficient applied before the division),
+    # ``h/d**2``, ``B`` and ``K``; the equations are evaluated in that order
+    # so the array path reproduces the scalar arithmetic exactly.
+    _ARRAY_COEFFICIENTS = {
+        ("southern", "pine", True, True): (420.16, 1519.24, 51.62, 0, 0, -3.962, -0.9246),
+        ("southern", "pine", True, False): (308.97, 1365.38, 93.14, 0, 0, 0, 0),
+        ("southern", "pine", False, True): (448.53, 909.21, 44.71, 0, 0, 1.339, -1.201),
+        ("southern", "pine", False, False): (408.49, 798.46, 72.89, 0, 0, 0, 0),
+        ("southern", "spruce", True, True): (329.09, 1348.92, 186.94, -583.74, 0, 0, -0.7854),
+        ("southern", "spruce", True, False): (245.09, 1405.66, 231.11, -628.48, 0, 0, 0),
+        ("southern", "spruce", False, True): (325.04, 1322.62, 180.36, -551.55, 0, 0, -0.7566),
+        ("southern", "spruce", False, False): (245.57, 1369.89, 219.34, -587.65, 0, 0, 0),
+        ("southern", "birch", True, True): (302.45, 1221.63, 155.44, -462.95, 0, -5.864, 0),
+        ("southern", "birch", True, False): (109.01, 1823.03, 277.56, -844.17, 0, 0, 0),
+        ("southern", "birch", False, True): (267.44, 1139.98, 149.04, -406.04, 0, -0.9224, 0),
+        ("southern", "birch", False, False): (237.03, 1266.05, 162.72, -451.26, 0, 0, 0),
+        ("northern", "pine", True, True): (489.35, 1296.11, 0, 0, 0, -3700, -0.9310),
+        ("northern", "pine", True, False): (390.81, 1185.86, 35.88, 0, 0, 0, 0),
+        ("northern", "pine", False, True): (502.22, 771.5, 0, 0, 0, 2.257, -1.008),
+        ("northern", "pine", False, False): (463.55, 699.14, 34.36, 0, 0, 0, 0),
+        ("northern", "spruce", True, True): (290.93, 1346.06, 226.83, 0, -595.98, 0, -0.7980),
+        ("northern", "spruce", True, False): (193.84, 1467.46, 276.26, 0, -700.45, 0, 0),
+        ("northern", "spruce", False, True): (306.60, 1363.31, 199.71, 0, -591.81, 0, -0.7403),
+        ("northern", "spruce", False, False): (221.51, 1431.21, 244.14, 0, -652.09, 0, 0),
+        ("northern", "birch", True, True): (414.20, 533.74, 47.35, 0, 0, -2.154, -0.4154),
+        ("northern", "birch", True, False): (368.17, 473, 63.44, 0, 0, 0, 0),
+        ("northern", "birch", False, True): (404.30, 423.71, 47.05, 0, 0, 0, -0.3808),
+        ("northern", "birch", False, False): (384.88, 344.14, 55.34, 0, 0, 0, 0),
+    }
+
+    @staticmethod
+    def calculate_array(
+        species,
+        height_m,
+        diameter_cm,
+        double_bark_mm=None,
+        crown_base_height_m=None,
+        over_bark=True,
+        region="southern",
+    ) -> np.ndarray:
+        """
+        Array version of :meth:`calculate` for many trees at once.
+
+        All arguments broadcast against each other; ``species`` may also hold
+        integer species codes. Missing crown base heights or bark thicknesses
+        are given as ``None`` or NaN; like the scalar method, a value of zero
+        also selects the equation without that input.
+        The equations are evaluated per group with the same arithmetic as the
+        scalar path, so the results are bit-identical.
+        """
+        shape, group, region, diameter_cm, height_m, bark, crown, over_bark = _tree_columns(
+            species, region, diameter_cm, height_m, double_bark_mm, crown_base_height_m, over_bark
+        )
+        if np.any(diameter_cm < 5):
+            raise ValueError("Diameter must be larger than 5 cm.")
+
+        order, runs = _equation_runs(group, region, over_bark, crown, bark)
+        d, h, crown, bark = diameter_cm[order], height_m[order], crown[order], bark[order]
+        d_squared = _square(d)
+        sorted_form_factor = np.empty(len(order))
+        for equation, rows in runs:
+            c = NaslundFormFactor._ARRAY_COEFFICIENTS[equation]
+            value = c[0] + c[1] * (1 / h[rows]) + c[2] * (h[rows] / d[rows])
+            value = value + c[3] * h[rows] / d_squared[rows] + c[4] * (h[rows] / d_squared[rows])
+            if equation[3]:
+                B = ((bark[rows] / 10) / d[rows]) * 100
+                K = ((h[rows] - crown[rows]) / h[rows]) * 100
+                value = value + c[5] * np.nan_to_num(B) + c[6] * np.nan_to_num(K)
+            sorted_form_factor[rows] = value / 1000
+        form_factor = np.empty(len(order))
+        form_factor[order] = sorted_form_factor
+        return form_factor.reshape(shape)
+
     @staticmethod
     def _southern_pine_form_factor(
         height_m: float,
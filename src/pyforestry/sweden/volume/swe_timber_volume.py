@@ -0,0 +1,254 @@
+"""
+Stem volumes of many trees with the model choice of `SweTimber.getvolume`.
+
+`swe_timber_volumes` takes a table of trees, picks the volume function of
+each tree with the rules of :meth:`SweTimber.getvolume`, sorts the trees by
+function once and evaluates every function on its trees as arrays.
+"""
+
+from typing import Any, Mapping
+
+import numpy as np
+
+from pyforestry.base.helpers.tree_species import GLOBAL_TREE_SPECIES
+from pyforestry.sweden.volume.andersson_1954 import (
+    andersson_1954_volume_small_trees_birch_height_above_4_m,
+    andersson_1954_volume_small_trees_birch_under_diameter_5_cm,
+    andersson_1954_volume_small_trees_pine,
+    andersson_1954_volume_small_trees_spruce,
+)
+from pyforestry.sweden.volume.brandel_1990 import BrandelVolume
+from pyforestry.sweden.volume.carbonnier_1954 import carbonnier_1954_volume_larch
+from pyforestry.sweden.volume.eriksson_1973 import (
+    Eriksson_1973_volume_aspen_Sweden,
+    Eriksson_1973_volume_lodgepole_pine_Sweden,
+)
+from pyforestry.sweden.volume.matern_1975 import (
+    matern_1975_volume_sweden_beech,
+    matern_1975_volume_sweden_oak,
+)
+
+#: Volume functions chosen by `swe_timber_volumes`, in the order of its
+#: model codes. Trees with a negative diameter get a volume of zero; the
+#: Brandel models are evaluated with `BrandelVolume.get_volume_array`.
+VOLUME_MODELS = (
+    "zero",
+    "andersson_1954_pine",
+    "andersson_1954_spruce",
+    "andersson_1954_birch_height_above_4_m",
+    "andersson_1954_birch_under_diameter_5_cm",
+    "brandel_1990_pine",
+    "brandel_1990_spruce",
+    "brandel_1990_birch",
+    "carbonnier_1954_larch",
+    "eriksson_1973_aspen",
+    "eriksson_1973_lodgepole_pine",
+    "matern_1975_beech",
+    "matern_1975_oak",
+)
+(
+    _ZERO,
+    _ANDERSSON_PINE,
+    _ANDERSSON_SPRUCE,
+    _ANDERSSON_BIRCH_TALL,
+    _ANDERSSON_BIRCH_SHORT,
+    _BRANDEL_PINE,
+    _BRANDEL_SPRUCE,
+    _BRANDEL_BIRCH,
+    _CARBONNIER_LARCH,
+    _ERIKSSON_ASPEN,
+    _ERIKSSON_CONTORTA,
+    _MATERN_BEECH,
+    _MATERN_OAK,
+) = range(len(VOLUME_MODELS))
+
+_FUNCTIONS = {
+    _ANDERSSON_PINE: andersson_1954_volume_small_trees_pine,
+    _ANDERSSON_SPRUCE: andersson_1954_volume_small_trees_spruce,
+    _ANDERSSON_BIRCH_TALL: andersson_1954_volume_small_trees_birch_height_above_4_m,
+    _ANDERSSON_BIRCH_SHORT: andersson_1954_volume_small_trees_birch_under_diameter_5_cm,
+    _CARBONNIER_LARCH: carbonnier_1954_volume_larch,
+    _ERIKSSON_ASPEN: Eriksson_1973_volume_aspen_Sweden,
+    _ERIKSSON_CONTORTA: Eriksson_1973_volume_lodgepole_pine_Sweden,
+    _MATERN_BEECH: matern_1975_volume_sweden_beech,
+    _MATERN_OAK: matern_1975_volume_sweden_oak,
+}
+
+# Species groups of `SweTimber.getvolume`. Species outside every group are
+# treated as birch.
+_LARCH, _PINE, _SPRUCE, _BIRCH, _ASPEN, _CONTORTA, _BEECH, _OAK = range(8)
+
+# Species the Brandel models are evaluated for.
+_BRANDEL_SPECIES = {
+    _BRANDEL_PINE: "pinus sylvestris",
+    _BRANDEL_SPRUCE: "picea abies",
+    _BRANDEL_BIRCH: "betula pendula",
+}
+
+_REGION_LATITUDES = {"northern": 64, "southern": 58}
+
+
+def _species_group(name: str) -> int:
+    """Species group of a lower-case species name, as in `SweTimber.getvolume`."""
+    if name.startswith("larix"):
+        return _LARCH
+    if name == "pinus sylvestris":
+        return _PINE
+    if name == "picea abies":
+        return _SPRUCE
+    if name in ("fraxinus excelsior", "populus tremula") or name.startswith("alnus"):
+        return _ASPEN
+    if name == "pinus contorta":
+        return _CONTORTA
+    if name in ("fagus sylvatica", "carpinus betulus"):
+        return _BEECH
+    if name.startswith("quercus"):
+        return _OAK
+    return _BIRCH
+
+
+def _species_groups(species: np.ndarray) -> np.ndarray:
+    """Species group of each tree, from names or `tree_species_codes`."""
+    if species.dtype.kind in "iu":
+        table = np.array([_species_group(sp.full_name.lower()) for sp in GLOBAL_TREE_SPECIES])
+        if np.any((species < 0) | (species >= len(table))):
+            raise ValueError(f"Species codes must be in [0, {len(table)}).")
+        return table[species]
+    groups = np.full(species.shape, -1, dtype=np.intp)
+    # Compare against the usual names first; only other names are parsed.
+    for name in ("pinus sylvestris", "picea abies", "betula pendula", "betula pubescens"):
+        groups[species == name] = _species_group(name)
+    other = groups < 0
+    if other.any():
+        names, inverse = np.unique(species[other].astype(str), return_inverse=True)
+        table = np.array([_species_group(name.lower()) for name in names], dtype=np.intp)
+        groups[other] = table[inverse]
+    return groups
+
+
+def _column(table: Mapping[str, Any], name: str, default: Any, dtype: Any) -> np.ndarray:
+    """Column ``name`` of ``table`` as an array, or ``default`` if it is missing."""
+    value = table[name] if name in table else default
+    return np.asarray(np.nan if value is None else value, dtype=dtype)
+
+
+def _latitudes(latitude: np.ndarray, region: np.ndarray) -> np.ndarray:
+    """Latitudes, with missing values taken from the region as in `SweTimber`."""
+    latitude, region = np.broadcast_arrays(latitude, region)
+    missing = np.isnan(latitude)
+    if not missing.any():
+        return latitude
+    region = np.char.lower(region[missing].astype(str))
+    filled = np.full(region.shape, np.nan)
+    for name, region_latitude in _REGION_LATITUDES.items():
+        filled[region == name] = region_latitude
+    if np.isnan(filled).any():
+        raise ValueError("Region must be 'northern' or 'southern'.")
+    latitude = latitude.copy()
+    latitude[missing] = filled
+    return latitude
+
+
+def volume_models(species, diameter_cm, height_m) -> np.ndarray:
+    """
+    Index into `VOLUME_MODELS` of the function `SweTimber.getvolume` uses.
+
+    ``species`` holds names or integer codes from
+    :func:`~pyforestry.base.helpers.tree_species.tree_species_codes`.
+    """
+    groups = _species_groups(np.asarray(species))
+    groups, diameter_cm, height_m = np.broadcast_arrays(
+        groups, np.asarray(diameter_cm, dtype=float), np.asarray(height_m, dtype=float)
+    )
+    small = (diameter_cm < 4.5) | (height_m < 7)
+    birch = np.where(
+        small,
+        np.where(height_m > 4, _ANDERSSON_BIRCH_TALL, _ANDERSSON_BIRCH_SHORT),
+        _BRANDEL_BIRCH,
+    )
+    by_group = [
+        (groups == _LARCH, np.where(diameter_cm > 50, _BRANDEL_PINE, _CARBONNIER_LARCH)),
+        (groups == _PINE, np.where(small, _ANDERSSON_PINE, _BRANDEL_PINE)),
+        (groups == _SPRUCE, np.where(small, _ANDERSSON_SPRUCE, _BRANDEL_SPRUCE)),
+        (groups == _ASPEN, _ERIKSSON_ASPEN),
+        (groups == _CONTORTA, np.where(small, _ANDERSSON_PINE, _ERIKSSON_CONTORTA)),
+        (groups == _BEECH, _MATERN_BEECH),
+        (groups == _OAK, _MATERN_OAK),
+    ]
+    models = np.select([mask for mask, _ in by_group], [model for _, model in by_group], birch)
+    return np.where(diameter_cm < 0, _ZERO, models).astype(np.int8)
+
+
+def swe_timber_volumes(table: Mapping[str, Any]) -> np.ndarray:
+    """
+    Stem volume (m³) of every tree in ``table``, as `SweTimber.getvolume`.
+
+    ``table`` maps column names to arrays (a dict of arrays or a pandas
+    DataFrame). Its columns are named like the arguments of `SweTimber`:
+
+    - ``species``: names or integer codes from
+      :func:`~pyforestry.base.helpers.tree_species.tree_species_codes`;
+    - ``diameter_cm`` and ``height_m``;
+    - optionally ``over_bark`` (default true), ``region`` (default
+      ``"southern"``) and ``latitude`` (default from the region: 64 in the
+      north, 58 in the south, also where NaN);
+    - optionally ``altitude`` and ``field_layer`` (an integer field layer
+      code); where either is missing or NaN the Brandel functions select
+      their coefficients by latitude only.
+
+    Columns broadcast against each other, so site columns may be scalars.
+    Trees are sorted by volume function once and each function is evaluated
+    on its trees as arrays, see `volume_models`. Trees the scalar method
+    would raise for (Brandel trees under 5 cm, between the small-tree limit
+    of 4.5 cm and the 5 cm limit of the Brandel functions) get a NaN volume.
+    """
+    species = np.asarray(table["species"])
+    diameter_cm = _column(table, "diameter_cm", None, float)
+    height_m = _column(table, "height_m", None, float)
+    models = volume_models(species, diameter_cm, height_m)
+    latitude = _latitudes(
+        _column(table, "latitude", None, float), _column(table, "region", "southern", str)
+    )
+    columns = np.broadcast_arrays(
+        models,
+        diameter_cm,
+        height_m,
+        latitude,
+        _column(table, "altitude", None, float),
+        _column(table, "field_layer", None, float),
+        _column(table, "over_bark", True, bool),
+    )
+    shape = columns[0].shape
+    models, diameter_cm, height_m, latitude, altitude, field_layer, over_bark = (
+        column.ravel() for column in columns
+    )
+
+    order = np.argsort(models, kind="stable")
+    bounds = np.concatenate([[0], np.cumsum(np.bincount(models, minlength=len(VOLUME_MODELS)))])
+    diameter_cm, height_m = diameter_cm[order], height_m[order]
+    volume = np.zeros(len(order))
+    for model, function in _FUNCTIONS.items():
+        rows = slice(bounds[model], bounds[model + 1])
+        if rows.stop > rows.start:
+            # A zero diameter gives log(0) in the Andersson birch function.
+            with np.errstate(divide="ignore"):
+                volume[rows] = function(diameter_cm[rows], height_m[rows])
+
+    # The Brandel models share one call, with the species of each model.
+    rows = slice(bounds[_BRANDEL_PINE], bounds[_BRANDEL_BIRCH + 1])
+    if rows.stop > rows.start:
+        brandel = order[rows]
+        names = np.array([_BRANDEL_SPECIES[model] for model in sorted(_BRANDEL_SPECIES)])
+        volume[rows] = BrandelVolume.get_volume_array(
+            names[models[brandel] - _BRANDEL_PINE],
+            diameter_cm[rows],
+            height_m[rows],
+            latitude[brandel],
+            altitude[brandel],
+            field_layer[brandel],
+            over_bark[brandel],
+        ).volume
+
+    result = np.empty(len(order))
+    result[order] = volume
+    return result.reshape(shape)
@@ -1,4 +1,6 @@
+import numpy as np
 import pytest
+from scipy.integrate import quad
 
 from pyforestry.base.timber.timber_base import Timber, TimberVolumeIntegrator
 
@@ -57,3 +59,42 @@ def test_integrate_volume_constant_diameter():
     vol = TimberVolumeIntegrator.integrate_volume(0.0, 10.0, taper)
     expected = pytest.approx(3.141592653589793 * (0.05**2) * 10.0)
     assert vol == expected
+
+
+class ConeTaper:
+    """Array taper model of a cone with a kink, split at ``segment_heights``."""
+
+    segment_heights = (4.0,)
+
+    def __init__(self):
+        self.calls = 0
+
+    def get_diameter_array(self, heights):
+        self.calls += 1
+        return np.where(heights < 4.0, 20.0 - heights, 16.0 - 0.5 * (heights - 4.0))
+
+
+def _cone_volume(h1, h2):
+    def area(h):
+        return np.pi * (np.interp(h, [0, 4, 36], [20, 16, 0]) / 200) ** 2
+
+    return quad(area, h1, h2, points=[4.0])[0]
+
+
+def test_integrate_volumes_batch_is_exact_for_piecewise_cone():
+    taper = ConeTaper()
+    h1 = np.array([0.0, 1.0, 5.0, 3.0])
+    h2 = np.array([10.0, 3.5, 20.0, 2.0])
+    vols = TimberVolumeIntegrator.integrate_volumes(h1, h2, taper, order=4)
+
+    assert taper.calls == 1
+    expected = [_cone_volume(a, b) for a, b in zip(h1[:3], h2[:3], strict=True)]
+    np.testing.assert_allclose(vols[:3], expected, rtol=1e-12)
+    assert vols[3] == 0.0
+
+
+def test_integrate_volume_gauss_scalar():
+    taper = ConeTaper()
+    vol = TimberVolumeIntegrator.integrate_volume_gauss(1.0, 30.0, taper)
+    assert vol == pytest.approx(_cone_volume(1.0, 30.0), rel=1e-12)
+    assert TimberVolumeIntegrator.integrate_volume_gauss(5.0, 2.0, taper) == 0.0
@@ -0,0 +1,140 @@
+import multiprocessing
+
+import numpy as np
+import pytest
+import xarray as xr
+
+import pyforestry.base.pricelist.cube_cache as cc
+from pyforestry.base.pricelist import SolutionCube, SolutionCubeCache
+from pyforestry.base.pricelist.solutioncube import _hash_pricelist
+
+PRICE = {"Common": {"a": 1}}
+GRID = dict(species_list=["pine"], dbh_range=(10, 12), height_range=(10, 10))
+
+
+class DummyTaper:
+    pass
+
+
+def _fake_cube(pricelist_data, n_dbh=2):
+    ds = xr.Dataset(
+        {
+            "total_value": (("species", "height", "dbh"), np.ones((1, 1, n_dbh))),
+            "solution_sections": (("species", "height", "dbh"), np.full((1, 1, n_dbh), "[]")),
+        },
+        coords={"species": ["pine"], "height": [10.0], "dbh": np.arange(n_dbh) * 2 + 10},
+        attrs={"pricelist_hash": _hash_pricelist(pricelist_data), "taper_model": "DummyTaper"},
+    )
+    return SolutionCube(ds)
+
+
+@pytest.fixture
+def counting_generate(monkeypatch):
+    calls = []
+
+    def fake_generate(pricelist_data, taper_model, species_list, dbh_range, **kwargs):
+        calls.append((dbh_range, kwargs))
+        return _fake_cube(pricelist_data)
+
+    monkeypatch.setattr(SolutionCube, "generate", staticmethod(fake_generate))
+    return calls
+
+
+def test_generate_on_miss_reuse_on_hit(tmp_path, counting_generate):
+    cache = SolutionCubeCache(tmp_path / "cache")
+    first = cache.get_or_generate(PRICE, DummyTaper, **GRID)
+    second = cache.get_or_generate(PRICE, DummyTaper, **GRID)
+
+    assert len(counting_generate) == 1
+    assert isinstance(second.dataset["total_value"].variable._data, np.memmap)
+    assert first.lookup("pine", 10, 10.0) == second.lookup("pine", 10, 10.0) == (1.0, [])
+    assert len(cache.entries()) == 1
+    assert not [p for p in (tmp_path / "cache").iterdir() if p.name.startswith(".")]
+
+
+def test_key_depends_on_every_component(monkeypatch):
+    base = SolutionCubeCache.key(PRICE, DummyTaper, **GRID)
+    assert base == SolutionCubeCache.key(PRICE, DummyTaper, **GRID)
+    assert base != SolutionCubeCache.key({"Common": {"a": 2}}, DummyTaper, **GRID)
+    assert base != SolutionCubeCache.key(PRICE, object, **GRID)
+    assert base != SolutionCubeCache.key(PRICE, DummyTaper, **GRID, dbh_step=1)
+    monkeypatch.setattr(cc, "_package_version", lambda: "9.9.9")
+    assert base != SolutionCubeCache.key(PRICE, DummyTaper, **GRID)
+
+
+def test_key_ignores_species_order_and_duplicates():
+    grid = {**GRID, "species_list": ["pine", "spruce"]}
+    key = SolutionCubeCache.key(PRICE, DummyTaper, **grid)
+    assert key == SolutionCubeCache.key(
+        PRICE, DummyTaper, **{**grid, "species_list": ["spruce", "pine", "spruce"]}
+    )
+    assert key != SolutionCubeCache.key(PRICE, DummyTaper, **GRID)
+
+
+def test_put_keeps_existing_entry(tmp_path):
+    cache = SolutionCubeCache(tmp_path)
+    key = SolutionCubeCache.key(PRICE, DummyTaper, **GRID)
+    cache.put(key, _fake_cube(PRICE, n_dbh=2))
+    stored = cache.put(key, _fake_cube(PRICE, n_dbh=3))
+    assert stored.dataset.sizes["dbh"] == 2
+    assert len(cache.entries()) == 1
+
+
+def test_lru_eviction_by_size(tmp_path):
+    cache = SolutionCubeCache(tmp_path)
+    cache.put("a", _fake_cube(PRICE))
+    entry_size = cache.size_bytes
+    cache.max_bytes = 2 * entry_size
+    cache.put("b", _fake_cube(PRICE))
+    cache.get("a")  # "a" becomes most recently used
+    cache.put("c", _fake_cube(PRICE))
+
+    names = [p.name for p in cache.entries()]
+    assert names == ["a", "c"]
+    assert cache.size_bytes <= cache.max_bytes
+
+
+def test_evict_without_limit_and_clear(tmp_path):
+    cache = SolutionCubeCache(tmp_path)
+    cache.put("a", _fake_cube(PRICE))
+    (tmp_path / ".tmp-stale").mkdir()
+    assert cache.evict() == []
+    cache.clear()
+    assert list(tmp_path.iterdir()) == []
+    assert cache.get("a") is None
+
+
+def test_hit_with_mismatching_hash_raises(tmp_path, counting_generate):
+    cache = SolutionCubeCache(tmp_path)
+    key = SolutionCubeCache.key(PRICE, DummyTaper, **GRID)
+    cache.put(key, _fake_cube({"other": 1}))
+    with pytest.raises(ValueError, match="does not match"):
+        cache.get_or_generate(PRICE, DummyTaper, **GRID)
+
+
+def _hammer(args):
+    directory, max_bytes, worker = args
+    cache = SolutionCubeCache(directory, max_bytes=max_bytes)
+    keys = [f"k{i}" for i in range(4)]
+    for i in range(30):
+        key = keys[(i + worker) % len(keys)]
+        assert cache.put(key, _fake_cube(PRICE)).lookup("pine", 10, 10.0) == (1.0, [])
+        cube = cache.get(keys[(i * 3 + worker) % len(keys)])
+        assert cube is None or cube.lookup("pine", 10, 10.0) == (1.0, [])
+        cache.entries()
+        cache.evict()
+    return True
+
+
+@pytest.mark.skipif(
+    "fork" not in multiprocessing.get_all_start_methods(), reason="needs the fork start method"
+)
+def test_concurrent_processes_with_small_limit(tmp_path):
+    probe = SolutionCubeCache(tmp_path / "probe")
+    probe.put("a", _fake_cube(PRICE))
+    max_bytes = probe.size_bytes  # room for a single entry
+
+    with multiprocessing.get_context("fork").Pool(4) as pool:
+        results = pool.map(_hammer, [(tmp_path / "cache", max_bytes, w) for w in range(8)])
+    assert all(results)
+    assert not [p for p in (tmp_path / "cache").iterdir() if p.name.startswith(".")]
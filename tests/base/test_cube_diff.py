@@ -0,0 +1,187 @@
+import copy
+import json
+
+import numpy as np
+import pytest
+import xarray as xr
+
+import pyforestry.base.pricelist.cube_diff as cd
+from pyforestry.base.pricelist import SolutionCube
+from pyforestry.base.pricelist.solutioncube import _hash_pricelist
+from pyforestry.sweden.pricelist.data.mellanskog_2013 import Mellanskog_2013_price_data
+from pyforestry.sweden.taper import EdgrenNylinder1949
+from pyforestry.sweden.timber.swe_timber import SweTimber
+
+OLD = {
+    "Common": {"TopDiameter": 5, "PulpwoodPrices": {"pinus sylvestris": 250, "betula": 250}},
+    "pinus sylvestris": {
+        "VolumeType": "m3to",
+        "DiameterPrices": {14: [400, 350, 300], 20: [500, 450, 350], 30: [600, 500, 400]},
+        "LengthCorrectionsPercent": {14: {34: 90}},
+        "MaxHeight": {"Butt": 5.5, "Middle": 11.0, "Top": 99.0},
+    },
+}
+SPECIES = ["pinus sylvestris", "betula pendula"]
+
+
+class DummyTaper:
+    pass
+
+
+def _cube(price_data, values, sections=None):
+    shape = (2, 1, 3)
+    dims = ("species", "height", "dbh")
+    if sections is None:
+        sections = np.full(shape, "[]", dtype=object)
+    ds = xr.Dataset(
+        {
+            "total_value": (dims, np.asarray(values, float).reshape(shape)),
+            "solution_sections": (dims, sections),
+        },
+        coords={"species": SPECIES, "height": [20.0], "dbh": [10, 20, 30]},
+        attrs={"pricelist_hash": _hash_pricelist(price_data), "taper_model": "DummyTaper"},
+    )
+    return SolutionCube(ds)
+
+
+def _stump_diameters(taper, species, heights, dbhs):
+    return np.tile(np.asarray(dbhs) * 1.2, (len(heights), 1))
+
+
+def test_price_data_changes():
+    new = copy.deepcopy(OLD)
+    new["pinus sylvestris"]["DiameterPrices"][20] = [510, 450, 350]
+    new["pinus sylvestris"]["LengthCorrectionsPercent"][30] = {34: 95}
+    assert cd.price_data_changes(OLD, new, SPECIES) == {
+        "pinus sylvestris": {20, 30},
+        "betula pendula": set(),
+    }
+
+    new["Common"]["PulpwoodPrices"]["betula"] = 260
+    assert cd.price_data_changes(OLD, new, SPECIES)["betula pendula"] is None
+
+    new = copy.deepcopy(OLD)
+    new["pinus sylvestris"]["MaxHeight"]["Butt"] = 6.0
+    assert cd.price_data_changes(OLD, new, SPECIES)["pinus sylvestris"] is None
+
+    new = copy.deepcopy(OLD)
+    new["pinus sylvestris"]["DiameterPrices"][32] = [600, 500, 400]
+    assert cd.price_data_changes(OLD, new, SPECIES)["pinus sylvestris"] is None
+
+    new = copy.deepcopy(OLD)
+    new["Common"]["TopDiameter"] = 6
+    assert set(cd.price_data_changes(OLD, new, SPECIES).values()) == {None}
+
+
+def test_changed_cells_uses_stump_diameter(monkeypatch):
+    monkeypatch.setattr(cd, "_stump_diameters", _stump_diameters)
+    new = copy.deepcopy(OLD)
+    new["pinus sylvestris"]["DiameterPrices"][30] = [650, 500, 400]
+
+    mask = cd.changed_cells(_cube(OLD, np.zeros(6)), OLD, new, DummyTaper)
+    assert mask.dims == ("species", "height", "dbh")
+    assert mask.values.astype(int).tolist() == [[[0, 0, 1]], [[0, 0, 0]]]
+
+
+def test_stump_diameters_batch_matches_single_stems():
+    heights = np.array([10.0, 15.2, 24.0])
+    dbhs = np.array([0, 12, 20, 34])
+
+    class SingleStem(EdgrenNylinder1949):
+        pass
+
+    batch = cd._stump_diameters(EdgrenNylinder1949, "picea abies", heights, dbhs)
+    single = cd._stump_diameters(SingleStem, "picea abies", heights, dbhs)
+    assert batch.shape == (3, 4) and batch.dtype == np.float32
+    np.testing.assert_array_equal(batch, single)
+    assert np.isinf(batch[:, 0]).all()  # zero diameter is not a valid stem
+    taper = EdgrenNylinder1949(SweTimber("picea abies", 20, 15.2))
+    assert batch[1, 2] == taper.get_diameter_vectorised([taper.timber.stump_height_m])[0]
+
+
+def test_compare_cubes():
+    cut = json.dumps([{"start_point": 0, "end_point": 43, "quality": 1, "value": 1.0}])
+    revalued = json.dumps([{"start_point": 0, "end_point": 43, "quality": 1, "value": 2.0}])
+    recut = json.dumps([{"start_point": 0, "end_point": 49, "quality": 1, "value": 2.0}])
+    old_sections = np.full((2, 1, 3), cut, dtype=object)
+    new_sections = old_sections.copy()
+    new_sections[0, 0, 1] = revalued
+    new_sections[0, 0, 2] = recut
+
+    old = _cube(OLD, [0, 10, 20, 1, 1, 1], old_sections)
+    new = _cube(OLD, [0, 12, 25, 1, 1, 1], new_sections)
+    diff = cd.compare_cubes(old, new)
+
+    np.testing.assert_allclose(diff["value_delta"].values.ravel(), [0, 2, 5, 0, 0, 0])
+    assert np.isnan(diff["relative_delta"].values[0, 0, 0])
+    assert diff["relative_delta"].values[0, 0, 2] == pytest.approx(0.25)
+    assert diff["pattern_changed"].values.ravel().tolist() == [0, 0, 1, 0, 0, 0]
+
+
+def test_compare_cubes_rejects_different_grids():
+    other = _cube(OLD, np.zeros(6))
+    other.dataset = other.dataset.assign_coords(dbh=[10, 20, 32])
+    with pytest.raises(ValueError, match="'dbh' coordinates"):
+        cd.compare_cubes(_cube(OLD, np.zeros(6)), other)
+
+
+def test_regenerate_only_changed_cells(monkeypatch):
+    monkeypatch.setattr(cd, "_stump_diameters", _stump_diameters)
+    solved = []
+
+    def fake_solve(price_data, taper, grid, cells, total_value, sections, workers, block_size):
+        solved.append((grid, cells.tolist(), workers))
+        total_value[cells] = -1.0
+        sections[cells] = "[1]"
+
+    monkeypatch.setattr(cd, "_solve_cells", fake_solve)
+    new = copy.deepcopy(OLD)
+    new["pinus sylvestris"]["DiameterPrices"][20] = [510, 450, 350]
+
+    cube = _cube(OLD, np.arange(6))
+    result = cd.regenerate_cube(cube, OLD, new, DummyTaper, workers=2)
+
+    (species, heights_dm, dbhs), cells, workers = solved[0]
+    assert species == SPECIES and heights_dm.tolist() == [200] and dbhs.tolist() == [10, 20, 30]
+    assert cells == [1, 2] and workers == 2
+    assert result.dataset["total_value"].values.ravel().tolist() == [0, -1, -1, 3, 4, 5]
+    assert result.lookup("pinus sylvestris", 20, 20.0) == (-1.0, [1])
+    assert result.pricelist_hash == _hash_pricelist(new)
+    assert result.dataset.attrs["regenerated_cells"] == 2
+
+
+def test_regenerate_validates_inputs():
+    cube = _cube(OLD, np.zeros(6))
+    with pytest.raises(ValueError, match="old pricelist"):
+        cd.regenerate_cube(cube, {"Common": {}}, OLD, DummyTaper)
+    with pytest.raises(ValueError, match="generated with DummyTaper"):
+        cd.regenerate_cube(cube, OLD, OLD, object)
+
+
+def test_regenerate_matches_full_generation():
+    species = "pinus sylvestris"
+    new = copy.deepcopy(Mellanskog_2013_price_data)
+    new[species]["DiameterPrices"][24] = [
+        price * 1.5 for price in Mellanskog_2013_price_data[species]["DiameterPrices"][24]
+    ]
+    grid = dict(
+        taper_model="EdgrenNylinder1949",
+        species_list=[species],
+        dbh_range=(14, 30),
+        height_range=(16, 22),
+        dbh_step=4,
+        height_step=3.0,
+        workers=2,
+    )
+    old = SolutionCube.generate(Mellanskog_2013_price_data, **grid)
+    full = SolutionCube.generate(new, **grid)
+    regenerated = cd.regenerate_cube(old, Mellanskog_2013_price_data, new, workers=2)
+
+    assert regenerated.dataset.attrs["regenerated_cells"] == 9
+    changes = cd.compare_cubes(old, full)
+    assert int((changes["value_delta"] != 0).sum()) == 3
+    assert int(changes["pattern_changed"].sum()) == 2
+    diff = cd.compare_cubes(full, regenerated)
+    assert float(np.abs(diff["value_delta"]).max()) == 0.0
+    assert not diff["pattern_changed"].any()
+    assert regenerated.pricelist_hash == full.pricelist_hash
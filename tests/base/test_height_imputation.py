@@ -0,0 +1,130 @@
+import math
+
+import numpy as np
+import pytest
+
+from pyforestry.base.helpers import (
+    CircularPlot,
+    Stand,
+    Tree,
+    fit_naslund_curves,
+    impute_heights,
+    naslund_height,
+)
+from pyforestry.sweden.volume import swe_timber_volumes
+
+SPRUCE = (1.1, 0.2)
+PINE = (1.4, 0.22)
+
+
+def _tree(species, diameter, curve=None, uid=None):
+    height = None if curve is None else float(naslund_height(diameter, *curve))
+    return Tree(species=species, diameter_cm=diameter, height_m=height, uid=uid)
+
+
+def test_curves_recover_parameters_per_group():
+    rng = np.random.default_rng(0)
+    groups = np.repeat([0, 1, 2, 3], 40)
+    diameter = rng.uniform(5, 45, groups.size)
+    a = np.array([1.1, 1.4, 0.9, 1.2])[groups]
+    b = np.array([0.2, 0.22, 0.25, 0.21])[groups]
+    height = naslund_height(diameter, a, b)
+    height[groups == 2] = np.nan  # no sample trees
+    height[(groups == 3) & (np.arange(groups.size) % 40 > 1)] = np.nan  # two sample trees
+
+    curves = fit_naslund_curves(groups, diameter, height, n_groups=5)
+    assert curves.valid.tolist() == [True, True, False, False, False]
+    assert curves.n_trees.tolist() == [40, 40, 0, 2, 0]
+    np.testing.assert_allclose(curves.a[:2], [1.1, 1.4], rtol=1e-10)
+    np.testing.assert_allclose(curves.b[:2], [0.2, 0.22], rtol=1e-10)
+    np.testing.assert_allclose(curves.height(groups[:40], diameter[:40]), height[:40])
+    assert np.isnan(curves.height([2, 3], [20.0, 20.0])).all()
+
+    same_diameter = fit_naslund_curves([0, 0, 0], 20.0, [15.0, 16.0, 17.0])
+    assert not same_diameter.valid[0]
+
+
+def test_curve_arguments_are_checked():
+    with pytest.raises(ValueError, match="min_trees"):
+        fit_naslund_curves([0], [20.0], [15.0], min_trees=1)
+    with pytest.raises(TypeError, match="integers"):
+        fit_naslund_curves([0.5], [20.0], [15.0])
+    with pytest.raises(ValueError, match="non-negative"):
+        fit_naslund_curves([-1], [20.0], [15.0])
+
+
+def test_heights_come_from_plot_then_stand_curves():
+    diameters = [8.0, 14.0, 21.0, 30.0]
+    plot1 = CircularPlot(
+        id=1,
+        radius_m=10.0,
+        trees=[_tree("picea abies", d, SPRUCE) for d in diameters]
+        + [_tree("picea abies", 18.0, uid="spruce"), _tree("pinus sylvestris", 25.0, uid="pine")]
+        + [Tree(species="picea abies", diameter_cm=None)],
+    )
+    # Pine has sample trees in the stand, but too few in any single plot.
+    plot2 = CircularPlot(
+        id=2,
+        radius_m=10.0,
+        trees=[_tree("pinus sylvestris", d, PINE) for d in diameters[:2]]
+        + [_tree("betula pendula", 12.0, uid="birch")],
+    )
+    plot3 = CircularPlot(
+        id=3, radius_m=10.0, trees=[_tree("pinus sylvestris", d, PINE) for d in diameters[2:]]
+    )
+    stand = Stand(plots=[plot1, plot2, plot3])
+    measured = [t.height_m for p in stand.plots for t in p.trees if t.height_m is not None]
+
+    assert impute_heights(stand) == 3
+    trees = {t.uid: t for p in stand.plots for t in p.trees if t.uid is not None}
+    assert math.isclose(trees["spruce"].height_m, naslund_height(18.0, *SPRUCE))
+    assert math.isclose(trees["pine"].height_m, naslund_height(25.0, *PINE))
+    # No birch sample trees: the curve of all species in the stand is used.
+    assert 1.3 < trees["birch"].height_m < 25
+    assert plot1.trees[-1].height_m is None
+    assert [t.height_m for p in stand.plots for t in p.trees][:4] == measured[:4]
+    assert impute_heights(stand) == 0
+
+
+def test_many_stands_at_once_match_one_at_a_time():
+    def stands():
+        rng = np.random.default_rng(1)
+        result = []
+        for _ in range(3):
+            plots = []
+            for i in range(4):
+                trees = []
+                for d in rng.uniform(5, 40, 12).round(1):
+                    species = str(rng.choice(["picea abies", "pinus sylvestris"]))
+                    sample = rng.random() < 0.5
+                    height = naslund_height(d, 1.1, 0.2) + rng.normal(0, 0.5) if sample else None
+                    trees.append(Tree(species=species, diameter_cm=d, height_m=height))
+                plots.append(CircularPlot(id=i, radius_m=8.0, trees=trees))
+            result.append(Stand(plots=plots))
+        return result
+
+    batch, single = stands(), stands()
+    filled = impute_heights(batch)
+    assert filled == sum(impute_heights(stand) for stand in single) > 0
+    heights = [[t.height_m for p in s.plots for t in p.trees] for s in (*batch, *single)]
+    assert heights[:3] == heights[3:]
+    assert all(h is not None for stand in heights for h in stand)
+
+
+def test_imputed_heights_feed_volume_estimates():
+    plot = CircularPlot(
+        id=1,
+        radius_m=10.0,
+        trees=[_tree("picea abies", d, SPRUCE) for d in (10.0, 16.0, 24.0)]
+        + [_tree("picea abies", 20.0)],
+    )
+    stand = Stand(plots=[plot])
+    with pytest.raises(ValueError, match="no height"):
+        stand.estimate_volume(swe_timber_volumes)
+
+    plot.trees[-1].height_m = 10.0
+    low = float(stand.estimate_volume(swe_timber_volumes)["TOTAL"])
+    plot.trees[-1].height_m = None
+    assert impute_heights([stand]) == 1
+    # The stored volume estimates are refreshed with the new height.
+    assert float(stand.Volume) > low
@@ -98,6 +98,18 @@ def test_build_value_table():
     assert tv[10, 0, 3] == pytest.approx(4 * 100 * vf)
 
 
+def test_for_timber_shares_value_table():
+    pl = make_pricelist()
+    nb = Nasberg_1985_BranchBound(Timber("pine", 10, 5), pl, ConstantTaper)
+    other = Timber("pine", 12, 6)
+    reused = nb.for_timber(other)
+    assert reused._timber is other
+    assert reused._timberValue is nb._timberValue
+    assert nb._timber.height_m == 5
+    with pytest.raises(ValueError, match="Cannot reuse"):
+        nb.for_timber(Timber("spruce", 10, 5))
+
+
 def test_build_value_table_no_prices():
     """_build_value_table should handle missing price tables."""
     t = Timber("pine", 10, 5)
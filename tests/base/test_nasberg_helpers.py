@@ -48,6 +48,23 @@ def test_tree_cache():
     assert taper.height_calls == 1
 
 
+def test_tree_cache_batches_heights():
+    class ArrayTaper:
+        def __init__(self):
+            self.calls = []
+
+        def get_height_array(self, diameters):
+            self.calls.append(list(diameters))
+            return [d / 2 for d in diameters]
+
+    cache = _TreeCache()
+    taper = ArrayTaper()
+    assert cache.heights(taper, [6, 8, 6]) == [30, 40, 30]
+    assert cache.height(taper, 8) == 40
+    assert cache.heights(taper, [8, 10]) == [40, 50]
+    assert taper.calls == [[6, 8], [10]]
+
+
 def test_merge_sections():
     a = CrossCutSection(
         0,
@@ -0,0 +1,80 @@
+import numpy as np
+import pytest
+
+from pyforestry.base.helpers.bucking import QualityType
+from pyforestry.base.pricelist import Pricelist, create_pricelist_from_data
+from pyforestry.base.timber_bucking.nasberg_1985 import Nasberg_1985_BranchBound
+from pyforestry.sweden.pricelist.data.mellanskog_2013 import Mellanskog_2013_price_data
+from pyforestry.sweden.timber.swe_timber import SweTimber
+
+
+@pytest.fixture
+def pricelist() -> Pricelist:
+    return create_pricelist_from_data(Mellanskog_2013_price_data)
+
+
+def test_price_logs_matches_the_bucking_value_table(pricelist):
+    species = "pinus sylvestris"
+    optimiser = Nasberg_1985_BranchBound(SweTimber(species, 30, 25), pricelist)
+    diameters = np.array([14, 20, 26, 34, 36])
+    lengths_dm = np.array([34, 43, 49, 55, 40])
+    parts = np.array([1, 2, 3, 1, 2])
+
+    prices = pricelist.price_logs(species, parts, diameters + 0.7, lengths_dm / 10, 0.2)
+    expected = optimiser._timberValue[
+        diameters, [optimiser._mod_ix[dm] for dm in lengths_dm], parts
+    ]
+    np.testing.assert_allclose(prices.value * 100, expected, rtol=1e-6)
+    assert prices.assortment.tolist() == parts.tolist()
+    assert prices.price_per_m3[0] == 415 + 80
+
+
+def test_price_logs_between_classes_are_not_timber(pricelist):
+    # Mellanskog 2013 pine has classes 13, 14, 16, ...; 15 and 17 cm are
+    # priced 0 in the value table, so the optimiser never makes them timber.
+    species = "pinus sylvestris"
+    optimiser = Nasberg_1985_BranchBound(SweTimber(species, 30, 25), pricelist)
+    diameters = np.array([15.5, 17.9, 14.2])
+    lengths_dm = np.array([43, 40, 43])
+    expected = optimiser._timberValue[
+        np.floor(diameters).astype(int), [optimiser._mod_ix[dm] for dm in lengths_dm], 1
+    ]
+    assert expected[:2].tolist() == [0.0, 0.0]
+
+    prices = pricelist.price_logs(species, QualityType.ButtLog, diameters, lengths_dm / 10, 0.2)
+    assert prices.assortment.tolist() == [4, 4, 1]
+    assert prices.price_per_m3.tolist() == [250.0, 250.0, 510.0]
+    assert prices.value[2] * 100 == pytest.approx(expected[2])
+
+
+def test_price_logs_fallbacks_and_volume_types(pricelist):
+    part = np.array(
+        [
+            QualityType.ButtLog,  # timber
+            QualityType.ButtLog,  # too thin for timber -> pulp
+            QualityType.TopLog,  # too short for pulp -> cull
+            QualityType.Pulp,
+            QualityType.LogCull,
+            QualityType.Fuelwood,
+        ]
+    )
+    diameter = np.array([20.0, 10.0, 20.0, 20.0, 20.0, 20.0])
+    length = np.array([4.3, 4.3, 2.0, 4.3, 4.3, 4.3])
+    volume = np.full(6, 0.25)
+    codes = np.array([1, 1, 0, 1, 0, 0])  # picea abies, pinus sylvestris
+
+    pricelist.Timber["picea abies"].volume_type = "m3fub"
+    prices = pricelist.price_logs(
+        codes, part, diameter, length, volume, species_names=["pinus sylvestris", "picea abies"]
+    )
+    assert prices.assortment.tolist() == [1, 4, 5, 4, 5, 6]
+    assert prices.price_per_m3.tolist() == [510.0, 265.0, 380.0, 265.0, 380.0, 200.0]
+    np.testing.assert_allclose(prices.value, prices.price_per_m3 * volume)
+
+    named = pricelist.price_logs(
+        np.where(codes, "picea abies", "pinus sylvestris"), part, diameter, length, volume
+    )
+    np.testing.assert_array_equal(named.value, prices.value)
+
+    with pytest.raises(ValueError, match="Species codes"):
+        pricelist.price_logs([2], [1], [20.0], [4.3], [0.2])
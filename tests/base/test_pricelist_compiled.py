@@ -0,0 +1,76 @@
+import numpy as np
+import pytest
+
+from pyforestry.base.pricelist import (
+    LengthCorrections,
+    TimberPriceForDiameter,
+    TimberPricelist,
+    create_pricelist_from_data,
+)
+from pyforestry.sweden.pricelist.data.mellanskog_2013 import Mellanskog_2013_price_data
+
+
+@pytest.fixture
+def pine() -> TimberPricelist:
+    return create_pricelist_from_data(Mellanskog_2013_price_data, "pinus sylvestris").Timber[
+        "pinus sylvestris"
+    ]
+
+
+def test_compiled_arrays(pine):
+    compiled = pine.compiled
+    assert compiled.diameter_classes.tolist() == sorted(
+        Mellanskog_2013_price_data["pinus sylvestris"]["DiameterPrices"]
+    )
+    assert compiled.prices.shape == (len(compiled.diameter_classes) + 1, 3)
+    assert compiled.prices[-1].tolist() == [0, 0, 0]
+    row = compiled.diameter_class_index(20)
+    assert compiled.prices[row].tolist() == [575, 460, 340]
+    assert not compiled.prices.flags.writeable
+    assert pine.compiled is compiled
+
+
+def test_vectorised_lookups_match_object_api(pine):
+    diameters = np.array([-3.0, 0.0, 12.9, 13.0, 15.5, 20.0, 35.9, 36.0, 80.0, np.nan])
+    classes = pine.compiled.nearest_diameter_class(diameters)
+    assert classes.tolist() == [0, 0, 0, 13, 14, 20, 34, 36, 36, 0]
+    assert classes.tolist() == [pine.get_nearest_diameter_class(d) for d in diameters]
+
+    for part in (-1, 0, 1, 2, 3):
+        expected = [pine[c].price_for_log_part(part) for c in classes]
+        assert pine.compiled.prices_for(part, diameters).tolist() == expected
+        exact = [pine[d].price_for_log_part(part) for d in (14, 15, 20)]
+        assert pine.compiled.exact_prices(part, [14, 15, 20]).tolist() == exact
+
+
+def test_length_corrections_compiled():
+    corrections = LengthCorrections({10: {31: 1, 35: 2}, 12: {40: 5}})
+    lookup = corrections.compiled.lookup
+    assert lookup(10, [30, 31, 34.9, 35, 99]).tolist() == [0, 1, 1, 2, 2]
+    assert lookup([10, 11, 12, 12.5, -1, 50], 40).tolist() == [2, 0, 5, 0, 0, 0]
+    assert corrections.get_length_correction(12, None, 45) == 5
+
+    corrections.corrections = {10: {31: 7}}
+    assert corrections.get_length_correction(10, None, 40) == 7
+    assert LengthCorrections().get_length_correction(10, None, 40) == 0
+
+
+def test_recompiled_after_changes():
+    tp = TimberPricelist(10, 20)
+    assert tp.price_for_log_part(0, 15) == 0
+    assert tp[15] is tp[16]  # shared zero entry on misses
+
+    tp.set_price_for_diameter(10, TimberPriceForDiameter(1, 2, 3))
+    tp.set_price_for_diameter(14, TimberPriceForDiameter(4, 5, 6))
+    assert tp.price_for_log_part(1, 13.5) == 2
+    assert tp.price_for_log_part(2, 15) == 6
+    assert tp.get_nearest_diameter_class(9) == 0
+
+
+def test_non_integer_keys_are_rejected():
+    tp = TimberPricelist(10, 20)
+    tp.set_price_for_diameter(10.5, TimberPriceForDiameter(1, 2, 3))
+    with pytest.raises(ValueError, match="Diameter classes"):
+        tp.get_nearest_diameter_class(12)
+    with pytest.raises(ValueError, match="lengths"):
+        LengthCorrections({10: {31.5: 1}}).get_length_correction(10, None, 40)
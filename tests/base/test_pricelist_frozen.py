@@ -0,0 +1,133 @@
+import copy
+import os
+import pickle
+import subprocess
+import sys
+
+import numpy as np
+import pytest
+
+import pyforestry.base.pricelist.solutioncube as sc
+from pyforestry.base.helpers.tree_species import TreeSpecies
+from pyforestry.base.pricelist import FrozenPricelist, create_pricelist_from_data
+from pyforestry.base.pricelist.frozen import price_data_fingerprint
+from pyforestry.base.pricelist.solutioncube import _hash_pricelist
+from pyforestry.base.timber_bucking.nasberg_1985 import Nasberg_1985_BranchBound
+from pyforestry.sweden.pricelist.data.mellanskog_2013 import Mellanskog_2013_price_data
+from pyforestry.sweden.taper import EdgrenNylinder1949
+from pyforestry.sweden.timber.swe_timber import SweTimber
+
+
+@pytest.fixture
+def frozen() -> FrozenPricelist:
+    return create_pricelist_from_data(Mellanskog_2013_price_data).freeze()
+
+
+def test_snapshot_is_compiled_and_immutable(frozen):
+    pine = frozen.Timber["pinus sylvestris"]
+    assert pine._compiled is not None
+    assert pine.length_corrections._compiled is not None
+    assert frozen.freeze() is frozen
+
+    with pytest.raises(AttributeError, match="immutable"):
+        frozen.TopDiameter = 10
+    with pytest.raises(AttributeError):
+        frozen.PulpLogDiameter.Min = 0
+    with pytest.raises(TypeError, match="immutable"):
+        frozen.Timber["betula"] = pine
+    with pytest.raises(TypeError, match="immutable"):
+        pine.set_price_for_diameter(20, pine[20])
+    with pytest.raises(AttributeError, match="immutable"):
+        pine[20].butt_price = 0
+    with pytest.raises(TypeError, match="immutable"):
+        pine.length_corrections.corrections[14][34] = 0
+    with pytest.raises(TypeError, match="immutable"):
+        frozen.Pulp._prices["pinus sylvestris"] = 0
+    with pytest.raises(TypeError, match="immutable"):
+        frozen.load_from_dict(Mellanskog_2013_price_data)
+
+
+def test_snapshot_is_independent_of_its_source():
+    pricelist = create_pricelist_from_data(Mellanskog_2013_price_data, "pinus sylvestris")
+    frozen = pricelist.freeze()
+    pricelist.TopDiameter = 12
+    pricelist.Timber["pinus sylvestris"][20].butt_price = 1
+    assert frozen.TopDiameter == Mellanskog_2013_price_data["Common"]["TopDiameter"]
+    assert frozen.Timber["pinus sylvestris"][20].butt_price == 575
+    assert pricelist.freeze() != frozen
+
+
+def test_fingerprint_tracks_content(frozen):
+    again = create_pricelist_from_data(Mellanskog_2013_price_data).freeze()
+    assert again.fingerprint == frozen.fingerprint
+    assert again == frozen and hash(again) == hash(frozen)
+
+    data = copy.deepcopy(Mellanskog_2013_price_data)
+    data["picea abies"]["DiameterPrices"][20][0] += 1
+    assert create_pricelist_from_data(data).freeze().fingerprint != frozen.fingerprint
+
+    # Integral floats and NumPy scalars hash like the equal Python ints.
+    data = copy.deepcopy(Mellanskog_2013_price_data)
+    data["Common"]["TopDiameter"] = np.float64(data["Common"]["TopDiameter"])
+    assert create_pricelist_from_data(data).freeze().fingerprint == frozen.fingerprint
+
+
+def test_fingerprint_is_stable_across_processes(frozen):
+    code = (
+        "from pyforestry.base.pricelist import create_pricelist_from_data\n"
+        "from pyforestry.sweden.pricelist.data.mellanskog_2013 import "
+        "Mellanskog_2013_price_data as d\n"
+        "print(create_pricelist_from_data(d).freeze().fingerprint)\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+        env={**os.environ, "PYTHONHASHSEED": "123"},
+    )
+    assert result.stdout.strip() == frozen.fingerprint
+
+
+def test_snapshot_pickles(frozen):
+    restored = pickle.loads(pickle.dumps(frozen))
+    assert restored.fingerprint == frozen.fingerprint
+    assert restored.fingerprint == price_data_fingerprint(restored._content())
+    with pytest.raises(TypeError, match="immutable"):
+        restored.Timber.clear()
+    np.testing.assert_array_equal(
+        restored.Timber["picea abies"].compiled.prices,
+        frozen.Timber["picea abies"].compiled.prices,
+    )
+
+
+def test_hash_pricelist_accepts_snapshots_and_tree_name_keys(frozen):
+    assert _hash_pricelist(frozen) == frozen.fingerprint
+
+    # Plain JSON is hashed as before; TreeName keys hash by their full name.
+    pine = TreeSpecies.Sweden.pinus_sylvestris
+    by_name = {pine.full_name: 250, "betula": 250}
+    assert _hash_pricelist({pine: 250, "betula": 250}) == price_data_fingerprint(by_name)
+    assert _hash_pricelist({1: 1, "1": 1}) != _hash_pricelist({1: 1, "2": 1})
+    with pytest.raises(TypeError, match="fingerprint"):
+        price_data_fingerprint({"a": object()})
+
+
+def test_snapshot_bucks_like_the_source(frozen):
+    timber = SweTimber("pinus sylvestris", 28.0, 22.0)
+    pricelist = create_pricelist_from_data(Mellanskog_2013_price_data, "pinus sylvestris")
+    expected = Nasberg_1985_BranchBound(timber, pricelist, EdgrenNylinder1949)
+    result = Nasberg_1985_BranchBound(timber, frozen, EdgrenNylinder1949)
+    value = result.calculate_tree_value(min_diam_dead_wood=99).total_value
+    assert value == expected.calculate_tree_value(min_diam_dead_wood=99).total_value
+
+
+def test_worker_shares_the_snapshot(frozen, monkeypatch):
+    monkeypatch.setattr(
+        sc, "create_pricelist_from_data", lambda *args: pytest.fail("snapshot was rebuilt")
+    )
+    species = ["picea abies", "pinus sylvestris"]
+    sc._init_worker(frozen, EdgrenNylinder1949, (species, np.array([200]), np.array([24])))
+    assert all(sc._WORKER_STATE["pricelists"][sp] is frozen for sp in species)
+    _, values, counts, _ = sc._worker_buck_block(np.arange(2))
+    assert np.all(values > 0) and np.all(counts > 0)
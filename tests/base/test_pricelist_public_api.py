@@ -1,15 +1,32 @@
 import importlib
 
 EXPECTED = {
+    "CompiledLengthCorrections",
+    "CompiledTimberPrices",
     "DiameterRange",
+    "FrozenPricelist",
     "LengthCorrections",
     "LengthRange",
+    "LogPrices",
     "TimberPriceForDiameter",
     "TimberPricelist",
     "PulpPricelist",
     "Pricelist",
+    "PricelistSeries",
+    "compound_trend",
     "create_pricelist_from_data",
     "SolutionCube",
+    "SolutionCubeCache",
+    "changed_cells",
+    "compare_cubes",
+    "price_data_changes",
+    "regenerate_cube",
+    "DBHHistogram",
+    "WeibullDBH",
+    "value_stands",
+    "load_price_data",
+    "load_pricelist",
+    "save_price_table",
 }
 
 
@@ -0,0 +1,103 @@
+import copy
+from datetime import date
+
+import numpy as np
+import pytest
+
+from pyforestry.base.pricelist import PricelistSeries, compound_trend, create_pricelist_from_data
+from pyforestry.base.timber_bucking.nasberg_1985 import Nasberg_1985_BranchBound
+from pyforestry.sweden.pricelist.data.mellanskog_2013 import Mellanskog_2013_price_data
+from pyforestry.sweden.taper import EdgrenNylinder1949
+from pyforestry.sweden.timber.swe_timber import SweTimber
+
+DATES = [date(2025, 1, 1), date(2030, 1, 1), date(2035, 1, 1)]
+
+
+@pytest.fixture
+def series() -> PricelistSeries:
+    return PricelistSeries.from_trends(
+        create_pricelist_from_data(Mellanskog_2013_price_data),
+        DATES,
+        timber_trend=compound_trend(0.03),
+        pulp_trend=lambda years: 1 - 0.02 * years,
+    )
+
+
+def test_trends_scale_prices(series):
+    assert len(series) == 3 and series.dates == tuple(DATES)
+    np.testing.assert_allclose(series.years, [0, 5, 10], atol=0.01)
+    pine = [pricelist.Timber["pinus sylvestris"] for _, pricelist in series]
+    factor = 1.03 ** series.years[2]
+    assert pine[0][20].butt_price == 575
+    assert pine[2][20].butt_price == pytest.approx(575 * factor)
+    assert pine[2].length_corrections.get_length_correction(14, None, 34) == pytest.approx(
+        80 * factor
+    )
+    pulp = series[2].Pulp.getPulpwoodPrice("picea abies")
+    assert pulp == pytest.approx(265 * (1 - 0.02 * series.years[2]))
+    assert series[2].LogCullPrice < series[0].LogCullPrice
+
+
+def test_period_lookup(series):
+    assert series.period_index(date(2029, 12, 31)) == 0
+    assert series.pricelist_at(date(2030, 1, 1)) is series[1]
+    assert series.period_index(date(2100, 1, 1)) == 2
+    with pytest.raises(ValueError, match="No price list"):
+        series.period_index(date(2020, 1, 1))
+
+
+def test_from_data_follows_apply_price_trends():
+    assert Mellanskog_2013_price_data["Common"]["ApplyPriceTrends"] is False
+    flat = PricelistSeries.from_data(Mellanskog_2013_price_data, DATES, compound_trend(0.05))
+    assert flat[0].fingerprint == flat[2].fingerprint
+    trended = PricelistSeries.from_data(
+        Mellanskog_2013_price_data, DATES, compound_trend(0.05), apply_trends=True
+    )
+    assert trended[0].fingerprint != trended[2].fingerprint
+    assert trended.fingerprint != flat.fingerprint
+
+
+def test_periods_must_share_their_structure():
+    base = create_pricelist_from_data(Mellanskog_2013_price_data)
+    data = copy.deepcopy(Mellanskog_2013_price_data)
+    data["Common"]["SawlogLengthRange"] = (3.7, 5.5)
+    other = create_pricelist_from_data(data)
+    with pytest.raises(ValueError, match="more than its prices"):
+        PricelistSeries([(DATES[0], base), (DATES[1], other)])
+    with pytest.raises(ValueError, match="distinct"):
+        PricelistSeries([(DATES[0], base), (DATES[0], base)])
+    with pytest.raises(ValueError, match="at least one"):
+        PricelistSeries([])
+
+
+def test_price_logs_per_period(series):
+    args = (["pinus sylvestris", "picea abies"], [1, 4], [22.0, 12.0], [4.3, 3.0], [0.2, 0.05])
+    prices = series.price_logs(*args)
+    assert prices.value.shape == (3, 2)
+    for period, pricelist in enumerate(series.pricelists):
+        expected = pricelist.price_logs(*args)
+        np.testing.assert_array_equal(prices.assortment[period], expected.assortment)
+        np.testing.assert_array_equal(prices.value[period], expected.value)
+
+
+@pytest.mark.parametrize("species", ["pinus sylvestris", "picea abies"])
+def test_bucking_every_period_matches_bucking_each_period(series, species):
+    timber = SweTimber(species, 31.0, 24.0)
+    optimizer = Nasberg_1985_BranchBound(timber, series, EdgrenNylinder1949)
+    results = optimizer.calculate_period_values(min_diam_dead_wood=99)
+    assert len(results) == len(series)
+
+    for result, pricelist in zip(results, series.pricelists, strict=True):
+        expected = Nasberg_1985_BranchBound(timber, pricelist, EdgrenNylinder1949)
+        assert dict(result) == dict(expected.calculate_tree_value(min_diam_dead_wood=99))
+    assert results[0].total_value < results[-1].total_value
+    first = optimizer.calculate_tree_value(min_diam_dead_wood=99)
+    assert first.total_value == results[0].total_value
+
+
+def test_single_pricelist_is_one_period():
+    timber = SweTimber("pinus sylvestris", 26.0, 21.0)
+    pricelist = create_pricelist_from_data(Mellanskog_2013_price_data, "pinus sylvestris")
+    optimizer = Nasberg_1985_BranchBound(timber, pricelist, EdgrenNylinder1949)
+    (result,) = optimizer.calculate_period_values(min_diam_dead_wood=99)
+    assert result.total_value == optimizer.calculate_tree_value(min_diam_dead_wood=99).total_value
@@ -0,0 +1,149 @@
+import csv
+import importlib.util
+
+import pytest
+
+import pyforestry.base.pricelist.tables as tables
+from pyforestry.base.pricelist import (
+    create_pricelist_from_data,
+    load_price_data,
+    load_pricelist,
+    save_price_table,
+)
+from pyforestry.sweden.pricelist.data.mellanskog_2013 import Mellanskog_2013_price_data
+
+COMMON = Mellanskog_2013_price_data["Common"]
+SPECIES_INFO = {
+    name: {k: v for k, v in timber.items() if k not in tables._TABLE_KEYS}
+    for name, timber in Mellanskog_2013_price_data.items()
+    if name != "Common"
+}
+HAS_PYARROW = importlib.util.find_spec("pyarrow") is not None
+
+
+@pytest.fixture
+def csv_table(tmp_path):
+    path = tmp_path / "mellanskog.csv"
+    save_price_table(Mellanskog_2013_price_data, path)
+    return path
+
+
+def _rows(path):
+    with path.open(newline="") as handle:
+        return list(csv.reader(handle))
+
+
+def _write_rows(path, rows):
+    with path.open("w", newline="") as handle:
+        csv.writer(handle).writerows(rows)
+
+
+def test_csv_round_trip_matches_the_dictionary(csv_table):
+    expected = create_pricelist_from_data(Mellanskog_2013_price_data).freeze()
+    loaded = load_pricelist(csv_table, COMMON, SPECIES_INFO)
+    assert loaded.fingerprint == expected.fingerprint
+    assert loaded.Timber["picea abies"].compiled.prices.tolist() == (
+        expected.Timber["picea abies"].compiled.prices.tolist()
+    )
+
+
+def test_json_round_trip_needs_no_settings(tmp_path):
+    path = tmp_path / "mellanskog.json"
+    save_price_table(Mellanskog_2013_price_data, path)
+    expected = create_pricelist_from_data(Mellanskog_2013_price_data).freeze()
+    assert load_pricelist(path).fingerprint == expected.fingerprint
+
+    data = load_price_data(path, species_info={"picea abies": {"VolumeType": "m3fub"}})
+    assert data["picea abies"]["VolumeType"] == "m3fub"
+    assert data["pinus sylvestris"]["MaxHeight"] == {"Butt": 5.5, "Middle": 11.0, "Top": 99.0}
+
+
+def test_defaults_without_species_settings(csv_table):
+    data = load_price_data(csv_table, COMMON)
+    assert data["pinus sylvestris"]["VolumeType"] == "m3to"
+    assert data["pinus sylvestris"]["MaxHeight"]["Butt"] == 99.9
+    assert data["pinus sylvestris"]["LengthCorrectionsPercent"] == {
+        14: {34: 80, 37: 85, 40: 90, 43: 95, 46: 100, 49: 102, 52: 104, 55: 106}
+    }
+    with pytest.raises(ValueError, match="Common"):
+        load_price_data(csv_table)
+
+
+def test_cache_is_reused_until_the_source_changes(csv_table, monkeypatch):
+    first = load_price_data(csv_table, COMMON, SPECIES_INFO)
+    assert csv_table.with_name("mellanskog.csv.npz").exists()
+
+    read = tables._read_columns
+    monkeypatch.setattr(tables, "_read_columns", lambda path: pytest.fail("cache was not used"))
+    assert load_price_data(csv_table, COMMON, SPECIES_INFO) == first
+
+    rows = _rows(csv_table)
+    rows[1][-1] = "301"
+    _write_rows(csv_table, rows)
+    monkeypatch.setattr(tables, "_read_columns", read)
+    changed = load_price_data(csv_table, COMMON, SPECIES_INFO)
+    assert changed["pinus sylvestris"]["DiameterPrices"][13][0] == 301
+
+
+def test_cache_can_be_disabled_and_tolerates_corruption(csv_table):
+    load_price_data(csv_table, COMMON, cache=False)
+    cache = csv_table.with_name("mellanskog.csv.npz")
+    assert not cache.exists()
+    cache.write_bytes(b"not a zip file")
+    assert load_price_data(csv_table, COMMON)["picea abies"]["DiameterPrices"]
+
+
+@pytest.mark.parametrize(
+    "edit, message",
+    [
+        (lambda rows: rows[1].__setitem__(1, "stem"), "Unknown log parts"),
+        (lambda rows: rows[1].__setitem__(2, "13.5"), "non-negative integers"),
+        (lambda rows: rows[1].__setitem__(4, "-1"), "must not be negative"),
+        (lambda rows: rows[1].__setitem__(3, "40"), "must not have a length"),
+        (lambda rows: rows[4].__setitem__(2, "12"), "strictly increasing"),
+        (lambda rows: rows.pop(3), "butt, middle and top"),
+        (lambda rows: rows[1].__setitem__(4, "abc"), "must be numeric"),
+    ],
+)
+def test_validation_reports_rows(csv_table, edit, message):
+    rows = _rows(csv_table)
+    edit(rows)
+    _write_rows(csv_table, rows)
+    with pytest.raises(ValueError, match=message):
+        load_price_data(csv_table, COMMON, cache=False)
+
+
+def test_length_corrections_must_increase(csv_table):
+    rows = _rows(csv_table)
+    corrections = [i for i, row in enumerate(rows) if row[1] == "length_correction"]
+    rows[corrections[1]][3] = rows[corrections[0]][3]
+    _write_rows(csv_table, rows)
+    with pytest.raises(ValueError, match=r"strictly increasing \(rows \["):
+        load_price_data(csv_table, COMMON, cache=False)
+
+
+def test_unsupported_formats(tmp_path):
+    with pytest.raises(ValueError, match="Unsupported"):
+        save_price_table(Mellanskog_2013_price_data, tmp_path / "prices.xlsx")
+    path = tmp_path / "prices.txt"
+    path.write_text("")
+    with pytest.raises(ValueError, match="Unsupported"):
+        load_price_data(path, COMMON)
+
+
+@pytest.mark.skipif(HAS_PYARROW, reason="pyarrow is installed")
+def test_parquet_needs_pyarrow(tmp_path):
+    path = tmp_path / "prices.parquet"
+    with pytest.raises(ImportError, match="pyarrow"):
+        save_price_table(Mellanskog_2013_price_data, path)
+    path.write_bytes(b"")
+    with pytest.raises(ImportError, match="pyarrow"):
+        load_price_data(path, COMMON)
+
+
+@pytest.mark.skipif(not HAS_PYARROW, reason="pyarrow is not installed")
+def test_parquet_round_trip(tmp_path):  # pragma: no cover - needs pyarrow
+    path = tmp_path / "prices.parquet"
+    save_price_table(Mellanskog_2013_price_data, path)
+    expected = create_pricelist_from_data(Mellanskog_2013_price_data).freeze()
+    assert load_pricelist(path, COMMON, SPECIES_INFO).fingerprint == expected.fingerprint
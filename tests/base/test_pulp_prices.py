@@ -0,0 +1,64 @@
+import numpy as np
+import pytest
+
+from pyforestry.base.helpers.tree_species import (
+    GLOBAL_TREE_SPECIES,
+    PINUS,
+    TreeName,
+    TreeSpecies,
+    tree_species_codes,
+)
+from pyforestry.base.pricelist import PulpPricelist, create_pricelist_from_data
+from pyforestry.sweden.pricelist.data.mellanskog_2013 import Mellanskog_2013_price_data
+
+
+@pytest.fixture
+def pulp() -> PulpPricelist:
+    return create_pricelist_from_data(Mellanskog_2013_price_data).Pulp
+
+
+def test_species_resolved_by_full_name_then_genus(pulp):
+    prices = pulp.species_prices
+    assert len(prices) == len(GLOBAL_TREE_SPECIES)
+    assert prices["pinus sylvestris"] == 250
+    assert prices["picea abies"] == 265
+    assert prices["betula pendula"] == prices["betula pubescens"] == 250
+    assert prices["pinus contorta"] == pulp.default_price
+    assert pulp.getPulpwoodPrice(" Picea Abies ") == 265
+    assert pulp.getPulpwoodPrice(TreeSpecies.Sweden.betula_pendula) == 250
+    assert pulp.getPulpwoodPrice("betula") == pulp.default_price  # genus names are not species
+
+
+def test_species_outside_the_global_list_are_resolved_on_lookup(pulp):
+    pulp._prices = {"pinus": 123}
+    assert pulp.getPulpwoodPrice(TreeName(PINUS, "nigra", "PNIG")) == 123
+    assert pulp.getPulpwoodPrice("pinus nigra") == pulp.default_price
+
+
+def test_bulk_lookup_by_species_code(pulp):
+    names = np.array([["picea abies", "pinus sylvestris"], ["betula pubescens", "picea abies"]])
+    codes = tree_species_codes(names)
+    assert codes.shape == (2, 2)
+    assert codes[0, 0] == tree_species_codes(TreeSpecies.Sweden.picea_abies)
+    np.testing.assert_array_equal(pulp.pulpwood_prices(codes), [[265, 250], [250, 265]])
+    assert [GLOBAL_TREE_SPECIES[c].full_name for c in codes.ravel()] == names.ravel().tolist()
+
+    with pytest.raises(ValueError, match="Species codes"):
+        pulp.pulpwood_prices([len(GLOBAL_TREE_SPECIES)])
+    with pytest.raises(ValueError, match="Could not find species"):
+        tree_species_codes(["pinus sylvestris", "oak"])
+
+
+def test_reassigning_prices_rebuilds_the_lookup(pulp):
+    assert pulp.pulpwood_prices(tree_species_codes("picea abies")) == 265
+    pulp._prices = {"picea": 300}
+    assert pulp.getPulpwoodPrice("picea abies") == 300
+    assert pulp.pulpwood_prices(tree_species_codes("picea mariana")) == 300
+    assert not pulp.species_price_array.flags.writeable
+
+
+def test_frozen_lookup_is_resolved_and_immutable():
+    pulp = create_pricelist_from_data(Mellanskog_2013_price_data).freeze().Pulp
+    assert pulp.getPulpwoodPrice("picea abies") == 265
+    with pytest.raises(TypeError, match="immutable"):
+        pulp.species_prices["picea abies"] = 0
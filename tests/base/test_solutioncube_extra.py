@@ -1,5 +1,6 @@
 from types import SimpleNamespace
 
+import numpy as np
 import xarray as xr
 
 import pyforestry.base.pricelist.solutioncube as sc
@@ -9,8 +10,12 @@ class DummyOptimizer:
     def __init__(self, *args, **kwargs):
         pass
 
+    def for_timber(self, timber):
+        return self
+
     def calculate_tree_value(self, *args, **kwargs):
-        return SimpleNamespace(total_value=1.0, sections=[SimpleNamespace(a=1)])
+        section = SimpleNamespace(**{name: 1 for name in sc._SECTION_DTYPE.names})
+        return SimpleNamespace(total_value=1.0, sections=[section])
 
 
 class FailingOptimizer(DummyOptimizer):
@@ -19,67 +24,88 @@ class FailingOptimizer(DummyOptimizer):
 
 
 class DummyPool:
-    def __init__(self, processes):
+    def __init__(self, processes, initializer=None, initargs=()):
         self.processes = processes
-        self.tasks = []
-
-    def __enter__(self):
-        return self
-
-    def __exit__(self, exc_type, exc, tb):
-        pass
+        self.chunksizes = []
+        initializer(*initargs)
 
     def imap_unordered(self, func, tasks, chunksize=1):
+        self.chunksizes.append(chunksize)
         for t in tasks:
             yield func(t)
 
+    def close(self):
+        pass
+
+    def join(self):
+        pass
 
-def test_worker_with_sections(monkeypatch):
+
+def _patch_bucking(monkeypatch, optimizer):
     monkeypatch.setattr(sc, "SweTimber", lambda *args, **kwargs: object())
     monkeypatch.setattr(sc, "create_pricelist_from_data", lambda *a, **k: {})
-    monkeypatch.setattr(sc, "Nasberg_1985_BranchBound", lambda *a, **k: DummyOptimizer())
+    monkeypatch.setattr(sc, "Nasberg_1985_BranchBound", optimizer)
+
 
-    res = sc._worker_buck_one_tree(("pine", 10, 100), {}, object)
-    assert res["solution_sections"] == '[{"a": 1}]'
-    assert res["total_value"] == 1.0
+def _generate(**kwargs):
+    return sc.SolutionCube.generate(
+        pricelist_data={},
+        taper_model=object,
+        species_list=["pine"],
+        dbh_range=(10, 12),
+        height_range=(10, 10),
+        **kwargs,
+    )
 
 
-def test_worker_error(monkeypatch):
-    monkeypatch.setattr(sc, "SweTimber", lambda *a, **k: object())
-    monkeypatch.setattr(sc, "create_pricelist_from_data", lambda *a, **k: {})
-    monkeypatch.setattr(sc, "Nasberg_1985_BranchBound", lambda *a, **k: FailingOptimizer())
+def test_generate_with_sections(monkeypatch):
+    _patch_bucking(monkeypatch, DummyOptimizer)
+    cube = _generate(workers=1)
 
-    out = sc._worker_buck_one_tree(("pine", 10, 100), {}, object)
-    assert out["total_value"] != out["total_value"]  # NaN
-    assert out["solution_sections"] == "[]"
+    value, sections = cube.lookup("pine", 10, 10.0)
+    assert value == 1.0
+    assert sections[0]["species_group"] == "pine"
+    assert sections[0]["quality"] == 1
+
+
+def test_generate_worker_error(monkeypatch, capsys):
+    _patch_bucking(monkeypatch, FailingOptimizer)
+    cube = _generate(workers=1)
+
+    assert np.isnan(cube.dataset["total_value"].values).all()
+    assert cube.lookup("pine", 10, 10.0)[1] == []
+    assert "Error processing pine" in capsys.readouterr().out
+
+
+def test_generate_pricelist_error_per_species(monkeypatch, capsys):
+    _patch_bucking(monkeypatch, DummyOptimizer)
+
+    def create(data, sp):
+        raise ValueError(f"no prices for {sp}")
+
+    monkeypatch.setattr(sc, "create_pricelist_from_data", create)
+    cube = _generate(workers=1)
+    assert np.isnan(cube.dataset["total_value"].values).all()
+    assert "no prices for pine" in capsys.readouterr().out
 
 
 def test_generate_custom_pool(monkeypatch):
-    monkeypatch.setattr(
-        sc,
-        "_worker_buck_one_tree",
-        lambda *a, **k: {
-            "species": "pine",
-            "dbh": 10,
-            "height": 10.0,
-            "total_value": 1.0,
-            "solution_sections": "[]",
-        },
-    )
-    monkeypatch.setattr(sc, "Pool", DummyPool)
+    _patch_bucking(monkeypatch, DummyOptimizer)
+    pools = []
+
+    def make_pool(*args, **kwargs):
+        pools.append(DummyPool(*args, **kwargs))
+        return pools[-1]
+
+    monkeypatch.setattr(sc, "Pool", make_pool)
     monkeypatch.setattr(sc, "cpu_count", lambda: 4)
 
-    cube = sc.SolutionCube.generate(
-        pricelist_data={},
-        taper_model=object,
-        species_list=["pine"],
-        dbh_range=(10, 10),
-        height_range=(10, 10),
-        workers=-1,
-    )
+    cube = _generate(workers=-1, block_size=1)
     assert isinstance(cube.dataset, xr.Dataset)
-    assert cube.dataset.dims["dbh"] == 1
+    assert cube.dataset.sizes["dbh"] == 2
     assert cube.dataset.attrs["taper_model"] == "object"
+    assert pools[0].processes == 4 and pools[0].chunksizes == [1]
+    np.testing.assert_array_equal(cube.dataset["total_value"].values, 1.0)
 
 
 def test_lookup_timber_pricelist_unknown_species(capsys):
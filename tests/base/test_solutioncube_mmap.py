@@ -0,0 +1,90 @@
+import json
+
+import numpy as np
+import pytest
+import xarray as xr
+
+from pyforestry.base.pricelist.solutioncube import SolutionCube, _hash_pricelist
+
+
+@pytest.fixture
+def small_cube():
+    values = np.arange(2 * 2 * 3, dtype=float).reshape(2, 2, 3)
+    sections = np.empty((2, 2, 3), dtype=object)
+    for idx in np.ndindex(sections.shape):
+        sections[idx] = json.dumps([{"cell": list(idx), "label": "grån"}])
+    ds = xr.Dataset(
+        {
+            "total_value": (("species", "height", "dbh"), values),
+            "solution_sections": (("species", "height", "dbh"), sections),
+        },
+        coords={"species": ["pine", "spruce"], "height": [10.0, 10.2], "dbh": [10, 12, 14]},
+        attrs={"pricelist_hash": _hash_pricelist({"a": 1}), "taper_model": "Dummy"},
+    )
+    return SolutionCube(ds)
+
+
+def test_mmap_roundtrip_values_and_sections(small_cube, tmp_path):
+    store = tmp_path / "cube"
+    small_cube.save_mmap(store)
+    loaded = SolutionCube.load(store, pricelist_to_verify={"a": 1})
+
+    assert isinstance(loaded.dataset["total_value"].variable._data, np.memmap)
+    assert "solution_sections" not in loaded.dataset
+    assert loaded.taper_model == "Dummy"
+    np.testing.assert_array_equal(
+        loaded.dataset["total_value"].values, small_cube.dataset["total_value"].values
+    )
+    for sp in ("pine", "spruce"):
+        for h in (10.0, 10.2):
+            for d in (10, 12, 14):
+                assert loaded.lookup(sp, d, h) == small_cube.lookup(sp, d, h)
+
+
+def test_mmap_lookup_nearest_and_unknown_species(small_cube, tmp_path, capsys):
+    small_cube.save_mmap(tmp_path / "cube")
+    loaded = SolutionCube.load(tmp_path / "cube")
+
+    value, sections = loaded.lookup("spruce", 13.2, 10.15)
+    assert value == small_cube.dataset["total_value"].sel(species="spruce", height=10.2, dbh=14)
+    assert sections == [{"cell": [1, 1, 2], "label": "grån"}]
+
+    assert loaded.lookup("birch", 12, 10.0) == (0.0, [])
+    assert "not found" in capsys.readouterr().out
+
+
+def test_mmap_hash_mismatch(small_cube, tmp_path):
+    small_cube.save_mmap(tmp_path / "cube")
+    with pytest.raises(ValueError, match="Pricelist hash mismatch"):
+        SolutionCube.load(tmp_path / "cube", pricelist_to_verify={"a": 2})
+
+
+def test_mmap_resave_from_mmap_cube(small_cube, tmp_path):
+    small_cube.save_mmap(tmp_path / "first")
+    first = SolutionCube.load(tmp_path / "first")
+    first.save_mmap(tmp_path / "second")
+    second = SolutionCube.load(tmp_path / "second")
+    assert second.lookup("pine", 12, 10.2) == small_cube.lookup("pine", 12, 10.2)
+
+
+def test_mmap_without_sections_and_broadcast_dims(tmp_path):
+    ds = xr.Dataset(
+        {"total_value": ("species", [3.0])},
+        coords={"species": ["sp"], "dbh": [10], "height": [5.0]},
+    )
+    SolutionCube(ds).save_mmap(tmp_path / "cube")
+    loaded = SolutionCube.load(tmp_path / "cube")
+    assert loaded.dataset["total_value"].shape == (1, 1, 1)
+    assert loaded.lookup("sp", 10, 5.0) == (3.0, [])
+
+
+def test_mmap_rejects_foreign_directory(tmp_path):
+    (tmp_path / "meta.json").write_text(json.dumps({"format": "other"}))
+    with pytest.raises(ValueError, match="not a memory-mapped"):
+        SolutionCube.load(tmp_path)
+
+    (tmp_path / "meta.json").write_text(
+        json.dumps({"format": "pyforestry-solutioncube", "version": 99})
+    )
+    with pytest.raises(ValueError, match="Unsupported"):
+        SolutionCube.load(tmp_path)
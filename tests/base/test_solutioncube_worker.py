@@ -1,33 +1,51 @@
-from pyforestry.base.pricelist.solutioncube import _worker_buck_one_tree
+import json
+from types import SimpleNamespace
+
+import numpy as np
+
+import pyforestry.base.pricelist.solutioncube as sc
+from pyforestry.base.helpers.bucking import CrossCutSection, QualityType
 
 
 class DummyOptimizer:
+    created = 0
+
     def __init__(self, *args, **kwargs):
-        pass
+        DummyOptimizer.created += 1
 
-    class Result:
-        total_value = 100.0
-        sections = None
+    def for_timber(self, timber):
+        return self
 
     def calculate_tree_value(self, *args, **kwargs):
-        return self.Result()
-
-
-def test_worker_buck_one_tree_basic(monkeypatch):
-    monkeypatch.setattr(
-        "pyforestry.base.pricelist.solutioncube.SweTimber",
-        lambda species, diameter_cm, height_m: object(),
-    )
-    monkeypatch.setattr(
-        "pyforestry.base.pricelist.solutioncube.create_pricelist_from_data",
-        lambda data, sp: {},
-    )
-    monkeypatch.setattr(
-        "pyforestry.base.pricelist.solutioncube.Nasberg_1985_BranchBound",
-        lambda t, p, taper_model_class: DummyOptimizer(),
-    )
-
-    out = _worker_buck_one_tree(("pine", 20, 150), {}, object)
-    assert out["species"] == "pine"
-    assert out["total_value"] == 100.0
-    assert out["solution_sections"] == "[]"
+        return SimpleNamespace(total_value=100.0, sections=None)
+
+
+def test_worker_reuses_pricelist_and_optimizer(monkeypatch):
+    built = []
+    monkeypatch.setattr(sc, "SweTimber", lambda species, diameter_cm, height_m: object())
+    monkeypatch.setattr(sc, "create_pricelist_from_data", lambda data, sp: built.append(sp) or {})
+    monkeypatch.setattr(sc, "Nasberg_1985_BranchBound", DummyOptimizer)
+    DummyOptimizer.created = 0
+
+    sc._init_worker({}, object, (["pine"], np.array([150, 152]), np.array([20, 22])))
+    indices, values, counts, records = sc._worker_buck_block(np.arange(4))
+
+    assert built == ["pine"]
+    assert DummyOptimizer.created == 1
+    np.testing.assert_array_equal(indices, np.arange(4))
+    np.testing.assert_array_equal(values, [100.0] * 4)
+    np.testing.assert_array_equal(counts, [0] * 4)
+    assert records.dtype == sc._SECTION_DTYPE and len(records) == 0
+
+
+def test_sections_json_matches_dataclass_dict():
+    section = CrossCutSection(1, 43, 0.12, 18.5, 55.0, "pine", 1.0, 0.0, 0.0, 0.0)
+    section.quality = QualityType.ButtLog
+    records = np.array([sc._section_record(section)], dtype=sc._SECTION_DTYPE)
+    assert sc._sections_json(records, "pine") == json.dumps([section.__dict__])
+
+
+def test_auto_block_size():
+    assert sc._auto_block_size(10, 4) == 1
+    assert sc._auto_block_size(1000, 2) == 125
+    assert sc._auto_block_size(10**6, 2) == sc._MAX_BLOCK_SIZE
@@ -0,0 +1,78 @@
+import json
+
+import numpy as np
+import pytest
+import xarray as xr
+from scipy import integrate, stats
+
+from pyforestry.base.pricelist import DBHHistogram, SolutionCube, WeibullDBH, value_stands
+
+HEIGHTS = np.arange(10.0, 30.1, 1.0)
+DBHS = np.arange(8, 62, 2)
+
+
+def _height_curve(dbh):
+    return 5 + 0.5 * dbh
+
+
+@pytest.fixture(scope="module")
+def linear_cube():
+    # value is linear in height and dbh, so bilinear interpolation is exact
+    values = 2.0 * HEIGHTS[:, None] + 3.0 * DBHS[None, :]
+    sections = np.empty((1, len(HEIGHTS), len(DBHS)), dtype=object)
+    for i, j in np.ndindex(len(HEIGHTS), len(DBHS)):
+        sections[0, i, j] = json.dumps(
+            [{"volume": 0.01 * DBHS[j], "quality": 1}, {"volume": 0.05, "quality": 4}]
+        )
+    ds = xr.Dataset(
+        {
+            "total_value": (("species", "height", "dbh"), values[None]),
+            "solution_sections": (("species", "height", "dbh"), sections),
+        },
+        coords={"species": ["pine"], "height": HEIGHTS, "dbh": DBHS},
+    )
+    return SolutionCube(ds)
+
+
+def test_assortment_volumes(linear_cube):
+    vol = linear_cube.assortment_volumes()
+    assert vol.dims == ("species", "height", "dbh", "assortment")
+    assert vol.sel(species="pine", height=10.0, dbh=20).values.tolist() == [0.2, 0.05, 0, 0]
+    assert linear_cube.assortment_volumes() is vol
+
+
+def test_histogram_interpolates_between_grid_nodes(linear_cube):
+    hist = DBHHistogram(dbh=[11.0, 21.0, 70.0], stems_per_ha=[100.0, 50.0, 5.0])
+    res = value_stands(linear_cube, {"pine": hist}, _height_curve)
+
+    expected = sum(n * (2 * _height_curve(d) + 3 * d) for d, n in ((11, 100), (21, 50)))
+    assert res["value_per_ha"].values[0, 0] == pytest.approx(expected)
+    sawlog = 100 * 0.11 + 50 * 0.21
+    np.testing.assert_allclose(res["volume_per_ha"].values[0, 0], [sawlog, 7.5, 0, 0])
+    assert res["stems_outside"].values[0, 0] == 5.0
+
+
+def test_weibull_matches_numerical_integration(linear_cube):
+    dist = WeibullDBH(shape=np.array([3.0, 4.0]), scale=np.array([25.0, 30.0]), stems_per_ha=800)
+    res = value_stands(linear_cube, {"pine": dist}, {"pine": _height_curve})
+    assert res.sizes["stand"] == 2
+
+    for stand, (k, lam) in enumerate(((3.0, 25.0), (4.0, 30.0))):
+
+        def density(d, k=k, lam=lam):
+            height = np.clip(_height_curve(d), HEIGHTS[0], HEIGHTS[-1])
+            return 800 * stats.weibull_min.pdf(d, k, scale=lam) * (2 * height + 3 * d)
+
+        expected = integrate.quad(density, 7, 61)[0]
+        assert res["value_per_ha"].values[stand, 0] == pytest.approx(expected, rel=2e-3)
+        inside = 800 * np.diff(stats.weibull_min.cdf([7, 61], k, scale=lam))[0]
+        assert res["stems_outside"].values[stand, 0] == pytest.approx(800 - inside)
+
+
+def test_value_stands_validation(linear_cube):
+    with pytest.raises(ValueError, match="not in the solution cube"):
+        value_stands(linear_cube, {"spruce": DBHHistogram([20.0], [1.0])}, _height_curve)
+    with pytest.raises(ValueError, match="At least one"):
+        value_stands(linear_cube, {}, _height_curve)
+    with pytest.raises(TypeError, match="Unsupported"):
+        value_stands(linear_cube, {"pine": object()}, _height_curve)
@@ -0,0 +1,116 @@
+import math
+import random
+import statistics
+
+import pytest
+
+from pyforestry.base.helpers import (
+    AngleCount,
+    CircularPlot,
+    Stand,
+    StandVolume,
+    Tree,
+    parse_tree_species,
+)
+from pyforestry.sweden.timber import SweTimber
+from pyforestry.sweden.volume import swe_timber_volumes
+
+SPECIES = ["picea abies", "pinus sylvestris", "betula pendula"]
+
+
+def _stand(seed=0):
+    rng = random.Random(seed)
+    plots = []
+    for i in range(5):
+        trees = [
+            Tree(
+                species=rng.choice(SPECIES),
+                diameter_cm=round(rng.uniform(6, 40), 1),
+                height_m=round(rng.uniform(8, 28), 1),
+                weight_n=rng.choice([1.0, 1.0, 2.0]),
+                uid=(i, j),
+            )
+            for j in range(rng.randint(1, 12))
+        ]
+        plots.append(CircularPlot(id=i, radius_m=rng.uniform(5, 10), trees=trees, occlusion=0.1))
+    return Stand(plots=plots)
+
+
+def _expected(stand, latitude):
+    per_plot = {}
+    for plot in stand.plots:
+        sums = {}
+        for tree in plot.trees:
+            timber = SweTimber(
+                tree.species.full_name.lower(), tree.diameter_cm, tree.height_m, latitude=latitude
+            )
+            sums[tree.species] = sums.get(tree.species, 0.0) + timber.getvolume() * tree.weight_n
+        for sp, volume in sums.items():
+            per_plot.setdefault(sp, []).append(volume / (plot.area_ha * (1 - plot.occlusion)))
+    return {sp: (statistics.mean(v), statistics.pstdev(v)) for sp, v in per_plot.items()}
+
+
+def test_volume_matches_single_tree_expansion():
+    stand = _stand()
+    volumes = stand.estimate_volume(swe_timber_volumes, latitude=61.0)
+    expected = _expected(stand, 61.0)
+
+    assert set(volumes) == set(expected) | {"TOTAL"}
+    for sp, (mean, sd) in expected.items():
+        assert isinstance(volumes[sp], StandVolume)
+        assert volumes[sp].species == sp
+        assert math.isclose(volumes[sp], mean, rel_tol=1e-12)
+        assert math.isclose(volumes[sp].precision, sd, rel_tol=1e-9)
+    total = volumes["TOTAL"]
+    assert math.isclose(total, sum(mean for mean, _ in expected.values()), rel_tol=1e-12)
+    assert math.isclose(
+        total.precision, math.sqrt(sum(sd**2 for _, sd in expected.values())), rel_tol=1e-9
+    )
+    assert total.fn is swe_timber_volumes and total.over_bark
+    assert stand.Volume("picea abies") is volumes[parse_tree_species("picea abies")]
+    assert float(stand.Volume) == total
+
+
+def test_volume_follows_thinning_and_new_plots():
+    stand = _stand(seed=1)
+    before = float(stand.estimate_volume(swe_timber_volumes, over_bark=False)["TOTAL"])
+    assert stand.Volume.TOTAL.over_bark is False
+
+    stand.thin_trees(rule=lambda tree: tree.diameter_cm > 20)
+    after = stand.Volume.TOTAL
+    assert after < before
+    assert math.isclose(after, stand.estimate_volume(swe_timber_volumes, False)["TOTAL"])
+
+    stand.append_plot(
+        CircularPlot(
+            id=9, radius_m=5.0, trees=[Tree(species="picea abies", diameter_cm=30, height_m=25)]
+        )
+    )
+    assert float(stand.Volume) != float(after)
+
+
+def test_volume_needs_a_model_and_heights():
+    stand = _stand()
+    with pytest.raises(KeyError, match="estimate_volume"):
+        float(stand.Volume)
+
+    stand.plots[0].trees[0].height_m = None
+    with pytest.raises(ValueError, match="1 trees have no height"):
+        stand.estimate_volume(swe_timber_volumes)
+    assert stand._volume_model is None
+    assert float(stand.BasalArea) > 0
+
+    stand.plots[0].trees[0].height_m = 12.0
+    with pytest.raises(ValueError, match="no volume"):
+        stand.estimate_volume(lambda table: table["diameter_cm"] * math.nan)
+
+
+def test_volume_not_supported_for_angle_counts():
+    sp = parse_tree_species("picea abies")
+    plot = CircularPlot(
+        id=1,
+        radius_m=5.0,
+        AngleCount=[AngleCount(ba_factor=2.0, value=[3], species=[sp], point_id="P1")],
+    )
+    with pytest.raises(ValueError, match="AngleCount"):
+        Stand(plots=[plot]).estimate_volume(swe_timber_volumes)
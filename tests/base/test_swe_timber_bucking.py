@@ -31,3 +31,56 @@ def test_nasberg_1985_branch_bound(test_log, test_pricelist):
     assert result is not None, "Result should not be None"
     assert "total_value" in result, "Expected 'total_value' key in result"
     assert result["total_value"] >= 0, "Total value should be non-negative"
+
+
+@pytest.mark.parametrize(
+    "species, diameter, height, value, pattern",
+    [
+        ("pinus sylvestris", 12, 28, 43.7027, [[174, 277, 5], [33, 174, 4], [0, 33, 1]]),
+        (
+            "pinus sylvestris",
+            30,
+            24,
+            249.1515,
+            [[155, 262, 5], [83, 155, 3], [36, 83, 2], [0, 36, 1]],
+        ),
+        ("picea abies", 12, 28, 47.5302, [[172, 284, 5], [27, 172, 4], [0, 27, 1]]),
+        (
+            "picea abies",
+            18,
+            25,
+            119.6042,
+            [[167, 249, 5], [102, 167, 3], [47, 102, 2], [0, 47, 1]],
+        ),
+    ],
+)
+def test_nasberg_reference_cutting_patterns(species, diameter, height, value, pattern):
+    # Pinned with the closed-form Edgren–Nylinder section volumes.
+    pricelist = create_pricelist_from_data(Mellanskog_2013_price_data, species_to_load=species)
+    optimizer = Nasberg_1985_BranchBound(
+        SweTimber(species, diameter, height), pricelist, EdgrenNylinder1949
+    )
+    result = optimizer.calculate_tree_value(
+        min_diam_dead_wood=99, config=BuckingConfig(save_sections=True)
+    )
+    assert result.total_value == pytest.approx(value, abs=1e-4)
+    sections = [[int(s.start_point), int(s.end_point), int(s.quality)] for s in result.sections]
+    assert sections == pattern
+
+
+def test_nasberg_inverts_heights_in_one_array_call(test_log, test_pricelist, monkeypatch):
+    calls = []
+    original = EdgrenNylinder1949.get_height_array
+
+    def counting(self, diameters):
+        calls.append(list(diameters))
+        return original(self, diameters)
+
+    def scalar(self, diameter):
+        raise AssertionError("scalar height inversion used")
+
+    monkeypatch.setattr(EdgrenNylinder1949, "get_height_array", counting)
+    monkeypatch.setattr(EdgrenNylinder1949, "get_height_at_diameter", scalar)
+    optimizer = Nasberg_1985_BranchBound(test_log, test_pricelist, EdgrenNylinder1949)
+    assert optimizer.calculate_tree_value(min_diam_dead_wood=99)["total_value"] > 0
+    assert len(calls) == 1 and len(calls[0]) == 2
@@ -0,0 +1,79 @@
+import pytest
+
+from pyforestry.base.pricelist import create_pricelist_from_data
+from pyforestry.base.taper import Taper, TaperCache
+from pyforestry.base.timber_bucking.nasberg_1985 import Nasberg_1985_BranchBound
+from pyforestry.sweden.pricelist.data.mellanskog_2013 import Mellanskog_2013_price_data
+from pyforestry.sweden.taper import EdgrenNylinder1949
+from pyforestry.sweden.timber.swe_timber import SweTimber
+
+
+def pine(diameter_cm=25.0, height_m=20.0, **kwargs):
+    return SweTimber(
+        species="pinus sylvestris", diameter_cm=diameter_cm, height_m=height_m, **kwargs
+    )
+
+
+def test_hits_for_stems_with_the_same_quantised_attributes():
+    cache = TaperCache("EdgrenNylinder1949")
+    first = cache.get(pine(25.02, 20.01))
+    assert cache.get(pine(24.98, 19.99)) is first
+    assert cache.get(pine(25.2, 20.0)) is not first
+    assert cache.get(pine(25.0, 20.0, region="northern")) is not first
+
+    stats = cache.stats()
+    assert (stats.hits, stats.misses, stats.size) == (1, 3, 3)
+    assert stats.hit_rate == pytest.approx(0.25)
+    assert "hit_rate=25.0%" in repr(cache)
+
+
+def test_taper_describes_the_quantised_stem():
+    cache = TaperCache(EdgrenNylinder1949, diameter_step_cm=1.0, height_step_m=0.5)
+    taper = cache.get(pine(25.3, 20.2, crown_base_height_m=8.04))
+    assert (taper.timber.diameter_cm, taper.timber.height_m) == (25.0, 20.0)
+    assert taper.timber.crown_base_height_m == pytest.approx(8.0)
+    reference = EdgrenNylinder1949(pine(25.0, 20.0, crown_base_height_m=8.0))
+    assert taper.base_diameter == pytest.approx(reference.base_diameter)
+
+
+def test_lru_eviction_and_clear():
+    cache = TaperCache(EdgrenNylinder1949, maxsize=2)
+    a = cache.get(pine(20.0))
+    cache.get(pine(22.0))
+    cache.get(pine(20.0))  # "a" becomes most recently used
+    cache.get(pine(24.0))
+    assert cache.get(pine(20.0)) is a
+    assert cache.stats().evictions == 1
+    assert len(cache) == 2
+
+    cache.clear()
+    assert len(cache) == 0
+    assert cache.stats().hit_rate == 0.0
+
+
+def test_invalid_settings():
+    with pytest.raises(ValueError, match="maxsize"):
+        TaperCache(EdgrenNylinder1949, maxsize=0)
+    with pytest.raises(ValueError, match="steps"):
+        TaperCache(EdgrenNylinder1949, height_step_m=0)
+
+
+def test_optimiser_uses_the_cache():
+    pricelist = create_pricelist_from_data(Mellanskog_2013_price_data, "pinus sylvestris")
+    cache = TaperCache(EdgrenNylinder1949)
+    trees = [pine(28.0, 22.0), pine(28.01, 22.02)]
+    results = [
+        Nasberg_1985_BranchBound(tree, pricelist, taper_cache=cache).calculate_tree_value(
+            min_diam_dead_wood=99
+        )
+        for tree in trees
+    ]
+    assert cache.stats().hits == 1
+    assert results[0].total_value == results[1].total_value
+    uncached = Nasberg_1985_BranchBound(
+        trees[0], pricelist, EdgrenNylinder1949
+    ).calculate_tree_value(min_diam_dead_wood=99)
+    assert results[0].total_value == pytest.approx(uncached.total_value)
+
+    with pytest.raises(ValueError, match="different taper model"):
+        Nasberg_1985_BranchBound(trees[0], pricelist, Taper, taper_cache=cache)
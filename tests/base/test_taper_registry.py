@@ -0,0 +1,132 @@
+import pytest
+
+import pyforestry.base.taper.registry as registry
+from pyforestry.base.pricelist import SolutionCubeCache, create_pricelist_from_data
+from pyforestry.base.taper import (
+    Taper,
+    TaperModel,
+    available_taper_models,
+    check_registered_models,
+    check_taper_model,
+    get_taper_model,
+    register_taper_model,
+    taper_model_name,
+)
+from pyforestry.base.timber_bucking.nasberg_1985 import Nasberg_1985_BranchBound
+from pyforestry.sweden.pricelist.data.mellanskog_2013 import Mellanskog_2013_price_data
+from pyforestry.sweden.taper import EdgrenNylinder1949
+from pyforestry.sweden.timber.swe_timber import SweTimber
+
+TIMBERS = [
+    SweTimber(species="pinus sylvestris", diameter_cm=30, height_m=24, region="southern"),
+    SweTimber(species="picea abies", diameter_cm=22, height_m=19, region="northern"),
+]
+
+
+class ConeModel(Taper):
+    """Cone from the ground to the top; only scalar methods."""
+
+    def __init__(self, timber):
+        super().__init__(timber, self)
+
+    def get_diameter_at_height(self, height_m):
+        return max(0.0, self.timber.diameter_cm * (1 - height_m / self.timber.height_m))
+
+
+class WideningModel(ConeModel):
+    def get_diameter_at_height(self, height_m):
+        return self.timber.diameter_cm * (1 + height_m / self.timber.height_m)
+
+
+class WrongVolumeModel(ConeModel):
+    def volume_sections(self, h1_m, h2_m):
+        return 2 * super().volume_sections(h1_m, h2_m)
+
+
+@pytest.fixture
+def clean_registry(monkeypatch):
+    monkeypatch.setattr(registry, "_TAPER_MODELS", dict(registry._TAPER_MODELS))
+
+
+def test_builtin_model_resolves_lazily_by_name():
+    assert "EdgrenNylinder1949" in available_taper_models()
+    assert get_taper_model("EdgrenNylinder1949") is EdgrenNylinder1949
+    assert get_taper_model(EdgrenNylinder1949) is EdgrenNylinder1949
+    assert taper_model_name(EdgrenNylinder1949) == "EdgrenNylinder1949"
+    assert isinstance(EdgrenNylinder1949(TIMBERS[0]), TaperModel)
+
+
+def test_register_and_name_lookup(clean_registry):
+    register_taper_model("cone", ConeModel)
+    assert get_taper_model("cone") is ConeModel
+    assert taper_model_name(ConeModel) == "cone"
+    register_taper_model("cone", ConeModel)  # same entry again is fine
+    with pytest.raises(ValueError, match="already registered"):
+        register_taper_model("cone", WideningModel)
+    register_taper_model("cone", WideningModel, overwrite=True)
+    assert taper_model_name(ConeModel) == "ConeModel"
+
+    register_taper_model("lazy-cone", f"{__name__}:ConeModel")
+    assert taper_model_name(ConeModel) == "lazy-cone"
+    assert get_taper_model("lazy-cone") is ConeModel
+
+
+def test_invalid_registrations_and_lookups(clean_registry):
+    with pytest.raises(ValueError, match="Unknown taper model"):
+        get_taper_model("no-such-model")
+    with pytest.raises(TypeError):
+        get_taper_model(42)
+    with pytest.raises(ValueError, match="module:attribute"):
+        register_taper_model("bad", "not_a_reference")
+    with pytest.raises(ValueError, match="non-empty"):
+        register_taper_model("", ConeModel)
+
+
+def test_names_select_models_in_optimiser_and_cache():
+    pricelist = create_pricelist_from_data(Mellanskog_2013_price_data, "pinus sylvestris")
+    optimiser = Nasberg_1985_BranchBound(TIMBERS[0], pricelist, "EdgrenNylinder1949")
+    assert optimiser._taper_class is EdgrenNylinder1949
+
+    grid = dict(species_list=["pine"], dbh_range=(10, 12), height_range=(10, 10))
+    assert SolutionCubeCache.key({"a": 1}, "EdgrenNylinder1949", **grid) == SolutionCubeCache.key(
+        {"a": 1}, EdgrenNylinder1949, **grid
+    )
+
+
+def test_conformance_of_registered_and_faulty_models(clean_registry):
+    register_taper_model("cone", ConeModel)
+    reports = check_registered_models(TIMBERS, points=50)
+    assert set(reports) == {"EdgrenNylinder1949", "EdgrenNylinder1949UnderBark", "cone"}
+    for report in reports.values():
+        assert report.passed
+        assert report.stems == len(TIMBERS)
+        assert report.diameters_per_second > 0
+        assert report.volumes_per_second > 0
+
+    widening = check_taper_model(WideningModel, TIMBERS, points=50)
+    assert not widening.monotonic
+    assert widening.model == "WideningModel"
+
+    wrong_volume = check_taper_model(WrongVolumeModel, TIMBERS, points=50)
+    assert wrong_volume.monotonic
+    assert not wrong_volume.volume_consistent
+    assert wrong_volume.max_volume_error > 0.01
+
+    with pytest.raises(ValueError, match="At least one"):
+        check_taper_model(ConeModel, [])
+
+
+def test_registered_checks_skip_unsupported_stems():
+    birch = SweTimber(species="betula pendula", diameter_cm=20, height_m=18)
+    reports = check_registered_models([*TIMBERS, birch], points=50)
+    assert reports["EdgrenNylinder1949"].stems == 3
+    assert reports["EdgrenNylinder1949"].skipped == []
+
+    under_bark = reports["EdgrenNylinder1949UnderBark"]
+    assert under_bark.passed
+    assert under_bark.stems == 2
+    assert len(under_bark.skipped) == 1
+    assert "stem 2 (betula pendula)" in under_bark.skipped[0]
+
+    none_supported = check_taper_model("EdgrenNylinder1949UnderBark", [birch], points=50)
+    assert none_supported.stems == 0 and not none_supported.passed
@@ -92,3 +92,74 @@ def test_volume_section_invalid_range(monkeypatch, timber):
     )
     assert taper.volume_section(5.0, 5.0) == 0.0
     assert not called
+
+
+def test_get_diameter_array_dispatches_to_model(timber):
+    class ArrayModel(DummyModel):
+        def get_diameter_array(self, heights):
+            self.array_calls = heights.copy()
+            return heights * 2
+
+    model = ArrayModel()
+    taper = Taper(timber, model)
+    res = taper.get_diameter_array([-1, 0, 10, 25])
+    # only heights inside the stem reach the model, already offset by the stump
+    assert np.allclose(model.array_calls, [0.5, 10.5])
+    assert np.allclose(res, [0.0, 1.0, 21.0, 0.0])
+    assert model.diam_calls == []
+    assert taper.get_diameter_vectorised([0]).dtype == np.float32
+
+
+def test_get_diameter_array_scalar_subclass(timber):
+    class ScalarTaper(Taper):
+        def __init__(self, timber):
+            super().__init__(timber, self)
+
+        def get_diameter_at_height(self, height_m):
+            return 3.0 * height_m
+
+    res = ScalarTaper(timber).get_diameter_array(np.array([[1.0, 2.0]]))
+    assert res.shape == (1, 2)
+    assert np.allclose(res, [[3.0, 6.0]])
+
+
+def test_volume_sections_scalar_subclass(timber):
+    class SectionTaper(Taper):
+        def __init__(self, timber):
+            super().__init__(timber, self)
+
+        def volume_section(self, h1_m, h2_m):
+            return h2_m - h1_m
+
+    res = SectionTaper(timber).volume_sections(1.0, np.array([2.0, 4.0]))
+    assert np.allclose(res, [1.0, 3.0])
+
+
+def test_volume_sections_wrapper_uses_gauss(timber):
+    # DummyModel diameter 2 * h (h above ground), stump at 0.5 m
+    taper = Taper(timber, DummyModel())
+    res = taper.volume_sections([0.0, 1.0], [1.0, 1.0])
+    expected = np.pi / 4e4 * ((2 * 1.5) ** 3 - (2 * 0.5) ** 3) / 6
+    assert res[0] == pytest.approx(expected, rel=1e-12)
+    assert res[1] == 0.0
+
+
+def test_get_height_array_scalar_model(timber):
+    model = DummyModel()
+    taper = Taper(timber, model)
+    res = taper.get_height_array(np.array([[10.0, 4.0]]))
+    assert np.allclose(res, [[4.5, 1.5]])
+    assert model.height_calls == [10.0, 4.0]
+
+
+def test_get_height_array_dispatches_and_handles_none(timber):
+    class ArrayModel(DummyModel):
+        def get_height_array(self, diameters):
+            return diameters / 4
+
+    taper = Taper(timber, ArrayModel())
+    assert np.allclose(taper.get_height_array([8.0]), [1.5])
+
+    model = DummyModel()
+    model.get_height_at_diameter = lambda d: None
+    assert Taper(timber, model).get_height_array([8.0]).tolist() == [0.0]
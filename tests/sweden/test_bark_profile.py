@@ -0,0 +1,151 @@
+import warnings
+
+import numpy as np
+import pytest
+
+from pyforestry.base.pricelist import create_pricelist_from_data
+from pyforestry.base.taper import check_taper_model, get_taper_model
+from pyforestry.base.timber_bucking.nasberg_1985 import Nasberg_1985_BranchBound
+from pyforestry.sweden.bark import (
+    Hannrup_2004_bark_picea_abies_sweden,
+    Hannrup_2004_bark_picea_abies_sweden_array,
+    Hannrup_2004_bark_pinus_sylvestris_sweden,
+    Hannrup_2004_bark_pinus_sylvestris_sweden_array,
+    double_bark_profile,
+    over_bark_profile,
+    under_bark_profile,
+)
+from pyforestry.sweden.pricelist.data.mellanskog_2013 import Mellanskog_2013_price_data
+from pyforestry.sweden.taper import EdgrenNylinder1949, EdgrenNylinder1949Batch, UnderBarkTaper
+from pyforestry.sweden.timber.swe_timber import SweTimber
+
+
+def test_array_models_match_scalar_models():
+    rng = np.random.default_rng(1)
+    dbh = rng.uniform(50, 650, 500)
+    latitude = rng.uniform(55, 70, 500)
+    height = rng.uniform(0, 3000, 500)
+    diameter = rng.uniform(0, 600, 500)
+
+    pine = Hannrup_2004_bark_pinus_sylvestris_sweden_array(dbh, latitude, height)
+    spruce = Hannrup_2004_bark_picea_abies_sweden_array(diameter, dbh)
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        expected_pine = [
+            Hannrup_2004_bark_pinus_sylvestris_sweden(*map(float, args))
+            for args in zip(dbh, latitude, height, strict=True)
+        ]
+    expected_spruce = [
+        Hannrup_2004_bark_picea_abies_sweden(float(d), float(b))
+        for d, b in zip(diameter, dbh, strict=True)
+    ]
+    np.testing.assert_allclose(pine, expected_pine, rtol=1e-12)
+    np.testing.assert_allclose(spruce, expected_spruce, rtol=1e-12)
+
+
+def test_array_models_validate_once():
+    with pytest.raises(ValueError, match="stem_height_cm"):
+        Hannrup_2004_bark_pinus_sylvestris_sweden_array(300, 60, [100, -1])
+    with pytest.raises(ValueError, match="diameter_breast_height_mm"):
+        Hannrup_2004_bark_picea_abies_sweden_array([100, 200], [300, 0])
+    with pytest.warns(UserWarning, match="Latitudes"):
+        Hannrup_2004_bark_pinus_sylvestris_sweden_array(300, [60, 75], 100)
+
+
+@pytest.mark.parametrize("species", ["pinus sylvestris", "picea abies"])
+def test_over_and_under_bark_profiles_round_trip(species):
+    heights = np.linspace(0, 20, 41)
+    over = np.linspace(32, 0, 41)
+    under = under_bark_profile(species, 28.0, heights, over, latitude=62)
+    bark = double_bark_profile(species, 28.0, heights, over, latitude=62)
+
+    inside = over > 0
+    np.testing.assert_allclose(under[inside], over[inside] - bark[inside] / 10)
+    assert under[~inside] == 0
+    back = over_bark_profile(species, 28.0, heights, under, latitude=62)
+    thick = under > 0
+    np.testing.assert_allclose(back[thick], over[thick])
+
+
+def test_profiles_broadcast_over_a_batch():
+    species = np.array(["pinus sylvestris", "picea abies", "Picea abies"])[:, None]
+    dbh = np.array([24.0, 31.0, 18.0])[:, None]
+    heights = np.linspace(0, 15, 16)
+    over = np.linspace(1.2, 0.2, 16) * dbh
+
+    profiles = under_bark_profile(species, dbh, heights, over, latitude=60)
+    assert profiles.shape == (3, 16)
+    for i, (sp, d) in enumerate(zip(species[:, 0], dbh[:, 0], strict=True)):
+        row = under_bark_profile(sp, d, heights, over[i], latitude=60)
+        np.testing.assert_array_equal(profiles[i], row)
+
+    with pytest.raises(ValueError, match="No Hannrup"):
+        under_bark_profile("betula", 20.0, heights, over[0])
+
+
+def test_batch_taper_profiles_convert_in_one_call():
+    batch = EdgrenNylinder1949Batch(
+        species=np.array(["pinus sylvestris", "picea abies"]),
+        diameter_cm=np.array([25.0, 30.0]),
+        height_m=np.array([20.0, 24.0]),
+    )
+    heights = np.linspace(0, 24, 49)
+    under = under_bark_profile(
+        batch.species[:, None], batch.diameter_cm[:, None], heights, batch.diameter(heights)
+    )
+    assert under.shape == (2, 49)
+    assert np.all(under <= batch.diameter(heights))
+
+
+@pytest.fixture
+def pine():
+    return SweTimber("pinus sylvestris", 28.0, 22.0, latitude=62)
+
+
+def test_under_bark_taper_diameters_and_volumes(pine):
+    over = EdgrenNylinder1949(pine)
+    under = UnderBarkTaper(pine)
+    heights = np.linspace(0, 22, 45)
+
+    expected = under_bark_profile(
+        "pinus sylvestris", 28.0, heights, over.get_diameter_array(heights), 62
+    )
+    np.testing.assert_array_equal(under.get_diameter_array(heights), expected)
+    assert under.get_diameter_at_height(5.0) == pytest.approx(expected[10])
+
+    volume_over = float(over.volume_sections(0.0, 22.0))
+    volume_under = under.volume_section(0.0, 22.0)
+    assert 0.8 * volume_over < volume_under < volume_over
+    assert under.volume_section(5.0, 5.0) == 0.0
+
+
+def test_under_bark_taper_heights_invert_diameters(pine):
+    under = UnderBarkTaper(pine)
+    targets = np.array([5.0, 12.0, 20.0])
+    heights = under.get_height_array(targets)
+    np.testing.assert_allclose(under.get_diameter_array(heights), targets, atol=1e-6)
+    assert under.get_height_at_diameter(500.0) == 0.0
+    assert under.get_height_at_diameter(0.0) == 0.0
+
+
+def test_under_bark_taper_is_registered_and_conforms(pine):
+    assert get_taper_model("EdgrenNylinder1949UnderBark") is UnderBarkTaper
+    spruce = SweTimber("picea abies", 32.0, 25.0)
+    result = check_taper_model("EdgrenNylinder1949UnderBark", [pine, spruce])
+    assert result.volume_consistent
+
+
+def test_under_bark_taper_rejects_unsupported_stems():
+    with pytest.raises(ValueError, match="over-bark"):
+        UnderBarkTaper(SweTimber("pinus sylvestris", 28.0, 22.0, over_bark=False))
+    with pytest.raises(ValueError, match="No Hannrup"):
+        UnderBarkTaper(SweTimber("betula", 28.0, 22.0))
+
+
+def test_bucking_under_bark_gives_less_volume(pine):
+    pricelist = create_pricelist_from_data(Mellanskog_2013_price_data, "pinus sylvestris")
+    over = Nasberg_1985_BranchBound(pine, pricelist, EdgrenNylinder1949)
+    under = Nasberg_1985_BranchBound(pine, pricelist, "EdgrenNylinder1949UnderBark")
+    result_over = over.calculate_tree_value(min_diam_dead_wood=99)
+    result_under = under.calculate_tree_value(min_diam_dead_wood=99)
+    assert 0 < result_under.vol_sk_ub < result_over.vol_sk_ub
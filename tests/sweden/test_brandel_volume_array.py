@@ -0,0 +1,74 @@
+import numpy as np
+import pytest
+
+from pyforestry.base.helpers.tree_species import tree_species_codes
+from pyforestry.sweden.volume import BrandelVolume, BrandelVolumes
+
+
+def _scalar(species, diameter, height, latitude, altitude, field_layer, over_bark):
+    try:
+        return BrandelVolume.get_volume(
+            str(species),
+            float(diameter),
+            float(height),
+            float(latitude),
+            None if np.isnan(altitude) else float(altitude),
+            None if np.isnan(field_layer) else int(field_layer),
+            bool(over_bark),
+        )
+    except ValueError:
+        return np.nan
+
+
+def test_array_matches_scalar_across_sites():
+    rng = np.random.default_rng(0)
+    n = 4000
+    # Latitudes and altitudes on the band limits, field layers out of range.
+    columns = (
+        rng.choice(["pinus sylvestris", "picea abies", "Betula pendula", "spruce"], n),
+        np.round(rng.uniform(3, 60, n), 1),
+        np.round(rng.uniform(1, 35, n), 1),
+        rng.choice([55.5, 57, 58, 59, 60, 61, 63, 64, 65, 66, 67, 68.5], n),
+        np.where(rng.random(n) < 0.3, np.nan, rng.choice([0, 199, 200, 499, 500, 800], n)),
+        np.where(rng.random(n) < 0.3, np.nan, rng.integers(-1, 22, n)),
+        rng.random(n) < 0.5,
+    )
+    result = BrandelVolume.get_volume_array(*columns)
+    expected = np.array([_scalar(*tree) for tree in zip(*columns, strict=True)])
+
+    assert isinstance(result, BrandelVolumes)
+    np.testing.assert_array_equal(result.valid, ~np.isnan(expected))
+    np.testing.assert_allclose(result.volume, expected, rtol=1e-13)
+
+
+def test_invalid_trees_are_masked_not_raised():
+    result = BrandelVolume.get_volume_array(
+        "picea abies", [4.9, 5.0, 20.0, 20.0], [10.0, 10.0, 1.3, 1.31], latitude=62
+    )
+    assert result.valid_diameter.tolist() == [False, True, True, True]
+    assert result.valid_height.tolist() == [True, True, False, True]
+    assert np.isnan(result.volume).tolist() == [True, False, True, False]
+    assert result.volume[3] == pytest.approx(
+        BrandelVolume.get_volume("picea abies", 20.0, 1.31, 62, None, None)
+    )
+
+    none_valid = BrandelVolume.get_volume_array("picea abies", 3.0, 10.0, latitude=62)
+    assert np.isnan(none_valid.volume) and not none_valid.valid
+
+
+def test_species_codes_and_broadcasting():
+    names = ["pinus sylvestris", "picea abies", "betula pubescens"]
+    heights = np.array([[12.0], [24.0]])
+    by_code = BrandelVolume.get_volume_array(
+        tree_species_codes(names), 25.0, heights, 64.0, 300.0, 5, over_bark=False
+    )
+    by_name = BrandelVolume.get_volume_array(names, 25.0, heights, 64.0, 300.0, 5, False)
+    assert by_code.volume.shape == (2, 3)
+    np.testing.assert_array_equal(by_code.volume, by_name.volume)
+
+
+def test_unsupported_species_raise():
+    with pytest.raises(ValueError, match="pine, spruce or birch"):
+        BrandelVolume.get_volume_array(["picea abies", "quercus robur"], 20.0, 15.0, 58.0)
+    with pytest.raises(ValueError, match="codes"):
+        BrandelVolume.get_volume_array(99, 20.0, 15.0, 58.0)
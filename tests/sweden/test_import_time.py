@@ -0,0 +1,78 @@
+import os
+import subprocess
+import sys
+
+import pytest
+
+HEAVY_PACKAGES = ("geopandas", "shapely", "pyproj", "matplotlib", "pandas", "scipy")
+# Cumulative import time budget in microseconds. Importing these modules
+# took about 1.8 s while they pulled in geopandas; without it they take
+# about 0.15 s, most of it numpy. Wall-clock times vary on shared runners,
+# so the budget is only checked when PYFORESTRY_IMPORT_BUDGET is set; the
+# heavy-package check below runs always.
+BUDGET_US = 1_000_000
+
+SCRIPT = """
+import sys
+from pyforestry.sweden.timber import SweTimber
+from pyforestry.sweden.volume import *
+from pyforestry.sweden.volume import swe_timber_volumes
+print(",".join(sorted({name.split(".")[0] for name in sys.modules})))
+"""
+
+
+def _import_times(script):
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", script],
+        capture_output=True,
+        text=True,
+        env={**os.environ},
+        check=True,
+    )
+    # Sum the cumulative times of the top-level imports, which include
+    # everything they import in turn.
+    total = 0
+    for line in result.stderr.splitlines():
+        fields = line.split("|")
+        if len(fields) == 3 and fields[1].strip().isdigit() and not fields[2].startswith("  "):
+            total += int(fields[1])
+    return set(result.stdout.strip().split(",")), total
+
+
+@pytest.fixture(scope="module")
+def swe_timber_import():
+    return _import_times(SCRIPT)
+
+
+def test_timber_and_volume_functions_skip_heavy_packages(swe_timber_import):
+    modules, _ = swe_timber_import
+    assert "pyforestry" in modules
+    assert modules.isdisjoint(HEAVY_PACKAGES), sorted(modules.intersection(HEAVY_PACKAGES))
+
+
+@pytest.mark.skipif(
+    not os.environ.get("PYFORESTRY_IMPORT_BUDGET"), reason="set PYFORESTRY_IMPORT_BUDGET=1"
+)
+def test_timber_and_volume_functions_import_within_budget(swe_timber_import):
+    _, total = swe_timber_import
+    assert 0 < total < BUDGET_US
+
+
+def test_attribute_paths_load_on_access():
+    script = """
+import functools
+import pyforestry
+paths = [
+    "base.helpers.Stand",
+    "base.helpers.primitives.age.Age",
+    "base.helpers.tree_species.parse_tree_species",
+    "base.pricelist.Pricelist",
+    "base.taper.taper.Taper",
+    "base.timber.timber_base.timber_volume_integrator.TimberVolumeIntegrator",
+    "base.timber_bucking",
+    "sweden.helpers",
+]
+for path in paths:
+    functools.reduce(getattr, path.split("."), pyforestry)
+"""
+    subprocess.run([sys.executable, "-c", script], env={**os.environ}, check=True)
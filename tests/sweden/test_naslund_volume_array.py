@@ -0,0 +1,106 @@
+import numpy as np
+import pytest
+
+from pyforestry.base.helpers.tree_species import tree_species_codes, tree_species_names
+from pyforestry.sweden.timber.swe_timber import SweTimber
+from pyforestry.sweden.volume.naslund_1947 import NaslundFormFactor, NaslundVolume
+
+SPECIES = ["pinus sylvestris", "picea abies", "betula", "Betula pendula", "betula pubescens"]
+
+
+def _trees(n, seed=0):
+    rng = np.random.default_rng(seed)
+    height = np.round(rng.uniform(1.5, 35, n), 1)
+    return dict(
+        species=rng.choice(SPECIES, n),
+        # Three decimals give diameters whose Python square is not d * d.
+        diameter_cm=np.round(rng.uniform(5, 60, n), 3),
+        height_m=height,
+        double_bark_mm=np.where(rng.random(n) < 0.3, np.nan, np.round(rng.uniform(0, 30, n))),
+        crown_base_height_m=np.where(
+            rng.random(n) < 0.3, np.nan, np.round(height * rng.uniform(0, 0.9, n), 1)
+        ),
+        over_bark=rng.random(n) < 0.5,
+        region=rng.choice(["southern", "northern"], n),
+    )
+
+
+def _scalar(trees, i):
+    bark, crown = trees["double_bark_mm"][i], trees["crown_base_height_m"][i]
+    return SweTimber(
+        str(trees["species"][i]),
+        float(trees["diameter_cm"][i]),
+        float(trees["height_m"][i]),
+        None if np.isnan(bark) else float(bark),
+        None if np.isnan(crown) else float(crown),
+        bool(trees["over_bark"][i]),
+        str(trees["region"][i]),
+    )
+
+
+def test_volume_array_matches_scalar_exactly():
+    trees = _trees(3000)
+    result = NaslundVolume.calculate_array(**trees)
+    expected = [NaslundVolume.calculate(_scalar(trees, i)) for i in range(len(result))]
+    assert result.tolist() == expected
+
+
+def test_form_factor_array_matches_scalar_exactly():
+    trees = _trees(3000, seed=1)
+    result = NaslundFormFactor.calculate_array(**trees)
+    expected = []
+    for i in range(len(result)):
+        timber = _scalar(trees, i)
+        expected.append(
+            NaslundFormFactor.calculate(
+                timber.species,
+                timber.height_m,
+                timber.diameter_cm,
+                timber.double_bark_mm,
+                timber.crown_base_height_m,
+                timber.over_bark,
+                timber.region,
+            )
+        )
+    assert result.tolist() == expected
+
+
+def test_species_codes_and_broadcasting():
+    names = ["pinus sylvestris", "picea abies", "betula pendula"]
+    codes = tree_species_codes(names)
+    assert tree_species_names(codes).tolist() == names
+
+    diameters = np.array([[12.0], [31.5]])
+    by_code = NaslundVolume.calculate_array(codes, diameters, 18.0, region="northern")
+    by_name = NaslundVolume.calculate_array(names, diameters, 18.0, region="northern")
+    assert by_code.shape == (2, 3)
+    np.testing.assert_array_equal(by_code, by_name)
+    assert by_code[1, 2] == NaslundVolume.calculate(
+        SweTimber("betula pendula", 31.5, 18.0, region="northern")
+    )
+
+
+def test_zero_crown_and_bark_select_the_simple_equation():
+    simple = NaslundVolume.calculate_array("pinus sylvestris", 25.0, 20.0)
+    zero = NaslundVolume.calculate_array("pinus sylvestris", 25.0, 20.0, 0.0, 0.0)
+    assert zero == simple
+    detailed = NaslundVolume.calculate_array("pinus sylvestris", 25.0, 20.0, 8.0, 10.0)
+    assert detailed != simple
+
+
+@pytest.mark.parametrize(
+    "kwargs, message",
+    [
+        (dict(species="quercus robur"), "Species"),
+        (dict(species=tree_species_codes("quercus robur")), "Species"),
+        (dict(species=[0, 99]), "codes"),
+        (dict(region="east"), "Region"),
+        (dict(height_m=[20.0, 0.0]), "Height"),
+        (dict(diameter_cm=-1.0), "Diameter"),
+        (dict(crown_base_height_m=25.0), "Crown"),
+    ],
+)
+def test_volume_array_validation(kwargs, message):
+    arguments = {"species": "picea abies", "diameter_cm": 20.0, "height_m": 20.0, **kwargs}
+    with pytest.raises(ValueError, match=message):
+        NaslundVolume.calculate_array(**arguments)
@@ -191,3 +191,39 @@ def test_form_factor_invalid_species():
             height_m=20,
             diameter_cm=25,
         )
+
+
+def test_form_factor_array_matches_scalar_exactly():
+    species = ["pinus sylvestris", "picea abies", "betula", "Betula pendula"]
+    cases = [
+        (sp, region, over_bark, bark, crown)
+        for sp in species
+        for region in ("southern", "northern")
+        for over_bark in (True, False)
+        for bark in (None, 0, 6.0)
+        for crown in (None, 8.0)
+    ]
+    height, diameter = 21.5, 27.3
+    result = NaslundFormFactor.calculate_array(
+        species=[c[0] for c in cases],
+        height_m=height,
+        diameter_cm=diameter,
+        double_bark_mm=[float("nan") if c[3] is None else c[3] for c in cases],
+        crown_base_height_m=[float("nan") if c[4] is None else c[4] for c in cases],
+        over_bark=[c[2] for c in cases],
+        region=[c[1] for c in cases],
+    )
+    expected = [
+        NaslundFormFactor.calculate(sp, height, diameter, bark, crown, over_bark, region)
+        for sp, region, over_bark, bark, crown in cases
+    ]
+    assert result.tolist() == expected
+
+
+def test_form_factor_array_validation():
+    with pytest.raises(ValueError, match="larger than 5"):
+        NaslundFormFactor.calculate_array("picea abies", 20, [10, 4])
+    with pytest.raises(ValueError, match="Region"):
+        NaslundFormFactor.calculate_array("picea abies", 20, 10, region="east")
+    with pytest.raises(ValueError, match="Species"):
+        NaslundFormFactor.calculate_array("quercus robur", 20, 10)
@@ -0,0 +1,116 @@
+import numpy as np
+import pytest
+
+from pyforestry.base.helpers.tree_species import tree_species_codes
+from pyforestry.sweden.timber import SweTimber
+from pyforestry.sweden.volume import (
+    VOLUME_MODELS,
+    matern_1975_volume_sweden_oak,
+    swe_timber_volumes,
+    volume_models,
+)
+
+SPECIES = [
+    "pinus sylvestris",
+    "Picea abies",
+    "betula pendula",
+    "larix decidua",
+    "populus tremula",
+    "alnus incana",
+    "pinus contorta",
+    "carpinus betulus",
+    "quercus robur",
+    "tilia cordata",
+]
+
+
+def _getvolume(species, diameter, height, region, latitude, altitude, field_layer):
+    # SweTimber only accepts pine, spruce and birch, so other species are set
+    # on a valid record the way getvolume reads them.
+    timber = SweTimber("picea abies", 10.0, 10.0, region=region, latitude=latitude)
+    timber.species, timber.diameter_cm, timber.height_m = species.lower(), diameter, height
+    if altitude is not None:
+        timber.altitude, timber.field_layer = altitude, field_layer
+    try:
+        return timber.getvolume()
+    except ValueError:
+        return np.nan
+
+
+@pytest.fixture
+def trees():
+    rng = np.random.default_rng(3)
+    n = 3000
+    diameter = np.round(rng.uniform(-1, 70, n), 1)
+    diameter[::4] = np.round(rng.uniform(4, 5.2, len(diameter[::4])), 2)
+    site = rng.random(n) < 0.5
+    return {
+        "species": rng.choice(SPECIES, n),
+        "diameter_cm": diameter,
+        "height_m": np.round(rng.uniform(1.4, 35, n), 1),
+        "region": rng.choice(["southern", "northern"], n),
+        "latitude": np.where(rng.random(n) < 0.5, np.nan, np.round(rng.uniform(55, 69, n), 1)),
+        "altitude": np.where(site, rng.uniform(0, 800, n), np.nan),
+        "field_layer": np.where(site, rng.integers(1, 20, n), np.nan),
+    }
+
+
+def test_volumes_match_getvolume(trees):
+    result = swe_timber_volumes(trees)
+    expected = [
+        _getvolume(
+            str(trees["species"][i]),
+            float(trees["diameter_cm"][i]),
+            float(trees["height_m"][i]),
+            str(trees["region"][i]),
+            None if np.isnan(trees["latitude"][i]) else float(trees["latitude"][i]),
+            None if np.isnan(trees["altitude"][i]) else float(trees["altitude"][i]),
+            None if np.isnan(trees["field_layer"][i]) else int(trees["field_layer"][i]),
+        )
+        for i in range(len(result))
+    ]
+    # Brandel trees between 4.5 and 5 cm raise in getvolume and are NaN here.
+    np.testing.assert_allclose(result, expected, rtol=1e-13)
+    assert np.isnan(result).any()
+    assert set(volume_models(trees["species"], trees["diameter_cm"], trees["height_m"])) == set(
+        range(len(VOLUME_MODELS))
+    )
+
+
+def test_species_codes_and_scalar_site_columns():
+    species = ["pinus sylvestris", "picea abies", "betula pendula", "quercus robur"]
+    table = {
+        "species": tree_species_codes(species),
+        "diameter_cm": np.array([[3.0], [28.0]]),
+        "height_m": 18.0,
+        "latitude": 62.0,
+        "over_bark": False,
+    }
+    result = swe_timber_volumes(table)
+    assert result.shape == (2, 4)
+    np.testing.assert_array_equal(result, swe_timber_volumes({**table, "species": species}))
+
+    models = volume_models(species, table["diameter_cm"], 18.0)
+    assert [VOLUME_MODELS[m] for m in models[1]] == [
+        "brandel_1990_pine",
+        "brandel_1990_spruce",
+        "brandel_1990_birch",
+        "matern_1975_oak",
+    ]
+
+
+def test_region_fills_missing_latitudes():
+    table = {"species": "picea abies", "diameter_cm": 30.0, "height_m": 25.0}
+    north = swe_timber_volumes({**table, "region": "northern"})
+    assert north == swe_timber_volumes({**table, "latitude": 64.0})
+    assert north != swe_timber_volumes(table)
+    with pytest.raises(ValueError, match="Region"):
+        swe_timber_volumes({**table, "region": "east"})
+
+
+def test_matern_oak_accepts_arrays():
+    heights = np.array([6.0, 9.9, 10.0, 20.0])
+    result = matern_1975_volume_sweden_oak(30.0, heights)
+    assert result.tolist() == pytest.approx(
+        [matern_1975_volume_sweden_oak(30.0, h) for h in heights.tolist()], rel=1e-15
+    )
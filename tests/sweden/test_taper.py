@@ -116,6 +116,45 @@ def test_volume_section(taper_instance):
     assert vol >= 0
 
 
+@pytest.mark.parametrize(
+    "constants",
+    [None, np.array([[0.5, np.nan, 0.8409, 15.970, np.nan, 183.44]])],
+    ids=["fitted", "nan-Q"],
+)
+def test_closed_form_volume_matches_quadrature(taper_instance, constants):
+    from scipy.integrate import quad
+
+    if constants is not None:
+        taper_instance.constants = constants
+
+    def area(h):
+        return np.pi * (taper_instance.get_diameter_at_height(h) / 200) ** 2
+
+    h1 = np.array([0.0, 0.3, 5.0, 20.0, 25.0])
+    h2 = np.array([30.0, 4.6, 18.0, 29.9, 24.0])
+    vols = taper_instance.volume_sections(h1, h2)
+    for i in range(4):
+        expected = quad(
+            area, h1[i], h2[i], points=taper_instance.segment_heights, epsabs=1e-12, limit=200
+        )[0]
+        assert vols[i] == pytest.approx(expected, rel=1e-9)
+        assert taper_instance.volume_section(h1[i], h2[i]) == vols[i]
+    assert vols[4] == 0.0
+    assert taper_instance.volume_section(5.0, 2.0) == 0.0
+
+
+@pytest.mark.parametrize("species", ["pinus sylvestris", "picea abies"])
+@pytest.mark.parametrize("diameter, height", [(8, 10), (12, 28), (30, 24), (45, 34)])
+def test_gauss_volumes_match_closed_form_at_the_butt(species, diameter, height):
+    from pyforestry.base.timber import TimberVolumeIntegrator
+
+    taper = EdgrenNylinder1949(SweTimber(species, diameter, height))
+    h1 = np.array([0.0, 0.0, 0.0, 0.0, 0.3, 0.3, 2.0])
+    h2 = np.array([0.01, 0.5, 2.0, 5.0, 3.3, 5.8, 7.0])
+    gauss = TimberVolumeIntegrator.integrate_volumes(h1, h2, taper)
+    np.testing.assert_allclose(gauss, taper.volume_sections(h1, h2), rtol=1e-6)
+
+
 def test_invalid_timber_raises_error():
     """
     Tests that the constructor raises a ValueError when provided with
@@ -284,6 +323,24 @@ def test_get_relative_diameter_branches(taper_instance):
     assert taper_instance.get_relative_diameter(1.2) == 0
 
 
+@pytest.mark.parametrize(
+    "constants",
+    [None, np.array([[0.5, np.nan, 0.8409, 15.970, np.nan, 183.44]])],
+    ids=["fitted", "nan-Q"],
+)
+def test_array_methods_match_scalar(taper_instance, constants):
+    if constants is not None:
+        taper_instance.constants = constants
+    rel = np.linspace(0, 1.1, 221)
+    expected = [taper_instance.get_relative_diameter(r) if r < 1 else 0.0 for r in rel.tolist()]
+    np.testing.assert_array_equal(taper_instance.get_relative_diameter_array(rel), expected)
+
+    heights = np.linspace(-1, 31, 321).reshape(3, 107)
+    expected = np.vectorize(taper_instance.get_diameter_at_height)(heights)
+    np.testing.assert_array_equal(taper_instance.get_diameter_array(heights), expected)
+    assert taper_instance.get_diameter_vectorised(heights).dtype == np.float32
+
+
 def test_get_diameter_at_height_errors(taper_instance, monkeypatch):
     assert taper_instance.get_diameter_at_height(-1) == 0
     monkeypatch.setattr(
@@ -294,6 +351,59 @@ def test_get_diameter_at_height_errors(taper_instance, monkeypatch):
     assert taper_instance.get_diameter_at_height(1) == 0
 
 
+def test_get_height_array_inverts_taper(taper_instance):
+    diameters = np.linspace(1.0, taper_instance.base_diameter, 50)
+    heights = taper_instance.get_height_array(diameters)
+    # largest height whose diameter is still at least the target
+    grid = np.linspace(0, taper_instance.timber.height_m, 300001)
+    grid_diameters = taper_instance.get_diameter_array(grid)
+    expected = [grid[grid_diameters >= d].max() for d in diameters]
+    np.testing.assert_allclose(heights, expected, atol=2e-4)
+
+    scalar = taper_instance.get_height_at_diameter(20.0)
+    assert taper_instance.get_height_array(20.0) == pytest.approx(scalar, abs=1e-3)
+
+
+def test_get_height_array_stays_on_stem_past_inflexion():
+    # A slender pine whose inflexion point lies above the top of the tree.
+    taper = EdgrenNylinder1949(SweTimber("pinus sylvestris", 12, 38))
+    assert taper.inflexion_point > 1
+    diameters = np.array([1.0, 2.0, 6.0, 9.0, 10.0])
+    heights = taper.get_height_array(diameters)
+    assert np.all((heights >= 0) & (heights <= 38))
+    grid = np.linspace(0, 38, 300001)
+    grid_diameters = taper.get_diameter_array(grid)
+    expected = [grid[grid_diameters >= d].max() for d in diameters]
+    np.testing.assert_allclose(heights, expected, atol=2e-4)
+    np.testing.assert_array_equal(
+        EdgrenNylinder1949.get_heights_for_trees([taper], diameters)[0], heights
+    )
+
+
+def test_get_height_array_invalid_is_silent(taper_instance, capsys):
+    res = taper_instance.get_height_array([-1.0, 0.0, taper_instance.base_diameter + 1])
+    assert res.tolist() == [0.0, 0.0, 0.0]
+    assert capsys.readouterr().out == ""
+
+
+def test_get_heights_for_trees(taper_instance):
+    other = EdgrenNylinder1949(SweTimber("picea abies", 25, 20, region="northern"))
+    diameters = np.array([5.0, 12.0, 18.0])
+    res = EdgrenNylinder1949.get_heights_for_trees([taper_instance, other], diameters)
+    assert res.shape == (2, 3)
+    np.testing.assert_array_equal(res[0], taper_instance.get_height_array(diameters))
+    np.testing.assert_array_equal(res[1], other.get_height_array(diameters))
+
+
+def test_inverse_bisection_fallback():
+    # Q = 0 makes the analytic middle inverse non-finite
+    constants = np.array([0.7, 6.32, 3.974, 13.24, 0.0, 95.286])
+    rel = edgren_nylinder_1949._inverse_relative_diameter(np.array([95.0, 30.0]), constants, 0.2)
+    curve = edgren_nylinder_1949._relative_diameter_array
+    assert curve(rel[0], constants, 0.2) == pytest.approx(95.0)
+    assert np.isfinite(rel).all()
+
+
 def test_get_height_at_diameter_invalid(taper_instance):
     assert taper_instance.get_height_at_diameter(-1) == 0
 
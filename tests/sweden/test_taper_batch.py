@@ -0,0 +1,102 @@
+import numpy as np
+import pytest
+
+from pyforestry.sweden.taper import EdgrenNylinder1949, EdgrenNylinder1949Batch
+from pyforestry.sweden.timber.swe_timber import SweTimber
+
+
+@pytest.fixture
+def timbers():
+    return [
+        SweTimber(species="pinus sylvestris", diameter_cm=40, height_m=30, region="southern"),
+        SweTimber(
+            species="picea abies",
+            diameter_cm=28,
+            height_m=24,
+            region="northern",
+            crown_base_height_m=9,
+        ),
+        SweTimber(
+            species="pinus sylvestris",
+            diameter_cm=18,
+            height_m=16,
+            region="northern",
+            double_bark_mm=12,
+            crown_base_height_m=7,
+        ),
+        SweTimber(species="betula", diameter_cm=22, height_m=20, over_bark=False),
+    ]
+
+
+def test_parameters_match_single_stem_models(timbers):
+    batch = EdgrenNylinder1949Batch.from_timbers(timbers)
+    singles = [EdgrenNylinder1949(t) for t in timbers]
+
+    assert len(batch) == len(timbers)
+    np.testing.assert_array_equal(batch.constants, np.array([s.constants[0] for s in singles]))
+    np.testing.assert_allclose(batch.inflexion_point, [s.inflexion_point for s in singles])
+    np.testing.assert_allclose(batch.base_diameter, [s.base_diameter for s in singles])
+
+
+def test_queries_match_single_stem_models(timbers):
+    batch = EdgrenNylinder1949Batch.from_timbers(timbers)
+    singles = [EdgrenNylinder1949(t) for t in timbers]
+    heights = np.linspace(-1, 32, 67)
+    diameters = np.array([0, 5, 12.5, 20, 60])
+
+    np.testing.assert_allclose(
+        batch.diameter(heights), [s.get_diameter_array(heights) for s in singles], atol=1e-12
+    )
+    np.testing.assert_allclose(
+        batch.height_at_diameter(diameters),
+        [s.get_height_array(diameters) for s in singles],
+        atol=1e-12,
+    )
+    np.testing.assert_allclose(
+        batch.volume(0.3, [3.0, 10.0, 40.0]),
+        [s.volume_sections(0.3, np.array([3.0, 10.0, 40.0])) for s in singles],
+        rtol=1e-12,
+    )
+
+
+def test_per_stem_queries_and_array_constructor():
+    batch = EdgrenNylinder1949Batch(
+        species=["pinus sylvestris", "picea abies"],
+        diameter_cm=[30.0, 25.0],
+        height_m=[25.0, 22.0],
+        crown_base_height_m=[np.nan, 8.0],
+    )
+    single = EdgrenNylinder1949(
+        SweTimber(species="picea abies", diameter_cm=25, height_m=22, crown_base_height_m=8)
+    )
+
+    heights = np.array([[1.3, 5.0], [2.0, 11.0]])
+    diameter = batch.diameter(heights)
+    assert diameter.shape == (2, 2)
+    assert diameter[1, 1] == pytest.approx(single.get_diameter_at_height(11.0), rel=1e-12)
+
+    volume = batch.volume(heights[:, :1], heights[:, 1:])
+    assert volume.shape == (2, 1)
+    assert volume[1, 0] == pytest.approx(single.volume_section(2.0, 11.0), rel=1e-12)
+    np.testing.assert_array_equal(batch.volume(5.0, 1.0), 0.0)
+
+
+@pytest.mark.parametrize(
+    "kwargs,match",
+    [
+        (dict(height_m=[25.0, 0.0]), "height_m"),
+        (dict(crown_base_height_m=[10.0, 30.0]), "crown_base_height_m"),
+        (dict(region="central"), "region"),
+        (dict(double_bark_mm=[-1.0, 2.0]), "double_bark_mm"),
+    ],
+)
+def test_invalid_stems_raise(kwargs, match):
+    params = dict(species="pinus sylvestris", diameter_cm=[30.0, 20.0], height_m=[25.0, 20.0])
+    params.update(kwargs)
+    with pytest.raises(ValueError, match=match):
+        EdgrenNylinder1949Batch(**params)
+
+
+def test_form_quotient_of_one_or_more_raises():
+    with pytest.raises(ValueError, match="inflexion point"):
+        EdgrenNylinder1949Batch(species="picea abies", diameter_cm=8.0, height_m=30.0)
@@ -0,0 +1,50 @@
+import numpy as np
+import pytest
+
+from pyforestry.sweden.taper import EdgrenNylinder1949Batch
+from pyforestry.sweden.taper.edgren_nylinder_1949 import _relative_diameter_array
+from pyforestry.sweden.taper.edgren_nylinder_tables import (
+    TABLE_SIZE,
+    TabulatedEdgrenNylinder1949Batch,
+    edgren_nylinder_tables,
+)
+
+STEMS = dict(
+    species=["pinus sylvestris", "picea abies", "picea abies", "pinus sylvestris"],
+    diameter_cm=[32.0, 26.0, 14.0, 45.0],
+    height_m=[27.0, 23.0, 13.0, 29.0],
+    region=["southern", "northern", "southern", "northern"],
+)
+
+
+def test_tables_are_shared_and_read_only():
+    tables = edgren_nylinder_tables()
+    assert edgren_nylinder_tables() is tables
+    assert tables.diameter.shape == (len(tables.constants), 3, TABLE_SIZE)
+    with pytest.raises(ValueError):
+        tables.diameter[0, 0, 0] = 1.0
+
+
+@pytest.mark.parametrize("inflexion_point", [0.05, 0.2, 0.7])
+def test_relative_diameter_matches_analytic_curve(inflexion_point):
+    tables = edgren_nylinder_tables()
+    rows = np.arange(len(tables.constants))[:, None]
+    rel_height = np.linspace(0, 1.05, 400)
+    tabulated = tables.relative_diameter(rel_height, rows, inflexion_point)
+    analytic = _relative_diameter_array(rel_height, tables.constants[:, None, :], inflexion_point)
+    np.testing.assert_allclose(tabulated, analytic, atol=1e-3)
+
+
+def test_tabulated_batch_matches_analytic_batch():
+    analytic = EdgrenNylinder1949Batch(**STEMS)
+    tabulated = TabulatedEdgrenNylinder1949Batch(**STEMS)
+    heights = np.linspace(0, 30, 121)
+
+    np.testing.assert_allclose(tabulated.diameter(heights), analytic.diameter(heights), atol=1e-4)
+    np.testing.assert_allclose(
+        tabulated.volume(heights[:-1], heights[1:]),
+        analytic.volume(heights[:-1], heights[1:]),
+        rtol=1e-5,
+        atol=1e-7,
+    )
+    np.testing.assert_allclose(tabulated.volume(0.3, 30.0), analytic.volume(0.3, 30.0), rtol=1e-7)
@@ -1,7 +1,9 @@
 import importlib
 
+import numpy as np
 import pytest
 
+from pyforestry.sweden.timber.swe_timber import SweTimber
 from pyforestry.sweden.volume import andersson_1954, brandel_1990
 
 # -- Tests for andersson_1954 -------------------------------------------------
@@ -22,6 +24,23 @@ def test_andersson_1954_all_functions():
     )
 
 
+def test_andersson_1954_birch_scalar_and_array():
+    volume = andersson_1954.andersson_1954_volume_small_trees_birch_height_above_4_m(4.0, 10.0)
+    assert type(volume) is float
+    with pytest.raises(ValueError, match="math domain error"):
+        andersson_1954.andersson_1954_volume_small_trees_birch_height_above_4_m(0, 10.0)
+    with pytest.raises(ValueError, match="math domain error"):
+        SweTimber("betula pendula", 0, 10.0).getvolume()
+
+    volumes = andersson_1954.andersson_1954_volume_small_trees_birch_height_above_4_m(
+        np.array([4.0, 3.0]), np.array([10.0, 6.0])
+    )
+    assert volumes[0] == volume
+    assert volumes[1] == andersson_1954.andersson_1954_volume_small_trees_birch_height_above_4_m(
+        3.0, 6.0
+    )
+
+
 # -- Tests for brandel_1990 ---------------------------------------------------
 
 